@@ -11,7 +11,8 @@ import time
 
 from .auth.kis_auth import KisAuthClient, AuthError
 from .auth.kiwoom_auth import KiwoomAuthClient, KiwoomAuthError
-from .collector.constituent import ConstituentCollector
+from .auth.token_cache import TokenCache
+from .collector.constituent import DEFAULT_WORKERS, ConstituentCollector
 from .collector.etf_list import EtfListCollector
 from .collector.kiwoom_etf_list import KiwoomEtfListCollector, MarketType
 from .config import Config, ConfigError, EtfListSource
@@ -21,7 +22,18 @@ from .filter.keyword import (
     create_filter_from_args,
 )
 from .limiter.rate_limiter import SlidingWindowRateLimiter, RateLimiterConfig
-from .storage.data_storage import DataStorage, OutputFormat
+from .stats.holdings import HoldingsIndex, stock_changes
+from .stats.overlap import OverlapMatrix
+from .storage.data_storage import DataStorage, OutputFormat, StorageError
+from .storage.run_journal import RunJournal
+from .storage.snapshot_store import (
+    STATUS_DECREASE,
+    STATUS_INCREASE,
+    STATUS_NEW,
+    STATUS_REMOVED,
+    SnapshotStore,
+)
+from .utils.helpers import format_number, today_str
 from .utils.logger import log_info, log_err, log_warn, set_level
 
 
@@ -56,6 +68,20 @@ Examples:
   # Specify market type (KOSPI, KOSDAQ, ALL)
   python -m etf_collector collect --market all --active-only
 
+  # Continue an interrupted run (only the ETFs not yet collected today)
+  python -m etf_collector collect --active-only --resume
+
+  # Top stocks by total evaluation amount across the recorded ETFs
+  python -m etf_collector stats --top 20
+
+  # ETFs holding a stock, and holdings changes over a period
+  python -m etf_collector stats --stock 005930
+  python -m etf_collector stats --since 20251001 --date 20251031
+
+  # ETFs whose holdings overlap most with an ETF, and groups of look-alikes
+  python -m etf_collector stats --similar 069500
+  python -m etf_collector stats --clusters 60
+
   # Test rate limiter
   python -m etf_collector test-rate-limit --env real --duration 10
 
@@ -134,11 +160,67 @@ Examples:
         "--etf-code",
         help="Collect constituents for a specific ETF code only",
     )
+    collect_parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip ETFs already collected today by an interrupted run",
+    )
+    collect_parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Concurrent constituent requests (default: {DEFAULT_WORKERS})",
+    )
     collect_parser.add_argument(
         "--env-file",
         help="Path to .env file",
     )
 
+    # stats command
+    stats_parser = subparsers.add_parser(
+        "stats",
+        help="Holdings statistics from the recorded snapshots",
+    )
+    stats_parser.add_argument(
+        "--data-dir",
+        default="./data",
+        help="Directory the collect command saves to (default: ./data)",
+    )
+    stats_parser.add_argument(
+        "--date",
+        help="Holdings as of this date YYYYMMDD (default: today)",
+    )
+    stats_parser.add_argument(
+        "--since",
+        help="Show holdings changes from this date YYYYMMDD to --date",
+    )
+    stats_parser.add_argument(
+        "--stock",
+        help="Show the ETFs holding this stock code",
+    )
+    stats_parser.add_argument(
+        "--similar",
+        help="Show the ETFs whose holdings overlap most with this ETF code",
+    )
+    stats_parser.add_argument(
+        "--clusters",
+        type=float,
+        metavar="OVERLAP",
+        help="Group ETFs whose holdings overlap by at least OVERLAP %%",
+    )
+    stats_parser.add_argument(
+        "--by",
+        choices=["amount", "etf_count"],
+        default="amount",
+        help="Ranking key (default: amount)",
+    )
+    stats_parser.add_argument(
+        "--top",
+        type=int,
+        default=20,
+        help="Number of rows to show (default: 20)",
+    )
+
     # test-rate-limit command
     rate_limit_parser = subparsers.add_parser(
         "test-rate-limit",
@@ -181,6 +263,8 @@ Examples:
     # Execute command
     if args.command == "collect":
         return run_collect(args)
+    elif args.command == "stats":
+        return run_stats(args)
     elif args.command == "test-rate-limit":
         return run_test_rate_limit(args)
     elif args.command == "config":
@@ -218,7 +302,8 @@ def run_collect(args) -> int:
 
         # Initialize KIS components (for constituent data)
         kis_auth_client = KisAuthClient(
-            config.app_key, config.app_secret, config.base_url
+            config.app_key, config.app_secret, config.base_url,
+            token_cache=TokenCache(),
         )
         min_interval = 0.5  # Prevent server-side rate limiting
         kis_rate_limiter = SlidingWindowRateLimiter(
@@ -312,13 +397,21 @@ def run_collect(args) -> int:
 
         # Collect constituents using KIS API
         constituent_collector = ConstituentCollector(
-            kis_auth_client, kis_rate_limiter, config.base_url
+            kis_auth_client, kis_rate_limiter, config.base_url,
+            max_workers=args.workers,
         )
 
         def progress_callback(current: int, total: int, name: str):
             print(f"[{current}/{total}] Collecting constituents: {name}")
 
-        result = constituent_collector.get_all_constituents(etfs, progress_callback)
+        # Each ETF is journaled as it arrives so an interrupted run can resume
+        journal = RunJournal(storage, name="etf_report")
+        try:
+            result = journal.collect(
+                constituent_collector, etfs, progress_callback, resume=args.resume
+            )
+        finally:
+            constituent_collector.close()
 
         if not result.get("ok"):
             log_err("cli", f"Failed to collect constituents: {result.get('error', {})}")
@@ -326,6 +419,8 @@ def run_collect(args) -> int:
 
         summaries = result["data"]
         errors = result.get("errors")
+        if result["resumed"]:
+            print(f"Resumed {result['resumed']} ETFs from {journal.path}")
 
         # Prepare filter info for report
         filter_info = None
@@ -338,20 +433,25 @@ def run_collect(args) -> int:
                 "no_leverage": args.no_leverage,
             }
 
-        # Save report
-        filepath = storage.save_full_report(
+        # Save report (the journal is kept while ETFs are still missing)
+        filepath = journal.finalize(
             summaries,
-            filename="etf_report",
             output_format=output_format,
             filter_info=filter_info,
+            keep=bool(errors),
         )
         print(f"Report saved to: {filepath}")
 
+        # Add the day to the holdings history used for period comparisons
+        snapshot_info = SnapshotStore(storage).record(summaries, journal.run_date)
+        print(f"Snapshots recorded: {snapshot_info['etfs']} ETFs ({journal.run_date})")
+
         total_constituents = sum(len(s.constituents) for s in summaries)
         print(f"Total: {len(summaries)} ETFs, {total_constituents} constituents")
 
         if errors:
             print(f"Warning: {len(errors)} ETFs failed to collect")
+            print("Run again with --resume to fetch only the missing ETFs")
 
         return 0
 
@@ -387,6 +487,7 @@ def collect_etf_list_from_kiwoom(config: Config, args) -> dict:
         config.kiwoom_app_key,
         config.kiwoom_secret_key,
         config.kiwoom_base_url,
+        token_cache=TokenCache(),
     )
     kiwoom_rate_limiter = SlidingWindowRateLimiter(
         RateLimiterConfig(
@@ -488,6 +589,99 @@ def collect_single_etf(
     return 0
 
 
+def run_stats(args) -> int:
+    """Run stats command.
+
+    Args:
+        args: Parsed arguments
+
+    Returns:
+        Exit code
+    """
+    date = args.date or today_str()
+    try:
+        store = SnapshotStore(DataStorage(args.data_dir))
+        index = HoldingsIndex.from_store(store, date)
+        earlier = HoldingsIndex.from_store(store, args.since) if args.since else None
+    except StorageError as e:
+        log_err("cli", f"Stats failed: {e}")
+        print(f"Error: {e}")
+        return 1
+
+    if not index.etf_codes:
+        print(f"No snapshots recorded by {date} in {args.data_dir}")
+        print("Run the collect command first")
+        return 1
+
+    if args.stock:
+        stat = index.exposure(args.stock, by=args.by)
+        if stat is None:
+            print(f"No ETF holds {args.stock} as of {date}")
+            return 1
+        print(
+            f"{stat.stock_name} ({stat.stock_code}) as of {date}: rank {stat.rank}, "
+            f"{stat.etf_count} ETFs, {format_number(stat.total_amount)} won"
+        )
+        for e in index.holders(args.stock)[:args.top]:
+            print(
+                f"  {e.etf_code} {e.etf_name}: {e.weight:.2f}% "
+                f"({format_number(e.evaluation_amount)} won)"
+            )
+        return 0
+
+    if args.similar:
+        matrix = OverlapMatrix.from_index(index)
+        if args.similar not in matrix.etf_codes:
+            print(f"No snapshot of ETF {args.similar} as of {date}")
+            return 1
+        name = index.etf_names[args.similar]
+        print(f"ETFs overlapping {args.similar} {name} ({date})")
+        for etf in matrix.similar(args.similar, top=args.top):
+            print(
+                f"  {etf.etf_code} {index.etf_names[etf.etf_code]}: "
+                f"overlap {etf.overlap:.1f}%, {etf.shared} shared stocks, "
+                f"jaccard {etf.jaccard:.2f}, cosine {etf.cosine:.2f}"
+            )
+        return 0
+
+    if args.clusters is not None:
+        matrix = OverlapMatrix.from_index(index)
+        clusters = [c for c in matrix.clusters(args.clusters) if len(c) > 1]
+        print(
+            f"{len(clusters)} groups of ETFs overlapping by "
+            f"{args.clusters:g}%+ ({date})"
+        )
+        for cluster in clusters[:args.top]:
+            names = ", ".join(f"{code} {index.etf_names[code]}" for code in cluster)
+            print(f"  [{len(cluster)}] {names}")
+        return 0
+
+    if earlier is not None:
+        changes = stock_changes(index.compare(earlier))
+        print(f"Holdings changes {args.since} -> {date}")
+        for status in (STATUS_NEW, STATUS_REMOVED, STATUS_INCREASE, STATUS_DECREASE):
+            rows = [c for c in changes if c.status == status]
+            print(f"\n[{status}] {len(rows)} stocks")
+            for c in rows[:args.top]:
+                print(
+                    f"  {c.stock_code} {c.stock_name}: {c.etf_count} ETFs, "
+                    f"{c.weight_change:+.2f}%p"
+                )
+        return 0
+
+    print(
+        f"Top {args.top} stocks by {args.by} as of {date} "
+        f"({len(index.etf_codes)} ETFs)"
+    )
+    for stat in index.ranking(args.top, by=args.by):
+        print(
+            f"{stat.rank:>4}. {stat.stock_code} {stat.stock_name}: "
+            f"{format_number(stat.total_amount)} won in {stat.etf_count} ETFs "
+            f"(avg {stat.avg_weight:.2f}%)"
+        )
+    return 0
+
+
 def run_test_rate_limit(args) -> int:
     """Run rate limit test.
 
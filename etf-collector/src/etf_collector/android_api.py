@@ -18,12 +18,19 @@ from typing import Any, Dict, Optional
 
 from .auth.kis_auth import KisAuthClient
 from .auth.kiwoom_auth import KiwoomAuthClient
-from .collector.constituent import ConstituentCollector, EtfConstituentSummary
+from .auth.token_cache import TokenCache
+from .collector.constituent import (
+    DEFAULT_WORKERS,
+    ConstituentCollector,
+    EtfConstituentSummary,
+)
 from .collector.etf_list import EtfListCollector
 from .collector.kiwoom_etf_list import KiwoomEtfListCollector
 from .config import Config, ConfigError, EtfListSource
 from .limiter.rate_limiter import SlidingWindowRateLimiter
 from .storage.data_storage import DataStorage, OutputFormat
+from .storage.run_journal import RunJournal
+from .storage.snapshot_store import SnapshotStore
 from .utils.logger import log_info, log_err
 
 MODULE = "android_api"
@@ -96,6 +103,7 @@ def get_constituents(config_json: str, etf_code: str, etf_name: str = "") -> str
             app_key=config.app_key,
             app_secret=config.app_secret,
             base_url=config.base_url,
+            token_cache=TokenCache(),
         )
         rate_limiter = SlidingWindowRateLimiter(
             max_requests=config.rate_limit,
@@ -162,6 +170,7 @@ def get_etf_list(config_json: str, use_predefined: bool = False) -> str:
             app_key=config.kiwoom_app_key,
             secret_key=config.kiwoom_secret_key,
             base_url=config.kiwoom_base_url,
+            token_cache=TokenCache(),
         )
         kiwoom_limiter = SlidingWindowRateLimiter(
             max_requests=config.kiwoom_rate_limit,
@@ -195,6 +204,7 @@ def collect_all_constituents(
     config_json: str,
     etf_codes: Optional[str] = None,
     output_dir: str = "./data",
+    resume: bool = True,
 ) -> str:
     """Collect constituents for multiple ETFs and save to file.
 
@@ -203,6 +213,8 @@ def collect_all_constituents(
         etf_codes: Optional JSON array of ETF codes to collect.
                    If None, collects all active ETFs.
         output_dir: Directory to save output files
+        resume: Continue today's run if it was interrupted (e.g. the
+                process was killed), fetching only the missing ETFs
 
     Returns:
         JSON string with result:
@@ -246,6 +258,7 @@ def collect_all_constituents(
             app_key=config.app_key,
             app_secret=config.app_secret,
             base_url=config.base_url,
+            token_cache=TokenCache(),
         )
         rate_limiter = SlidingWindowRateLimiter(
             max_requests=config.rate_limit,
@@ -256,18 +269,24 @@ def collect_all_constituents(
             auth_client=auth_client,
             rate_limiter=rate_limiter,
             base_url=config.base_url,
+            max_workers=DEFAULT_WORKERS,
         )
 
-        # Collect all constituents
-        result = collector.get_all_constituents(etf_list)
+        # Collect all constituents, journaling each ETF as it arrives
+        storage = DataStorage(output_dir)
+        journal = RunJournal(storage)
+        try:
+            result = journal.collect(collector, etf_list, resume=resume)
+        finally:
+            collector.close()
 
         if not result.get("ok"):
             return _serialize_result(result)
 
-        # Save to file
-        storage = DataStorage(output_dir)
+        # Save to file (the journal is kept while ETFs are still missing)
         summaries = result["data"]
-        file_path = storage.save_full_report(summaries)
+        file_path = journal.finalize(summaries, keep=bool(result.get("errors")))
+        SnapshotStore(storage).record(summaries, journal.run_date)
 
         total_constituents = sum(len(s.constituents) for s in summaries)
 
@@ -2,6 +2,7 @@
 
 from .kis_auth import KisAuthClient, TokenInfo, AuthError
 from .kiwoom_auth import KiwoomAuthClient, KiwoomTokenInfo, KiwoomAuthError
+from .token_cache import TokenCache
 
 __all__ = [
     # KIS API
@@ -12,4 +13,6 @@ __all__ = [
     "KiwoomAuthClient",
     "KiwoomTokenInfo",
     "KiwoomAuthError",
+    # Shared
+    "TokenCache",
 ]
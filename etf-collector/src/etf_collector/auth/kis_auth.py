@@ -2,13 +2,14 @@
 
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 
 import requests
 
 from ..config import ENDPOINTS, DEFAULT_TIMEOUT
 from ..utils.logger import log_info, log_err, log_debug
 from ..utils.validators import mask_credentials
+from .token_cache import TokenCache, TokenRefreshMixin
 
 MODULE = "kis_auth"
 
@@ -43,41 +44,63 @@ class TokenInfo:
         """
         return f"{self.token_type} {self.access_token}"
 
+    @classmethod
+    def from_cache(cls, entry: Dict[str, Any]) -> "TokenInfo":
+        """Build from fields stored by to_cache().
 
-class KisAuthClient:
+        Args:
+            entry: Stored token fields
+
+        Returns:
+            TokenInfo instance
+        """
+        return cls(
+            access_token=entry["access_token"],
+            token_type=entry.get("token_type", "Bearer"),
+            expires_at=datetime.fromisoformat(entry["expires_at"]),
+        )
+
+    def to_cache(self) -> Tuple[Dict[str, Any], float]:
+        """Get the fields to store and the epoch expiry.
+
+        Returns:
+            (token fields, expiry) for TokenCache
+        """
+        fields = {
+            "access_token": self.access_token,
+            "token_type": self.token_type,
+            "expires_at": self.expires_at.isoformat(),
+        }
+        return fields, self.expires_at.timestamp()
+
+
+class KisAuthClient(TokenRefreshMixin[TokenInfo]):
     """KIS API OAuth authentication client."""
 
-    def __init__(self, app_key: str, app_secret: str, base_url: str):
+    TOKEN_CLASS = TokenInfo
+    TOKEN_FIELD = "access_token"
+
+    def __init__(
+        self,
+        app_key: str,
+        app_secret: str,
+        base_url: str,
+        token_cache: Optional[TokenCache] = None,
+    ):
         """Initialize authentication client.
 
         Args:
             app_key: KIS API app key
             app_secret: KIS API secret
             base_url: KIS API base URL
+            token_cache: On-disk token store shared with other processes
+                (tokens kept in memory only if None)
         """
         self.app_key = app_key
         self.app_secret = app_secret
         self.base_url = base_url
-        self._token: Optional[TokenInfo] = None
-
-    def get_token(self, force_refresh: bool = False) -> TokenInfo:
-        """Get valid token (auto-refresh if expired).
-
-        Args:
-            force_refresh: Force token refresh even if not expired
-
-        Returns:
-            Valid TokenInfo instance
-
-        Raises:
-            AuthError: If token fetch fails
-        """
-        if force_refresh or self._token is None or self._token.is_expired:
-            log_info(MODULE, "Fetching new token", {"force": force_refresh})
-            self._token = self._fetch_token()
-        else:
-            log_debug(MODULE, "Using cached token")
-        return self._token
+        self.token_cache = token_cache
+        self._init_token_state()
 
     def _fetch_token(self) -> TokenInfo:
         """Fetch new token from KIS API.
@@ -140,6 +163,8 @@ class KisAuthClient:
             raise AuthError(f"Unexpected error: {e}")
 
     def clear_token(self) -> None:
-        """Clear cached token."""
+        """Clear cached token (including the on-disk copy)."""
         self._token = None
+        if self.token_cache is not None:
+            self.token_cache.remove(TokenCache.key(self.base_url, self.app_key))
         log_info(MODULE, "Token cache cleared")
@@ -2,13 +2,14 @@
 
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 
 import requests
 
 from ..config import DEFAULT_TIMEOUT
 from ..utils.logger import log_info, log_err, log_debug
 from ..utils.validators import mask_credentials
+from .token_cache import TokenCache, TokenRefreshMixin
 
 MODULE = "kiwoom_auth"
 
@@ -56,44 +57,66 @@ class KiwoomTokenInfo:
         """
         return self.bearer
 
+    @classmethod
+    def from_cache(cls, entry: Dict[str, Any]) -> "KiwoomTokenInfo":
+        """Build from fields stored by to_cache().
 
-class KiwoomAuthClient:
+        Args:
+            entry: Stored token fields
+
+        Returns:
+            KiwoomTokenInfo instance
+        """
+        return cls(
+            token=entry["token"],
+            expires_dt=datetime.strptime(entry["expires_dt"], "%Y%m%d%H%M%S"),
+            token_type=entry.get("token_type", "bearer"),
+        )
+
+    def to_cache(self) -> Tuple[Dict[str, Any], float]:
+        """Get the fields to store and the epoch expiry.
+
+        Returns:
+            (token fields, expiry) for TokenCache
+        """
+        fields = {
+            "token": self.token,
+            "token_type": self.token_type,
+            "expires_dt": self.expires_dt.strftime("%Y%m%d%H%M%S"),
+        }
+        return fields, self.expires_dt.timestamp()
+
+
+class KiwoomAuthClient(TokenRefreshMixin[KiwoomTokenInfo]):
     """Kiwoom API OAuth authentication client."""
 
+    TOKEN_CLASS = KiwoomTokenInfo
+    TOKEN_FIELD = "token"
+
     API_ID = "au10001"
     TOKEN_PATH = "/oauth2/token"
 
-    def __init__(self, app_key: str, secret_key: str, base_url: str):
+    def __init__(
+        self,
+        app_key: str,
+        secret_key: str,
+        base_url: str,
+        token_cache: Optional[TokenCache] = None,
+    ):
         """Initialize Kiwoom authentication client.
 
         Args:
             app_key: Kiwoom API app key
             secret_key: Kiwoom API secret key
             base_url: Kiwoom API base URL
+            token_cache: On-disk token store shared with other processes
+                (tokens kept in memory only if None)
         """
         self.app_key = app_key
         self.secret_key = secret_key
         self.base_url = base_url
-        self._token: Optional[KiwoomTokenInfo] = None
-
-    def get_token(self, force_refresh: bool = False) -> KiwoomTokenInfo:
-        """Get valid token (auto-refresh if expired).
-
-        Args:
-            force_refresh: Force token refresh even if not expired
-
-        Returns:
-            Valid KiwoomTokenInfo instance
-
-        Raises:
-            KiwoomAuthError: If token fetch fails
-        """
-        if force_refresh or self._token is None or self._token.is_expired:
-            log_info(MODULE, "Fetching new Kiwoom token", {"force": force_refresh})
-            self._token = self._fetch_token()
-        else:
-            log_debug(MODULE, "Using cached Kiwoom token")
-        return self._token
+        self.token_cache = token_cache
+        self._init_token_state()
 
     def _fetch_token(self) -> KiwoomTokenInfo:
         """Fetch new token from Kiwoom API (au10001).
@@ -170,6 +193,8 @@ class KiwoomAuthClient:
             raise KiwoomAuthError(f"Unexpected error: {e}")
 
     def clear_token(self) -> None:
-        """Clear cached token."""
+        """Clear cached token (including the on-disk copy)."""
         self._token = None
+        if self.token_cache is not None:
+            self.token_cache.remove(TokenCache.key(self.base_url, self.app_key))
         log_info(MODULE, "Kiwoom token cache cleared")
@@ -0,0 +1,293 @@
+"""Persistent OAuth token cache shared between processes.
+
+KIS throttles token issuance (one token per minute per app key), so CLI
+runs, Android process restarts and worker processes should reuse the
+token issued by an earlier run instead of requesting a new one.
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterator,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from ..utils.logger import log_debug, log_err, log_info
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+try:
+    import msvcrt
+except ImportError:  # POSIX
+    msvcrt = None
+
+MODULE = "token_cache"
+
+# Token directory used when none is given (Android sets it to app storage)
+TOKEN_DIR_ENV = "ETF_COLLECTOR_TOKEN_DIR"
+DEFAULT_TOKEN_DIR = "~/.etf_collector/tokens"
+
+T = TypeVar("T")
+
+
+class TokenCache:
+    """On-disk OAuth token store.
+
+    One JSON file per (base URL, app key) holds the current token. Files
+    are readable by the owner only; secrets are never written. lock()
+    takes an exclusive file lock so only one process refreshes an expired
+    token while the others wait and read the result.
+
+    Example:
+        >>> cache = TokenCache()
+        >>> auth = KisAuthClient(app_key, app_secret, base_url, token_cache=cache)
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Initialize token cache.
+
+        Args:
+            directory: Token directory (ETF_COLLECTOR_TOKEN_DIR or
+                ~/.etf_collector/tokens if None); created on first store
+            clock: Epoch time source
+        """
+        directory = directory or os.getenv(TOKEN_DIR_ENV) or DEFAULT_TOKEN_DIR
+        self.directory = os.path.expanduser(directory)
+        self._clock = clock
+
+    @staticmethod
+    def key(base_url: str, app_key: str) -> str:
+        """Get the cache key (file name) of an account.
+
+        Args:
+            base_url: API base URL
+            app_key: API app key
+
+        Returns:
+            File name derived from a hash of both
+        """
+        raw = f"{base_url}\n{app_key}"
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest() + ".json"
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+    @contextlib.contextmanager
+    def lock(self, name: str) -> Iterator[None]:
+        """Hold an exclusive inter-process lock on a token.
+
+        Falls back to no locking when the directory is not writable.
+
+        Args:
+            name: Cache key (see key())
+        """
+        try:
+            os.makedirs(self.directory, mode=0o700, exist_ok=True)
+            fd = os.open(self._path(name) + ".lock", os.O_RDWR | os.O_CREAT, 0o600)
+        except OSError as e:
+            log_err(
+                MODULE,
+                "Token lock unavailable",
+                {"path": self.directory, "error": str(e)},
+            )
+            yield
+            return
+
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            elif msvcrt is not None:
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            elif msvcrt is not None:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+            os.close(fd)
+
+    def load(self, name: str) -> Optional[Dict[str, Any]]:
+        """Get a stored token.
+
+        Args:
+            name: Cache key (see key())
+
+        Returns:
+            Token fields as stored, or None if missing, unreadable or expired
+        """
+        try:
+            with open(self._path(name), encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or self._clock() >= entry.get("expires", 0):
+            return None
+        return entry.get("token")
+
+    def store(self, name: str, token: Dict[str, Any], expires: float) -> None:
+        """Store a token.
+
+        Args:
+            name: Cache key (see key())
+            token: JSON-serializable token fields
+            expires: Epoch time at which the token stops being valid
+        """
+        raw = json.dumps({"expires": expires, "token": token}, ensure_ascii=False)
+        tmp = self._path(name) + ".tmp"
+        try:
+            os.makedirs(self.directory, mode=0o700, exist_ok=True)
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(raw)
+            os.replace(tmp, self._path(name))
+        except OSError as e:
+            log_err(
+                MODULE,
+                "Failed to store token",
+                {"path": self.directory, "error": str(e)},
+            )
+
+    def get_or_fetch(
+        self,
+        name: str,
+        fetch: Callable[[], T],
+        decode: Callable[[Dict[str, Any]], T],
+        encode: Callable[[T], Tuple[Dict[str, Any], float]],
+        accept: Callable[[T], bool],
+    ) -> T:
+        """Get the stored token or issue and store a new one.
+
+        Runs under lock(), so when a token expires only one process issues
+        a new one; the others wait and then use it.
+
+        Args:
+            name: Cache key (see key())
+            fetch: Issues a new token
+            decode: Stored fields -> token (KeyError, TypeError or
+                ValueError if malformed)
+            encode: Token -> (stored fields, epoch expiry)
+            accept: True if a stored token may be used
+
+        Returns:
+            Stored or newly issued token
+        """
+        with self.lock(name):
+            entry = self.load(name)
+            if entry is not None:
+                try:
+                    cached = decode(entry)
+                except (KeyError, TypeError, ValueError):
+                    cached = None
+                if cached is not None and accept(cached):
+                    log_debug(MODULE, "Using stored token")
+                    return cached
+
+            log_info(MODULE, "Fetching new token")
+            token = fetch()
+            self.store(name, *encode(token))
+            return token
+
+    def remove(self, name: str) -> None:
+        """Delete a stored token.
+
+        Args:
+            name: Cache key (see key())
+        """
+        try:
+            os.remove(self._path(name))
+        except OSError:
+            pass
+
+
+class TokenRefreshMixin(ABC, Generic[T]):
+    """Single-flight get_token() shared by the auth clients.
+
+    Concurrent callers share one refresh. With a token cache, a valid
+    token stored by another process is used instead of issuing a new one.
+
+    Subclasses set TOKEN_CLASS (a token type with is_expired, from_cache()
+    and to_cache()) and TOKEN_FIELD (the attribute holding the token
+    string), implement _fetch_token() and call _init_token_state() from
+    __init__ after setting base_url, app_key and token_cache.
+    """
+
+    TOKEN_CLASS: Type[T]
+    TOKEN_FIELD: str
+
+    base_url: str
+    app_key: str
+    token_cache: Optional[TokenCache]
+
+    def _init_token_state(self) -> None:
+        self._token: Optional[T] = None
+        # Single-flight: one thread refreshes, the others wait for its token
+        self._refresh_lock = threading.Lock()
+
+    @abstractmethod
+    def _fetch_token(self) -> T:
+        """Issue a new token."""
+
+    def get_token(self, force_refresh: bool = False) -> T:
+        """Get valid token (auto-refresh if expired).
+
+        Args:
+            force_refresh: Force token refresh even if not expired
+
+        Returns:
+            Valid token (TOKEN_CLASS instance)
+
+        Raises:
+            The auth error of _fetch_token() if token fetch fails
+        """
+        stale = self._token
+        if not force_refresh and stale is not None and not stale.is_expired:
+            log_debug(MODULE, "Using cached token")
+            return stale
+
+        with self._refresh_lock:
+            # Another thread refreshed while this one waited
+            current = self._token
+            if current is not stale and current is not None and not current.is_expired:
+                return current
+
+            if self.token_cache is None:
+                log_info(MODULE, "Fetching new token", {"force": force_refresh})
+                self._token = self._fetch_token()
+                return self._token
+
+            # A forced refresh only accepts a token other than the rejected one
+            def accept(cached: T) -> bool:
+                return not cached.is_expired and (
+                    not force_refresh
+                    or stale is None
+                    or getattr(cached, self.TOKEN_FIELD)
+                    != getattr(stale, self.TOKEN_FIELD)
+                )
+
+            self._token = self.token_cache.get_or_fetch(
+                TokenCache.key(self.base_url, self.app_key),
+                self._fetch_token,
+                self.TOKEN_CLASS.from_cache,
+                self.TOKEN_CLASS.to_cache,
+                accept,
+            )
+            return self._token
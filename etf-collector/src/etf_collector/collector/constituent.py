@@ -1,11 +1,12 @@
 """ETF constituent stock collector using KIS API (FHKST121600C0)."""
 
-import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Callable, Dict, List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from ..auth.kis_auth import KisAuthClient
 from ..config import ENDPOINTS, DEFAULT_TIMEOUT, ERROR_CODES
@@ -17,6 +18,26 @@ from .etf_list import EtfInfo
 
 MODULE = "constituent"
 
+# Concurrent requests for get_all_constituents(); the shared rate limiter,
+# not this, bounds the request rate
+DEFAULT_WORKERS = 4
+
+
+def create_session(pool_size: int = DEFAULT_WORKERS) -> requests.Session:
+    """Create an HTTP session whose connection pool fits the worker count.
+
+    Args:
+        pool_size: Keep-alive connections per host
+
+    Returns:
+        requests.Session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(1, pool_size))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
 
 @dataclass
 class ConstituentStock:
@@ -71,20 +92,31 @@ class ConstituentCollector:
         auth_client: KisAuthClient,
         rate_limiter: SlidingWindowRateLimiter,
         base_url: str,
+        max_workers: int = 1,
+        session: Optional[requests.Session] = None,
     ):
         """Initialize constituent collector.
 
         Args:
             auth_client: KIS authentication client
-            rate_limiter: Rate limiter instance
+            rate_limiter: Rate limiter instance (shared by all workers)
             base_url: KIS API base URL
+            max_workers: Concurrent requests in get_all_constituents()
+                (1 fetches one ETF at a time)
+            session: HTTP session (a pooled one is created if None)
         """
         self.auth = auth_client
         self.limiter = rate_limiter
         self.base_url = base_url
+        self.max_workers = max(1, max_workers)
+        self.session = session or create_session(self.max_workers)
         self.max_retries = 3
         self.retry_delay = 1.0
 
+    def close(self) -> None:
+        """Close the HTTP session."""
+        self.session.close()
+
     def get_constituents(self, etf_code: str, etf_name: str = "") -> Dict[str, Any]:
         """Fetch constituent stocks for a single ETF.
 
@@ -130,28 +162,50 @@ class ConstituentCollector:
         self,
         etf_list: List[EtfInfo],
         progress_callback: Optional[Callable[[int, int, str], None]] = None,
+        on_result: Optional[Callable[[EtfConstituentSummary], None]] = None,
     ) -> Dict[str, Any]:
         """Fetch constituents for multiple ETFs.
 
+        With max_workers > 1 the ETFs are fetched on a thread pool sharing
+        the rate limiter and HTTP session, so a sweep is bound by the API
+        quota rather than by round-trip latency. Results keep the order of
+        etf_list either way.
+
         Args:
             etf_list: List of EtfInfo objects
-            progress_callback: Optional callback (current, total, etf_name)
+            progress_callback: Optional callback (current, total, etf_name),
+                called on the calling thread before each fetch (sequential)
+                or as each fetch completes (concurrent)
+            on_result: Optional callback called on the calling thread with
+                each successful summary as soon as it is fetched (e.g.
+                RunJournal.append)
 
         Returns:
             {"ok": True, "data": List[EtfConstituentSummary]} on success
             {"ok": False, "error": {...}} on partial/full failure
         """
-        log_info(MODULE, f"Fetching constituents for {len(etf_list)} ETFs")
+        log_info(
+            MODULE,
+            f"Fetching constituents for {len(etf_list)} ETFs",
+            {"workers": self.max_workers},
+        )
+
+        if self.max_workers > 1 and len(etf_list) > 1:
+            fetched = self._fetch_concurrent(etf_list, progress_callback, on_result)
+        else:
+            fetched = []
+            for idx, etf in enumerate(etf_list, 1):
+                if progress_callback:
+                    progress_callback(idx, len(etf_list), etf.etf_name)
+                result = self.get_constituents(etf.etf_code, etf.etf_name)
+                if on_result and result.get("ok"):
+                    on_result(result["data"])
+                fetched.append(result)
 
         results: List[EtfConstituentSummary] = []
         errors: List[Dict[str, Any]] = []
 
-        for idx, etf in enumerate(etf_list, 1):
-            if progress_callback:
-                progress_callback(idx, len(etf_list), etf.etf_name)
-
-            result = self.get_constituents(etf.etf_code, etf.etf_name)
-
+        for etf, result in zip(etf_list, fetched):
             if result.get("ok"):
                 results.append(result["data"])
             else:
@@ -190,6 +244,36 @@ class ConstituentCollector:
             "errors": errors if errors else None,
         }
 
+    def _fetch_concurrent(
+        self,
+        etf_list: List[EtfInfo],
+        progress_callback: Optional[Callable[[int, int, str], None]],
+        on_result: Optional[Callable[[EtfConstituentSummary], None]],
+    ) -> List[Dict[str, Any]]:
+        """Fetch on a thread pool; results in etf_list order."""
+        fetched: List[Dict[str, Any]] = [{} for _ in etf_list]
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="constituent"
+        ) as pool:
+            futures = {
+                pool.submit(self.get_constituents, etf.etf_code, etf.etf_name): idx
+                for idx, etf in enumerate(etf_list)
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                idx = futures[future]
+                try:
+                    fetched[idx] = future.result()
+                except Exception as e:
+                    fetched[idx] = {
+                        "ok": False,
+                        "error": {"code": "UNKNOWN_ERROR", "msg": str(e)},
+                    }
+                if on_result and fetched[idx].get("ok"):
+                    on_result(fetched[idx]["data"])
+                if progress_callback:
+                    progress_callback(done, len(etf_list), etf_list[idx].etf_name)
+        return fetched
+
     def _call_api_with_retry(self, params: Dict[str, str]) -> Dict[str, Any]:
         """Make API call with retry on rate limit errors.
 
@@ -216,7 +300,9 @@ class ConstituentCollector:
                         f"Rate limit hit, retrying in {delay}s",
                         {"attempt": attempt + 1},
                     )
-                    time.sleep(delay)
+                    # Back off every worker sharing the limiter; the retry
+                    # waits in _call_api's wait_if_needed()
+                    self.limiter.defer(delay)
                     continue
 
             # Retry on token expired
@@ -258,7 +344,9 @@ class ConstituentCollector:
 
         try:
             log_debug(MODULE, f"Calling API", {"url": url, "params": params})
-            resp = requests.get(url, params=params, headers=headers, timeout=DEFAULT_TIMEOUT)
+            resp = self.session.get(
+                url, params=params, headers=headers, timeout=DEFAULT_TIMEOUT
+            )
             resp.raise_for_status()
             data = resp.json()
 
@@ -54,6 +54,8 @@ class SlidingWindowRateLimiter:
         # Configured minimum interval between requests (only if > 0)
         self._enforced_min_interval = self.config.min_interval
         self._last_request_time: float = 0.0
+        # No request before this time (see defer())
+        self._deferred_until: float = 0.0
 
     def acquire(self, timeout: Optional[float] = None) -> bool:
         """Blocking acquire - waits until request is allowed.
@@ -98,6 +100,9 @@ class SlidingWindowRateLimiter:
         with self.lock:
             current_time = time.time()
 
+            if current_time < self._deferred_until:
+                return False
+
             # Check enforced minimum interval since last request (only if > 0)
             if self._enforced_min_interval > 0:
                 time_since_last = current_time - self._last_request_time
@@ -135,11 +140,25 @@ class SlidingWindowRateLimiter:
         """Convenience method - blocks until request is allowed."""
         self.acquire()
 
+    def defer(self, seconds: float) -> None:
+        """Hold back every caller for a while.
+
+        Used when the server reports a rate limit (EGW00201) so that all
+        threads sharing this limiter back off, not only the one that hit it.
+
+        Args:
+            seconds: Time from now during which no request is allowed
+        """
+        with self.lock:
+            self._deferred_until = max(self._deferred_until, time.time() + seconds)
+        log_debug("rate_limiter", "Requests deferred", {"seconds": seconds})
+
     def reset(self) -> None:
         """Reset the rate limiter state."""
         with self.lock:
             self.request_times.clear()
             self._last_request_time = 0.0
+            self._deferred_until = 0.0
         log_debug("rate_limiter", "Rate limiter reset")
 
     @property
@@ -175,8 +194,10 @@ class SlidingWindowRateLimiter:
                 oldest_time = self.request_times[0] if self.request_times else current_time
                 window_wait = (oldest_time + self.window_size) - current_time
 
-            # Return the maximum of both wait times
-            return max(0.0, min_interval_wait, window_wait)
+            deferred_wait = self._deferred_until - current_time
+
+            # Return the maximum of all wait times
+            return max(0.0, min_interval_wait, window_wait, deferred_wait)
 
 
 def create_rate_limiter(environment: str = "real") -> SlidingWindowRateLimiter:
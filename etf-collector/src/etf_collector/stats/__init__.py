@@ -0,0 +1,22 @@
+"""Holdings statistics module."""
+
+from .holdings import (
+    EtfExposure,
+    HoldingsIndex,
+    StockChange,
+    StockStat,
+    is_cash,
+    stock_changes,
+)
+from .overlap import OverlapMatrix, SimilarEtf
+
+__all__ = [
+    "EtfExposure",
+    "HoldingsIndex",
+    "OverlapMatrix",
+    "SimilarEtf",
+    "StockChange",
+    "StockStat",
+    "is_cash",
+    "stock_changes",
+]
@@ -0,0 +1,357 @@
+"""Holdings statistics over one collection.
+
+HoldingsIndex turns the constituent summaries of a run (or the snapshots of
+a date) into
+- an inverted index: stock_code -> [EtfExposure], heaviest weight first
+- dense ETF x stock matrices of weights (%) and evaluation amounts
+so rankings, per-stock exposure and period comparisons are array operations
+instead of rescans of the full report.
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..collector.constituent import EtfConstituentSummary
+from ..storage.snapshot_store import (
+    STATUS_DECREASE,
+    STATUS_INCREASE,
+    STATUS_NEW,
+    STATUS_REMOVED,
+    WEIGHT_CHANGE_THRESHOLD,
+    Holding,
+    HoldingChange,
+    Snapshot,
+    SnapshotStore,
+)
+from ..utils.logger import log_debug
+
+MODULE = "stats.holdings"
+
+# Holding names that denote cash or deposits rather than a stock
+CASH_KEYWORDS = ("원화예금", "현금", "예금", "cash", "krw")
+
+RANK_BY = ("amount", "etf_count")
+
+
+def is_cash(stock_name: str) -> bool:
+    """Check if a holding is cash or a deposit.
+
+    Args:
+        stock_name: Holding name
+
+    Returns:
+        True if the name contains a cash keyword
+    """
+    name = stock_name.lower()
+    return any(keyword in name for keyword in CASH_KEYWORDS)
+
+
+@dataclass
+class EtfExposure:
+    """An ETF's position in one stock."""
+
+    etf_code: str
+    etf_name: str
+    weight: float  # %
+    evaluation_amount: int
+
+
+@dataclass
+class StockStat:
+    """A stock's holdings across all ETFs."""
+
+    rank: int
+    stock_code: str
+    stock_name: str
+    total_amount: int  # Sum of evaluation amounts
+    etf_count: int
+    avg_weight: float  # Over the ETFs holding it
+    max_weight: float
+
+
+@dataclass
+class StockChange:
+    """A stock's changes of one kind across ETFs over a period."""
+
+    stock_code: str
+    stock_name: str
+    status: str  # STATUS_*
+    etf_count: int
+    weight_change: float  # Sum over the ETFs, %p
+    amount_change: int
+
+
+class HoldingsIndex:
+    """Inverted stock -> ETF index and ETF x stock matrices of one date."""
+
+    def __init__(self, etfs: Sequence[Tuple[str, str, Sequence[Holding]]]):
+        """Build the index.
+
+        Args:
+            etfs: (etf_code, etf_name, holdings) per ETF; a repeated ETF or
+                stock keeps its last entry
+        """
+        entries: Dict[str, Tuple[str, Dict[str, Holding]]] = {}
+        for etf_code, etf_name, holdings in etfs:
+            entries[etf_code] = (etf_name, {h.stock_code: h for h in holdings})
+
+        self.etf_codes: List[str] = list(entries)
+        self.etf_names: Dict[str, str] = {}
+        self.stock_codes: List[str] = []
+        self.stock_names: Dict[str, str] = {}
+        self._etf_pos: Dict[str, int] = {}
+        self._stock_pos: Dict[str, int] = {}
+        self._holders: Dict[str, List[EtfExposure]] = defaultdict(list)
+
+        rows: List[int] = []
+        cols: List[int] = []
+        weights: List[float] = []
+        amounts: List[int] = []
+        for row, (etf_code, (etf_name, holdings)) in enumerate(entries.items()):
+            self._etf_pos[etf_code] = row
+            self.etf_names[etf_code] = etf_name
+            for stock_code, holding in holdings.items():
+                col = self._stock_pos.setdefault(stock_code, len(self.stock_codes))
+                if col == len(self.stock_codes):
+                    self.stock_codes.append(stock_code)
+                    self.stock_names[stock_code] = holding.stock_name
+                rows.append(row)
+                cols.append(col)
+                weights.append(holding.weight)
+                amounts.append(holding.evaluation_amount)
+                self._holders[stock_code].append(EtfExposure(
+                    etf_code, etf_name, holding.weight, holding.evaluation_amount
+                ))
+        for exposures in self._holders.values():
+            exposures.sort(key=lambda e: e.weight, reverse=True)
+
+        shape = (len(self.etf_codes), len(self.stock_codes))
+        self.weights = np.zeros(shape)
+        self.amounts = np.zeros(shape, dtype=np.int64)
+        self.held = np.zeros(shape, dtype=bool)
+        self.weights[rows, cols] = weights
+        self.amounts[rows, cols] = amounts
+        self.held[rows, cols] = True
+        self.cash = np.array(
+            [is_cash(self.stock_names[code]) for code in self.stock_codes], dtype=bool
+        )
+        log_debug(MODULE, "Built holdings index", {
+            "etfs": shape[0], "stocks": shape[1], "holdings": len(rows),
+        })
+
+    @classmethod
+    def from_summaries(cls, summaries: List[EtfConstituentSummary]) -> "HoldingsIndex":
+        """Build the index from a collection run."""
+        return cls([
+            (
+                s.etf_code,
+                s.etf_name,
+                [
+                    Holding(c.stock_code, c.stock_name, c.weight, c.evaluation_amount)
+                    for c in s.constituents
+                ],
+            )
+            for s in summaries
+        ])
+
+    @classmethod
+    def from_snapshots(cls, snapshots: Dict[str, Snapshot]) -> "HoldingsIndex":
+        """Build the index from snapshots (see SnapshotStore.snapshots())."""
+        return cls([
+            (code, s.info.get("etf_name", ""), list(s.holdings.values()))
+            for code, s in snapshots.items()
+        ])
+
+    @classmethod
+    def from_store(
+        cls,
+        store: SnapshotStore,
+        date: str,
+        etf_codes: Optional[List[str]] = None,
+    ) -> "HoldingsIndex":
+        """Build the index of the holdings as of a date.
+
+        Args:
+            store: Snapshot store
+            date: Date YYYYMMDD
+            etf_codes: ETFs to include (all recorded ETFs if None)
+        """
+        return cls.from_snapshots(store.snapshots(date, etf_codes))
+
+    def holders(self, stock_code: str) -> List[EtfExposure]:
+        """ETFs holding a stock, heaviest weight first."""
+        return list(self._holders.get(stock_code, ()))
+
+    def _stats(self, cols: np.ndarray, ranks: np.ndarray) -> List[StockStat]:
+        total = self.amounts[:, cols].sum(axis=0)
+        count = self.held[:, cols].sum(axis=0)
+        weight_sum = self.weights[:, cols].sum(axis=0)
+        max_weight = self.weights[:, cols].max(axis=0, initial=0.0)
+        return [
+            StockStat(
+                rank=int(ranks[i]),
+                stock_code=self.stock_codes[col],
+                stock_name=self.stock_names[self.stock_codes[col]],
+                total_amount=int(total[i]),
+                etf_count=int(count[i]),
+                avg_weight=float(weight_sum[i] / count[i]) if count[i] else 0.0,
+                max_weight=float(max_weight[i]),
+            )
+            for i, col in enumerate(cols)
+        ]
+
+    def _rank_key(self, by: str) -> np.ndarray:
+        if by not in RANK_BY:
+            raise ValueError(f"by must be one of {RANK_BY}, got {by!r}")
+        if by == "amount":
+            return self.amounts.sum(axis=0)
+        return self.held.sum(axis=0)
+
+    def ranking(
+        self,
+        top: Optional[int] = None,
+        by: str = "amount",
+        include_cash: bool = False,
+    ) -> List[StockStat]:
+        """Rank stocks across all ETFs.
+
+        Args:
+            top: Number of stocks to return (all if None)
+            by: "amount" (total evaluation amount) or "etf_count"
+            include_cash: Rank cash and deposit holdings too
+
+        Returns:
+            StockStat list, rank 1 first (ties keep first-seen order)
+
+        Raises:
+            ValueError: If by is unknown
+        """
+        key = self._rank_key(by)
+        cols = np.arange(len(self.stock_codes))
+        if not include_cash:
+            cols = cols[~self.cash]
+        order = cols[np.argsort(-key[cols], kind="stable")][:top]
+        return self._stats(order, np.arange(1, len(order) + 1))
+
+    def exposure(self, stock_code: str, by: str = "amount") -> Optional[StockStat]:
+        """Get one stock's totals and rank (among non-cash holdings).
+
+        Args:
+            stock_code: Stock code
+            by: Ranking key (see ranking())
+
+        Returns:
+            StockStat, or None if no ETF holds the stock
+        """
+        col = self._stock_pos.get(stock_code)
+        if col is None:
+            return None
+        key = self._rank_key(by)
+        rank = int(np.count_nonzero(key[~self.cash] > key[col])) + 1
+        return self._stats(np.array([col]), np.array([rank]))[0]
+
+    def cash_weights(self) -> Dict[str, float]:
+        """Cash and deposit weight (%) per ETF."""
+        cash = self.weights[:, self.cash].sum(axis=1)
+        return {code: float(cash[row]) for code, row in self._etf_pos.items()}
+
+    def _aligned(
+        self, etf_codes: List[str], stock_codes: List[str]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Weights, amounts and held mask laid out on other code lists."""
+        etf_pos = {code: i for i, code in enumerate(etf_codes)}
+        stock_pos = {code: i for i, code in enumerate(stock_codes)}
+        rows = np.array([etf_pos[c] for c in self.etf_codes], dtype=np.intp)
+        cols = np.array([stock_pos[c] for c in self.stock_codes], dtype=np.intp)
+        shape = (len(etf_codes), len(stock_codes))
+        out = (
+            np.zeros(shape),
+            np.zeros(shape, dtype=np.int64),
+            np.zeros(shape, dtype=bool),
+        )
+        for target, source in zip(out, (self.weights, self.amounts, self.held)):
+            target[np.ix_(rows, cols)] = source
+        return out
+
+    def compare(
+        self,
+        earlier: "HoldingsIndex",
+        threshold: float = WEIGHT_CHANGE_THRESHOLD,
+    ) -> List[HoldingChange]:
+        """Classify holding changes from an earlier index to this one.
+
+        An ETF missing from one side counts as holding nothing there, as in
+        SnapshotStore.diff_all().
+
+        Args:
+            earlier: Index at the start of the period
+            threshold: Smallest weight change (%p) reported as increase/decrease
+
+        Returns:
+            Changes ordered by ETF code, then stock code
+        """
+        etf_codes = sorted(set(self.etf_codes) | set(earlier.etf_codes))
+        stock_codes = sorted(set(self.stock_codes) | set(earlier.stock_codes))
+        w0, a0, h0 = earlier._aligned(etf_codes, stock_codes)
+        w1, a1, h1 = self._aligned(etf_codes, stock_codes)
+
+        both = h0 & h1
+        delta = w1 - w0
+        conditions = [
+            h1 & ~h0,
+            h0 & ~h1,
+            both & (delta > threshold),
+            both & (-delta > threshold),
+        ]
+        code = np.select(conditions, [1, 2, 3, 4], default=0)
+        statuses = ("", STATUS_NEW, STATUS_REMOVED, STATUS_INCREASE, STATUS_DECREASE)
+
+        # Gather the changed cells once, then build objects from plain lists
+        rows, cols = np.nonzero(code)
+        cells = (rows, cols)
+        names = {**earlier.stock_names, **self.stock_names}
+        return [
+            HoldingChange(
+                etf_code=etf_codes[r],
+                stock_code=stock_codes[c],
+                stock_name=names[stock_codes[c]],
+                status=statuses[k],
+                weight_before=wb,
+                weight_after=wa,
+                amount_before=ab,
+                amount_after=aa,
+            )
+            for r, c, k, wb, wa, ab, aa in zip(
+                rows.tolist(), cols.tolist(), code[cells].tolist(),
+                w0[cells].tolist(), w1[cells].tolist(),
+                a0[cells].tolist(), a1[cells].tolist(),
+            )
+        ]
+
+
+def stock_changes(changes: List[HoldingChange]) -> List[StockChange]:
+    """Group holding changes by stock and kind.
+
+    Args:
+        changes: Changes from HoldingsIndex.compare() or SnapshotStore.diff_all()
+
+    Returns:
+        StockChange list, most ETFs first, then largest absolute weight change
+    """
+    groups: Dict[Tuple[str, str], StockChange] = {}
+    for change in changes:
+        key = (change.stock_code, change.status)
+        group = groups.get(key)
+        if group is None:
+            group = groups[key] = StockChange(
+                change.stock_code, change.stock_name, change.status, 0, 0.0, 0
+            )
+        group.etf_count += 1
+        group.weight_change += change.weight_change
+        group.amount_change += change.amount_after - change.amount_before
+    return sorted(
+        groups.values(), key=lambda g: (-g.etf_count, -abs(g.weight_change))
+    )
@@ -0,0 +1,316 @@
+"""Pairwise ETF overlap and similarity.
+
+Holdings form a sparse ETF x stock weight matrix A (a few dozen stocks per
+ETF out of thousands). Every pairwise measure is a sum over the stocks two
+ETFs both hold, i.e. over the non-zero terms of the sparse product A @ A.T:
+
+- overlap: sum of min(weight_a, weight_b), in % (100 = identical portfolios)
+- jaccard: shared stocks / stocks held by either
+- cosine: dot(weights_a, weights_b) / (|weights_a| |weights_b|)
+
+The co-held pairs are generated column by column (each stock's holders
+against each other) and all three sums are accumulated in one bincount
+pass, so no ETF pair that shares nothing is ever visited. When a few ETFs
+change, only their rows and columns are recomputed.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from ..collector.constituent import EtfConstituentSummary
+from ..utils.logger import log_debug
+from .holdings import HoldingsIndex, is_cash
+
+MODULE = "stats.overlap"
+
+METRICS = ("overlap", "jaccard", "cosine")
+
+
+@dataclass
+class SimilarEtf:
+    """An ETF compared with a reference ETF."""
+
+    etf_code: str
+    overlap: float  # Sum of the smaller weight per shared stock, %
+    jaccard: float
+    cosine: float
+    shared: int  # Stocks held by both
+
+
+def _co_holdings(
+    rows: np.ndarray,
+    cols: np.ndarray,
+    weights: np.ndarray,
+    n_etfs: int,
+    left: np.ndarray,
+) -> Dict[str, np.ndarray]:
+    """Sum min, count and product of weights over co-held stocks.
+
+    Args:
+        rows: ETF position of each holding
+        cols: Stock position of each holding
+        weights: Weight of each holding
+        n_etfs: Number of ETFs
+        left: ETF positions to compute rows for
+
+    Returns:
+        {"overlap", "shared", "dot"}, each (len(left), n_etfs)
+    """
+    shape = (len(left), n_etfs)
+    if not cols.size:
+        return {
+            "overlap": np.zeros(shape),
+            "shared": np.zeros(shape, dtype=np.int64),
+            "dot": np.zeros(shape),
+        }
+    order = np.lexsort((rows, cols))
+    rows, cols, weights = rows[order], cols[order], weights[order]
+
+    # Holdings grouped by stock: every holding pairs with its whole group
+    starts = np.flatnonzero(np.r_[True, cols[1:] != cols[:-1]])
+    sizes = np.diff(np.r_[starts, cols.size])
+    group_start = np.repeat(starts, sizes)
+    group_size = np.repeat(sizes, sizes)
+
+    pos = np.full(n_etfs, -1)
+    pos[left] = np.arange(len(left))
+    first = np.flatnonzero(pos[rows] >= 0)
+    reps = group_size[first]
+    a = np.repeat(first, reps)
+    offset = np.arange(a.size) - np.repeat(np.cumsum(reps) - reps, reps)
+    b = np.repeat(group_start[first], reps) + offset
+
+    cell = pos[rows[a]] * n_etfs + rows[b]
+    size = shape[0] * shape[1]
+    wa, wb = weights[a], weights[b]
+    return {
+        "overlap": np.bincount(cell, np.minimum(wa, wb), size).reshape(shape),
+        "shared": np.bincount(cell, minlength=size).reshape(shape),
+        "dot": np.bincount(cell, wa * wb, size).reshape(shape),
+    }
+
+
+class OverlapMatrix:
+    """Pairwise overlap, Jaccard and cosine similarity between ETFs."""
+
+    def __init__(self, include_cash: bool = False):
+        """Initialize an empty matrix.
+
+        Args:
+            include_cash: Count cash and deposit lines as holdings (they
+                would make every pair of ETFs look alike)
+        """
+        self.include_cash = include_cash
+        self.etf_codes: List[str] = []
+        self._etf_pos: Dict[str, int] = {}
+        self._stock_pos: Dict[str, int] = {}
+        self._holdings: List[tuple] = []  # (stock positions, weights) per ETF
+        self._sums = {
+            "overlap": np.zeros((0, 0)),
+            "shared": np.zeros((0, 0), dtype=np.int64),
+            "dot": np.zeros((0, 0)),
+        }
+
+    @classmethod
+    def from_summaries(
+        cls, summaries: List[EtfConstituentSummary], include_cash: bool = False
+    ) -> "OverlapMatrix":
+        """Build the matrix from a collection run."""
+        matrix = cls(include_cash)
+        matrix.update(summaries)
+        return matrix
+
+    @classmethod
+    def from_index(
+        cls, index: HoldingsIndex, include_cash: bool = False
+    ) -> "OverlapMatrix":
+        """Build the matrix from a holdings index."""
+        matrix = cls(include_cash)
+        keep = index.held if include_cash else index.held & ~index.cash
+        for row, etf_code in enumerate(index.etf_codes):
+            cols = np.flatnonzero(keep[row])
+            matrix._set(
+                etf_code,
+                [index.stock_codes[c] for c in cols],
+                index.weights[row, cols].tolist(),
+            )
+        matrix._refresh(list(range(len(matrix.etf_codes))))
+        return matrix
+
+    def _set(self, etf_code: str, stock_codes: List[str], weights: List[float]) -> int:
+        """Store an ETF's holdings and return its position."""
+        cols = np.array(
+            [self._stock_pos.setdefault(c, len(self._stock_pos)) for c in stock_codes],
+            dtype=np.intp,
+        )
+        holdings = (cols, np.asarray(weights, dtype=np.float64))
+        pos = self._etf_pos.get(etf_code)
+        if pos is None:
+            pos = self._etf_pos[etf_code] = len(self.etf_codes)
+            self.etf_codes.append(etf_code)
+            self._holdings.append(holdings)
+        else:
+            self._holdings[pos] = holdings
+        return pos
+
+    def _refresh(self, changed: List[int]) -> None:
+        """Recompute the rows and columns of changed ETF positions."""
+        n = len(self.etf_codes)
+        for key, old in self._sums.items():
+            if old.shape[0] < n:
+                grown = np.zeros((n, n), dtype=old.dtype)
+                grown[: old.shape[0], : old.shape[1]] = old
+                self._sums[key] = grown
+        if not changed:
+            return
+
+        sizes = [len(cols) for cols, _ in self._holdings]
+        rows = np.repeat(np.arange(n), sizes)
+        cols = np.concatenate([c for c, _ in self._holdings]).astype(np.intp)
+        weights = np.concatenate([w for _, w in self._holdings])
+        left = np.array(sorted(set(changed)), dtype=np.intp)
+
+        block = _co_holdings(rows, cols, weights, n, left)
+        for key, values in block.items():
+            self._sums[key][left, :] = values
+            self._sums[key][:, left] = values.T
+        log_debug(MODULE, "Updated overlap", {"etfs": n, "changed": len(left)})
+
+    def update(self, summaries: List[EtfConstituentSummary]) -> None:
+        """Add ETFs or replace their holdings, recomputing only their pairs.
+
+        Args:
+            summaries: New or changed ETFs
+        """
+        changed = []
+        for summary in summaries:
+            weights = {
+                c.stock_code: c.weight
+                for c in summary.constituents
+                if self.include_cash or not is_cash(c.stock_name)
+            }
+            changed.append(
+                self._set(summary.etf_code, list(weights), list(weights.values()))
+            )
+        self._refresh(changed)
+
+    def remove(self, etf_codes: Sequence[str]) -> None:
+        """Drop ETFs from the matrix.
+
+        Args:
+            etf_codes: ETFs to drop (unknown codes are ignored)
+        """
+        drop = {self._etf_pos[c] for c in etf_codes if c in self._etf_pos}
+        if not drop:
+            return
+        keep = [i for i in range(len(self.etf_codes)) if i not in drop]
+        self.etf_codes = [self.etf_codes[i] for i in keep]
+        self._holdings = [self._holdings[i] for i in keep]
+        self._etf_pos = {code: i for i, code in enumerate(self.etf_codes)}
+        for key, values in self._sums.items():
+            self._sums[key] = values[np.ix_(keep, keep)]
+
+    def _rows(self, metric: str, rows: np.ndarray) -> np.ndarray:
+        """Compute a measure for some ETF positions against all ETFs."""
+        if metric not in METRICS:
+            raise ValueError(f"metric must be one of {METRICS}, got {metric!r}")
+        if metric == "overlap":
+            return self._sums["overlap"][rows]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if metric == "jaccard":
+                counts = np.diag(self._sums["shared"])
+                shared = self._sums["shared"][rows]
+                result = shared / (counts[rows, None] + counts[None, :] - shared)
+            else:
+                norms = np.sqrt(np.diag(self._sums["dot"]))
+                result = self._sums["dot"][rows] / np.outer(norms[rows], norms)
+        return np.nan_to_num(result)
+
+    def matrix(self, metric: str = "overlap") -> np.ndarray:
+        """Get a pairwise measure for all ETFs (etf_codes order).
+
+        Args:
+            metric: "overlap", "jaccard" or "cosine"
+
+        Returns:
+            Symmetric (n, n) matrix; the diagonal compares each ETF with
+            itself (overlap: its total weight)
+
+        Raises:
+            ValueError: If metric is unknown
+        """
+        return self._rows(metric, np.arange(len(self.etf_codes)))
+
+    def similar(
+        self, etf_code: str, top: Optional[int] = 10, by: str = "overlap"
+    ) -> List[SimilarEtf]:
+        """Find the ETFs most similar to one ETF.
+
+        Args:
+            etf_code: Reference ETF
+            top: Number of ETFs to return (all if None)
+            by: Ranking metric ("overlap", "jaccard" or "cosine")
+
+        Returns:
+            SimilarEtf list, most similar first (ETFs sharing nothing are
+            left out)
+
+        Raises:
+            KeyError: If the ETF is not in the matrix
+            ValueError: If by is unknown
+        """
+        row = np.array([self._etf_pos[etf_code]])
+        values = {metric: self._rows(metric, row)[0] for metric in METRICS}
+        if by not in values:
+            raise ValueError(f"by must be one of {METRICS}, got {by!r}")
+        shared = self._sums["shared"][row[0]]
+        candidates = np.flatnonzero(shared > 0)
+        candidates = candidates[candidates != row[0]]
+        order = candidates[np.argsort(-values[by][candidates], kind="stable")][:top]
+        return [
+            SimilarEtf(
+                etf_code=self.etf_codes[i],
+                overlap=float(values["overlap"][i]),
+                jaccard=float(values["jaccard"][i]),
+                cosine=float(values["cosine"][i]),
+                shared=int(shared[i]),
+            )
+            for i in order
+        ]
+
+    def clusters(self, threshold: float, by: str = "overlap") -> List[List[str]]:
+        """Group ETFs linked by a similarity at or above a threshold.
+
+        Single linkage: two ETFs share a cluster if a chain of pairs at or
+        above the threshold connects them.
+
+        Args:
+            threshold: Minimum similarity (overlap in %, jaccard/cosine 0-1)
+            by: Metric ("overlap", "jaccard" or "cosine")
+
+        Returns:
+            Clusters of ETF codes, largest first; ETFs linked to no other
+            ETF form clusters of one
+        """
+        n = len(self.etf_codes)
+        parent = list(range(n))
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        linked = np.triu(self.matrix(by) >= threshold, k=1)
+        for a, b in zip(*np.nonzero(linked)):
+            root_a, root_b = find(int(a)), find(int(b))
+            if root_a != root_b:
+                parent[max(root_a, root_b)] = min(root_a, root_b)
+
+        groups: Dict[int, List[str]] = {}
+        for i, etf_code in enumerate(self.etf_codes):
+            groups.setdefault(find(i), []).append(etf_code)
+        return sorted(groups.values(), key=len, reverse=True)
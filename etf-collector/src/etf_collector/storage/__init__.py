@@ -1,5 +1,14 @@
 """Data storage module."""
 
 from .data_storage import DataStorage, OutputFormat
+from .run_journal import RunJournal
+from .snapshot_store import HoldingChange, Snapshot, SnapshotStore
 
-__all__ = ["DataStorage", "OutputFormat"]
+__all__ = [
+    "DataStorage",
+    "HoldingChange",
+    "OutputFormat",
+    "RunJournal",
+    "Snapshot",
+    "SnapshotStore",
+]
@@ -5,11 +5,13 @@ This module provides secure file storage with path traversal protection.
 
 import csv
 import json
+import os
+from contextlib import contextmanager
 from dataclasses import asdict
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import IO, Any, Dict, Iterator, List, Optional
 
 from ..collector.constituent import ConstituentStock, EtfConstituentSummary
 from ..collector.etf_list import EtfInfo
@@ -29,6 +31,34 @@ class StorageError(Exception):
         self.message = message
 
 
+@contextmanager
+def atomic_write(
+    filepath: Path,
+    encoding: str = "utf-8",
+    newline: Optional[str] = None,
+) -> Iterator[IO[str]]:
+    """Open a file for writing that appears only when complete.
+
+    Writes go to a temporary file next to filepath, which replaces it after
+    the block succeeds, so a crash never leaves a truncated file behind.
+
+    Args:
+        filepath: Final file path
+        encoding: Text encoding
+        newline: Passed to open() (use "" for csv)
+    """
+    tmp = filepath.with_name(f".{filepath.name}.tmp")
+    try:
+        with open(tmp, "w", encoding=encoding, newline=newline) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, filepath)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+
 class OutputFormat(Enum):
     """Output file format."""
 
@@ -136,7 +166,7 @@ class DataStorage:
             "collected_at",
         ]
 
-        with open(filepath, "w", newline="", encoding="utf-8-sig") as f:
+        with atomic_write(filepath, encoding="utf-8-sig", newline="") as f:
             writer = csv.DictWriter(f, fieldnames=fieldnames)
             writer.writeheader()
             for etf in etfs:
@@ -152,7 +182,7 @@ class DataStorage:
             "etfs": [asdict(etf) for etf in etfs],
         }
 
-        with open(filepath, "w", encoding="utf-8") as f:
+        with atomic_write(filepath) as f:
             json.dump(data, f, ensure_ascii=False, indent=2)
 
     def save_constituents(
@@ -207,7 +237,7 @@ class DataStorage:
             "collected_at",
         ]
 
-        with open(filepath, "w", newline="", encoding="utf-8-sig") as f:
+        with atomic_write(filepath, encoding="utf-8-sig", newline="") as f:
             writer = csv.DictWriter(f, fieldnames=fieldnames)
             writer.writeheader()
             for stock in constituents:
@@ -223,7 +253,7 @@ class DataStorage:
             "constituents": [asdict(stock) for stock in constituents],
         }
 
-        with open(filepath, "w", encoding="utf-8") as f:
+        with atomic_write(filepath) as f:
             json.dump(data, f, ensure_ascii=False, indent=2)
 
     def save_full_report(
@@ -306,7 +336,7 @@ class DataStorage:
             }
             data["etfs"].append(etf_data)
 
-        with open(filepath, "w", encoding="utf-8") as f:
+        with atomic_write(filepath) as f:
             json.dump(data, f, ensure_ascii=False, indent=2)
 
     def load_etf_list(self, filepath: str) -> List[Dict[str, Any]]:
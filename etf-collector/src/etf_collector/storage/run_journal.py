@@ -0,0 +1,194 @@
+"""Run journal for resumable constituent collection.
+
+Each ETF's constituent summary is appended to a JSON Lines journal as soon
+as it is fetched, so an interrupted run (crash, network drop, Android
+process kill) can be resumed later that day. A resumed run fetches only the
+ETFs missing from the journal, then writes the report atomically.
+"""
+
+import json
+import os
+import threading
+from dataclasses import asdict
+from typing import Any, Callable, Dict, List, Optional
+
+from ..collector.constituent import (
+    ConstituentCollector,
+    ConstituentStock,
+    EtfConstituentSummary,
+)
+from ..collector.etf_list import EtfInfo
+from ..utils.helpers import today_str
+from ..utils.logger import log_info, log_warn
+from .data_storage import DataStorage, OutputFormat, atomic_write
+
+MODULE = "run_journal"
+
+
+def _summary_from_dict(data: Dict[str, Any]) -> EtfConstituentSummary:
+    """Rebuild a summary written with asdict()."""
+    constituents = [ConstituentStock(**c) for c in data["constituents"]]
+    return EtfConstituentSummary(**{**data, "constituents": constituents})
+
+
+class RunJournal:
+    """Append-only journal of one day's constituent collection run."""
+
+    def __init__(
+        self,
+        storage: DataStorage,
+        name: str = "etf_report",
+        run_date: Optional[str] = None,
+    ):
+        """Initialize run journal.
+
+        Args:
+            storage: Storage whose output directory holds the journal
+            name: Report name (the journal is {name}_{run_date}_journal.jsonl)
+            run_date: Run date YYYYMMDD (today if None)
+
+        Raises:
+            StorageError: If the journal path is invalid
+        """
+        self.storage = storage
+        self.name = name
+        self.run_date = run_date or today_str()
+        self.path = storage._validate_and_resolve_path(
+            f"{name}_{self.run_date}_journal", "jsonl"
+        )
+        self._lock = threading.Lock()
+
+    def load(self) -> Dict[str, EtfConstituentSummary]:
+        """Read the summaries recorded so far.
+
+        A line cut short by a crash is dropped and the journal rewritten
+        without it, so later appends start on a clean line.
+
+        Returns:
+            {etf_code: EtfConstituentSummary}
+        """
+        if not self.path.exists():
+            return {}
+
+        completed: Dict[str, EtfConstituentSummary] = {}
+        damaged = 0
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    summary = _summary_from_dict(json.loads(line))
+                except (ValueError, TypeError, KeyError):
+                    damaged += 1
+                    continue
+                completed[summary.etf_code] = summary
+
+        if damaged:
+            log_warn(MODULE, "Dropped damaged journal lines", {"lines": damaged})
+            with self._lock, atomic_write(self.path) as f:
+                for summary in completed.values():
+                    f.write(json.dumps(asdict(summary), ensure_ascii=False) + "\n")
+        return completed
+
+    def append(self, summary: EtfConstituentSummary) -> None:
+        """Record one ETF's summary durably.
+
+        Args:
+            summary: Fetched constituent summary
+        """
+        line = json.dumps(asdict(summary), ensure_ascii=False) + "\n"
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+
+    def remove(self) -> None:
+        """Delete the journal."""
+        with self._lock:
+            if self.path.exists():
+                self.path.unlink()
+
+    def collect(
+        self,
+        collector: ConstituentCollector,
+        etf_list: List[EtfInfo],
+        progress_callback: Optional[Callable[[int, int, str], None]] = None,
+        resume: bool = False,
+    ) -> Dict[str, Any]:
+        """Fetch constituents, journaling each ETF as it arrives.
+
+        Args:
+            collector: Constituent collector
+            etf_list: ETFs of the run
+            progress_callback: Passed to get_all_constituents() (counts only
+                the ETFs still to fetch)
+            resume: Skip ETFs already in the journal; otherwise the journal
+                is started over
+
+        Returns:
+            Same as ConstituentCollector.get_all_constituents(), with data
+            in etf_list order and "resumed" (ETFs taken from the journal)
+        """
+        if not resume:
+            self.remove()
+        completed = self.load()
+
+        codes = {etf.etf_code for etf in etf_list}
+        resumed = len(codes & completed.keys())
+        pending = [etf for etf in etf_list if etf.etf_code not in completed]
+        log_info(
+            MODULE,
+            "Collecting with journal",
+            {"journal": str(self.path), "resumed": resumed, "pending": len(pending)},
+        )
+
+        result: Dict[str, Any] = {"ok": True, "data": [], "errors": None}
+        if pending:
+            result = collector.get_all_constituents(
+                pending, progress_callback, on_result=self.append
+            )
+            if not result.get("ok") and not resumed:
+                return result
+
+        fetched = {s.etf_code: s for s in result.get("data") or []}
+        fetched.update(completed)
+        errors = result.get("errors")
+        if not result.get("ok"):
+            errors = result.get("error", {}).get("details")
+
+        return {
+            "ok": True,
+            "data": [fetched[e.etf_code] for e in etf_list if e.etf_code in fetched],
+            "errors": errors or None,
+            "resumed": resumed,
+        }
+
+    def finalize(
+        self,
+        summaries: List[EtfConstituentSummary],
+        output_format: OutputFormat = OutputFormat.JSON,
+        filter_info: Optional[Dict[str, Any]] = None,
+        keep: bool = False,
+    ) -> str:
+        """Write the report atomically and close out the run.
+
+        Args:
+            summaries: Summaries of the run (see collect())
+            output_format: Report format
+            filter_info: Filter information to include in the report
+            keep: Keep the journal (some ETFs failed and can be retried
+                with resume)
+
+        Returns:
+            Path to the report
+        """
+        filepath = self.storage.save_full_report(
+            summaries,
+            filename=self.name,
+            output_format=output_format,
+            filter_info=filter_info,
+        )
+        if not keep:
+            self.remove()
+        return filepath
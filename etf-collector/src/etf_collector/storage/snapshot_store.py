@@ -0,0 +1,473 @@
+"""Constituent snapshot history with delta encoding.
+
+Each ETF has a chain of records in {name}/{etf_code}.jsonl, one per
+collection date. A record is either a keyframe (every holding) or a delta
+from the previous record (holdings added or changed, codes removed), so the
+history grows with portfolio churn rather than with the number of days.
+A keyframe is written every keyframe_interval records, so rebuilding any
+date reads one keyframe and at most keyframe_interval - 1 deltas.
+
+Record lines (holdings are [stock_name, weight, evaluation_amount]):
+    {"date": "20251031", "full": true, "info": {...}, "set": {...}, "del": []}
+    {"date": "20251103", "full": false, "info": {"nav": 35310.2},
+     "set": {"005930": ["삼성전자", 31.4, 15700000000]}, "del": ["000660"]}
+"""
+
+import bisect
+import json
+import os
+import re
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from ..collector.constituent import EtfConstituentSummary
+from ..utils.helpers import today_str
+from ..utils.logger import log_info
+from ..utils.validators import validate_date
+from .data_storage import DataStorage, StorageError
+
+MODULE = "snapshot_store"
+
+KEYFRAME_INTERVAL = 20
+WEIGHT_CHANGE_THRESHOLD = 0.01  # Weight %p below which a holding is unchanged
+
+STATUS_NEW = "new"
+STATUS_REMOVED = "removed"
+STATUS_INCREASE = "increase"
+STATUS_DECREASE = "decrease"
+
+# ETF-level fields kept with each record (only changed ones in a delta)
+INFO_FIELDS = (
+    "etf_name",
+    "current_price",
+    "nav",
+    "total_assets",
+    "cu_unit_count",
+    "constituent_count",
+)
+
+# Record lines start with date and type, so the index never parses JSON
+_RECORD_HEAD = re.compile(rb'\{"date": "(\d{8})", "full": (true|false)')
+
+
+@dataclass(frozen=True)
+class Holding:
+    """One stock held by an ETF."""
+
+    stock_code: str
+    stock_name: str
+    weight: float  # %
+    evaluation_amount: int
+
+
+@dataclass
+class Snapshot:
+    """An ETF's holdings as of a date."""
+
+    etf_code: str
+    date: str  # Collection date of the record (YYYYMMDD)
+    info: Dict[str, Any]  # INFO_FIELDS
+    holdings: Dict[str, Holding]  # {stock_code: Holding}
+
+
+@dataclass
+class HoldingChange:
+    """A holding that changed between two dates."""
+
+    etf_code: str
+    stock_code: str
+    stock_name: str
+    status: str  # STATUS_*
+    weight_before: float
+    weight_after: float
+    amount_before: int
+    amount_after: int
+
+    @property
+    def weight_change(self) -> float:
+        """Weight change in %p."""
+        return self.weight_after - self.weight_before
+
+
+@dataclass
+class _Chain:
+    """Byte offsets of one ETF's records."""
+
+    path: Path
+    dates: List[str] = field(default_factory=list)
+    offsets: List[int] = field(default_factory=list)
+    keyframes: List[int] = field(default_factory=list)  # Record indexes
+    size: int = 0  # End of the last complete record
+    head: Optional[Tuple[Dict[str, Any], Dict[str, list]]] = None  # Last state
+
+
+def _date_key(date: str) -> str:
+    """Validate a date and return it as YYYYMMDD."""
+    is_valid, error_msg = validate_date(date)
+    if not is_valid:
+        raise StorageError(error_msg, "INVALID_DATE")
+    return date.replace("-", "")
+
+
+def _apply(record: Dict[str, Any], info: Dict[str, Any], rows: Dict[str, list]) -> None:
+    """Apply a keyframe or delta record to a state in place."""
+    if record["full"]:
+        info.clear()
+        rows.clear()
+    info.update(record["info"])
+    rows.update(record["set"])
+    for code in record["del"]:
+        rows.pop(code, None)
+
+
+def _snapshot(
+    etf_code: str, date: str, info: Dict[str, Any], rows: Dict[str, list]
+) -> Snapshot:
+    holdings = {
+        code: Holding(code, name, weight, amount)
+        for code, (name, weight, amount) in rows.items()
+    }
+    return Snapshot(etf_code, date, dict(info), holdings)
+
+
+def compare_holdings(
+    etf_code: str,
+    before: Dict[str, Holding],
+    after: Dict[str, Holding],
+    threshold: float = WEIGHT_CHANGE_THRESHOLD,
+) -> List[HoldingChange]:
+    """Classify the holdings that changed between two snapshots.
+
+    Args:
+        etf_code: ETF the holdings belong to
+        before: Holdings at the start of the period
+        after: Holdings at the end of the period
+        threshold: Smallest weight change (%p) reported as increase/decrease
+
+    Returns:
+        Changes ordered by stock code (unchanged holdings are left out)
+    """
+    changes = []
+    for code in sorted(before.keys() | after.keys()):
+        old = before.get(code)
+        new = after.get(code)
+        if old is None:
+            status = STATUS_NEW
+        elif new is None:
+            status = STATUS_REMOVED
+        elif new.weight - old.weight > threshold:
+            status = STATUS_INCREASE
+        elif old.weight - new.weight > threshold:
+            status = STATUS_DECREASE
+        else:
+            continue
+        changes.append(HoldingChange(
+            etf_code=etf_code,
+            stock_code=code,
+            stock_name=(new or old).stock_name,
+            status=status,
+            weight_before=old.weight if old else 0.0,
+            weight_after=new.weight if new else 0.0,
+            amount_before=old.evaluation_amount if old else 0,
+            amount_after=new.evaluation_amount if new else 0,
+        ))
+    return changes
+
+
+class SnapshotStore:
+    """Delta-encoded constituent history keyed by (date, ETF code)."""
+
+    def __init__(
+        self,
+        storage: DataStorage,
+        name: str = "snapshots",
+        keyframe_interval: int = KEYFRAME_INTERVAL,
+    ):
+        """Initialize snapshot store.
+
+        Args:
+            storage: Storage whose output directory holds the store
+            name: Subdirectory of the store
+            keyframe_interval: Records per keyframe (1 stores every day in full)
+
+        Raises:
+            StorageError: If the store directory is invalid
+            ValueError: If keyframe_interval < 1
+        """
+        if keyframe_interval < 1:
+            raise ValueError("keyframe_interval must be at least 1")
+        self.files = DataStorage(str(storage.output_dir / name))
+        self.keyframe_interval = keyframe_interval
+        self._chains: Dict[str, _Chain] = {}
+        self._lock = threading.Lock()
+
+    def _chain(self, etf_code: str) -> _Chain:
+        """Get an ETF's chain, indexing its file on first use."""
+        with self._lock:
+            chain = self._chains.get(etf_code)
+            if chain is None:
+                chain = _Chain(self.files._validate_and_resolve_path(etf_code, "jsonl"))
+                if chain.path.exists():
+                    self._index(chain)
+                self._chains[etf_code] = chain
+            return chain
+
+    @staticmethod
+    def _index(chain: _Chain) -> None:
+        """Record the date, type and offset of each complete line."""
+        offset = 0
+        with open(chain.path, "rb") as f:
+            for line in f:
+                match = _RECORD_HEAD.match(line)
+                if match is None or not line.endswith(b"\n"):
+                    break  # Cut short by a crash: the next write replaces it
+                if match.group(2) == b"true":
+                    chain.keyframes.append(len(chain.dates))
+                chain.dates.append(match.group(1).decode())
+                chain.offsets.append(offset)
+                offset += len(line)
+        chain.size = offset
+
+    @staticmethod
+    def _state(chain: _Chain, index: int) -> Tuple[Dict[str, Any], Dict[str, list]]:
+        """Rebuild info and holding rows as of record index."""
+        start = chain.keyframes[bisect.bisect_right(chain.keyframes, index) - 1]
+        info: Dict[str, Any] = {}
+        rows: Dict[str, list] = {}
+        with open(chain.path, "rb") as f:
+            f.seek(chain.offsets[start])
+            for _ in range(index - start + 1):
+                _apply(json.loads(f.readline()), info, rows)
+        return info, rows
+
+    def etf_codes(self) -> List[str]:
+        """ETFs with recorded history."""
+        return sorted(path.stem for path in self.files.output_dir.glob("*.jsonl"))
+
+    def dates(self, etf_code: str) -> List[str]:
+        """Collection dates recorded for an ETF, oldest first."""
+        return list(self._chain(etf_code).dates)
+
+    def put(self, summary: EtfConstituentSummary, date: Optional[str] = None) -> bool:
+        """Record an ETF's holdings for a collection date.
+
+        Recording the last date again replaces its record (the ETF was
+        collected twice that day).
+
+        Args:
+            summary: Collected constituent summary
+            date: Collection date YYYYMMDD (today if None)
+
+        Returns:
+            True if a keyframe was written, False for a delta
+
+        Raises:
+            StorageError: If the date is invalid or before the last record
+        """
+        date = _date_key(date or today_str())
+        chain = self._chain(summary.etf_code)
+
+        with self._lock:
+            if chain.dates and date < chain.dates[-1]:
+                raise StorageError(
+                    f"{summary.etf_code}: {date} is before the last snapshot "
+                    f"{chain.dates[-1]}",
+                    "OUT_OF_ORDER",
+                )
+            if chain.dates and date == chain.dates[-1]:
+                chain.size = chain.offsets.pop()
+                chain.dates.pop()
+                if chain.keyframes and chain.keyframes[-1] == len(chain.dates):
+                    chain.keyframes.pop()
+                chain.head = None
+
+            count = len(chain.dates)
+            if chain.head is None:
+                chain.head = self._state(chain, count - 1) if count else ({}, {})
+            prev_info, prev_rows = chain.head
+
+            info = {name: getattr(summary, name) for name in INFO_FIELDS}
+            rows = {
+                c.stock_code: [c.stock_name, c.weight, c.evaluation_amount]
+                for c in summary.constituents
+            }
+            full = not count or count - chain.keyframes[-1] >= self.keyframe_interval
+            if full:
+                record = {
+                    "date": date, "full": True, "info": info, "set": rows, "del": [],
+                }
+            else:
+                record = {
+                    "date": date,
+                    "full": False,
+                    "info": {k: v for k, v in info.items() if prev_info.get(k) != v},
+                    "set": {c: r for c, r in rows.items() if prev_rows.get(c) != r},
+                    "del": [c for c in prev_rows if c not in rows],
+                }
+
+            line = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+            with open(chain.path, "r+b" if chain.path.exists() else "wb") as f:
+                f.seek(chain.size)
+                f.write(line)
+                f.truncate()
+                f.flush()
+                os.fsync(f.fileno())
+
+            if full:
+                chain.keyframes.append(count)
+            chain.dates.append(date)
+            chain.offsets.append(chain.size)
+            chain.size += len(line)
+            chain.head = (info, rows)
+        return full
+
+    def record(
+        self,
+        summaries: List[EtfConstituentSummary],
+        date: Optional[str] = None,
+    ) -> Dict[str, int]:
+        """Record a collection run.
+
+        Args:
+            summaries: Collected constituent summaries
+            date: Collection date YYYYMMDD (today if None)
+
+        Returns:
+            {"etfs": N, "keyframes": N}
+
+        Raises:
+            StorageError: If the date is invalid or before an ETF's last record
+        """
+        date = _date_key(date or today_str())
+        keyframes = sum(self.put(summary, date) for summary in summaries)
+        log_info(
+            MODULE,
+            "Recorded snapshots",
+            {"date": date, "etfs": len(summaries), "keyframes": keyframes},
+        )
+        return {"etfs": len(summaries), "keyframes": keyframes}
+
+    def snapshot(self, etf_code: str, date: str) -> Optional[Snapshot]:
+        """Get an ETF's holdings as of a date.
+
+        Args:
+            etf_code: ETF code
+            date: Date YYYYMMDD; the latest record on or before it is used
+
+        Returns:
+            Snapshot, or None if nothing was recorded by that date
+        """
+        chain = self._chain(etf_code)
+        index = bisect.bisect_right(chain.dates, _date_key(date)) - 1
+        if index < 0:
+            return None
+        info, rows = self._state(chain, index)
+        return _snapshot(etf_code, chain.dates[index], info, rows)
+
+    def snapshots(
+        self, date: str, etf_codes: Optional[List[str]] = None
+    ) -> Dict[str, Snapshot]:
+        """Get the holdings of several ETFs as of a date.
+
+        Args:
+            date: Date YYYYMMDD
+            etf_codes: ETFs to read (all recorded ETFs if None)
+
+        Returns:
+            {etf_code: Snapshot} for the ETFs recorded by that date
+        """
+        result = {}
+        for etf_code in etf_codes if etf_codes is not None else self.etf_codes():
+            snapshot = self.snapshot(etf_code, date)
+            if snapshot is not None:
+                result[etf_code] = snapshot
+        return result
+
+    def history(
+        self,
+        etf_code: str,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+    ) -> Iterator[Snapshot]:
+        """Iterate over an ETF's recorded snapshots in a date range.
+
+        Deltas are applied in one forward pass, so a long range costs one
+        read of the file.
+
+        Args:
+            etf_code: ETF code
+            start: First date YYYYMMDD (inclusive, first record if None)
+            end: Last date YYYYMMDD (inclusive, last record if None)
+
+        Yields:
+            Snapshot per recorded date, oldest first
+        """
+        chain = self._chain(etf_code)
+        dates = list(chain.dates)
+        first = bisect.bisect_left(dates, _date_key(start)) if start else 0
+        last = bisect.bisect_right(dates, _date_key(end)) - 1 if end else len(dates) - 1
+        if first > last:
+            return
+
+        index = chain.keyframes[bisect.bisect_right(chain.keyframes, first) - 1]
+        info: Dict[str, Any] = {}
+        rows: Dict[str, list] = {}
+        with open(chain.path, "rb") as f:
+            f.seek(chain.offsets[index])
+            while index <= last:
+                _apply(json.loads(f.readline()), info, rows)
+                if index >= first:
+                    yield _snapshot(etf_code, dates[index], info, rows)
+                index += 1
+
+    def diff(
+        self,
+        etf_code: str,
+        start: str,
+        end: str,
+        threshold: float = WEIGHT_CHANGE_THRESHOLD,
+    ) -> List[HoldingChange]:
+        """Compare an ETF's holdings as of two dates.
+
+        Args:
+            etf_code: ETF code
+            start: Start of the period YYYYMMDD
+            end: End of the period YYYYMMDD
+            threshold: Smallest weight change (%p) reported as increase/decrease
+
+        Returns:
+            Changes ordered by stock code (see compare_holdings())
+        """
+        before = self.snapshot(etf_code, start)
+        after = self.snapshot(etf_code, end)
+        return compare_holdings(
+            etf_code,
+            before.holdings if before else {},
+            after.holdings if after else {},
+            threshold,
+        )
+
+    def diff_all(
+        self,
+        start: str,
+        end: str,
+        etf_codes: Optional[List[str]] = None,
+        threshold: float = WEIGHT_CHANGE_THRESHOLD,
+    ) -> List[HoldingChange]:
+        """Compare the holdings of several ETFs as of two dates.
+
+        Args:
+            start: Start of the period YYYYMMDD
+            end: End of the period YYYYMMDD
+            etf_codes: ETFs to compare (all recorded ETFs if None)
+            threshold: Smallest weight change (%p) reported as increase/decrease
+
+        Returns:
+            Changes ordered by ETF code, then stock code
+        """
+        changes = []
+        for etf_code in etf_codes if etf_codes is not None else self.etf_codes():
+            changes.extend(self.diff(etf_code, start, end, threshold))
+        return changes
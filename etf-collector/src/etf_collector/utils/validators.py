@@ -18,7 +18,7 @@ DATE_COMPACT_PATTERN = re.compile(r"^\d{8}$")
 DANGEROUS_PATH_PATTERNS = ["..", "~", "/etc", "/var", "/tmp", "C:\\Windows", "C:\\System"]
 
 # Allowed file extensions for storage
-ALLOWED_EXTENSIONS = {".json", ".csv"}
+ALLOWED_EXTENSIONS = {".json", ".csv", ".jsonl"}
 
 
 class ValidationError(Exception):
@@ -0,0 +1,74 @@
+"""Collectors against the local mock Kiwoom/KIS server (no network needed).
+
+The mock server lives in the sibling stock-analyzer package
+(``stock_analyzer.client.mock_server``). These tests are skipped unless it
+is installed in the same environment, e.g.
+``uv pip install -e ../stock-analyzer``.
+"""
+
+import pytest
+
+from etf_collector.auth.kis_auth import KisAuthClient
+from etf_collector.auth.kiwoom_auth import KiwoomAuthClient
+from etf_collector.collector.constituent import ConstituentCollector
+from etf_collector.collector.kiwoom_etf_list import KiwoomEtfListCollector
+from etf_collector.limiter.rate_limiter import (
+    RateLimiterConfig,
+    SlidingWindowRateLimiter,
+)
+
+mock_server = pytest.importorskip("stock_analyzer.client.mock_server")
+
+
+def _limiter():
+    return SlidingWindowRateLimiter(RateLimiterConfig(requests_per_second=1000))
+
+
+@pytest.fixture
+def server():
+    config = mock_server.MockConfig(etfs=12, constituents=8, error_rate=0.2, seed=7)
+    with mock_server.MockServer(config) as server:
+        yield server
+
+
+def test_etf_list_then_constituents(server):
+    """Fetch the ETF list and every ETF's constituents offline."""
+    kiwoom = KiwoomAuthClient("key", "secret", server.url)
+    etf_result = KiwoomEtfListCollector(kiwoom, _limiter(), server.url).get_all_etfs()
+    # Injected 429s surface as HTTP errors, which the collector retries
+    assert etf_result["ok"], etf_result.get("error")
+    etfs = etf_result["data"]
+    assert len(etfs) == 12
+
+    kis = KisAuthClient("key", "secret", server.url)
+    collector = ConstituentCollector(kis, _limiter(), server.url)
+    collector.retry_delay = 0
+    result = collector.get_all_constituents(etfs)
+
+    assert result["ok"]
+    assert len(result["data"]) == 12
+    assert all(len(s.constituents) == 8 for s in result["data"])
+    assert server.stats()["FHKST121600C0"] >= 12
+
+
+def test_concurrent_constituents(server):
+    """A thread-pool sweep returns the same ETFs in the same order."""
+    kiwoom = KiwoomAuthClient("key", "secret", server.url)
+    etfs = KiwoomEtfListCollector(kiwoom, _limiter(), server.url).get_all_etfs()["data"]
+
+    kis = KisAuthClient("key", "secret", server.url)
+    collector = ConstituentCollector(kis, _limiter(), server.url, max_workers=4)
+    collector.retry_delay = 0
+    try:
+        result = collector.get_all_constituents(etfs)
+    finally:
+        collector.close()
+
+    # Which ETFs exhaust their retries on injected errors depends on thread
+    # timing; the rest must come back in list order
+    assert result["ok"]
+    failed = {e["etf_code"] for e in result["errors"] or []}
+    assert len(result["data"]) + len(failed) == len(etfs)
+    assert [s.etf_code for s in result["data"]] == [
+        e.etf_code for e in etfs if e.etf_code not in failed
+    ]
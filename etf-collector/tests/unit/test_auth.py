@@ -1,11 +1,15 @@
 """Tests for KIS authentication module."""
 
+import threading
+import time
 from datetime import datetime, timedelta
 from unittest.mock import Mock, patch
 
 import pytest
 
 from etf_collector.auth.kis_auth import KisAuthClient, TokenInfo, AuthError
+from etf_collector.auth.kiwoom_auth import KiwoomAuthClient
+from etf_collector.auth.token_cache import TokenCache
 
 
 class TestTokenInfo:
@@ -179,3 +183,190 @@ class TestKisAuthClient:
             # Get token again should fetch new one
             client.get_token()
             assert mock_post.call_count == 2
+
+
+def _fresh_tokens(mock_post, response, field, delay=0.0):
+    """Make requests.post return a new token on every call."""
+    calls = []
+
+    def post(*args, **kwargs):
+        calls.append(1)
+        time.sleep(delay)
+        resp = Mock()
+        resp.json.return_value = dict(response, **{field: f"token_{len(calls)}"})
+        resp.raise_for_status = Mock()
+        return resp
+
+    mock_post.side_effect = post
+    return calls
+
+
+class TestTokenCache:
+    """Tests for TokenCache."""
+
+    def test_store_and_load(self, tmp_path):
+        """Test stored token is readable by the owner only."""
+        cache = TokenCache(str(tmp_path))
+        name = TokenCache.key("https://api.test.com", "app_key")
+        cache.store(name, {"access_token": "abc"}, time.time() + 60)
+
+        assert cache.load(name) == {"access_token": "abc"}
+        assert (tmp_path / name).stat().st_mode & 0o777 == 0o600
+
+    def test_expired(self, tmp_path):
+        """Test expired token is not returned."""
+        now = [1000.0]
+        cache = TokenCache(str(tmp_path), clock=lambda: now[0])
+        cache.store("t.json", {"access_token": "abc"}, 1060.0)
+        now[0] = 1061.0
+
+        assert cache.load("t.json") is None
+
+    def test_corrupt_file(self, tmp_path):
+        """Test unreadable file is treated as missing."""
+        (tmp_path / "t.json").write_text("{oops")
+        assert TokenCache(str(tmp_path)).load("t.json") is None
+
+    def test_get_or_fetch(self, tmp_path):
+        """Test a stored token is reused until the caller rejects it."""
+        cache = TokenCache(str(tmp_path))
+        fetch = Mock(side_effect=["new", "newer"])
+
+        def call(accept):
+            return cache.get_or_fetch(
+                "t.json",
+                fetch,
+                decode=lambda entry: entry["access_token"],
+                encode=lambda token: ({"access_token": token}, time.time() + 60),
+                accept=accept,
+            )
+
+        assert call(lambda token: True) == "new"
+        assert call(lambda token: True) == "new"
+        assert call(lambda token: token != "new") == "newer"
+        assert cache.load("t.json") == {"access_token": "newer"}
+        assert fetch.call_count == 2
+
+
+class TestKisAuthClientTokenCache:
+    """Tests for KisAuthClient with a persistent token cache."""
+
+    @patch("etf_collector.auth.kis_auth.requests.post")
+    def test_restart_reuses_token(self, mock_post, mock_kis_token_response, tmp_path):
+        """Test a new client (process restart) does not issue a new token."""
+        calls = _fresh_tokens(mock_post, mock_kis_token_response, "access_token")
+
+        first = KisAuthClient(
+            "app_key", "app_secret", "https://api.test.com",
+            token_cache=TokenCache(str(tmp_path)),
+        ).get_token()
+        second = KisAuthClient(
+            "app_key", "app_secret", "https://api.test.com",
+            token_cache=TokenCache(str(tmp_path)),
+        ).get_token()
+
+        assert len(calls) == 1
+        assert second.access_token == first.access_token
+        assert second.expires_at == first.expires_at
+
+    @patch("etf_collector.auth.kis_auth.requests.post")
+    def test_force_refresh_skips_rejected_token(
+        self, mock_post, mock_kis_token_response, tmp_path
+    ):
+        """Test force refresh issues a token even if the stored one is valid."""
+        calls = _fresh_tokens(mock_post, mock_kis_token_response, "access_token")
+        client = KisAuthClient(
+            "app_key", "app_secret", "https://api.test.com",
+            token_cache=TokenCache(str(tmp_path)),
+        )
+
+        client.get_token()
+        token = client.get_token(force_refresh=True)
+
+        assert len(calls) == 2
+        assert token.access_token == "token_2"
+
+    @patch("etf_collector.auth.kis_auth.requests.post")
+    def test_concurrent_refresh_single_flight(
+        self, mock_post, mock_kis_token_response, tmp_path
+    ):
+        """Test concurrent threads share one token request."""
+        calls = _fresh_tokens(
+            mock_post, mock_kis_token_response, "access_token", delay=0.05
+        )
+        client = KisAuthClient(
+            "app_key", "app_secret", "https://api.test.com",
+            token_cache=TokenCache(str(tmp_path)),
+        )
+        tokens = []
+
+        threads = [
+            threading.Thread(target=lambda: tokens.append(client.get_token()))
+            for _ in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(calls) == 1
+        assert {t.access_token for t in tokens} == {"token_1"}
+
+    @patch("etf_collector.auth.kis_auth.requests.post")
+    def test_clear_token_removes_file(
+        self, mock_post, mock_kis_token_response, tmp_path
+    ):
+        """Test clear_token also drops the stored token."""
+        calls = _fresh_tokens(mock_post, mock_kis_token_response, "access_token")
+        cache = TokenCache(str(tmp_path))
+        client = KisAuthClient(
+            "app_key", "app_secret", "https://api.test.com", token_cache=cache
+        )
+
+        client.get_token()
+        client.clear_token()
+        client.get_token()
+
+        assert len(calls) == 2
+
+
+class TestKiwoomAuthClientTokenCache:
+    """Tests for KiwoomAuthClient with a persistent token cache."""
+
+    RESPONSE = {
+        "return_code": 0,
+        "token": "",
+        "token_type": "bearer",
+        "expires_dt": (datetime.now() + timedelta(hours=12)).strftime("%Y%m%d%H%M%S"),
+    }
+
+    @patch("etf_collector.auth.kiwoom_auth.requests.post")
+    def test_restart_reuses_token(self, mock_post, tmp_path):
+        """Test a new client (process restart) does not issue a new token."""
+        calls = _fresh_tokens(mock_post, self.RESPONSE, "token")
+
+        first = KiwoomAuthClient(
+            "app_key", "secret", "https://api.test.com",
+            token_cache=TokenCache(str(tmp_path)),
+        ).get_token()
+        second = KiwoomAuthClient(
+            "app_key", "secret", "https://api.test.com",
+            token_cache=TokenCache(str(tmp_path)),
+        ).get_token()
+
+        assert len(calls) == 1
+        assert second.token == first.token
+        assert second.expires_dt == first.expires_dt
+
+    @patch("etf_collector.auth.kiwoom_auth.requests.post")
+    def test_accounts_do_not_share_tokens(self, mock_post, tmp_path):
+        """Test different app keys get their own tokens."""
+        calls = _fresh_tokens(mock_post, self.RESPONSE, "token")
+        cache = TokenCache(str(tmp_path))
+
+        url = "https://api.test.com"
+        a = KiwoomAuthClient("key_a", "secret", url, token_cache=cache)
+        b = KiwoomAuthClient("key_b", "secret", url, token_cache=cache)
+
+        assert a.get_token().token != b.get_token().token
+        assert len(calls) == 2
@@ -184,7 +184,7 @@ class TestConstituentCollector:
         self.mock_limiter = Mock()
         self.mock_limiter.wait_if_needed = Mock()
 
-    @patch("etf_collector.collector.constituent.requests.get")
+    @patch("etf_collector.collector.constituent.requests.Session.get")
     def test_get_constituents_success(self, mock_get, mock_constituent_response):
         """Test successful constituent fetch."""
         mock_resp = Mock()
@@ -205,7 +205,7 @@ class TestConstituentCollector:
         assert len(summary.constituents) == 3
         assert summary.nav == 35248.50
 
-    @patch("etf_collector.collector.constituent.requests.get")
+    @patch("etf_collector.collector.constituent.requests.Session.get")
     def test_get_constituents_parses_output1(self, mock_get, mock_constituent_response):
         """Test output1 parsing."""
         mock_resp = Mock()
@@ -224,7 +224,7 @@ class TestConstituentCollector:
         assert summary.total_assets == 58234500000000
         assert summary.constituent_count == 200
 
-    @patch("etf_collector.collector.constituent.requests.get")
+    @patch("etf_collector.collector.constituent.requests.Session.get")
     def test_get_constituents_parses_output2(self, mock_get, mock_constituent_response):
         """Test output2 parsing."""
         mock_resp = Mock()
@@ -245,7 +245,7 @@ class TestConstituentCollector:
         assert samsung.current_price == 71500
         assert samsung.weight == 31.25
 
-    @patch("etf_collector.collector.constituent.requests.get")
+    @patch("etf_collector.collector.constituent.requests.Session.get")
     def test_get_all_constituents(self, mock_get, mock_constituent_response, sample_etf_infos):
         """Test fetching constituents for multiple ETFs."""
         mock_resp = Mock()
@@ -264,7 +264,7 @@ class TestConstituentCollector:
         assert result["ok"] is True
         assert len(result["data"]) == 2
 
-    @patch("etf_collector.collector.constituent.requests.get")
+    @patch("etf_collector.collector.constituent.requests.Session.get")
     def test_get_all_constituents_with_callback(self, mock_get, mock_constituent_response, sample_etf_infos):
         """Test progress callback is called."""
         mock_resp = Mock()
@@ -287,3 +287,103 @@ class TestConstituentCollector:
         assert len(callback_calls) == 2
         assert callback_calls[0] == (1, 2, "KODEX 200")
         assert callback_calls[1] == (2, 2, "KODEX 200 액티브")
+
+    @patch("etf_collector.collector.constituent.requests.Session.get")
+    def test_get_all_constituents_concurrent_keeps_order(
+        self, mock_get, mock_constituent_response, sample_etf_infos
+    ):
+        """Test concurrent fetch returns results in ETF list order."""
+        import threading
+        import time
+
+        order = {etf.etf_code: i for i, etf in enumerate(sample_etf_infos)}
+        threads = set()
+
+        def respond(url, params=None, **kwargs):
+            threads.add(threading.get_ident())
+            # Earlier ETFs answer later so completion order is reversed
+            time.sleep(0.02 * (len(order) - order[params["FID_INPUT_ISCD"]]))
+            resp = Mock()
+            resp.json.return_value = mock_constituent_response
+            return resp
+
+        mock_get.side_effect = respond
+        collector = ConstituentCollector(
+            self.mock_auth, self.mock_limiter, "https://api.test.com", max_workers=4
+        )
+
+        callback_calls = []
+        result = collector.get_all_constituents(
+            sample_etf_infos,
+            progress_callback=lambda *args: callback_calls.append(args),
+        )
+
+        assert result["ok"] is True
+        assert [s.etf_code for s in result["data"]] == [
+            etf.etf_code for etf in sample_etf_infos
+        ]
+        assert len(threads) > 1
+        assert self.mock_limiter.wait_if_needed.call_count == len(sample_etf_infos)
+        # Progress counts up as fetches complete
+        assert [call[0] for call in callback_calls] == list(
+            range(1, len(sample_etf_infos) + 1)
+        )
+        assert callback_calls[-1][2] == sample_etf_infos[0].etf_name
+
+    @patch("etf_collector.collector.constituent.requests.Session.get")
+    def test_get_all_constituents_concurrent_errors(
+        self, mock_get, mock_constituent_response, mock_error_response, sample_etf_infos
+    ):
+        """Test failed ETFs are reported while the others succeed."""
+        def respond(url, params=None, **kwargs):
+            resp = Mock()
+            if params["FID_INPUT_ISCD"] == sample_etf_infos[1].etf_code:
+                resp.json.return_value = {
+                    "rt_cd": "1",
+                    "msg_cd": "OPSW0009",
+                    "msg1": "x",
+                }
+            else:
+                resp.json.return_value = mock_constituent_response
+            return resp
+
+        mock_get.side_effect = respond
+        collector = ConstituentCollector(
+            self.mock_auth, self.mock_limiter, "https://api.test.com", max_workers=3
+        )
+        import threading
+
+        delivered = []
+        result = collector.get_all_constituents(
+            sample_etf_infos[:3],
+            on_result=lambda s: delivered.append((s.etf_code, threading.get_ident())),
+        )
+
+        assert result["ok"] is True
+        assert len(result["data"]) == 2
+        assert result["errors"][0]["etf_code"] == sample_etf_infos[1].etf_code
+        # Successes only, delivered on the calling thread
+        assert sorted(code for code, _ in delivered) == sorted(
+            s.etf_code for s in result["data"]
+        )
+        assert {ident for _, ident in delivered} == {threading.get_ident()}
+
+    @patch("etf_collector.collector.constituent.requests.Session.get")
+    def test_rate_limit_defers_shared_limiter(
+        self, mock_get, mock_constituent_response, mock_error_response
+    ):
+        """Test EGW00201 backs off through the shared limiter, not a sleep."""
+        limited = Mock()
+        limited.json.return_value = mock_error_response
+        ok = Mock()
+        ok.json.return_value = mock_constituent_response
+        mock_get.side_effect = [limited, ok]
+
+        collector = ConstituentCollector(
+            self.mock_auth, self.mock_limiter, "https://api.test.com"
+        )
+        result = collector.get_constituents("069500")
+
+        assert result["ok"] is True
+        self.mock_limiter.defer.assert_called_once_with(collector.retry_delay)
+        assert self.mock_limiter.wait_if_needed.call_count == 2
@@ -0,0 +1,118 @@
+"""Tests for ETF overlap and similarity."""
+
+import math
+import random
+
+import numpy as np
+import pytest
+
+from etf_collector.stats.holdings import HoldingsIndex
+from etf_collector.stats.overlap import OverlapMatrix
+
+from .test_stats import _summary
+
+
+def _random_run(rng: random.Random, n_etfs: int = 12) -> list:
+    universe = [f"{i:06d}" for i in range(60)]
+    return [
+        _summary(f"{400000 + e:06d}", {
+            code: (round(rng.random() * 10, 2), 0) for code in rng.sample(universe, 15)
+        })
+        for e in range(n_etfs)
+    ]
+
+
+def _pair(a: dict, b: dict) -> tuple:
+    """Overlap, Jaccard and cosine of two {stock_code: weight} dicts."""
+    shared = a.keys() & b.keys()
+    overlap = sum(min(a[s], b[s]) for s in shared)
+    jaccard = len(shared) / len(a.keys() | b.keys())
+    dot = sum(a[s] * b[s] for s in shared)
+    norm = math.sqrt(sum(w * w for w in a.values()) * sum(w * w for w in b.values()))
+    return overlap, jaccard, dot / norm
+
+
+def _weights(summary) -> dict:
+    return {c.stock_code: c.weight for c in summary.constituents}
+
+
+class TestOverlapMatrix:
+    def test_matches_pairwise_definition(self):
+        run = _random_run(random.Random(5))
+        matrix = OverlapMatrix.from_summaries(run)
+
+        overlap = matrix.matrix("overlap")
+        jaccard = matrix.matrix("jaccard")
+        cosine = matrix.matrix("cosine")
+        for i, a in enumerate(run):
+            for j, b in enumerate(run):
+                expected = _pair(_weights(a), _weights(b))
+                assert overlap[i, j] == pytest.approx(expected[0])
+                assert jaccard[i, j] == pytest.approx(expected[1])
+                assert cosine[i, j] == pytest.approx(expected[2])
+        with pytest.raises(ValueError):
+            matrix.matrix("euclidean")
+
+    def test_incremental_update_matches_rebuild(self):
+        rng = random.Random(11)
+        run = _random_run(rng)
+        matrix = OverlapMatrix.from_summaries(run)
+
+        changed = _random_run(rng, n_etfs=14)
+        updates = [changed[2], changed[7], changed[12], changed[13]]  # 2 new ETFs
+        matrix.update(updates)
+        run[2], run[7] = changed[2], changed[7]
+        rebuilt = OverlapMatrix.from_summaries(run + changed[12:])
+
+        assert matrix.etf_codes == rebuilt.etf_codes
+        for metric in ("overlap", "jaccard", "cosine"):
+            np.testing.assert_allclose(matrix.matrix(metric), rebuilt.matrix(metric))
+
+        matrix.remove([run[0].etf_code, "999999"])
+        rebuilt = OverlapMatrix.from_summaries(run[1:] + changed[12:])
+        assert matrix.etf_codes == rebuilt.etf_codes
+        np.testing.assert_allclose(matrix.matrix("overlap"), rebuilt.matrix("overlap"))
+
+    def test_similar(self):
+        matrix = OverlapMatrix.from_summaries([
+            _summary("069500", {"005930": (30.0, 0), "000660": (10.0, 0),
+                                "035420": (5.0, 0)}),
+            _summary("102110", {"005930": (25.0, 0), "000660": (12.0, 0)}),
+            _summary("229200", {"035420": (40.0, 0)}),
+            _summary("305720", {"373220": (20.0, 0)}),
+        ])
+
+        similar = matrix.similar("069500")
+        assert [s.etf_code for s in similar] == ["102110", "229200"]
+        assert similar[0].overlap == pytest.approx(35.0)
+        assert similar[0].shared == 2
+        assert similar[0].jaccard == pytest.approx(2 / 3)
+        assert [s.etf_code for s in matrix.similar("069500", top=1)] == ["102110"]
+        assert matrix.similar("305720") == []
+        with pytest.raises(KeyError):
+            matrix.similar("999999")
+
+    def test_cash_excluded(self):
+        run = [
+            _summary("069500", {"005930": (30.0, 0), "KRW000": (5.0, 0)}),
+            _summary("229200", {"035420": (40.0, 0), "KRW000": (3.0, 0)}),
+        ]
+        assert OverlapMatrix.from_summaries(run).similar("069500") == []
+        with_cash = OverlapMatrix.from_summaries(run, include_cash=True)
+        assert with_cash.similar("069500")[0].overlap == pytest.approx(3.0)
+
+        from_index = OverlapMatrix.from_index(HoldingsIndex.from_summaries(run))
+        np.testing.assert_allclose(
+            from_index.matrix("overlap"),
+            OverlapMatrix.from_summaries(run).matrix("overlap"),
+        )
+
+    def test_clusters(self):
+        matrix = OverlapMatrix.from_summaries([
+            _summary("A00001", {"005930": (50.0, 0), "000660": (50.0, 0)}),
+            _summary("A00002", {"005930": (45.0, 0), "000660": (40.0, 0)}),
+            _summary("A00003", {"000660": (60.0, 0), "035420": (40.0, 0)}),
+            _summary("A00004", {"373220": (100.0, 0)}),
+        ])
+        assert matrix.clusters(50.0) == [["A00001", "A00002", "A00003"], ["A00004"]]
+        assert matrix.clusters(80.0) == [["A00001", "A00002"], ["A00003"], ["A00004"]]
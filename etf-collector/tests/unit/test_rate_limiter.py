@@ -157,6 +157,23 @@ class TestSlidingWindowRateLimiter:
         assert wait > 0.0
         assert wait <= 1.0
 
+    def test_defer(self):
+        """Test defer() holds back every caller."""
+        config = RateLimiterConfig(requests_per_second=100.0)
+        limiter = SlidingWindowRateLimiter(config)
+
+        limiter.defer(0.2)
+        assert limiter.try_acquire() is False
+        assert 0.1 < limiter.wait_time() <= 0.2
+
+        start = time.time()
+        limiter.acquire()
+        assert time.time() - start >= 0.15
+
+        limiter.defer(10.0)
+        limiter.reset()
+        assert limiter.try_acquire() is True
+
     def test_thread_safety(self):
         """Test thread-safe operation."""
         config = RateLimiterConfig(requests_per_second=10.0)
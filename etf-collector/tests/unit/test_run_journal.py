@@ -0,0 +1,165 @@
+"""Tests for the resumable run journal."""
+
+import json
+
+import pytest
+
+from etf_collector.collector.constituent import ConstituentStock, EtfConstituentSummary
+from etf_collector.storage.data_storage import DataStorage, atomic_write
+from etf_collector.storage.run_journal import RunJournal
+
+
+def _summary(etf_code: str, etf_name: str = "") -> EtfConstituentSummary:
+    stock = ConstituentStock(
+        etf_code=etf_code,
+        etf_name=etf_name,
+        stock_code="005930",
+        stock_name="삼성전자",
+        current_price=71500,
+        price_change=500,
+        price_change_sign="2",
+        price_change_rate=0.70,
+        volume=15000000,
+        trading_value=1072500000000,
+        market_cap=427000000000000,
+        weight=31.25,
+        evaluation_amount=15625000000,
+    )
+    return EtfConstituentSummary(
+        etf_code=etf_code,
+        etf_name=etf_name,
+        current_price=35250,
+        price_change=500,
+        price_change_rate=1.44,
+        nav=35248.5,
+        total_assets=58234500000000,
+        cu_unit_count=50000,
+        constituent_count=1,
+        constituents=[stock],
+    )
+
+
+class FakeCollector:
+    """Fetches every ETF except those in ``fail``; stops after ``crash_after``."""
+
+    def __init__(self, fail=(), crash_after=None):
+        self.fail = set(fail)
+        self.crash_after = crash_after
+        self.requested = []
+
+    def get_all_constituents(self, etf_list, progress_callback=None, on_result=None):
+        self.requested.append([etf.etf_code for etf in etf_list])
+        data, errors = [], []
+        for etf in etf_list:
+            if self.crash_after is not None and len(data) == self.crash_after:
+                raise KeyboardInterrupt
+            if etf.etf_code in self.fail:
+                error = {"code": "HTTP_ERROR"}
+                errors.append({"etf_code": etf.etf_code, "error": error})
+                continue
+            summary = _summary(etf.etf_code, etf.etf_name)
+            on_result(summary)
+            data.append(summary)
+        if not data:
+            return {"ok": False, "error": {"code": "ALL_FAILED", "details": errors}}
+        return {"ok": True, "data": data, "errors": errors or None}
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return DataStorage(str(tmp_path / "data"))
+
+
+class TestRunJournal:
+    def test_append_and_load(self, storage):
+        journal = RunJournal(storage, run_date="20251031")
+        assert journal.path.name == "etf_report_20251031_journal.jsonl"
+        assert journal.load() == {}
+
+        kodex = _summary("069500", "KODEX 200")
+        journal.append(kodex)
+        journal.append(_summary("102110", "TIGER 200"))
+
+        loaded = RunJournal(storage, run_date="20251031").load()
+        assert list(loaded) == ["069500", "102110"]
+        assert loaded["069500"] == kodex
+
+    def test_damaged_tail_is_dropped(self, storage):
+        journal = RunJournal(storage, run_date="20251031")
+        journal.append(_summary("069500"))
+        with open(journal.path, "a", encoding="utf-8") as f:
+            f.write('{"etf_code": "1021')  # Killed mid-write
+
+        assert list(journal.load()) == ["069500"]
+        journal.append(_summary("102110"))
+        assert list(journal.load()) == ["069500", "102110"]
+
+    def test_resume_fetches_only_missing(self, storage, sample_etf_infos):
+        codes = [etf.etf_code for etf in sample_etf_infos]
+        journal = RunJournal(storage)
+
+        with pytest.raises(KeyboardInterrupt):
+            journal.collect(FakeCollector(crash_after=2), sample_etf_infos)
+        assert list(journal.load()) == codes[:2]
+
+        collector = FakeCollector()
+        result = journal.collect(collector, sample_etf_infos, resume=True)
+
+        assert collector.requested == [codes[2:]]
+        assert result["ok"] is True
+        assert result["resumed"] == 2
+        assert [s.etf_code for s in result["data"]] == codes
+
+    def test_without_resume_starts_over(self, storage, sample_etf_infos):
+        journal = RunJournal(storage)
+        journal.append(_summary(sample_etf_infos[0].etf_code))
+
+        collector = FakeCollector()
+        result = journal.collect(collector, sample_etf_infos)
+
+        assert collector.requested == [[etf.etf_code for etf in sample_etf_infos]]
+        assert result["resumed"] == 0
+
+    def test_failures_on_resume(self, storage, sample_etf_infos):
+        journal = RunJournal(storage)
+        journal.append(_summary(sample_etf_infos[0].etf_code))
+        failing = [etf.etf_code for etf in sample_etf_infos[1:]]
+
+        collector = FakeCollector(fail=failing)
+        result = journal.collect(collector, sample_etf_infos, resume=True)
+
+        # Nothing new succeeded, but the journaled ETF still makes a report
+        assert result["ok"] is True
+        assert len(result["data"]) == 1
+        assert [e["etf_code"] for e in result["errors"]] == failing
+
+    def test_finalize(self, storage, sample_etf_infos):
+        journal = RunJournal(storage)
+        result = journal.collect(FakeCollector(), sample_etf_infos)
+
+        path = journal.finalize(result["data"], keep=True)
+        assert journal.path.exists()
+        with open(path, encoding="utf-8") as f:
+            info = json.load(f)["collection_info"]
+        assert info["total_etfs"] == len(sample_etf_infos)
+
+        journal.finalize(result["data"])
+        assert not journal.path.exists()
+
+
+class TestAtomicWrite:
+    def test_failure_leaves_nothing(self, storage):
+        target = storage.output_dir / "report.json"
+        with pytest.raises(RuntimeError):
+            with atomic_write(target) as f:
+                f.write("partial")
+                raise RuntimeError("crash")
+        assert list(storage.output_dir.iterdir()) == []
+
+    def test_replaces_existing(self, storage):
+        target = storage.output_dir / "report.json"
+        target.write_text("old", encoding="utf-8")
+        with atomic_write(target) as f:
+            f.write("new")
+        assert target.read_text(encoding="utf-8") == "new"
+        assert list(storage.output_dir.iterdir()) == [target]
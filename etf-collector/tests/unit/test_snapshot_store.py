@@ -0,0 +1,185 @@
+"""Tests for the delta-encoded snapshot store."""
+
+import random
+
+import pytest
+
+from etf_collector.collector.constituent import ConstituentStock, EtfConstituentSummary
+from etf_collector.storage.data_storage import DataStorage, StorageError
+from etf_collector.storage.snapshot_store import (
+    STATUS_DECREASE,
+    STATUS_INCREASE,
+    STATUS_NEW,
+    STATUS_REMOVED,
+    SnapshotStore,
+)
+
+
+def _summary(
+    etf_code: str, holdings: dict, nav: float = 10000.0
+) -> EtfConstituentSummary:
+    """Build a summary from {stock_code: (weight, evaluation_amount)}."""
+    constituents = [
+        ConstituentStock(
+            etf_code=etf_code,
+            etf_name=f"ETF {etf_code}",
+            stock_code=code,
+            stock_name=f"Stock {code}",
+            current_price=10000,
+            price_change=0,
+            price_change_sign="3",
+            price_change_rate=0.0,
+            volume=0,
+            trading_value=0,
+            market_cap=0,
+            weight=weight,
+            evaluation_amount=amount,
+        )
+        for code, (weight, amount) in holdings.items()
+    ]
+    return EtfConstituentSummary(
+        etf_code=etf_code,
+        etf_name=f"ETF {etf_code}",
+        current_price=10000,
+        price_change=0,
+        price_change_rate=0.0,
+        nav=nav,
+        total_assets=1000000000,
+        cu_unit_count=50000,
+        constituent_count=len(constituents),
+        constituents=constituents,
+    )
+
+
+def _as_holdings(snapshot) -> dict:
+    return {
+        code: (h.weight, h.evaluation_amount) for code, h in snapshot.holdings.items()
+    }
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return DataStorage(str(tmp_path / "data"))
+
+
+class TestSnapshotStore:
+    def test_delta_holds_only_changes(self, storage):
+        store = SnapshotStore(storage)
+        base = {f"{i:06d}": (1.0, 1000) for i in range(50)}
+        assert store.put(_summary("069500", base), "20251030") is True
+
+        changed = dict(base)
+        changed["000001"] = (1.5, 1500)
+        del changed["000002"]
+        changed["900000"] = (0.5, 500)
+        assert store.put(_summary("069500", changed), "20251031") is False
+
+        lines = store._chain("069500").path.read_bytes().splitlines()
+        assert len(lines) == 2
+        assert len(lines[1]) < len(lines[0]) / 5
+        snapshot = store.snapshot("069500", "20251031")
+        assert _as_holdings(snapshot) == changed
+
+    def test_rebuilds_every_date(self, storage):
+        store = SnapshotStore(storage, keyframe_interval=3)
+        rng = random.Random(7)
+        holdings = {f"{i:06d}": (1.0, 1000) for i in range(30)}
+        expected = {}
+        for day in range(1, 21):
+            for code in rng.sample(sorted(holdings), 3):
+                holdings[code] = (rng.random() * 5, rng.randrange(10**9))
+            holdings.pop(rng.choice(sorted(holdings)))
+            holdings[f"{100 + day:06d}"] = (0.3, 300)
+            date = f"202510{day:02d}"
+            store.put(_summary("069500", holdings, nav=10000 + day), date)
+            expected[date] = dict(holdings)
+
+        assert store._chain("069500").keyframes == [0, 3, 6, 9, 12, 15, 18]
+        reopened = SnapshotStore(storage, keyframe_interval=3)
+        for date, holdings in expected.items():
+            snapshot = reopened.snapshot("069500", date)
+            assert _as_holdings(snapshot) == holdings
+            assert snapshot.info["nav"] == 10000 + int(date[-2:])
+
+        history = list(reopened.history("069500", "20251005", "20251011"))
+        assert [s.date for s in history] == [f"202510{d:02d}" for d in range(5, 12)]
+        assert [_as_holdings(s) for s in history] == [
+            expected[s.date] for s in history
+        ]
+
+    def test_snapshot_as_of_date(self, storage):
+        store = SnapshotStore(storage)
+        store.put(_summary("069500", {"005930": (30.0, 3000)}), "20251027")
+        store.put(_summary("069500", {"005930": (31.0, 3100)}), "20251031")
+
+        assert store.snapshot("069500", "20251026") is None
+        assert store.snapshot("069500", "2025-10-29").date == "20251027"
+        assert store.snapshot("069500", "20251105").date == "20251031"
+        assert store.snapshot("102110", "20251031") is None
+
+    def test_same_date_replaces_record(self, storage):
+        store = SnapshotStore(storage)
+        store.put(_summary("069500", {"005930": (30.0, 3000)}), "20251030")
+        store.put(_summary("069500", {"005930": (31.0, 3100)}), "20251031")
+        store.put(_summary("069500", {"000660": (20.0, 2000)}), "20251031")
+
+        assert store.dates("069500") == ["20251030", "20251031"]
+        reopened = SnapshotStore(storage)
+        assert _as_holdings(reopened.snapshot("069500", "20251031")) == {
+            "000660": (20.0, 2000)
+        }
+
+    def test_out_of_order_rejected(self, storage):
+        store = SnapshotStore(storage)
+        store.put(_summary("069500", {"005930": (30.0, 3000)}), "20251031")
+        with pytest.raises(StorageError) as exc:
+            store.put(_summary("069500", {"005930": (30.0, 3000)}), "20251030")
+        assert exc.value.code == "OUT_OF_ORDER"
+        with pytest.raises(StorageError):
+            store.snapshot("069500", "31/10/2025")
+
+    def test_damaged_tail_is_overwritten(self, storage):
+        store = SnapshotStore(storage)
+        store.put(_summary("069500", {"005930": (30.0, 3000)}), "20251030")
+        with open(store._chain("069500").path, "ab") as f:
+            f.write(b'{"date": "20251031", "full": false, "info"')  # Killed mid-write
+
+        reopened = SnapshotStore(storage)
+        assert reopened.dates("069500") == ["20251030"]
+        reopened.put(_summary("069500", {"005930": (31.0, 3100)}), "20251031")
+        assert _as_holdings(SnapshotStore(storage).snapshot("069500", "20251031")) == {
+            "005930": (31.0, 3100)
+        }
+
+    def test_diff_classifies_changes(self, storage):
+        store = SnapshotStore(storage)
+        store.record(
+            [
+                _summary("069500", {"A00001": (10.0, 100), "A00002": (5.0, 50),
+                                    "A00003": (3.0, 30), "A00004": (2.0, 20)}),
+                _summary("102110", {"A00001": (8.0, 80)}),
+            ],
+            "20251027",
+        )
+        store.record(
+            [_summary("069500", {"A00001": (12.0, 120), "A00002": (4.0, 40),
+                                 "A00003": (3.005, 31), "A00005": (1.0, 10)})],
+            "20251031",
+        )
+
+        changes = store.diff("069500", "20251027", "20251031")
+        assert [(c.stock_code, c.status) for c in changes] == [
+            ("A00001", STATUS_INCREASE),
+            ("A00002", STATUS_DECREASE),
+            ("A00004", STATUS_REMOVED),
+            ("A00005", STATUS_NEW),
+        ]
+        assert changes[0].weight_change == pytest.approx(2.0)
+        assert changes[2].weight_after == 0.0
+
+        # 102110 was not collected on 20251031: its last holdings carry over
+        assert store.etf_codes() == ["069500", "102110"]
+        assert [c.etf_code for c in store.diff_all("20251027", "20251031")] == [
+            "069500"
+        ] * 4
+        assert set(store.snapshots("20251031")) == {"069500", "102110"}
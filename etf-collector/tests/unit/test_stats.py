@@ -0,0 +1,144 @@
+"""Tests for holdings statistics."""
+
+import random
+
+import pytest
+
+from etf_collector.collector.constituent import ConstituentStock, EtfConstituentSummary
+from etf_collector.stats.holdings import HoldingsIndex, is_cash, stock_changes
+from etf_collector.storage.data_storage import DataStorage
+from etf_collector.storage.snapshot_store import (
+    STATUS_DECREASE,
+    STATUS_INCREASE,
+    STATUS_NEW,
+    STATUS_REMOVED,
+    SnapshotStore,
+)
+
+NAMES = {"005930": "삼성전자", "000660": "SK하이닉스", "035420": "NAVER"}
+
+
+def _summary(etf_code: str, holdings: dict) -> EtfConstituentSummary:
+    """Build a summary from {stock_code: (weight, evaluation_amount)}."""
+    constituents = [
+        ConstituentStock(
+            etf_code=etf_code,
+            etf_name=f"ETF {etf_code}",
+            stock_code=code,
+            stock_name=NAMES.get(code, "원화예금" if code == "KRW000" else code),
+            current_price=0,
+            price_change=0,
+            price_change_sign="3",
+            price_change_rate=0.0,
+            volume=0,
+            trading_value=0,
+            market_cap=0,
+            weight=weight,
+            evaluation_amount=amount,
+        )
+        for code, (weight, amount) in holdings.items()
+    ]
+    return EtfConstituentSummary(
+        etf_code=etf_code,
+        etf_name=f"ETF {etf_code}",
+        current_price=0,
+        price_change=0,
+        price_change_rate=0.0,
+        nav=0.0,
+        total_assets=0,
+        cu_unit_count=0,
+        constituent_count=len(constituents),
+        constituents=constituents,
+    )
+
+
+@pytest.fixture
+def index():
+    return HoldingsIndex.from_summaries([
+        _summary("069500", {"005930": (30.0, 300), "000660": (10.0, 100),
+                            "KRW000": (2.0, 1000)}),
+        _summary("102110", {"005930": (25.0, 250), "035420": (5.0, 50)}),
+        _summary("229200", {"000660": (40.0, 400)}),
+    ])
+
+
+class TestHoldingsIndex:
+    def test_inverted_index(self, index):
+        holders = index.holders("005930")
+        assert [(e.etf_code, e.weight, e.evaluation_amount) for e in holders] == [
+            ("069500", 30.0, 300),
+            ("102110", 25.0, 250),
+        ]
+        assert index.holders("999999") == []
+        assert index.weights.shape == (3, 4)
+        assert index.held.sum() == 6
+
+    def test_ranking(self, index):
+        ranking = index.ranking()
+        assert [(s.rank, s.stock_code, s.total_amount) for s in ranking] == [
+            (1, "005930", 550),
+            (2, "000660", 500),
+            (3, "035420", 50),
+        ]
+        assert ranking[0].etf_count == 2
+        assert ranking[0].avg_weight == pytest.approx(27.5)
+        assert ranking[1].max_weight == 40.0
+
+        assert index.ranking(include_cash=True)[0].stock_code == "KRW000"
+        assert len(index.ranking(top=1)) == 1
+        by_count = index.ranking(by="etf_count")
+        assert [s.stock_code for s in by_count[:2]] == ["005930", "000660"]
+        with pytest.raises(ValueError):
+            index.ranking(by="weight")
+
+    def test_exposure(self, index):
+        stat = index.exposure("000660")
+        assert (stat.rank, stat.etf_count, stat.total_amount) == (2, 2, 500)
+        assert index.exposure("999999") is None
+
+    def test_cash_weights(self, index):
+        assert index.cash_weights() == {"069500": 2.0, "102110": 0.0, "229200": 0.0}
+        assert is_cash("원화예금") and is_cash("KRW Cash")
+        assert not is_cash("삼성전자")
+
+    def test_compare(self, index):
+        later = HoldingsIndex.from_summaries([
+            _summary("069500", {"005930": (32.0, 320), "KRW000": (2.0, 1000)}),
+            _summary("102110", {"005930": (25.005, 250), "035420": (4.0, 40)}),
+            _summary("305720", {"035420": (20.0, 200)}),
+        ])
+        changes = later.compare(index)
+        assert [(c.etf_code, c.stock_code, c.status) for c in changes] == [
+            ("069500", "000660", STATUS_REMOVED),
+            ("069500", "005930", STATUS_INCREASE),
+            ("102110", "035420", STATUS_DECREASE),
+            ("229200", "000660", STATUS_REMOVED),
+            ("305720", "035420", STATUS_NEW),
+        ]
+        assert changes[1].weight_change == pytest.approx(2.0)
+        assert changes[0].stock_name == "SK하이닉스"
+
+        grouped = stock_changes(changes)
+        assert (grouped[0].stock_code, grouped[0].status) == ("000660", STATUS_REMOVED)
+        assert grouped[0].etf_count == 2
+        assert grouped[0].amount_change == -500
+
+    def test_compare_matches_snapshot_diff(self, tmp_path):
+        store = SnapshotStore(DataStorage(str(tmp_path / "data")))
+        rng = random.Random(3)
+        universe = [f"{i:06d}" for i in range(40)]
+        for day in ("20251027", "20251031"):
+            store.record(
+                [
+                    _summary(etf, {
+                        code: (round(rng.random() * 10, 2), rng.randrange(10**6))
+                        for code in rng.sample(universe, 15)
+                    })
+                    for etf in ("069500", "102110", "229200")
+                ],
+                day,
+            )
+
+        before = HoldingsIndex.from_store(store, "20251027")
+        after = HoldingsIndex.from_store(store, "20251031")
+        assert after.compare(before) == store.diff_all("20251027", "20251031")
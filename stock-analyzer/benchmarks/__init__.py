@@ -0,0 +1,4 @@
+"""Performance benchmarks (not part of the test suite).
+
+Run ``python -m benchmarks --help`` from the stock-analyzer directory.
+"""
@@ -0,0 +1,249 @@
+"""Benchmark cases for the hot paths of stock-analyzer and etf-collector.
+
+Each case prepares its input outside the timed region and returns the
+zero-argument callable that is timed. Case names are ``group/size`` where
+size is a bar count (per-ticker cases) or a ticker/ETF count (universe
+cases), so results from different profiles stay comparable.
+"""
+
+import os
+import tempfile
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Sequence
+
+from . import generators as gen
+
+# Bar counts: one trading year, ten years, a ~100-year history
+BAR_SIZES = (250, 2500, 25000)
+# Ticker counts: one stock, a sector, the whole KRX
+TICKER_SIZES = (1, 300, 3000)
+
+# Rendering 25 000 candles measures matplotlib, not our code
+CHART_MAX_BARS = 2500
+# Bars per ticker in universe cases
+UNIVERSE_BARS = 250
+# Backtests span ten years of daily bars
+BACKTEST_BARS = 2500
+
+PROFILES = {
+    "quick": {"bars": (250, 2500), "tickers": (1, 300)},
+    "full": {"bars": BAR_SIZES, "tickers": TICKER_SIZES},
+}
+
+
+@dataclass
+class Case:
+    """A named benchmark."""
+
+    name: str
+    prepare: Callable[[], Callable[[], Any]]
+
+
+# ========== Per-ticker cases (size = bars) ==========
+
+
+def _parse(n: int):
+    from stock_analyzer.stock import ohlcv
+
+    rows = gen.chart_rows(n)
+    return lambda: ohlcv._chart_result("005930", None, rows, "benchmark")
+
+
+def _resample_weekly(n: int):
+    from stock_analyzer.stock import ohlcv
+
+    d = gen.ohlcv_dict(n)
+    args = (d["dates"], d["open"], d["high"], d["low"], d["close"], d["volume"])
+    return lambda: ohlcv.resample_to_weekly(*args)
+
+
+def _trend(n: int):
+    from stock_analyzer.indicator import trend
+
+    d = gen.ohlcv_dict(n)
+    return lambda: trend.calc_from_ohlcv(
+        "005930", d["dates"], d["close"], d["high"], d["low"], d["volume"],
+    )
+
+
+def _elder(n: int):
+    from stock_analyzer.indicator import elder
+
+    d = gen.ohlcv_dict(n)
+    return lambda: elder.calc_from_ohlcv("005930", d["dates"], d["close"])
+
+
+def _demark(n: int):
+    from stock_analyzer.indicator import demark
+
+    d = gen.ohlcv_dict(n)
+    return lambda: demark.calc_from_ohlcv("005930", d["dates"], d["close"])
+
+
+def _oscillator(n: int):
+    from stock_analyzer.indicator import oscillator
+
+    a = gen.analysis_data(n)
+    return lambda: oscillator.calc_from_analysis(
+        a["ticker"], a["name"], a["dates"], a["mcap"], a["for_daily"], a["ins_daily"],
+    )
+
+
+def _chart_candle(n: int):
+    from stock_analyzer.chart import candle
+
+    d = gen.ohlcv_dict(n)
+    return lambda: candle.plot_from_ohlcv(d, title="bench")
+
+
+def _chart_trend(n: int):
+    from stock_analyzer.chart import line
+    from stock_analyzer.indicator import trend
+
+    d = gen.ohlcv_dict(n)
+    data = trend.calc_from_ohlcv(
+        "005930", d["dates"], d["close"], d["high"], d["low"], d["volume"],
+    )["data"]
+    return lambda: line.plot_trend(data, title="bench")
+
+
+def _chart_elder(n: int):
+    from stock_analyzer.chart import line
+    from stock_analyzer.indicator import elder
+
+    d = gen.ohlcv_dict(n)
+    data = elder.calc_from_ohlcv("005930", d["dates"], d["close"])["data"]
+    return lambda: line.plot_elder(data, title="bench")
+
+
+def _chart_demark(n: int):
+    from stock_analyzer.chart import bar
+    from stock_analyzer.indicator import demark
+
+    d = gen.ohlcv_dict(n)
+    data = demark.calc_from_ohlcv("005930", d["dates"], d["close"])["data"]
+    return lambda: bar.plot_demark(data, title="bench")
+
+
+def _chart_oscillator(n: int):
+    from stock_analyzer.chart import oscillator as osc_chart
+    from stock_analyzer.indicator import oscillator
+
+    a = gen.analysis_data(n)
+    data = oscillator.calc_from_analysis(
+        a["ticker"], a["name"], a["dates"], a["mcap"], a["for_daily"], a["ins_daily"],
+    )["data"]
+    return lambda: osc_chart.plot(data, title="bench")
+
+
+# ========== Universe cases (size = tickers / ETFs) ==========
+
+
+def _batch(n: int):
+    from stock_analyzer.indicator import batch
+    from stock_analyzer.stock.frame import OhlcvFrame
+    from stock_analyzer.stock.matrix import OhlcvMatrix
+    from stock_analyzer.stock.ohlcv import CHART_FIELDS
+
+    frames = [
+        OhlcvFrame.from_rows(ticker, gen.chart_rows(UNIVERSE_BARS, seed), CHART_FIELDS)
+        for seed, ticker in enumerate(gen.tickers(n))
+    ]
+    matrix = OhlcvMatrix.from_frames(frames)
+    return lambda: batch.calc_all(matrix)
+
+
+def _backtest(n: int):
+    from stock_analyzer.backtest import engine, signals
+    from stock_analyzer.indicator import batch
+
+    close = gen.close_matrix(n, BACKTEST_BARS)
+    td = batch.calc_demark(close)
+    positions = signals.from_setup(td["buy_setup"], td["sell_setup"])
+    return lambda: engine.run(close, positions, cost=0.0025)
+
+
+def _filter_etfs(n: int):
+    from etf_collector.filter.keyword import (
+        ACTIVE_ETF_FILTER,
+        EXCLUDE_LEVERAGE_FILTER,
+        combine_filters,
+    )
+
+    etfs = gen.etf_infos(n)
+    combined = combine_filters(ACTIVE_ETF_FILTER, EXCLUDE_LEVERAGE_FILTER)
+    return lambda: combined.filter_etfs(etfs)
+
+
+def _save_full_report(n: int):
+    from etf_collector.storage.data_storage import DataStorage
+
+    summaries = gen.constituent_summaries(n)
+    # DataStorage rejects /tmp paths: use a relative directory in the cwd.
+    # It stays alive with the closure and is removed when the case is dropped.
+    tmp = tempfile.TemporaryDirectory(prefix="bench_report_", dir=".")
+    storage = DataStorage(os.path.relpath(tmp.name))
+
+    def run():
+        tmp  # noqa: B018 - keep the directory alive
+        return storage.save_full_report(summaries, filename="bench")
+
+    return run
+
+
+BAR_CASES: Dict[str, Callable[[int], Callable[[], Any]]] = {
+    "ohlcv.parse_chart": _parse,
+    "ohlcv.resample_to_weekly": _resample_weekly,
+    "trend.calc_from_ohlcv": _trend,
+    "elder.calc_from_ohlcv": _elder,
+    "demark.calc_from_ohlcv": _demark,
+    "oscillator.calc_from_analysis": _oscillator,
+}
+
+CHART_CASES: Dict[str, Callable[[int], Callable[[], Any]]] = {
+    "chart.candle": _chart_candle,
+    "chart.trend": _chart_trend,
+    "chart.elder": _chart_elder,
+    "chart.demark": _chart_demark,
+    "chart.oscillator": _chart_oscillator,
+}
+
+UNIVERSE_CASES: Dict[str, Callable[[int], Callable[[], Any]]] = {
+    "batch.calc_all": _batch,
+    "backtest.run": _backtest,
+    "etf.filter_etfs": _filter_etfs,
+    "etf.save_full_report": _save_full_report,
+}
+
+
+def build(
+    bars: Sequence[int] = BAR_SIZES,
+    tickers: Sequence[int] = TICKER_SIZES,
+    pattern: str = "",
+) -> List[Case]:
+    """
+    Build the benchmark cases.
+
+    Args:
+        bars: Bar counts for per-ticker cases
+        tickers: Ticker counts for universe cases
+        pattern: Keep only cases whose name contains this
+
+    Returns:
+        Cases in a stable order
+    """
+    cases = []
+    for name, factory in BAR_CASES.items():
+        cases += [Case(f"{name}/{n}", _bind(factory, n)) for n in bars]
+    for name, factory in CHART_CASES.items():
+        cases += [
+            Case(f"{name}/{n}", _bind(factory, n))
+            for n in bars if n <= CHART_MAX_BARS
+        ]
+    for name, factory in UNIVERSE_CASES.items():
+        cases += [Case(f"{name}/{n}", _bind(factory, n)) for n in tickers]
+    return [case for case in cases if pattern in case.name]
+
+
+def _bind(factory: Callable[[int], Callable[[], Any]], n: int):
+    return lambda: factory(n)
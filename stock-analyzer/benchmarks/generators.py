@@ -0,0 +1,178 @@
+"""Synthetic market data for benchmarks.
+
+Every generator is deterministic for a (size, seed) pair so runs on
+different machines or commits time exactly the same work.
+"""
+
+import random
+from datetime import date, timedelta
+from typing import Dict, List
+
+import numpy as np
+
+END_DATE = date(2025, 10, 31)
+
+TICKER_BASE = 100000
+ETF_BRANDS = ("KODEX", "TIGER", "KBSTAR", "ACE", "SOL", "HANARO")
+ETF_THEMES = ("200", "반도체", "2차전지", "미국S&P500", "배당", "AI", "바이오")
+ETF_KINDS = ("", " 액티브", " 레버리지", " 인버스", " TR", " Active")
+
+
+def trading_days(n: int, end: date = END_DATE) -> List[str]:
+    """Weekdays on or before end (YYYYMMDD), newest first."""
+    days = []
+    day = end
+    while len(days) < n:
+        if day.weekday() < 5:
+            days.append(day.strftime("%Y%m%d"))
+        day -= timedelta(days=1)
+    return days
+
+
+def tickers(n: int) -> List[str]:
+    """n distinct 6-digit codes."""
+    return [f"{TICKER_BASE + i:06d}" for i in range(n)]
+
+
+def chart_rows(n: int, seed: int = 0) -> List[Dict]:
+    """
+    Daily chart rows in the ka10081 response format, newest first.
+
+    Args:
+        n: Number of bars
+        seed: Random seed
+
+    Returns:
+        [{"dt", "open_pric", "high_pric", "low_pric", "cur_prc", "trde_qty"}]
+    """
+    rng = np.random.default_rng(seed)
+    close = 50000 * np.exp(np.cumsum(rng.normal(0.0002, 0.02, n)))
+    close = np.maximum(close, 100).astype(np.int64)
+    spread = np.maximum(close // 100, 1)
+    open_ = close + rng.integers(-1, 2, n) * spread
+    high = np.maximum(open_, close) + rng.integers(0, 3, n) * spread
+    low = np.minimum(open_, close) - rng.integers(0, 3, n) * spread
+    volume = rng.integers(10_000, 5_000_000, n)
+
+    rows = []
+    # Oldest generated bar is the oldest date
+    for i, dt in enumerate(trading_days(n)):
+        j = n - 1 - i
+        rows.append({
+            "dt": dt,
+            "open_pric": str(int(open_[j])),
+            "high_pric": str(int(high[j])),
+            "low_pric": str(int(low[j])),
+            "cur_prc": str(int(close[j])),
+            "trde_qty": str(int(volume[j])),
+        })
+    return rows
+
+
+def close_matrix(n: int, bars: int, seed: int = 0) -> np.ndarray:
+    """
+    Random-walk closes for n tickers, shaped like ``OhlcvMatrix.close``.
+
+    Rows are (tickers, dates) oldest first; every tenth ticker is listed
+    halfway through (NaN before).
+    """
+    rng = np.random.default_rng(seed)
+    close = 50000 * np.exp(np.cumsum(rng.normal(0.0002, 0.02, (n, bars)), axis=1))
+    close[::10, : bars // 2] = np.nan
+    return close
+
+
+def ohlcv_dict(n: int, seed: int = 0) -> Dict[str, List]:
+    """Daily OHLCV in the dict-of-lists format (see OhlcvFrame.to_dict)."""
+    from stock_analyzer.stock.frame import OhlcvFrame
+    from stock_analyzer.stock.ohlcv import CHART_FIELDS
+
+    return OhlcvFrame.from_rows("005930", chart_rows(n, seed), CHART_FIELDS).to_dict()
+
+
+def analysis_data(n: int, seed: int = 0) -> Dict[str, List]:
+    """
+    Supply/demand data as returned by ``stock.analysis.analyze``, newest first.
+
+    Returns:
+        {"ticker", "name", "dates", "mcap", "for_daily", "ins_daily"}
+    """
+    rng = random.Random(seed)
+    cap = 300_000_000_000_000
+    mcap = []
+    for _ in range(n):
+        cap = max(10**11, int(cap * (1 + rng.gauss(0, 0.01))))
+        mcap.append(cap)
+    return {
+        "ticker": "005930",
+        "name": "삼성전자",
+        "dates": trading_days(n),
+        "mcap": mcap,
+        "for_daily": [rng.randint(-10**11, 10**11) for _ in range(n)],
+        "ins_daily": [rng.randint(-10**11, 10**11) for _ in range(n)],
+    }
+
+
+def etf_names(n: int, seed: int = 0) -> List[str]:
+    """n ETF names mixing brands, themes and kinds (active, leveraged, ...)."""
+    rng = random.Random(seed)
+    return [
+        f"{rng.choice(ETF_BRANDS)} {rng.choice(ETF_THEMES)}{rng.choice(ETF_KINDS)}"
+        for _ in range(n)
+    ]
+
+
+def etf_infos(n: int, seed: int = 0) -> List:
+    """n etf_collector EtfInfo records."""
+    from etf_collector.collector.etf_list import EtfInfo
+
+    return [
+        EtfInfo(etf_code=code, etf_name=name, etf_type="Active")
+        for code, name in zip(tickers(n), etf_names(n, seed))
+    ]
+
+
+def constituent_summaries(n: int, constituents: int = 30, seed: int = 0) -> List:
+    """n etf_collector EtfConstituentSummary records with their holdings."""
+    from etf_collector.collector.constituent import (
+        ConstituentStock,
+        EtfConstituentSummary,
+    )
+
+    rng = random.Random(seed)
+    stocks = tickers(2000)
+    summaries = []
+    for code, name in zip(tickers(n), etf_names(n, seed)):
+        holdings = [
+            ConstituentStock(
+                etf_code=code,
+                etf_name=name,
+                stock_code=stock,
+                stock_name=f"종목{stock}",
+                current_price=rng.randint(1000, 300000),
+                price_change=rng.randint(-1000, 1000),
+                price_change_sign="2",
+                price_change_rate=round(rng.uniform(-5, 5), 2),
+                volume=rng.randint(1000, 10**7),
+                trading_value=rng.randint(10**6, 10**11),
+                market_cap=rng.randint(100, 10**6),
+                weight=round(rng.uniform(0.1, 10), 2),
+                evaluation_amount=rng.randint(10**6, 10**10),
+                collected_at="2025-10-31T16:00:00",
+            )
+            for stock in rng.sample(stocks, constituents)
+        ]
+        summaries.append(EtfConstituentSummary(
+            etf_code=code,
+            etf_name=name,
+            current_price=rng.randint(5000, 60000),
+            price_change=0,
+            price_change_rate=0.0,
+            nav=10000.0,
+            total_assets=rng.randint(10**3, 10**6),
+            cu_unit_count=constituents,
+            constituent_count=constituents,
+            constituents=holdings,
+            collected_at="2025-10-31T16:00:00",
+        ))
+    return summaries
@@ -0,0 +1,222 @@
+"""Benchmark runner with JSON output and baseline comparison.
+
+Usage (from stock-analyzer/):
+    python -m benchmarks --profile quick --output bench.json
+    python -m benchmarks --baseline bench.json        # exit 1 on slowdowns
+    python -m benchmarks --filter trend --repeat 20
+"""
+
+import argparse
+import gc
+import json
+import logging
+import platform
+import statistics
+import sys
+import time
+import warnings
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from . import cases as bench_cases
+
+RESULT_VERSION = 1
+
+DEFAULT_REPEAT = 7
+DEFAULT_MIN_TIME = 0.2  # Seconds spent per case at least (fast cases repeat more)
+DEFAULT_MAX_TIME = 10.0  # Seconds after which slow cases stop early...
+MIN_RUNS = 3  # ...once they have this many samples
+MAX_RUNS = 1000
+
+# A case regresses when its median is this many times the baseline median...
+DEFAULT_TOLERANCE = 1.5
+# ...and at least this much slower (timer noise on sub-millisecond cases)
+DEFAULT_MIN_DELTA_MS = 1.0
+
+
+def time_callable(
+    func: Callable[[], Any],
+    repeat: int = DEFAULT_REPEAT,
+    min_time: float = DEFAULT_MIN_TIME,
+    max_time: float = DEFAULT_MAX_TIME,
+) -> Dict[str, float]:
+    """
+    Time a callable.
+
+    One untimed warm-up call, then at least ``repeat`` timed calls,
+    continuing until ``min_time`` seconds were spent. Cases slower than
+    ``max_time`` in total stop after MIN_RUNS calls.
+
+    Returns:
+        {"median_ms", "min_ms", "mean_ms", "runs"}
+    """
+    func()
+    samples: List[float] = []
+    spent = 0.0
+    gc.collect()
+    while len(samples) < repeat or (spent < min_time and len(samples) < MAX_RUNS):
+        if len(samples) >= MIN_RUNS and spent >= max_time:
+            break
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        samples.append(elapsed * 1000)
+        spent += elapsed
+    return {
+        "median_ms": round(statistics.median(samples), 4),
+        "min_ms": round(min(samples), 4),
+        "mean_ms": round(statistics.fmean(samples), 4),
+        "runs": len(samples),
+    }
+
+
+def run(
+    cases: List[bench_cases.Case],
+    repeat: int = DEFAULT_REPEAT,
+    min_time: float = DEFAULT_MIN_TIME,
+    max_time: float = DEFAULT_MAX_TIME,
+    progress: Optional[Callable[[str, Dict], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Run cases.
+
+    Cases whose optional package (e.g. etf_collector) is not installed are
+    listed under "skipped".
+
+    Returns:
+        {"version", "meta", "results": {name: timing}, "skipped": [names]}
+    """
+    results: Dict[str, Dict] = {}
+    skipped: List[str] = []
+    for case in cases:
+        try:
+            func = case.prepare()
+        except ImportError:
+            skipped.append(case.name)
+            continue
+        with warnings.catch_warnings():
+            # e.g. missing Hangul glyphs when no Korean font is installed
+            warnings.simplefilter("ignore")
+            timing = time_callable(func, repeat, min_time, max_time)
+        results[case.name] = timing
+        if progress:
+            progress(case.name, timing)
+    return {
+        "version": RESULT_VERSION,
+        "meta": {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+        "skipped": skipped,
+    }
+
+
+def compare(
+    current: Dict[str, Any],
+    baseline: Dict[str, Any],
+    tolerance: float = DEFAULT_TOLERANCE,
+    min_delta_ms: float = DEFAULT_MIN_DELTA_MS,
+) -> Dict[str, List[Dict]]:
+    """
+    Compare results against a baseline.
+
+    Args:
+        current: run() output
+        baseline: Earlier run() output
+        tolerance: Allowed median ratio (current / baseline)
+        min_delta_ms: Slowdowns smaller than this never count
+
+    Returns:
+        {"regressions": [...], "improvements": [...]} with
+        {"name", "baseline_ms", "current_ms", "ratio"} entries
+    """
+    regressions = []
+    improvements = []
+    base_results = baseline.get("results", {})
+    for name, timing in current.get("results", {}).items():
+        base = base_results.get(name)
+        if base is None:
+            continue
+        before = base["median_ms"]
+        after = timing["median_ms"]
+        ratio = after / before if before > 0 else float("inf")
+        entry = {
+            "name": name,
+            "baseline_ms": before,
+            "current_ms": after,
+            "ratio": round(ratio, 3),
+        }
+        if ratio > tolerance and after - before >= min_delta_ms:
+            regressions.append(entry)
+        elif ratio < 1 / tolerance and before - after >= min_delta_ms:
+            improvements.append(entry)
+    return {"regressions": regressions, "improvements": improvements}
+
+
+def _print_timing(name: str, timing: Dict) -> None:
+    print(
+        f"{name:<40} {timing['median_ms']:>12.3f} ms "
+        f"(min {timing['min_ms']:.3f}, {timing['runs']} runs)",
+        flush=True,
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run benchmarks from the command line; returns the exit code."""
+    parser = argparse.ArgumentParser(description="stock-analyzer benchmarks")
+    parser.add_argument(
+        "--profile", choices=sorted(bench_cases.PROFILES), default="full",
+    )
+    parser.add_argument("--filter", default="", help="substring of case names")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--min-time", type=float, default=DEFAULT_MIN_TIME)
+    parser.add_argument("--max-time", type=float, default=DEFAULT_MAX_TIME)
+    parser.add_argument("--output", help="write results JSON here")
+    parser.add_argument("--baseline", help="results JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--min-delta-ms", type=float, default=DEFAULT_MIN_DELTA_MS)
+    parser.add_argument(
+        "--verbose", action="store_true", help="keep INFO logs of timed calls",
+    )
+    args = parser.parse_args(argv)
+
+    if not args.verbose:
+        # Every timed call logs "... complete"; keep the table readable
+        logging.disable(logging.INFO)
+
+    profile = bench_cases.PROFILES[args.profile]
+    cases = bench_cases.build(profile["bars"], profile["tickers"], args.filter)
+    results = run(
+        cases, args.repeat, args.min_time, args.max_time, progress=_print_timing,
+    )
+    for name in results["skipped"]:
+        print(f"{name:<40} skipped (optional package not installed)")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f"Results written to {args.output}")
+
+    if not args.baseline:
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    diff = compare(results, baseline, args.tolerance, args.min_delta_ms)
+    for entry in diff["improvements"]:
+        print(f"faster      {entry['name']}: {entry['baseline_ms']:.3f} -> "
+              f"{entry['current_ms']:.3f} ms (x{entry['ratio']})")
+    for entry in diff["regressions"]:
+        print(f"REGRESSION  {entry['name']}: {entry['baseline_ms']:.3f} -> "
+              f"{entry['current_ms']:.3f} ms (x{entry['ratio']})", file=sys.stderr)
+    if diff["regressions"]:
+        print(f"{len(diff['regressions'])} benchmark(s) slower than "
+              f"x{args.tolerance} of baseline", file=sys.stderr)
+        return 1
+    return 0
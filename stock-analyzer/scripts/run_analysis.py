@@ -8,6 +8,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from stock_analyzer.client.kiwoom import KiwoomClient
+from stock_analyzer.client.token_cache import TokenCache
 from stock_analyzer.config import Config
 from stock_analyzer.stock import search as search_stock, get_info
 from stock_analyzer.stock import analyze
@@ -24,11 +25,12 @@ def main():
         print("Please create .env file with KIWOOM_APP_KEY and KIWOOM_SECRET_KEY")
         return
 
-    # Create client
+    # Create client (reuses the token of the previous run while valid)
     client = KiwoomClient(
         app_key=config.app_key,
         secret_key=config.secret_key,
         base_url=config.base_url,
+        token_cache=TokenCache(),
     )
 
     # Example: Search for Samsung
@@ -0,0 +1,11 @@
+"""Backtesting.
+
+Measures how the indicator signals would have performed: ``signals`` turns
+``indicator.batch`` matrices into positions and ``engine.run`` computes
+returns, drawdowns, trades, hit rates and turnover for every ticker at once.
+"""
+
+from . import signals
+from .engine import STAT_FIELDS, run
+
+__all__ = ["run", "signals", "STAT_FIELDS"]
@@ -0,0 +1,109 @@
+"""Target positions from indicator signals.
+
+Each function turns ``indicator.batch`` matrices (tickers, dates), oldest
+first, into a position matrix for ``engine.run``: 1 long, -1 short, 0 flat,
+NaN where the ticker has no bar.
+
+Event signals (Elder colors, TD Setup counts, oscillator scores) enter on one
+condition and exit on another; between the two the position is held (see
+``hold``).
+"""
+
+import numpy as np
+
+TD_SETUP_COUNT = 9  # Completed TD Setup
+SCORE_ENTER = 20  # analyze_signal "BUY" or better
+SCORE_EXIT = -20  # analyze_signal "SELL" or worse
+
+
+def hold(entries: np.ndarray, exits: np.ndarray) -> np.ndarray:
+    """
+    Hold a long position from each entry until the next exit.
+
+    An exit on the same bar as an entry wins.
+
+    Args:
+        entries: Boolean matrix, True where a position is opened
+        exits: Boolean matrix, True where it is closed
+
+    Returns:
+        Position matrix of 1 (held) and 0 (flat)
+    """
+    cols = np.arange(entries.shape[1])
+    last_entry = np.maximum.accumulate(np.where(entries, cols, -1), axis=1)
+    last_exit = np.maximum.accumulate(np.where(exits, cols, -1), axis=1)
+    return (last_entry > last_exit).astype(np.float64)
+
+
+def _mask(positions: np.ndarray, reference: np.ndarray) -> np.ndarray:
+    """NaN where the reference matrix has no value."""
+    return np.where(np.isnan(reference), np.nan, positions)
+
+
+def from_trend(signal: np.ndarray, long_only: bool = True) -> np.ndarray:
+    """
+    Follow a trend code matrix (``ma_signal`` or ``trend`` of calc_trend).
+
+    Args:
+        signal: 1 (buy/bullish), 0 (neutral), -1 (sell/bearish)
+        long_only: Stay flat instead of short on -1
+
+    Returns:
+        Position matrix
+    """
+    positions = np.clip(signal, 0 if long_only else -1, 1)
+    return _mask(positions, signal)
+
+
+def from_impulse(impulse: np.ndarray) -> np.ndarray:
+    """
+    Go long on a green Elder bar and exit on a red one; blue keeps the
+    position.
+
+    Args:
+        impulse: calc_elder "impulse" codes (1 green, 0 blue, -1 red)
+
+    Returns:
+        Position matrix
+    """
+    return _mask(hold(impulse == 1, impulse == -1), impulse)
+
+
+def from_setup(
+    buy_setup: np.ndarray,
+    sell_setup: np.ndarray,
+    count: int = TD_SETUP_COUNT,
+) -> np.ndarray:
+    """
+    Buy a completed TD Buy Setup (selling exhaustion) and exit on a
+    completed Sell Setup.
+
+    Args:
+        buy_setup: calc_demark "buy_setup" counts
+        sell_setup: calc_demark "sell_setup" counts
+        count: Setup count that triggers
+
+    Returns:
+        Position matrix
+    """
+    return _mask(hold(buy_setup == count, sell_setup == count), buy_setup)
+
+
+def from_score(
+    score: np.ndarray,
+    enter: float = SCORE_ENTER,
+    exit: float = SCORE_EXIT,
+) -> np.ndarray:
+    """
+    Go long when the oscillator score reaches ``enter`` and exit when it
+    falls to ``exit``.
+
+    Args:
+        score: batch.calc_oscillator_score matrix
+        enter: Entry score (>=)
+        exit: Exit score (<=)
+
+    Returns:
+        Position matrix
+    """
+    return _mask(hold(score >= enter, score <= exit), score)
@@ -2,6 +2,11 @@
 
 from .auth import AuthClient, TokenInfo, AuthError
 from .kiwoom import KiwoomClient, ApiResponse
+from .async_kiwoom import AsyncKiwoomClient
+from .session import KiwoomSession
+from .cache import ResponseCache
+from .token_cache import TokenCache
+from .replay import RecordingTransport, ReplayTransport
 
 __all__ = [
     "AuthClient",
@@ -9,4 +14,10 @@ __all__ = [
     "AuthError",
     "KiwoomClient",
     "ApiResponse",
+    "AsyncKiwoomClient",
+    "KiwoomSession",
+    "ResponseCache",
+    "TokenCache",
+    "RecordingTransport",
+    "ReplayTransport",
 ]
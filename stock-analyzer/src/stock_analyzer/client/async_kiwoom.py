@@ -0,0 +1,364 @@
+"""Asyncio wrapper around the Kiwoom REST API client."""
+
+import asyncio
+import functools
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, List, Optional
+
+from ..core.log import log_info
+from .kiwoom import (
+    DEFAULT_MAX_PAGES,
+    ApiResponse,
+    KiwoomClient,
+    is_last_page,
+    page_rows,
+)
+
+# Concurrency settings
+DEFAULT_MAX_CONCURRENCY = 4  # Maximum in-flight API calls
+
+
+class AsyncKiwoomClient:
+    """
+    Asyncio Kiwoom client with bounded concurrency.
+
+    Every endpoint of KiwoomClient is exposed as a coroutine. Calls run on a
+    bounded worker pool over the wrapped client, so they share its pooled
+    transport, token and rate limit. At most ``max_concurrency`` requests are
+    in flight at once.
+    """
+
+    def __init__(
+        self,
+        app_key: str,
+        secret_key: str,
+        base_url: str = "https://api.kiwoom.com",
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        **client_kwargs: Any,
+    ):
+        """
+        Initialize async Kiwoom client.
+
+        Args:
+            app_key: Kiwoom API app key
+            secret_key: Kiwoom API secret key
+            base_url: API base URL
+            max_concurrency: Maximum concurrent API calls
+            **client_kwargs: Extra KiwoomClient arguments (min_interval, transport, ...)
+        """
+        client = KiwoomClient(app_key, secret_key, base_url, **client_kwargs)
+        self._init(client, max_concurrency)
+
+    @classmethod
+    def from_client(
+        cls,
+        client: KiwoomClient,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> "AsyncKiwoomClient":
+        """
+        Wrap an existing KiwoomClient.
+
+        Args:
+            client: Sync Kiwoom client (shares its token and rate limit)
+            max_concurrency: Maximum concurrent API calls
+
+        Returns:
+            AsyncKiwoomClient instance
+        """
+        obj = cls.__new__(cls)
+        obj._init(client, max_concurrency)
+        return obj
+
+    def _init(self, client: KiwoomClient, max_concurrency: int) -> None:
+        """Set up shared state."""
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+        self.client = client
+        self.max_concurrency = max_concurrency
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency,
+            thread_name_prefix="kiwoom-async",
+        )
+        # One semaphore per event loop: a semaphore is bound to the loop it
+        # first waits on, and each asyncio.run() starts a new loop
+        self._semaphores: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Get the semaphore of the running loop (created on first use)."""
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphores[loop] = semaphore
+        return semaphore
+
+    async def _submit(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking call on the worker pool under the concurrency bound."""
+        loop = asyncio.get_running_loop()
+        async with self._get_semaphore():
+            return await loop.run_in_executor(
+                self._executor,
+                functools.partial(func, *args, **kwargs),
+            )
+
+    async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Run a sync function that takes a KiwoomClient as first argument.
+
+        Example:
+            result = await aclient.run(trend.calc, "005930", days=180)
+
+        Args:
+            func: Function called as func(client, *args, **kwargs)
+
+        Returns:
+            Function result
+        """
+        return await self._submit(func, self.client, *args, **kwargs)
+
+    async def fan_out(
+        self,
+        func: Callable[..., Awaitable[Any]],
+        tickers: Iterable[str],
+        *args: Any,
+        **kwargs: Any,
+    ) -> List[Any]:
+        """
+        Run a coroutine function for many tickers concurrently.
+
+        Example:
+            results = await aclient.fan_out(ohlcv.get_daily_async, tickers, days=120)
+
+        Args:
+            func: Coroutine function called as func(self, ticker, *args, **kwargs)
+            tickers: Stock codes
+
+        Returns:
+            Results in the same order as tickers
+        """
+        tickers = list(tickers)
+        results = await asyncio.gather(
+            *(func(self, ticker, *args, **kwargs) for ticker in tickers)
+        )
+        log_info("client.async_kiwoom", "fan_out complete", {
+            "count": len(tickers),
+            "max_concurrency": self.max_concurrency,
+        })
+        return list(results)
+
+    @staticmethod
+    async def iter_pages(
+        fetch: Callable[[str, str], Awaitable[ApiResponse]],
+        list_key: str,
+        start_date: Optional[str] = None,
+        max_rows: Optional[int] = None,
+        date_field: str = "dt",
+        max_pages: int = DEFAULT_MAX_PAGES,
+    ) -> AsyncIterator[ApiResponse]:
+        """
+        Async version of KiwoomClient.iter_pages().
+
+        Args:
+            fetch: Coroutine function called as fetch(cont_yn, next_key)
+            list_key: Response field holding the row list
+            start_date: Oldest date needed (YYYYMMDD)
+            max_rows: Number of rows needed
+            date_field: Row field holding the date
+            max_pages: Safety limit on pages fetched
+
+        Yields:
+            ApiResponse for each page
+        """
+        cont_yn = ""
+        next_key = ""
+        rows_seen = 0
+
+        for _ in range(max_pages):
+            resp = await fetch(cont_yn, next_key)
+            yield resp
+            if not resp.ok:
+                return
+
+            rows = page_rows(resp, list_key)
+            rows_seen += len(rows)
+            if is_last_page(resp, rows, rows_seen, start_date, max_rows, date_field):
+                return
+
+            cont_yn = "Y"
+            next_key = resp.next_key
+
+    async def aclose(self) -> None:
+        """Shut down the worker pool and close the wrapped client."""
+        self._executor.shutdown(wait=True)
+        self.client.close()
+
+    async def __aenter__(self) -> "AsyncKiwoomClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    # ========== Stock Search ==========
+
+    async def get_stock_list(
+        self,
+        market: str = "0",
+        cont_yn: str = "",
+        next_key: str = "",
+    ) -> ApiResponse:
+        """Get stock list (ka10099)."""
+        return await self._submit(
+            self.client.get_stock_list, market, cont_yn=cont_yn, next_key=next_key
+        )
+
+    async def get_stock_info(self, ticker: str) -> ApiResponse:
+        """Get stock basic info (ka10001)."""
+        return await self._submit(self.client.get_stock_info, ticker)
+
+    # ========== Supply/Demand Analysis ==========
+
+    async def get_foreign_trend(self, ticker: str) -> ApiResponse:
+        """Get foreign investor trading trend (ka10008)."""
+        return await self._submit(self.client.get_foreign_trend, ticker)
+
+    async def get_institution_trend(self, ticker: str) -> ApiResponse:
+        """Get institutional trading trend (ka10045)."""
+        return await self._submit(self.client.get_institution_trend, ticker)
+
+    async def get_investor_trend(
+        self,
+        ticker: str,
+        date: str = None,
+        amt_qty_tp: str = "1",
+        trde_tp: str = "0",
+        unit_tp: str = "1000",
+        cont_yn: str = "",
+        next_key: str = "",
+    ) -> ApiResponse:
+        """Get investor/institution trend by stock (ka10059)."""
+        return await self._submit(
+            self.client.get_investor_trend,
+            ticker,
+            date=date,
+            amt_qty_tp=amt_qty_tp,
+            trde_tp=trde_tp,
+            unit_tp=unit_tp,
+            cont_yn=cont_yn,
+            next_key=next_key,
+        )
+
+    async def get_investor_summary(
+        self,
+        ticker: str,
+        start_date: str = None,
+        end_date: str = None,
+        days: int = 30,
+        amt_qty_tp: str = "1",
+        trde_tp: str = "0",
+        unit_tp: str = "1000",
+    ) -> ApiResponse:
+        """Get investor/institution summary by stock (ka10061)."""
+        return await self._submit(
+            self.client.get_investor_summary,
+            ticker,
+            start_date=start_date,
+            end_date=end_date,
+            days=days,
+            amt_qty_tp=amt_qty_tp,
+            trde_tp=trde_tp,
+            unit_tp=unit_tp,
+        )
+
+    # ========== Chart Data ==========
+
+    async def get_daily_chart(
+        self,
+        ticker: str,
+        start_date: str,
+        end_date: str,
+        adj_price: str = "1",
+        cont_yn: str = "",
+        next_key: str = "",
+    ) -> ApiResponse:
+        """Get daily chart data (ka10081)."""
+        return await self._submit(
+            self.client.get_daily_chart,
+            ticker,
+            start_date,
+            end_date,
+            adj_price=adj_price,
+            cont_yn=cont_yn,
+            next_key=next_key,
+        )
+
+    async def get_weekly_chart(
+        self,
+        ticker: str,
+        start_date: str,
+        end_date: str,
+        adj_price: str = "1",
+        cont_yn: str = "",
+        next_key: str = "",
+    ) -> ApiResponse:
+        """Get weekly chart data (ka10082)."""
+        return await self._submit(
+            self.client.get_weekly_chart,
+            ticker,
+            start_date,
+            end_date,
+            adj_price=adj_price,
+            cont_yn=cont_yn,
+            next_key=next_key,
+        )
+
+    async def get_monthly_chart(
+        self,
+        ticker: str,
+        start_date: str,
+        end_date: str,
+        adj_price: str = "1",
+        cont_yn: str = "",
+        next_key: str = "",
+    ) -> ApiResponse:
+        """Get monthly chart data (ka10083)."""
+        return await self._submit(
+            self.client.get_monthly_chart,
+            ticker,
+            start_date,
+            end_date,
+            adj_price=adj_price,
+            cont_yn=cont_yn,
+            next_key=next_key,
+        )
+
+    # ========== ETF ==========
+
+    async def get_etf_list(self) -> ApiResponse:
+        """Get ETF full quote (ka40004)."""
+        return await self._submit(self.client.get_etf_list)
+
+    async def get_etf_daily(self, ticker: str) -> ApiResponse:
+        """Get ETF daily trend (ka40003)."""
+        return await self._submit(self.client.get_etf_daily, ticker)
+
+    # ========== Condition Search ==========
+
+    async def get_condition_list(self) -> ApiResponse:
+        """Get condition search list (ka10171)."""
+        return await self._submit(self.client.get_condition_list)
+
+    async def search_condition(self, cond_idx: str, cond_name: str) -> ApiResponse:
+        """Execute condition search (ka10172)."""
+        return await self._submit(self.client.search_condition, cond_idx, cond_name)
+
+    # ========== Market Indicators ==========
+
+    async def get_deposit_trend(self, days: int = 30) -> ApiResponse:
+        """Get customer deposit trend (kt00001)."""
+        return await self._submit(self.client.get_deposit_trend, days)
+
+    async def get_credit_trend(self, days: int = 30) -> ApiResponse:
+        """Get credit trading trend (ka10013)."""
+        return await self._submit(self.client.get_credit_trend, days)
+
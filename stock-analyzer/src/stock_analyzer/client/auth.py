@@ -2,11 +2,13 @@
 
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 
 import requests
 
+from ..core.http import HttpTransport
 from ..core.log import log_err, log_info
+from .token_cache import TokenCache, TokenRefreshMixin
 
 
 # Token expiration buffer (refresh 1 minute before actual expiry)
@@ -32,6 +34,24 @@ class TokenInfo:
         """Get bearer token string."""
         return f"Bearer {self.token}"
 
+    @classmethod
+    def from_cache(cls, entry: Dict[str, Any]) -> "TokenInfo":
+        """Build from fields stored by to_cache()."""
+        return cls(
+            token=entry["token"],
+            expires_dt=datetime.strptime(entry["expires_dt"], "%Y%m%d%H%M%S"),
+            token_type=entry.get("token_type", "bearer"),
+        )
+
+    def to_cache(self) -> Tuple[Dict[str, Any], float]:
+        """Get the fields to store and the epoch expiry (see TokenCache)."""
+        fields = {
+            "token": self.token,
+            "expires_dt": self.expires_dt.strftime("%Y%m%d%H%M%S"),
+            "token_type": self.token_type,
+        }
+        return fields, self.expires_dt.timestamp()
+
 
 class AuthError(Exception):
     """Authentication error."""
@@ -39,13 +59,23 @@ class AuthError(Exception):
     pass
 
 
-class AuthClient:
+class AuthClient(TokenRefreshMixin[TokenInfo]):
     """OAuth token issuer and manager."""
 
+    TOKEN_CLASS = TokenInfo
+    TOKEN_FIELD = "token"
+
     API_ID = "au10001"
     TOKEN_PATH = "/oauth2/token"
 
-    def __init__(self, app_key: str, secret_key: str, base_url: str):
+    def __init__(
+        self,
+        app_key: str,
+        secret_key: str,
+        base_url: str,
+        transport: Optional[HttpTransport] = None,
+        token_cache: Optional[TokenCache] = None,
+    ):
         """
         Initialize auth client.
 
@@ -53,28 +83,27 @@ class AuthClient:
             app_key: Kiwoom API app key
             secret_key: Kiwoom API secret key
             base_url: API base URL
+            transport: Shared HTTP transport (one-shot requests if None)
+            token_cache: On-disk token store shared with other processes
+                (tokens kept in memory only if None)
         """
         self.app_key = app_key
         self.secret_key = secret_key
         self.base_url = base_url
-        self._token: Optional[TokenInfo] = None
-
-    def get_token(self, force_refresh: bool = False) -> TokenInfo:
-        """
-        Get token (auto-refresh if expired).
-
-        Args:
-            force_refresh: Force token refresh
-
-        Returns:
-            TokenInfo object
-
-        Raises:
-            AuthError: If token fetch fails
-        """
-        if force_refresh or self._token is None or self._token.is_expired:
-            self._token = self._fetch_token()
-        return self._token
+        self.transport = transport
+        self.token_cache = token_cache
+        self._init_token_state()
+
+    def _post(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        body: Dict[str, Any],
+    ) -> requests.Response:
+        """Send POST through the shared transport when available."""
+        if self.transport is not None:
+            return self.transport.post(url, headers=headers, json_data=body, timeout=30)
+        return requests.post(url, headers=headers, json=body, timeout=30)
 
     def _fetch_token(self) -> TokenInfo:
         """
@@ -89,18 +118,17 @@ class AuthClient:
         url = f"{self.base_url}{self.TOKEN_PATH}"
 
         try:
-            resp = requests.post(
+            resp = self._post(
                 url,
-                headers={
+                {
                     "api-id": self.API_ID,
                     "Content-Type": "application/json;charset=UTF-8",
                 },
-                json={
+                {
                     "grant_type": "client_credentials",
                     "appkey": self.app_key,
                     "secretkey": self.secret_key,
                 },
-                timeout=30,
             )
             resp.raise_for_status()
             data = resp.json()
@@ -135,22 +163,21 @@ class AuthClient:
         url = f"{self.base_url}/oauth2/revoke"
 
         try:
-            resp = requests.post(
+            resp = self._post(
                 url,
-                headers={
+                {
                     "api-id": "au10002",
                     "Content-Type": "application/json;charset=UTF-8",
                 },
-                json={
+                {
                     "token": self._token.token,
                 },
-                timeout=30,
             )
             resp.raise_for_status()
             data = resp.json()
 
             if data.get("return_code") == 0:
-                self._token = None
+                self.clear_token()
                 log_info("client.auth", "Token revoked")
                 return True
 
@@ -161,5 +188,7 @@ class AuthClient:
             return False
 
     def clear_token(self) -> None:
-        """Clear cached token."""
+        """Clear cached token (including the on-disk copy)."""
         self._token = None
+        if self.token_cache is not None:
+            self.token_cache.remove(TokenCache.key(self.base_url, self.app_key))
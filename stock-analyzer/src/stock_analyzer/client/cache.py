@@ -0,0 +1,289 @@
+"""Persistent API response cache."""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+from ..core.krx_calendar import (
+    SESSION_CLOSE,
+    SESSION_OPEN,
+    SESSION_SETTLE,
+    KrxCalendar,
+)
+from ..core.log import log_err, log_info
+
+# Cache directory used when none is given (Android sets it to app storage)
+CACHE_DIR_ENV = "STOCK_ANALYZER_CACHE_DIR"
+DEFAULT_CACHE_DIR = "~/.stock_analyzer/cache"
+
+DEFAULT_MAX_ENTRIES = 5000
+DEFAULT_MAX_BYTES = 100 * 1024 * 1024
+
+# Seconds a response for the current session stays valid
+INTRADAY_TTL = 60  # Market open: prices move
+POST_CLOSE_TTL = 300  # 15:30-18:00: after-hours trades and investor data settle
+
+# Chart body field selecting adjusted prices ("1"); adjusted history of
+# closed sessions is restated when a corporate action takes effect
+ADJUSTED_PRICE_FIELD = "upd_stkpc_tp"
+
+# Live or account-specific results are never cached
+UNCACHED_APIS = frozenset({
+    "ka10171", "ka10172",  # Condition search (live)
+    "kt00001",  # Deposit trend (account, /api/dostk/acnt)
+})
+
+
+def _as_of(body: Dict[str, Any]) -> Optional[str]:
+    """Get the newest YYYYMMDD date in a request body (dt, base_dt, ...)."""
+    dates = [
+        value for key, value in body.items()
+        if (key == "dt" or key.endswith("_dt"))
+        and isinstance(value, str) and len(value) == 8 and value.isdigit()
+    ]
+    return max(dates) if dates else None
+
+
+class ResponseCache:
+    """
+    On-disk cache of successful API responses.
+
+    Entries are keyed by base URL, api_id, path, body and continuation key,
+    one JSON file each. Lifetimes follow the KRX session:
+
+    - Requests dated before today (``base_dt``/``dt``/``end_dt`` ...) cover
+      closed sessions and never expire, except adjusted-price charts
+      (``upd_stkpc_tp="1"``), which live until the next session open.
+    - Requests for today (or undated ones like ka10001/ka40004) live until
+      the next session open while the market is closed, INTRADAY_TTL while it
+      trades and POST_CLOSE_TTL until the day's data settles at 18:00.
+
+    The least recently used entries are evicted beyond ``max_entries`` or
+    ``max_bytes``.
+
+    Example:
+        cache = ResponseCache("/data/data/com.example.app/files/api_cache")
+        client = KiwoomClient(app_key, secret_key, cache=cache)
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        calendar: Optional[KrxCalendar] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            directory: Cache directory (STOCK_ANALYZER_CACHE_DIR or
+                ~/.stock_analyzer/cache if None); created on first store
+            max_entries: Maximum number of cached responses
+            max_bytes: Maximum total size of cache files
+            calendar: KRX calendar (weekends only if None)
+            clock: Epoch time source
+        """
+        directory = directory or os.getenv(CACHE_DIR_ENV) or DEFAULT_CACHE_DIR
+        self.directory = os.path.expanduser(directory)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.calendar = calendar or KrxCalendar()
+        self._clock = clock
+        self._lock = threading.Lock()
+        # file name -> size in bytes, least recently used first
+        self._index: Optional["OrderedDict[str, int]"] = None
+        self._bytes = 0
+        self._stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+    @staticmethod
+    def key(
+        base_url: str,
+        api_id: str,
+        url: str,
+        body: Dict[str, Any],
+        cont_yn: str = "",
+        next_key: str = "",
+    ) -> str:
+        """Get the cache key (file name) of a request."""
+        raw = json.dumps(
+            [base_url, api_id, url, body, cont_yn, next_key],
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest() + ".json"
+
+    def ttl(self, body: Dict[str, Any]) -> Optional[float]:
+        """
+        Get the lifetime of a response.
+
+        Args:
+            body: Request body
+
+        Returns:
+            Seconds to keep the response, or None if it never expires
+        """
+        now = self.calendar.now(self._clock())
+        today = now.strftime("%Y%m%d")
+        as_of = _as_of(body)
+        if as_of is not None and as_of < today:
+            # Corporate actions restate adjusted prices from a session open
+            if body.get(ADJUSTED_PRICE_FIELD) == "1":
+                return self._until_open(now)
+            return None
+
+        if self.calendar.is_trading_day(now.date()):
+            t = now.time()
+            if SESSION_OPEN <= t < SESSION_CLOSE:
+                return INTRADAY_TTL
+            if SESSION_CLOSE <= t < SESSION_SETTLE:
+                return POST_CLOSE_TTL
+        # Market closed: nothing changes until the next session opens
+        return self._until_open(now)
+
+    def _until_open(self, now) -> float:
+        """Seconds until the next session open."""
+        return (self.calendar.next_open(now) - now).total_seconds()
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+    def _load_index(self) -> None:
+        """Scan the directory once (oldest access first)."""
+        if self._index is not None:
+            return
+        entries = []
+        if os.path.isdir(self.directory):
+            for name in os.listdir(self.directory):
+                if not name.endswith(".json"):
+                    continue
+                try:
+                    st = os.stat(self._path(name))
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, name, st.st_size))
+        # Expiry is checked when an entry is read
+        entries.sort()
+        self._index = OrderedDict((name, size) for _, name, size in entries)
+        self._bytes = sum(self._index.values())
+
+    def _remove(self, name: str) -> None:
+        self._bytes -= self._index.pop(name)
+        try:
+            os.remove(self._path(name))
+        except OSError:
+            pass
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached response.
+
+        Args:
+            name: Cache key (see key())
+
+        Returns:
+            {"data", "has_next", "next_key"} or None if missing/expired
+        """
+        with self._lock:
+            self._load_index()
+            if name not in self._index:
+                self._stats["misses"] += 1
+                return None
+            try:
+                with open(self._path(name), encoding="utf-8") as f:
+                    entry = json.load(f)
+            except (OSError, ValueError):
+                self._remove(name)
+                self._stats["misses"] += 1
+                return None
+
+            expires = entry.get("expires")
+            if expires is not None and self._clock() >= expires:
+                self._remove(name)
+                self._stats["misses"] += 1
+                return None
+
+            self._index.move_to_end(name)
+            try:
+                os.utime(self._path(name))  # LRU order survives restarts
+            except OSError:
+                pass
+            self._stats["hits"] += 1
+            return entry
+
+    def put(
+        self,
+        name: str,
+        body: Dict[str, Any],
+        data: Dict[str, Any],
+        has_next: bool = False,
+        next_key: str = "",
+    ) -> None:
+        """
+        Store a successful response.
+
+        Args:
+            name: Cache key (see key())
+            body: Request body (decides the lifetime)
+            data: Response JSON
+            has_next: Continuation flag of the response
+            next_key: Continuation key of the response
+        """
+        ttl = self.ttl(body)
+        expires = None if ttl is None else self._clock() + ttl
+        entry = {
+            "expires": expires,
+            "data": data,
+            "has_next": has_next,
+            "next_key": next_key,
+        }
+        raw = json.dumps(entry, ensure_ascii=False).encode("utf-8")
+
+        with self._lock:
+            self._load_index()
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                tmp = self._path(name) + ".tmp"
+                with open(tmp, "wb") as f:
+                    f.write(raw)
+                os.replace(tmp, self._path(name))
+            except OSError as e:
+                log_err("client.cache", e, {"path": self.directory})
+                return
+
+            if name in self._index:
+                self._bytes -= self._index.pop(name)
+            self._index[name] = len(raw)
+            self._bytes += len(raw)
+            self._stats["stores"] += 1
+
+            while self._index and (
+                len(self._index) > self.max_entries or self._bytes > self.max_bytes
+            ):
+                oldest = next(iter(self._index))
+                self._remove(oldest)
+                self._stats["evictions"] += 1
+
+    def clear(self) -> None:
+        """Delete all cached responses."""
+        with self._lock:
+            self._load_index()
+            for name in list(self._index):
+                self._remove(name)
+        log_info("client.cache", "Cache cleared", {"path": self.directory})
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache counters.
+
+        Returns:
+            {"hits", "misses", "stores", "evictions", "entries", "bytes"}
+        """
+        with self._lock:
+            self._load_index()
+            return dict(self._stats, entries=len(self._index), bytes=self._bytes)
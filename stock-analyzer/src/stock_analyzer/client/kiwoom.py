@@ -1,21 +1,41 @@
 """Kiwoom REST API client."""
 
-import threading
 import time
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional
 
 import requests
 
+from ..core.http import HttpTransport, SessionTransport
 from ..core.log import log_err, log_info, log_warn
+from ..core.rate_limit import (
+    DEFAULT_BURST,
+    DEFAULT_RATE,
+    BucketConfig,
+    RateLimiter,
+)
 from .auth import AuthClient
+from .cache import UNCACHED_APIS, ResponseCache
+from .token_cache import TokenCache
 
 
 # Rate limiting settings
-DEFAULT_MIN_INTERVAL = 0.5  # Minimum seconds between API calls
 DEFAULT_MAX_RETRIES = 3  # Maximum retry attempts for 429 errors
 DEFAULT_RETRY_BASE_DELAY = 1.0  # Base delay for exponential backoff
 
+# Per-api_id quotas on top of the account-wide bucket; other APIs only
+# use the account bucket
+DEFAULT_API_LIMITS: Dict[str, BucketConfig] = {
+    "ka10001": BucketConfig(rate=3.0, burst=3),  # Stock info
+    "ka10059": BucketConfig(rate=2.0, burst=2),  # Investor trend by stock
+    "ka10081": BucketConfig(rate=2.0, burst=2),  # Daily chart
+    "ka10082": BucketConfig(rate=2.0, burst=2),  # Weekly chart
+    "ka10083": BucketConfig(rate=2.0, burst=2),  # Monthly chart
+}
+
+# Pagination settings
+DEFAULT_MAX_PAGES = 20  # Safety limit for continuation requests
+
 
 @dataclass
 class ApiResponse:
@@ -28,6 +48,53 @@ class ApiResponse:
     next_key: Optional[str] = None
 
 
+def page_rows(resp: ApiResponse, list_key: str) -> List[Dict]:
+    """
+    Get the row list of a paged response.
+
+    Args:
+        resp: API response
+        list_key: Response field holding the row list (falls back to "list")
+
+    Returns:
+        Rows of the page (empty if missing)
+    """
+    if not resp.ok or not resp.data:
+        return []
+    return resp.data.get(list_key, []) or resp.data.get("list", [])
+
+
+def is_last_page(
+    resp: ApiResponse,
+    rows: List[Dict],
+    rows_seen: int,
+    start_date: Optional[str] = None,
+    max_rows: Optional[int] = None,
+    date_field: str = "dt",
+) -> bool:
+    """
+    Check whether paging can stop after this page.
+
+    Args:
+        resp: Page response
+        rows: Rows of the page (newest first)
+        rows_seen: Rows yielded so far, including this page
+        start_date: Oldest date needed (YYYYMMDD)
+        max_rows: Number of rows needed
+        date_field: Row field holding the date
+
+    Returns:
+        True if no further page is needed or available
+    """
+    if not rows or not resp.has_next or not resp.next_key:
+        return True
+    if max_rows is not None and rows_seen >= max_rows:
+        return True
+    if start_date and str(rows[-1].get(date_field, "")) <= start_date:
+        return True
+    return False
+
+
 class KiwoomClient:
     """Kiwoom REST API wrapper."""
 
@@ -36,9 +103,16 @@ class KiwoomClient:
         app_key: str,
         secret_key: str,
         base_url: str = "https://api.kiwoom.com",
-        min_interval: float = DEFAULT_MIN_INTERVAL,
+        min_interval: Optional[float] = None,
         max_retries: int = DEFAULT_MAX_RETRIES,
         retry_base_delay: float = DEFAULT_RETRY_BASE_DELAY,
+        transport: Optional[HttpTransport] = None,
+        rate: float = DEFAULT_RATE,
+        burst: int = DEFAULT_BURST,
+        api_limits: Optional[Dict[str, BucketConfig]] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        token_cache: Optional[TokenCache] = None,
     ):
         """
         Initialize Kiwoom client.
@@ -47,29 +121,50 @@ class KiwoomClient:
             app_key: Kiwoom API app key
             secret_key: Kiwoom API secret key
             base_url: API base URL
-            min_interval: Minimum seconds between API calls
+            min_interval: Fixed seconds between API calls (overrides rate/burst,
+                0 disables rate limiting)
             max_retries: Maximum retry attempts for 429 errors
             retry_base_delay: Base delay for exponential backoff
+            transport: HTTP transport shared by API and auth calls
+                (pooled keep-alive SessionTransport if None)
+            rate: Account-wide requests per second
+            burst: Account-wide burst size
+            api_limits: Per-api_id bucket settings,
+                e.g. {"ka10081": BucketConfig(rate=2, burst=4)}
+                (DEFAULT_API_LIMITS if None and min_interval is not set;
+                {} for the account bucket only)
+            rate_limiter: Shared limiter (overrides all the above)
+            cache: Persistent response cache (no caching if None)
+            token_cache: Persistent token store shared across processes
+                (a new token per client if None)
         """
         self.base_url = base_url
-        self.auth = AuthClient(app_key, secret_key, base_url)
+        self.transport = transport or SessionTransport()
+        self.auth = AuthClient(
+            app_key,
+            secret_key,
+            base_url,
+            transport=self.transport,
+            token_cache=token_cache,
+        )
 
-        # Rate limiting (thread-safe)
-        self._min_interval = min_interval
+        # Rate limiting (thread-safe token buckets)
+        if rate_limiter is None:
+            if min_interval is not None:
+                rate = 1.0 / min_interval if min_interval > 0 else 0.0
+                burst = 1
+                api_limits = api_limits or {}
+            elif api_limits is None:
+                api_limits = DEFAULT_API_LIMITS
+            rate_limiter = RateLimiter(BucketConfig(rate, burst), api_limits)
+        self.rate_limiter = rate_limiter
         self._max_retries = max_retries
         self._retry_base_delay = retry_base_delay
-        self._last_call_time: float = 0
-        self._rate_limit_lock = threading.Lock()
-
-    def _wait_for_rate_limit(self) -> None:
-        """Wait if needed to respect rate limit (thread-safe)."""
-        with self._rate_limit_lock:
-            now = time.time()
-            elapsed = now - self._last_call_time
-            if elapsed < self._min_interval:
-                sleep_time = self._min_interval - elapsed
-                time.sleep(sleep_time)
-            self._last_call_time = time.time()
+        self.cache = cache
+
+    def _wait_for_rate_limit(self, api_id: str = "") -> None:
+        """Wait for rate limit capacity for an API (thread-safe)."""
+        self.rate_limiter.acquire(api_id)
 
     def _call(
         self,
@@ -94,6 +189,20 @@ class KiwoomClient:
         Returns:
             ApiResponse object
         """
+        cache_key = None
+        if self.cache is not None and api_id not in UNCACHED_APIS:
+            cache_key = self.cache.key(
+                self.base_url, api_id, url, body, cont_yn, next_key,
+            )
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return ApiResponse(
+                    ok=True,
+                    data=cached["data"],
+                    has_next=cached["has_next"],
+                    next_key=cached["next_key"],
+                )
+
         token = self.auth.get_token()
 
         headers = {
@@ -110,13 +219,13 @@ class KiwoomClient:
 
         for attempt in range(self._max_retries + 1):
             # Apply rate limiting
-            self._wait_for_rate_limit()
+            self._wait_for_rate_limit(api_id)
 
             try:
-                resp = requests.post(
+                resp = self.transport.post(
                     full_url,
                     headers=headers,
-                    json=body,
+                    json_data=body,
                     timeout=timeout,
                 )
 
@@ -156,6 +265,9 @@ class KiwoomClient:
 
                 log_info("client.kiwoom", "API call", {"api_id": api_id})
 
+                if cache_key is not None:
+                    self.cache.put(cache_key, body, data, has_next, resp_next_key)
+
                 return ApiResponse(
                     ok=True,
                     data=data,
@@ -181,6 +293,80 @@ class KiwoomClient:
             error={"code": "UNKNOWN_ERROR", "msg": "Unexpected error"},
         )
 
+    @staticmethod
+    def iter_pages(
+        fetch: Callable[[str, str], ApiResponse],
+        list_key: str,
+        start_date: Optional[str] = None,
+        max_rows: Optional[int] = None,
+        date_field: str = "dt",
+        max_pages: int = DEFAULT_MAX_PAGES,
+    ) -> Iterator[ApiResponse]:
+        """
+        Follow cont-yn/next-key continuation and yield responses page by page.
+
+        Rows are returned newest first, so paging stops after the page whose
+        oldest row is on or before ``start_date`` or once ``max_rows`` rows
+        were yielded. An error response is yielded and ends the iteration.
+
+        Example:
+            pages = KiwoomClient.iter_pages(
+                lambda cont_yn, next_key: client.get_daily_chart(
+                    "005930", "20200101", "20250110",
+                    cont_yn=cont_yn, next_key=next_key,
+                ),
+                "stk_dt_pole_chart_qry",
+                start_date="20200101",
+            )
+
+        Args:
+            fetch: Function called as fetch(cont_yn, next_key)
+            list_key: Response field holding the row list
+            start_date: Oldest date needed (YYYYMMDD)
+            max_rows: Number of rows needed
+            date_field: Row field holding the date
+            max_pages: Safety limit on pages fetched
+
+        Yields:
+            ApiResponse for each page
+        """
+        cont_yn = ""
+        next_key = ""
+        rows_seen = 0
+
+        for _ in range(max_pages):
+            resp = fetch(cont_yn, next_key)
+            yield resp
+            if not resp.ok:
+                return
+
+            rows = page_rows(resp, list_key)
+            rows_seen += len(rows)
+            if is_last_page(resp, rows, rows_seen, start_date, max_rows, date_field):
+                return
+
+            cont_yn = "Y"
+            next_key = resp.next_key
+
+        log_warn(
+            "client.kiwoom",
+            "Page limit reached",
+            {"list_key": list_key, "max_pages": max_pages},
+        )
+
+    def transport_stats(self) -> Dict[str, int]:
+        """
+        Get connection reuse counters of the underlying transport.
+
+        Returns:
+            Transport stats (requests, connections_opened, connections_reused, ...)
+        """
+        return self.transport.stats()
+
+    def close(self) -> None:
+        """Close the underlying transport."""
+        self.transport.close()
+
     # ========== Stock Search ==========
 
     def get_stock_list(
@@ -265,6 +451,8 @@ class KiwoomClient:
         amt_qty_tp: str = "1",
         trde_tp: str = "0",
         unit_tp: str = "1000",
+        cont_yn: str = "",
+        next_key: str = "",
     ) -> ApiResponse:
         """
         Get investor/institution trend by stock (ka10059).
@@ -275,6 +463,8 @@ class KiwoomClient:
             amt_qty_tp: Amount/quantity type (1: Amount, 2: Quantity)
             trde_tp: Trade type (0: Net buy, 1: Buy, 2: Sell)
             unit_tp: Unit type (1000, etc.)
+            cont_yn: Continuation flag (Y/N) for pagination
+            next_key: Next key for pagination
 
         Returns:
             ApiResponse with investor trading trend
@@ -292,6 +482,8 @@ class KiwoomClient:
                 "trde_tp": trde_tp,
                 "unit_tp": unit_tp,
             },
+            cont_yn=cont_yn,
+            next_key=next_key,
         )
 
     def get_investor_summary(
@@ -344,15 +536,20 @@ class KiwoomClient:
         start_date: str,
         end_date: str,
         adj_price: str = "1",
+        cont_yn: str = "",
+        next_key: str = "",
     ) -> ApiResponse:
         """
         Get daily chart data (ka10081).
 
         Args:
             ticker: Stock code
-            start_date: Start date (YYYYMMDD) - not used by API, kept for interface
+            start_date: Start date (YYYYMMDD) - not sent to API, use iter_pages()
+                to page back until it is reached
             end_date: End date (YYYYMMDD) - used as base_dt
             adj_price: Adjusted price flag (0: No, 1: Yes) - maps to upd_stkpc_tp
+            cont_yn: Continuation flag (Y/N) for pagination
+            next_key: Next key for pagination
 
         Returns:
             ApiResponse with OHLCV data
@@ -365,6 +562,8 @@ class KiwoomClient:
                 "base_dt": end_date,
                 "upd_stkpc_tp": adj_price,
             },
+            cont_yn=cont_yn,
+            next_key=next_key,
         )
 
     def get_weekly_chart(
@@ -373,15 +572,20 @@ class KiwoomClient:
         start_date: str,
         end_date: str,
         adj_price: str = "1",
+        cont_yn: str = "",
+        next_key: str = "",
     ) -> ApiResponse:
         """
         Get weekly chart data (ka10082).
 
         Args:
             ticker: Stock code
-            start_date: Start date (YYYYMMDD) - not used by API, kept for interface
+            start_date: Start date (YYYYMMDD) - not sent to API, use iter_pages()
+                to page back until it is reached
             end_date: End date (YYYYMMDD) - used as base_dt
             adj_price: Adjusted price flag (0: No, 1: Yes) - maps to upd_stkpc_tp
+            cont_yn: Continuation flag (Y/N) for pagination
+            next_key: Next key for pagination
 
         Returns:
             ApiResponse with OHLCV data
@@ -394,6 +598,8 @@ class KiwoomClient:
                 "base_dt": end_date,
                 "upd_stkpc_tp": adj_price,
             },
+            cont_yn=cont_yn,
+            next_key=next_key,
         )
 
     def get_monthly_chart(
@@ -402,15 +608,20 @@ class KiwoomClient:
         start_date: str,
         end_date: str,
         adj_price: str = "1",
+        cont_yn: str = "",
+        next_key: str = "",
     ) -> ApiResponse:
         """
         Get monthly chart data (ka10083).
 
         Args:
             ticker: Stock code
-            start_date: Start date (YYYYMMDD) - not used by API, kept for interface
+            start_date: Start date (YYYYMMDD) - not sent to API, use iter_pages()
+                to page back until it is reached
             end_date: End date (YYYYMMDD) - used as base_dt
             adj_price: Adjusted price flag (0: No, 1: Yes) - maps to upd_stkpc_tp
+            cont_yn: Continuation flag (Y/N) for pagination
+            next_key: Next key for pagination
 
         Returns:
             ApiResponse with OHLCV data
@@ -423,6 +634,8 @@ class KiwoomClient:
                 "base_dt": end_date,
                 "upd_stkpc_tp": adj_price,
             },
+            cont_yn=cont_yn,
+            next_key=next_key,
         )
 
     # ========== ETF ==========
@@ -0,0 +1,573 @@
+"""Local mock Kiwoom/KIS API server for offline load tests.
+
+Serves deterministic synthetic data for the endpoints used by KiwoomClient
+and the etf-collector (KiwoomEtfListCollector, ConstituentCollector), with
+cont-yn/next-key pagination, configurable latency and injected rate-limit
+errors (HTTP 429 for Kiwoom, EGW00201 for KIS).
+
+Run standalone:
+    python -m stock_analyzer.client.mock_server --port 8090 --latency 0.02 \\
+        --rate-limit 15 --error-rate 0.01
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+import zlib
+from collections import Counter, deque
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from ..core.log import log_info
+
+KIWOOM_TOKEN_PATH = "/oauth2/token"
+KIS_TOKEN_PATH = "/oauth2/tokenP"
+KIS_COMPONENT_PATH = "/uapi/etfetn/v1/quotations/inquire-component-stock-price"
+
+# api_id -> list field of paginated Kiwoom responses
+LIST_KEYS = {
+    "ka10099": "list",
+    "ka10059": "stk_invsr_orgn",
+    "ka10081": "stk_dt_pole_chart_qry",
+    "ka10082": "stk_stk_pole_chart_qry",
+    "ka10083": "stk_mth_pole_chart_qry",
+    "ka40004": "etf_list",
+}
+
+OK_MSG = "정상적으로 처리되었습니다"
+
+
+@dataclass
+class MockConfig:
+    """
+    Mock server behaviour.
+
+    Attributes:
+        latency: Seconds added to every response
+        jitter: Extra random latency, uniform in [0, jitter)
+        rate_limit: Requests per second accepted per API family before
+            throttling (0 = unlimited)
+        error_rate: Probability of an injected rate-limit error per request
+        page_size: Rows per page of list APIs
+        history_days: Trading days of chart/investor history per ticker
+        stocks: Number of stocks in the master (ka10099)
+        etfs: Number of ETFs in the ETF list (ka40004)
+        constituents: Constituents per ETF (FHKST121600C0)
+        token_ttl: Token lifetime in seconds
+        seed: Seed of synthetic data and error injection
+    """
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    rate_limit: float = 0.0
+    error_rate: float = 0.0
+    page_size: int = 100
+    history_days: int = 1500
+    stocks: int = 200
+    etfs: int = 50
+    constituents: int = 30
+    token_ttl: int = 86400
+    seed: int = 0
+
+
+def _seed(*parts: Any) -> int:
+    """Stable seed for a (config seed, ticker, ...) tuple."""
+    return zlib.crc32("|".join(str(p) for p in parts).encode("utf-8"))
+
+
+def _trading_days(end: str, count: int) -> List[str]:
+    """Weekdays on or before end (YYYYMMDD), newest first."""
+    day = datetime.strptime(end, "%Y%m%d").date()
+    days = []
+    while len(days) < count:
+        if day.weekday() < 5:
+            days.append(day.strftime("%Y%m%d"))
+        day -= timedelta(days=1)
+    return days
+
+
+class SyntheticMarket:
+    """Deterministic stock, chart, investor and ETF data."""
+
+    def __init__(self, config: MockConfig):
+        self.config = config
+        self._lock = threading.Lock()
+        self._bars: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+
+    def stock_codes(self) -> List[str]:
+        return [f"{100000 + i * 7:06d}" for i in range(self.config.stocks)]
+
+    def etf_codes(self) -> List[str]:
+        return [f"{400000 + i * 3:06d}" for i in range(self.config.etfs)]
+
+    def stock_list(self) -> List[Dict[str, Any]]:
+        """ka10099 rows."""
+        markets = ("거래소", "코스닥")
+        return [
+            {"code": code, "name": f"종목{code}", "marketName": markets[i % 2]}
+            for i, code in enumerate(self.stock_codes())
+        ]
+
+    def daily_bars(self, ticker: str, end: str) -> List[Dict[str, Any]]:
+        """ka10081 rows (random walk), newest first."""
+        key = (ticker, end)
+        with self._lock:
+            bars = self._bars.get(key)
+        if bars is not None:
+            return bars
+
+        rng = random.Random(_seed(self.config.seed, ticker))
+        days = _trading_days(end, self.config.history_days)
+        price = rng.randint(5000, 200000)
+        bars = []
+        for dt in reversed(days):
+            price = max(100, int(price * (1 + rng.gauss(0.0003, 0.02))))
+            spread = max(1, int(price * 0.01))
+            open_ = price + rng.randint(-spread, spread)
+            bars.append({
+                "dt": dt,
+                "open_pric": open_,
+                "high_pric": max(open_, price) + rng.randint(0, spread),
+                "low_pric": min(open_, price) - rng.randint(0, spread),
+                "cur_prc": price,
+                "trde_qty": rng.randint(10000, 5000000),
+            })
+        bars.reverse()
+        with self._lock:
+            self._bars[key] = bars
+        return bars
+
+    def resampled_bars(self, ticker: str, end: str, api_id: str) -> List[Dict]:
+        """ka10082/ka10083 rows built from the daily rows."""
+        groups: Dict[str, List[Dict[str, Any]]] = {}
+        order: List[str] = []
+        for bar in self.daily_bars(ticker, end):
+            d = datetime.strptime(bar["dt"], "%Y%m%d").date()
+            if api_id == "ka10082":
+                key = (d + timedelta(days=4 - d.weekday())).strftime("%Y%m%d")
+            else:
+                key = bar["dt"][:6]
+            if key not in groups:
+                groups[key] = []
+                order.append(key)
+            groups[key].append(bar)
+        rows = []
+        for key in order:
+            bars = groups[key]  # Newest first
+            rows.append({
+                "dt": bars[0]["dt"],
+                "open_pric": bars[-1]["open_pric"],
+                "high_pric": max(b["high_pric"] for b in bars),
+                "low_pric": min(b["low_pric"] for b in bars),
+                "cur_prc": bars[0]["cur_prc"],
+                "trde_qty": sum(b["trde_qty"] for b in bars),
+            })
+        return rows
+
+    def investor_rows(self, ticker: str, end: str) -> List[Dict[str, Any]]:
+        """ka10059 rows, newest first."""
+        rng = random.Random(_seed(self.config.seed, ticker, "investor"))
+        cap = rng.randint(10**11, 10**14)
+        rows = []
+        for dt in _trading_days(end, self.config.history_days):
+            rows.append({
+                "dt": dt,
+                "mrkt_tot_amt": cap,
+                "frgnr_invsr": rng.randint(-10**10, 10**10),
+                "orgn": rng.randint(-10**10, 10**10),
+                "ind_invsr": rng.randint(-10**10, 10**10),
+            })
+        return rows
+
+    def stock_info(self, ticker: str) -> Dict[str, Any]:
+        """ka10001 body."""
+        rng = random.Random(_seed(self.config.seed, ticker, "info"))
+        today = date.today().strftime("%Y%m%d")
+        return {
+            "stk_cd": ticker,
+            "stk_nm": f"종목{ticker}",
+            "cur_prc": self.daily_bars(ticker, today)[0]["cur_prc"],
+            "mrkt_tot_amt": rng.randint(10**11, 10**14),
+            "per": round(rng.uniform(3, 40), 2),
+            "pbr": round(rng.uniform(0.3, 5), 2),
+        }
+
+    def etf_list(self) -> List[Dict[str, Any]]:
+        """ka40004 rows."""
+        brands = ("KODEX", "TIGER", "KBSTAR", "ACE", "SOL")
+        rows = []
+        for i, code in enumerate(self.etf_codes()):
+            rng = random.Random(_seed(self.config.seed, code, "etf"))
+            price = rng.randint(5000, 60000)
+            rows.append({
+                "stk_cd": code,
+                "stk_nm": f"{brands[i % len(brands)]} 테마{i}",
+                "close_pric": str(price),
+                "pred_pre": str(rng.randint(-500, 500)),
+                "pre_sig": "2",
+                "pre_rt": f"{rng.uniform(-3, 3):.2f}",
+                "trde_qty": str(rng.randint(1000, 900000)),
+                "nav": f"{price * rng.uniform(0.99, 1.01):.2f}",
+                "trace_idex_nm": f"테마지수{i}",
+                "trace_idex_cd": f"{i:03d}",
+                "trace_eor_rt": f"{rng.uniform(0, 1):.2f}",
+                "mngmcomp": brands[i % len(brands)],
+                "drng": "1",
+            })
+        return rows
+
+    def etf_components(self, etf_code: str) -> Dict[str, Any]:
+        """FHKST121600C0 body."""
+        rng = random.Random(_seed(self.config.seed, etf_code, "components"))
+        codes = rng.sample(
+            self.stock_codes(), min(self.config.constituents, self.config.stocks)
+        )
+        weights = [rng.random() for _ in codes]
+        total = sum(weights) or 1.0
+        output2 = []
+        for code, weight in zip(codes, weights):
+            price = rng.randint(1000, 300000)
+            output2.append({
+                "stck_shrn_iscd": code,
+                "hts_kor_isnm": f"종목{code}",
+                "stck_prpr": str(price),
+                "prdy_vrss": str(rng.randint(-1000, 1000)),
+                "prdy_vrss_sign": "2",
+                "prdy_ctrt": f"{rng.uniform(-5, 5):.2f}",
+                "acml_vol": str(rng.randint(1000, 10**7)),
+                "acml_tr_pbmn": str(rng.randint(10**6, 10**11)),
+                "hts_avls": str(rng.randint(100, 10**6)),
+                "etf_cnfg_issu_rlim": f"{weight / total * 100:.2f}",
+                "etf_vltn_amt": str(rng.randint(10**6, 10**10)),
+            })
+        price = rng.randint(5000, 60000)
+        return {
+            "output1": {
+                "stck_prpr": str(price),
+                "prdy_vrss": "0",
+                "prdy_ctrt": "0.00",
+                "nav": f"{price:.2f}",
+                "etf_ntas_ttam": str(rng.randint(10**3, 10**6)),
+                "etf_cu_unit_scrt_cnt": str(len(codes)),
+                "etf_cnfg_issu_cnt": str(len(codes)),
+            },
+            "output2": output2,
+            "rt_cd": "0",
+            "msg_cd": "MCA00000",
+            "msg1": "정상처리 되었습니다.",
+        }
+
+
+class _Throttle:
+    """Per-family sliding one-second window plus random error injection."""
+
+    def __init__(self, config: MockConfig):
+        self.config = config
+        self._lock = threading.Lock()
+        self._rng = random.Random(config.seed)
+        self._windows: Dict[str, deque] = {}
+
+    def limited(self, family: str) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            if self.config.error_rate and self._rng.random() < self.config.error_rate:
+                return True
+            if not self.config.rate_limit:
+                return False
+            window = self._windows.setdefault(family, deque())
+            while window and now - window[0] >= 1.0:
+                window.popleft()
+            if len(window) >= self.config.rate_limit:
+                return True
+            window.append(now)
+            return False
+
+
+class MockServer:
+    """
+    Threaded HTTP server imitating the Kiwoom and KIS REST APIs.
+
+    Both APIs share one base URL, so the same server can back KiwoomClient,
+    KiwoomEtfListCollector and ConstituentCollector at once.
+
+    Example:
+        with MockServer(MockConfig(latency=0.02, error_rate=0.05)) as server:
+            client = KiwoomClient("key", "secret", base_url=server.url)
+            ohlcv.get_daily(client, "005930", days=365)
+            print(server.stats())
+    """
+
+    def __init__(
+        self,
+        config: Optional[MockConfig] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """
+        Initialize server (not started).
+
+        Args:
+            config: Server behaviour (defaults if None)
+            host: Bind address
+            port: Bind port (0 picks a free one)
+        """
+        self.config = config or MockConfig()
+        self.market = SyntheticMarket(self.config)
+        self._throttle = _Throttle(self.config)
+        self._lock = threading.Lock()
+        self._counts: Counter = Counter()
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockServer":
+        """Serve in a background thread."""
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever,
+            kwargs={"poll_interval": 0.05},
+            name="mock-api",
+            daemon=True,
+        )
+        self._thread.start()
+        log_info("client.mock_server", "Mock server started", {"url": self.url})
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release the port."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "MockServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get request counters.
+
+        Returns:
+            {"requests": 130, "throttled": 4, "ka10081": 100, "FHKST121600C0": 30, ...}
+        """
+        with self._lock:
+            return dict(self._counts)
+
+    def _count(self, *names: str) -> None:
+        with self._lock:
+            for name in names:
+                self._counts[name] += 1
+
+    def _sleep(self) -> None:
+        delay = self.config.latency
+        if self.config.jitter:
+            delay += random.uniform(0, self.config.jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+    # ========== Kiwoom ==========
+
+    def _kiwoom_token(self) -> Dict[str, Any]:
+        expires = datetime.now() + timedelta(seconds=self.config.token_ttl)
+        return {
+            "expires_dt": expires.strftime("%Y%m%d%H%M%S"),
+            "token_type": "bearer",
+            "token": "mock-kiwoom-token",
+            "return_code": 0,
+            "return_msg": OK_MSG,
+        }
+
+    def _kiwoom_rows(self, api_id: str, body: Dict[str, Any]) -> Optional[List[Dict]]:
+        """Full row list of a paginated API, or None if not paginated."""
+        today = date.today().strftime("%Y%m%d")
+        ticker = body.get("stk_cd", "")
+        if api_id == "ka10099":
+            return self.market.stock_list()
+        if api_id == "ka40004":
+            return self.market.etf_list()
+        if api_id == "ka10081":
+            return self.market.daily_bars(ticker, body.get("base_dt") or today)
+        if api_id in ("ka10082", "ka10083"):
+            end = body.get("base_dt") or today
+            return self.market.resampled_bars(ticker, end, api_id)
+        if api_id == "ka10059":
+            return self.market.investor_rows(ticker, body.get("dt") or today)
+        return None
+
+    def kiwoom(
+        self,
+        api_id: str,
+        body: Dict[str, Any],
+        next_key: str,
+    ) -> Tuple[int, Dict[str, Any], Dict[str, str]]:
+        """
+        Answer a Kiwoom request.
+
+        Returns:
+            (status, JSON body, response headers)
+        """
+        if api_id == "au10001":
+            return 200, self._kiwoom_token(), {"api-id": api_id}
+        if api_id == "ka10001":
+            data = dict(self.market.stock_info(body.get("stk_cd", "")))
+            data.update(return_code=0, return_msg=OK_MSG)
+            return 200, data, {"api-id": api_id}
+
+        rows = self._kiwoom_rows(api_id, body)
+        if rows is None:
+            return 200, {
+                "return_code": 2,
+                "return_msg": f"지원하지 않는 API입니다 ({api_id})",
+            }, {"api-id": api_id}
+
+        offset = int(next_key) if next_key.isdigit() else 0
+        end = offset + self.config.page_size
+        headers = {"api-id": api_id, "cont-yn": "N", "next-key": ""}
+        if end < len(rows):
+            headers.update({"cont-yn": "Y", "next-key": str(end)})
+        data = {
+            LIST_KEYS[api_id]: rows[offset:end],
+            "return_code": 0,
+            "return_msg": OK_MSG,
+        }
+        return 200, data, headers
+
+    # ========== KIS ==========
+
+    def _kis_token(self) -> Dict[str, Any]:
+        return {
+            "access_token": "mock-kis-token",
+            "token_type": "Bearer",
+            "expires_in": self.config.token_ttl,
+        }
+
+    @staticmethod
+    def _kis_rate_limited() -> Dict[str, Any]:
+        return {
+            "rt_cd": "1",
+            "msg_cd": "EGW00201",
+            "msg1": "초당 거래건수를 초과하였습니다.",
+        }
+
+    # ========== HTTP ==========
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # Keep-alive, like the real APIs
+
+            def log_message(self, format, *args):  # noqa: A002
+                pass  # Keep load tests quiet
+
+            def _reply(self, status: int, data: Dict, headers: Dict[str, str] = None):
+                raw = json.dumps(data, ensure_ascii=False).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json;charset=UTF-8")
+                self.send_header("Content-Length", str(len(raw)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(raw)
+
+            def _body(self) -> Dict[str, Any]:
+                length = int(self.headers.get("Content-Length") or 0)
+                if not length:
+                    return {}
+                try:
+                    return json.loads(self.rfile.read(length).decode("utf-8"))
+                except ValueError:
+                    return {}
+
+            def do_POST(self):
+                body = self._body()
+                path = urlsplit(self.path).path
+                server._sleep()
+
+                if path == KIS_TOKEN_PATH:
+                    server._count("requests", "tokenP")
+                    self._reply(200, server._kis_token())
+                    return
+
+                api_id = self.headers.get("api-id", "")
+                server._count("requests", api_id or path)
+                if api_id != "au10001" and server._throttle.limited("kiwoom"):
+                    server._count("throttled")
+                    self._reply(429, {
+                        "return_code": 5,
+                        "return_msg": "허용된 요청 개수를 초과하였습니다",
+                    })
+                    return
+                status, data, headers = server.kiwoom(
+                    api_id, body, self.headers.get("next-key", ""),
+                )
+                self._reply(status, data, headers)
+
+            def do_GET(self):
+                parts = urlsplit(self.path)
+                server._sleep()
+                if parts.path != KIS_COMPONENT_PATH:
+                    server._count("requests", "not_found")
+                    self._reply(404, {"rt_cd": "1", "msg1": "Not found"})
+                    return
+
+                server._count("requests", "FHKST121600C0")
+                if server._throttle.limited("kis"):
+                    server._count("throttled")
+                    self._reply(200, server._kis_rate_limited())
+                    return
+                query = parse_qs(parts.query)
+                etf_code = query.get("FID_INPUT_ISCD", [""])[0]
+                self._reply(200, server.market.etf_components(etf_code))
+
+        return Handler
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run the mock server until interrupted."""
+    parser = argparse.ArgumentParser(description="Mock Kiwoom/KIS API server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="seconds")
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="req/s")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    config = MockConfig(
+        latency=args.latency,
+        jitter=args.jitter,
+        rate_limit=args.rate_limit,
+        error_rate=args.error_rate,
+        page_size=args.page_size,
+        seed=args.seed,
+    )
+    server = MockServer(config, args.host, args.port).start()
+    print(f"Mock API server on {server.url} (Ctrl+C to stop)", flush=True)
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        print(json.dumps(server.stats(), ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,326 @@
+"""Record/replay transports for offline API runs."""
+
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from ..core.http import HttpTransport
+from ..core.log import log_info
+
+CASSETTE_VERSION = 1
+
+# Request headers that select a response (credentials are never stored)
+KEY_HEADERS = ("api-id", "tr_id", "cont-yn", "next-key")
+# Response headers kept in a cassette (continuation state)
+RESPONSE_HEADERS = ("cont-yn", "next-key", "api-id", "tr_id", "tr_cont")
+# Request/response fields replaced before a cassette is written
+SECRET_FIELDS = frozenset({
+    "appkey", "secretkey", "appsecret", "token", "access_token",
+})
+REDACTED = "REDACTED"
+
+
+class CassetteMiss(requests.RequestException):
+    """No recorded response matches a request."""
+
+
+def _redact(data: Any) -> Any:
+    """Replace credentials in a JSON body."""
+    if isinstance(data, dict):
+        return {
+            key: REDACTED if key in SECRET_FIELDS else _redact(value)
+            for key, value in data.items()
+        }
+    if isinstance(data, list):
+        return [_redact(item) for item in data]
+    return data
+
+
+def request_key(url: str, headers: Dict[str, str], body: Dict[str, Any]) -> str:
+    """
+    Get the cassette key of a request.
+
+    Only the URL path is used, so a cassette recorded against the live
+    server replays under any base URL. Credentials and the authorization
+    header do not take part.
+
+    Args:
+        url: Full request URL
+        headers: Request headers
+        body: JSON body or query parameters
+
+    Returns:
+        Stable key string
+    """
+    lowered = {k.lower(): v for k, v in headers.items()}
+    return json.dumps(
+        [
+            urlsplit(url).path,
+            {name: lowered.get(name, "") for name in KEY_HEADERS},
+            _redact(body),
+        ],
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+
+
+def build_response(
+    url: str,
+    status_code: int,
+    data: Any,
+    headers: Optional[Dict[str, str]] = None,
+) -> requests.Response:
+    """Build a ``requests.Response`` carrying a JSON body."""
+    resp = requests.Response()
+    resp.url = url
+    resp.status_code = status_code
+    resp.headers = CaseInsensitiveDict(headers or {})
+    resp.headers.setdefault("Content-Type", "application/json;charset=UTF-8")
+    resp._content = json.dumps(data, ensure_ascii=False).encode("utf-8")
+    resp.encoding = "utf-8"
+    return resp
+
+
+class Cassette:
+    """
+    Recorded request/response pairs stored in one JSON file.
+
+    A request recorded several times (e.g. a 429 followed by a success)
+    keeps every response; replay returns them in order and then repeats
+    the last one.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize cassette.
+
+        Args:
+            path: Cassette file (loaded if it exists)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._interactions: Dict[str, List[Dict[str, Any]]] = {}
+        self._cursors: Dict[str, int] = {}
+        if os.path.exists(path):
+            self.load()
+
+    def __len__(self) -> int:
+        return sum(len(v) for v in self._interactions.values())
+
+    def load(self) -> None:
+        """Load interactions from the cassette file."""
+        with open(self.path, encoding="utf-8") as f:
+            raw = json.load(f)
+        interactions: Dict[str, List[Dict[str, Any]]] = {}
+        for item in raw.get("interactions", []):
+            key = request_key(
+                item["request"]["url"],
+                item["request"]["headers"],
+                item["request"]["body"],
+            )
+            interactions.setdefault(key, []).append(item["response"])
+        with self._lock:
+            self._interactions = interactions
+            self._cursors = {}
+
+    def save(self) -> None:
+        """Write the cassette atomically."""
+        with self._lock:
+            items = []
+            for key, responses in self._interactions.items():
+                path, headers, body = json.loads(key)
+                request = {"url": path, "headers": headers, "body": body}
+                items.extend(
+                    {"request": request, "response": response}
+                    for response in responses
+                )
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(
+                {"version": CASSETTE_VERSION, "interactions": items},
+                f, ensure_ascii=False, indent=1,
+            )
+        os.replace(tmp, self.path)
+
+    def record(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        body: Dict[str, Any],
+        resp: requests.Response,
+    ) -> None:
+        """
+        Add a response.
+
+        Args:
+            url: Request URL
+            headers: Request headers
+            body: JSON body or query parameters
+            resp: Response to store (JSON body and continuation headers)
+        """
+        try:
+            data = resp.json()
+        except ValueError:
+            data = None
+        response = {
+            "status": resp.status_code,
+            "headers": {
+                name: resp.headers[name]
+                for name in RESPONSE_HEADERS if name in resp.headers
+            },
+            "json": _redact(data),
+        }
+        key = request_key(url, headers, body)
+        with self._lock:
+            self._interactions.setdefault(key, []).append(response)
+
+    def play(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        body: Dict[str, Any],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get the next recorded response of a request.
+
+        Returns:
+            {"status", "headers", "json"} or None if never recorded
+        """
+        key = request_key(url, headers, body)
+        with self._lock:
+            responses = self._interactions.get(key)
+            if not responses:
+                return None
+            cursor = self._cursors.get(key, 0)
+            self._cursors[key] = cursor + 1
+            return responses[min(cursor, len(responses) - 1)]
+
+    def rewind(self) -> None:
+        """Replay every request from its first response again."""
+        with self._lock:
+            self._cursors = {}
+
+
+class RecordingTransport(HttpTransport):
+    """
+    Transport that forwards requests and records the responses.
+
+    Tokens and app keys are redacted, so cassettes can be committed.
+
+    Example:
+        transport = RecordingTransport(SessionTransport(), "cassettes/005930.json")
+        client = KiwoomClient(app_key, secret_key, transport=transport)
+        analysis.analyze(client, "005930")
+        transport.close()  # Writes the cassette
+    """
+
+    def __init__(self, inner: HttpTransport, path: str):
+        """
+        Initialize recording transport.
+
+        Args:
+            inner: Transport doing the real requests
+            path: Cassette file (new responses are appended)
+        """
+        self.inner = inner
+        self.cassette = Cassette(path)
+        self._lock = threading.Lock()
+        self._recorded = 0
+
+    def post(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        json_data: Dict[str, Any],
+        timeout: Optional[float] = None,
+    ) -> requests.Response:
+        """Send POST request and record the response."""
+        resp = self.inner.post(
+            url, headers=headers, json_data=json_data, timeout=timeout,
+        )
+        self.cassette.record(url, headers, json_data, resp)
+        with self._lock:
+            self._recorded += 1
+        return resp
+
+    def stats(self) -> Dict[str, int]:
+        """Get inner transport counters plus the recorded count."""
+        with self._lock:
+            return dict(self.inner.stats(), recorded=self._recorded)
+
+    def close(self) -> None:
+        """Write the cassette and close the inner transport."""
+        self.cassette.save()
+        log_info("client.replay", "Cassette saved", {
+            "path": self.cassette.path,
+            "interactions": len(self.cassette),
+        })
+        self.inner.close()
+
+
+class ReplayTransport(HttpTransport):
+    """
+    Transport that answers from a cassette without touching the network.
+
+    Unknown requests raise CassetteMiss (a ``requests.RequestException``),
+    which clients report as a network error.
+
+    Example:
+        client = KiwoomClient("key", "secret", min_interval=0,
+                              transport=ReplayTransport("cassettes/005930.json"))
+    """
+
+    def __init__(self, path: str, latency: float = 0.0):
+        """
+        Initialize replay transport.
+
+        Args:
+            path: Cassette file
+            latency: Seconds to sleep per request (simulated network time)
+        """
+        self.cassette = Cassette(path)
+        self.latency = latency
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._misses = 0
+
+    def post(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        json_data: Dict[str, Any],
+        timeout: Optional[float] = None,
+    ) -> requests.Response:
+        """Return the recorded response of a request."""
+        with self._lock:
+            self._requests += 1
+        if self.latency > 0:
+            time.sleep(self.latency)
+        response = self.cassette.play(url, headers, json_data)
+        if response is None:
+            with self._lock:
+                self._misses += 1
+            raise CassetteMiss(
+                f"No recorded response: {request_key(url, headers, json_data)}"
+            )
+        return build_response(
+            url, response["status"], response["json"], response["headers"],
+        )
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get replay counters.
+
+        Returns:
+            {"requests", "misses"}
+        """
+        with self._lock:
+            return {"requests": self._requests, "misses": self._misses}
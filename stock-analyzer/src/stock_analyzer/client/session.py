@@ -0,0 +1,140 @@
+"""Request-memoizing Kiwoom session."""
+
+import json
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from ..core.log import log_info
+from .kiwoom import ApiResponse, KiwoomClient
+
+
+class _Flight:
+    """A request in progress that other callers can wait for."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Optional[ApiResponse] = None
+
+
+class KiwoomSession(KiwoomClient):
+    """
+    Kiwoom client view that issues each distinct request once.
+
+    Successful responses are memoized by (api_id, url, body, cont-yn,
+    next-key) for the lifetime of the session, and concurrent identical
+    requests are collapsed into one API call whose response is shared.
+    Auth, transport and rate limiter are shared with the wrapped client.
+
+    A session is meant to be short-lived (one analysis or dashboard), so
+    every endpoint is treated as a snapshot. Responses are shared between
+    callers and must not be modified.
+
+    Example:
+        with KiwoomSession(client) as session:
+            analysis.analyze(session, "005930")
+            trend.calc(session, "005930")  # daily chart pages come from memory
+    """
+
+    def __init__(self, client: KiwoomClient):
+        """
+        Initialize session.
+
+        Args:
+            client: Kiwoom API client that sends the requests
+        """
+        # Share auth, transport and rate limiter with the wrapped client
+        self.__dict__.update(client.__dict__)
+        self.client = client
+        self._memo: Dict[Tuple, ApiResponse] = {}
+        self._inflight: Dict[Tuple, _Flight] = {}
+        self._memo_lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "coalesced": 0}
+
+    def __enter__(self) -> "KiwoomSession":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @staticmethod
+    def _key(
+        api_id: str,
+        url: str,
+        body: Dict[str, Any],
+        cont_yn: str,
+        next_key: str,
+    ) -> Tuple:
+        return (
+            api_id,
+            url,
+            json.dumps(body, sort_keys=True, ensure_ascii=False),
+            cont_yn,
+            next_key,
+        )
+
+    def _call(
+        self,
+        api_id: str,
+        url: str,
+        body: Dict[str, Any],
+        cont_yn: str = "",
+        next_key: str = "",
+        timeout: int = 30,
+    ) -> ApiResponse:
+        """Call API endpoint once per distinct request (see class docstring)."""
+        key = self._key(api_id, url, body, cont_yn, next_key)
+
+        with self._memo_lock:
+            resp = self._memo.get(key)
+            if resp is not None:
+                self._stats["hits"] += 1
+                return resp
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = _Flight()
+                self._inflight[key] = flight
+                self._stats["misses"] += 1
+            else:
+                self._stats["coalesced"] += 1
+
+        if not leader:
+            flight.done.wait()
+            return flight.result
+
+        resp = ApiResponse(
+            ok=False,
+            error={"code": "UNKNOWN_ERROR", "msg": "Unexpected error"},
+        )
+        try:
+            resp = self.client._call(api_id, url, body, cont_yn, next_key, timeout)
+        finally:
+            with self._memo_lock:
+                # Errors are shared with waiters but not memoized
+                if resp.ok:
+                    self._memo[key] = resp
+                del self._inflight[key]
+            flight.result = resp
+            flight.done.set()
+        return resp
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get memoization counters.
+
+        Returns:
+            {"hits", "misses", "coalesced", "entries"}
+        """
+        with self._memo_lock:
+            return dict(self._stats, entries=len(self._memo))
+
+    def clear(self) -> None:
+        """Drop memoized responses."""
+        with self._memo_lock:
+            self._memo.clear()
+
+    def close(self) -> None:
+        """End the session (the wrapped client's transport stays open)."""
+        stats = self.stats()
+        self.clear()
+        log_info("client.session", "Session closed", stats)
@@ -1,8 +1,10 @@
 """Core utilities."""
 
 from .log import get_logger, log_err, log_info
-from .http import HttpClient
+from .http import HttpClient, HttpTransport, SessionTransport
+from .rate_limit import BucketConfig, RateLimiter, TokenBucket
 from .date import fmt_date, parse_date, today_str
+from .krx_calendar import KST, KrxCalendar
 from .json_util import from_json, safe_float, safe_int, to_json
 
 __all__ = [
@@ -10,9 +12,16 @@ __all__ = [
     "log_err",
     "log_info",
     "HttpClient",
+    "HttpTransport",
+    "SessionTransport",
+    "BucketConfig",
+    "RateLimiter",
+    "TokenBucket",
     "fmt_date",
     "parse_date",
     "today_str",
+    "KST",
+    "KrxCalendar",
     "to_json",
     "from_json",
     "safe_int",
@@ -1,11 +1,18 @@
 """HTTP client utilities."""
 
+import threading
+from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Any, Dict, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
-from .log import log_err, log_info
+from .log import log_err, log_info, log_warn
+
+# Connection pool settings
+DEFAULT_POOL_CONNECTIONS = 4  # Number of per-host pools kept alive
+DEFAULT_POOL_MAXSIZE = 10  # Maximum keep-alive connections per host
 
 
 @dataclass
@@ -19,13 +26,172 @@ class HttpResponse:
     headers: Optional[Dict[str, str]] = None
 
 
+class HttpTransport(ABC):
+    """
+    Pluggable transport used by API clients.
+
+    Subclasses send a single POST request and return the raw
+    ``requests.Response``. Errors are raised as ``requests.RequestException``
+    so callers keep a single error-handling path.
+    """
+
+    @abstractmethod
+    def post(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        json_data: Dict[str, Any],
+        timeout: Optional[float] = None,
+    ) -> requests.Response:
+        """Send POST request with JSON body."""
+
+    def stats(self) -> Dict[str, int]:
+        """Get transport counters."""
+        return {}
+
+    def close(self) -> None:
+        """Release transport resources."""
+
+
+class SessionTransport(HttpTransport):
+    """
+    Keep-alive transport backed by a pooled ``requests.Session``.
+
+    Connections are reused across calls, so the TCP+TLS handshake is paid
+    once per pooled connection instead of once per request.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        session: Optional[requests.Session] = None,
+    ):
+        """
+        Initialize session transport.
+
+        Args:
+            pool_connections: Number of per-host connection pools to cache
+            pool_maxsize: Maximum connections kept per host
+            pool_block: Block when a host's pool is exhausted instead of
+                opening extra (non-pooled) connections
+            session: Existing session to mount the adapter on
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+
+        self.session = session or requests.Session()
+        self._adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self.session.mount("https://", self._adapter)
+        self.session.mount("http://", self._adapter)
+
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._errors = 0
+        # Counters of pools already dropped by the pool manager (evicted
+        # hosts or close()), so stats() stays cumulative
+        self._disposed_opened = 0
+        self._disposed_served = 0
+
+        self._hook_pool_disposal()
+
+    def _hook_pool_disposal(self) -> None:
+        """
+        Count the connections of pools the pool manager drops.
+
+        Relies on urllib3's private ``RecentlyUsedContainer.dispose_func``
+        (PoolManager.pools, checked with urllib3 1.26 and 2.x). If a later
+        urllib3 drops it, stats() only covers the live pools.
+        """
+        pools = self._adapter.poolmanager.pools
+        if not hasattr(pools, "dispose_func"):
+            log_warn("http", "Pool dispose hook unavailable; stats cover live pools")
+            return
+        dispose = pools.dispose_func
+
+        def on_dispose(pool) -> None:
+            with self._lock:
+                self._disposed_opened += pool.num_connections
+                self._disposed_served += pool.num_requests
+            if dispose is not None:
+                dispose(pool)
+
+        pools.dispose_func = on_dispose
+
+    def post(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        json_data: Dict[str, Any],
+        timeout: Optional[float] = None,
+    ) -> requests.Response:
+        """Send POST request over a pooled connection."""
+        with self._lock:
+            self._requests += 1
+        try:
+            return self.session.post(
+                url, headers=headers, json=json_data, timeout=timeout
+            )
+        except requests.RequestException:
+            with self._lock:
+                self._errors += 1
+            raise
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get connection reuse counters since the transport was created.
+
+        Returns:
+            {
+                "requests": 120,            # Requests sent through this transport
+                "errors": 0,                # Requests that raised
+                "connections_opened": 2,    # New TCP(+TLS) connections
+                "connections_reused": 118,  # Requests on a kept-alive connection
+            }
+        """
+        with self._lock:
+            opened = self._disposed_opened
+            served = self._disposed_served
+            pools = self._adapter.poolmanager.pools
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                opened += pool.num_connections
+                served += pool.num_requests
+
+            return {
+                "requests": self._requests,
+                "errors": self._errors,
+                "connections_opened": opened,
+                "connections_reused": max(0, served - opened),
+            }
+
+    def close(self) -> None:
+        """Close the session and all pooled connections."""
+        log_info("http", "Transport closed", self.stats())
+        self.session.close()
+
+
 class HttpClient:
     """HTTP client with retry support."""
 
-    def __init__(self, timeout: int = 30, max_retries: int = 3):
+    def __init__(
+        self,
+        timeout: int = 30,
+        max_retries: int = 3,
+        transport: Optional[SessionTransport] = None,
+    ):
         self.timeout = timeout
         self.max_retries = max_retries
-        self.session = requests.Session()
+        self.transport = transport or SessionTransport()
+        self.session = self.transport.session
 
     def post(
         self,
@@ -38,10 +204,10 @@ class HttpClient:
         timeout = timeout or self.timeout
 
         try:
-            resp = self.session.post(
+            resp = self.transport.post(
                 url,
                 headers=headers,
-                json=json_data,
+                json_data=json_data,
                 timeout=timeout,
             )
 
@@ -68,4 +234,4 @@ class HttpClient:
 
     def close(self) -> None:
         """Close the session."""
-        self.session.close()
+        self.transport.close()
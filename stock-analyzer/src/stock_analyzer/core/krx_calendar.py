@@ -0,0 +1,64 @@
+"""KRX trading calendar."""
+
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Iterable, Optional
+
+# Korea Standard Time (no daylight saving)
+KST = timezone(timedelta(hours=9))
+
+SESSION_OPEN = time(9, 0)
+SESSION_CLOSE = time(15, 30)
+# After-hours trading ends and the day's investor/program data is final
+SESSION_SETTLE = time(18, 0)
+
+
+class KrxCalendar:
+    """
+    KRX trading days and session times.
+
+    Weekends are closed; other closures (설/추석, 선거일, 연말 휴장, ...) are
+    passed in as YYYYMMDD strings since they change every year.
+
+    Example:
+        seollal = ["20250127", "20250128", "20250129", "20250130"]
+        cal = KrxCalendar(holidays=seollal)
+        cal.next_open(datetime(2025, 1, 24, 20, 0, tzinfo=KST))
+        # -> 2025-01-31 09:00 KST
+    """
+
+    def __init__(self, holidays: Iterable[str] = ()):
+        """
+        Initialize calendar.
+
+        Args:
+            holidays: Market closure dates (YYYYMMDD) besides weekends
+        """
+        self.holidays = {str(d) for d in holidays}
+
+    def is_trading_day(self, day: date) -> bool:
+        """Check whether the market opens on a day."""
+        return day.weekday() < 5 and day.strftime("%Y%m%d") not in self.holidays
+
+    def now(self, timestamp: Optional[float] = None) -> datetime:
+        """Get the current (or given epoch) time in KST."""
+        if timestamp is None:
+            return datetime.now(KST)
+        return datetime.fromtimestamp(timestamp, KST)
+
+    def next_open(self, now: datetime) -> datetime:
+        """
+        Get the next session open after a time.
+
+        Args:
+            now: Timezone-aware time
+
+        Returns:
+            Session open (KST) strictly after now
+        """
+        now = now.astimezone(KST)
+        day = now.date()
+        if now.time() >= SESSION_OPEN:
+            day += timedelta(days=1)
+        while not self.is_trading_day(day):
+            day += timedelta(days=1)
+        return datetime.combine(day, SESSION_OPEN, KST)
@@ -0,0 +1,270 @@
+"""Token-bucket rate limiting for API clients."""
+
+import bisect
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Default quota settings
+DEFAULT_RATE = 5.0  # Requests per second across all endpoints
+DEFAULT_BURST = 5  # Requests allowed back-to-back after an idle period
+
+_EPSILON = 1e-9  # Float tolerance when checking scheduled claims
+
+
+@dataclass(frozen=True)
+class BucketConfig:
+    """Token bucket settings."""
+
+    rate: float  # Tokens added per second (0 = unlimited)
+    burst: int = 1  # Bucket capacity
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    ``reserve()`` claims a token and returns how long the caller must wait for
+    it. The lock is only held while updating the bucket, never while
+    sleeping, so waiting callers do not block each other and are served in
+    arrival order.
+
+    A token can be claimed for a later send time than now (``at``). Claims
+    not yet due are kept as a sorted schedule, and a new claim takes the
+    first gap in it where the bucket stays non-negative, so a call waiting
+    on another limit does not hold back earlier calls.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize token bucket.
+
+        Args:
+            rate: Tokens added per second (0 or less = unlimited)
+            burst: Bucket capacity
+            clock: Monotonic time source
+        """
+        if burst < 1:
+            raise ValueError("burst must be >= 1")
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._scheduled: List[float] = []  # Claimed send times still ahead
+        self._lock = threading.Lock()
+
+    @property
+    def unlimited(self) -> bool:
+        return self.rate <= 0
+
+    def _refill(self, tokens: float, since: float, until: float) -> float:
+        return min(float(self.burst), tokens + (until - since) * self.rate)
+
+    def _advance(self, now: float) -> None:
+        """Fold claims that are due into the token count (lock held)."""
+        tokens, updated = self._tokens, self._updated
+        due = bisect.bisect_right(self._scheduled, now)
+        for at in self._scheduled[:due]:
+            tokens = self._refill(tokens, updated, at) - 1.0
+            updated = at
+        del self._scheduled[:due]
+        self._tokens = self._refill(tokens, updated, now)
+        self._updated = now
+
+    def _fits(self, at: float, tokens: float, since: float, later: int) -> bool:
+        """Check a claim at ``at`` keeps the later scheduled claims covered."""
+        at = max(at, since)
+        tokens = self._refill(tokens, since, at) - 1.0
+        for claim in self._scheduled[later:]:
+            tokens = self._refill(tokens, at, claim) - 1.0
+            if tokens < -_EPSILON:
+                return False
+            at = claim
+        return True
+
+    def _slot(self, at: float) -> Tuple[float, int]:
+        """
+        Find the earliest claim time at or after ``at`` (lock held).
+
+        Returns:
+            (time, position in the schedule); a time before now means the
+            token is available immediately
+        """
+        tokens, updated = self._tokens, self._updated
+        for index in range(len(self._scheduled) + 1):
+            # Earliest time after the claims before index with a whole token
+            slot = max(at, updated + (1.0 - tokens) / self.rate)
+            if index:
+                slot = max(slot, updated)
+            if index == len(self._scheduled) or slot <= self._scheduled[index]:
+                if self._fits(slot, tokens, updated, index):
+                    return slot, index
+            if index < len(self._scheduled):
+                claim = self._scheduled[index]
+                tokens = self._refill(tokens, updated, claim) - 1.0
+                updated = claim
+        raise AssertionError("unreachable: a claim after the schedule fits")
+
+    def ready_at(self, at: Optional[float] = None) -> float:
+        """
+        Get when a token could be claimed, without claiming it.
+
+        Args:
+            at: Earliest send time wanted (clock time, now if None)
+
+        Returns:
+            Clock time at or after ``at`` (``at`` itself if a token is free)
+        """
+        now = self._clock()
+        at = now if at is None else at
+        if self.unlimited:
+            return at
+        with self._lock:
+            self._advance(now)
+            return self._slot(at)[0]
+
+    def reserve(self, at: Optional[float] = None) -> float:
+        """
+        Claim one token.
+
+        Args:
+            at: Earliest send time (clock time, now if None); a call held
+                back by another limit claims its token for its real send time
+
+        Returns:
+            Seconds from now to wait before the claimed token is available
+        """
+        now = self._clock()
+        at = now if at is None else at
+        if self.unlimited:
+            return max(0.0, at - now)
+
+        with self._lock:
+            self._advance(now)
+            slot, index = self._slot(at)
+            if slot <= now:
+                self._tokens -= 1.0
+                return 0.0
+            self._scheduled.insert(index, slot)
+            return slot - now
+
+    def available(self) -> float:
+        """Get currently available tokens (may be negative while callers wait)."""
+        if self.unlimited:
+            return float(self.burst)
+        with self._lock:
+            self._advance(self._clock())
+            return self._tokens - len(self._scheduled)
+
+
+class RateLimiter:
+    """
+    Rate limiter with one global bucket and optional per-key buckets.
+
+    Every call consumes a token from the global bucket (account quota) and
+    from the bucket of its key (e.g. Kiwoom ``api_id``), so a slow endpoint
+    does not throttle the others. Both tokens are claimed for the same send
+    time, the later of the two buckets' next free slots, so a call held
+    back by its key bucket does not spend account quota ahead of time.
+
+    Example:
+        limiter = RateLimiter(
+            BucketConfig(rate=5, burst=5),
+            {"ka10081": BucketConfig(rate=2, burst=2)},
+        )
+        limiter.acquire("ka10081")
+    """
+
+    def __init__(
+        self,
+        default: Optional[BucketConfig] = None,
+        per_key: Optional[Dict[str, BucketConfig]] = None,
+        key_default: Optional[BucketConfig] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Initialize rate limiter.
+
+        Args:
+            default: Global bucket settings (DEFAULT_RATE/DEFAULT_BURST if None)
+            per_key: Extra bucket settings by key
+            key_default: Bucket settings for keys not in per_key
+                (keys without settings only use the global bucket if None)
+            clock: Monotonic time source
+            sleep: Sleep function
+        """
+        default = default or BucketConfig(DEFAULT_RATE, DEFAULT_BURST)
+        self._clock = clock
+        self._sleep = sleep
+        self._global = TokenBucket(default.rate, default.burst, clock)
+        self._configs = dict(per_key or {})
+        self._key_default = key_default
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+        self._reserve_lock = threading.Lock()
+
+    def _bucket(self, key: str) -> Optional[TokenBucket]:
+        """Get the bucket for a key, creating it on first use."""
+        config = self._configs.get(key, self._key_default)
+        if config is None or not key:
+            return None
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = TokenBucket(config.rate, config.burst, self._clock)
+                self._buckets[key] = bucket
+            return bucket
+
+    def configure(self, key: str, config: BucketConfig) -> None:
+        """Set or replace the bucket settings for a key."""
+        with self._lock:
+            self._configs[key] = config
+            self._buckets.pop(key, None)
+
+    def reserve(self, key: str = "") -> float:
+        """
+        Claim capacity for one call without sleeping.
+
+        Args:
+            key: Bucket key (e.g. api_id)
+
+        Returns:
+            Seconds to wait before the call may be sent
+        """
+        bucket = self._bucket(key)
+        with self._reserve_lock:
+            if bucket is None:
+                return self._global.reserve()
+
+            # Find a send time both buckets can serve, then claim it in both
+            send_at = self._global.ready_at()
+            while True:
+                key_at = bucket.ready_at(send_at)
+                if key_at == send_at:
+                    break
+                send_at = self._global.ready_at(key_at)
+            bucket.reserve(send_at)
+            return self._global.reserve(send_at)
+
+    def acquire(self, key: str = "") -> float:
+        """
+        Wait until one call may be sent.
+
+        Args:
+            key: Bucket key (e.g. api_id)
+
+        Returns:
+            Seconds waited
+        """
+        wait = self.reserve(key)
+        if wait > 0:
+            self._sleep(wait)
+        return wait
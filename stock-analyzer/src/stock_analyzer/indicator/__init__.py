@@ -5,8 +5,9 @@ This module provides technical analysis indicators:
 - elder: Elder Impulse System (EMA13, MACD)
 - demark: DeMark TD Sequential Setup
 - oscillator: Market Cap & Supply/Demand Oscillator (MACD Style)
+- lookback: Warmup-aware fetch planning
 """
 
-from . import demark, elder, oscillator, trend
+from . import demark, elder, lookback, oscillator, trend
 
-__all__ = ["trend", "elder", "demark", "oscillator"]
+__all__ = ["trend", "elder", "demark", "oscillator", "lookback"]
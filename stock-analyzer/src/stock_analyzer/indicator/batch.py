@@ -0,0 +1,452 @@
+"""Universe-wide batch indicators.
+
+Computes the trend, Elder, DeMark and supply oscillator indicators for many
+tickers at once from aligned (tickers x dates) matrices, dates oldest first
+(see ``stock.matrix.OhlcvMatrix``). NaN marks dates without a bar.
+
+Each ticker's bars are first shifted right so they are contiguous and end at
+the last column; after that every indicator is a handful of vectorized
+passes over the whole matrix (rolling kernels along axis 1, recursive EMAs
+and TD counters as one loop over dates). Results are scattered back to the
+input layout, NaN where the input had no bar, and equal the per-ticker
+``calc_from_ohlcv`` / ``calc_from_analysis`` values for the same bars.
+
+Labels are returned as integer codes: impulse 1 (green) / 0 (blue) /
+-1 (red), trend 1 (bullish) / 0 (neutral) / -1 (bearish).
+"""
+
+from typing import Dict, Literal
+
+import numpy as np
+
+from ..core.log import log_info
+from ..stock.matrix import OhlcvMatrix
+from .rolling import rolling_max, rolling_min, rolling_std, rolling_sum
+from .trend import (
+    FG_MIN_CALC_PERIOD,
+    FG_MOMENTUM_DIVISOR,
+    FG_MOMENTUM_LOOKBACK,
+    FG_MOMENTUM_MAX,
+    FG_MOMENTUM_MIN,
+    FG_MOMENTUM_SMOOTHING_PERIOD,
+    FG_POSITION_LOOKBACK,
+    FG_POSITION_MAX,
+    FG_POSITION_MIN,
+    FG_VOLUME_LOOKBACK,
+    FG_VOLUME_MAX,
+    FG_VOLUME_MIN,
+    FG_VOLUME_SMOOTHING_PERIOD,
+    FG_WEIGHT_MOMENTUM,
+    FG_WEIGHT_POSITION,
+    FG_WEIGHT_VOLUME_SPIKE,
+    FG_WEIGHT_VOLUME_SURGE,
+)
+
+# Label codes
+IMPULSE_CODES = {1: "green", 0: "blue", -1: "red"}
+TREND_CODES = {1: "bullish", 0: "neutral", -1: "bearish"}
+
+
+class _Aligned:
+    """
+    Row layout with each ticker's bars contiguous at the end.
+
+    ``k`` is the bar number since the ticker's first bar (negative on the
+    padding columns), which replaces the "i >= period" checks of the
+    per-ticker kernels.
+    """
+
+    def __init__(self, valid: np.ndarray):
+        # Stable sort of the mask moves padding to the front, keeping bar order
+        self.order = np.argsort(valid, axis=1, kind="stable")
+        self.counts = valid.sum(axis=1)
+        n = valid.shape[1]
+        self.k = np.arange(n)[None, :] - (n - self.counts)[:, None]
+        self.pad = self.k < 0
+
+    def gather(self, x: np.ndarray, fill: float = 0.0) -> np.ndarray:
+        """Shift a matrix into the aligned layout (padding set to fill)."""
+        out = np.take_along_axis(np.asarray(x, dtype=np.float64), self.order, axis=1)
+        out[self.pad] = fill
+        return out
+
+    def scatter(self, x: np.ndarray) -> np.ndarray:
+        """Shift an aligned result back to the input layout."""
+        out = np.full(x.shape, np.nan)
+        np.put_along_axis(out, self.order, np.where(self.pad, np.nan, x), axis=1)
+        return out
+
+
+def _shift(x: np.ndarray, periods: int, fill: float = 0.0) -> np.ndarray:
+    """Value ``periods`` columns earlier."""
+    out = np.full(x.shape, fill)
+    if periods < x.shape[1]:
+        out[:, periods:] = x[:, :-periods]
+    return out
+
+
+def _ema(x: np.ndarray, k: np.ndarray, period: int) -> np.ndarray:
+    """Row-wise EMA seeded with each row's first bar (adjust=False)."""
+    alpha = 2 / (period + 1)
+    out = np.empty(x.shape)
+    prev = np.zeros(x.shape[0])
+    for j in range(x.shape[1]):
+        col = x[:, j]
+        prev = np.where(k[:, j] == 0, col, alpha * col + (1 - alpha) * prev)
+        out[:, j] = prev
+    return out
+
+
+def _slope(x: np.ndarray, k: np.ndarray) -> np.ndarray:
+    """Difference from the previous bar (0 on each row's first bar)."""
+    return np.where(k >= 1, x - _shift(x, 1), 0.0)
+
+
+def _ma(c: np.ndarray, k: np.ndarray, period: int) -> np.ndarray:
+    """Simple moving average truncated to int like ``trend._calc_ma``."""
+    ma = np.trunc(rolling_sum(c, period, min_periods=1) / period)
+    ma[k < period - 1] = np.nan
+    return ma
+
+
+def _cmf(h, lo, c, v, k, period: int) -> np.ndarray:
+    """Chaikin Money Flow like ``trend._calc_cmf``."""
+    hl_range = h - lo
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mfm = ((c - lo) - (h - c)) / hl_range
+        mfv = np.where(hl_range == 0, 0.0, mfm * v)
+        sum_mfv = rolling_sum(mfv, period, min_periods=1)
+        sum_vol = rolling_sum(v, period, min_periods=1)
+        cmf = np.round(sum_mfv / sum_vol, 4)
+    return np.where((k < period - 1) | (sum_vol == 0), 0.0, cmf)
+
+
+def _fear_greed(c: np.ndarray, v: np.ndarray, al: _Aligned) -> np.ndarray:
+    """Fear/Greed index like ``trend._fear_greed_chrono``."""
+    k = al.k
+    lookback = FG_MOMENTUM_LOOKBACK
+
+    # Momentum5: log return over 5 periods * 100
+    base = _shift(c, lookback)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        log_ret = (np.log(c) - np.log(base)) * 100
+    momentum5 = np.where((k >= lookback) & (c > 0) & (base > 0), log_ret, 0.0)
+
+    # Pos52: position within the 52-period range since listing
+    window = FG_POSITION_LOOKBACK
+    low52 = rolling_min(np.where(al.pad, np.inf, c), window, min_periods=1)
+    high52 = rolling_max(np.where(al.pad, -np.inf, c), window, min_periods=1)
+    span = high52 - low52
+    with np.errstate(invalid="ignore", divide="ignore"):
+        pos52 = np.where(span > 0, (c - low52) / span, 0.5)
+    pos52[al.pad] = 0.0
+
+    prev = _shift(c, 1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        ret = (c - prev) / prev
+    returns = np.where((k >= 1) & (prev > 0), ret, 0.0)
+
+    full = k >= FG_VOLUME_LOOKBACK
+
+    # VolSurge: recent 5-period avg volume / past 20-period avg volume
+    recent_vol = rolling_sum(v, 5) / 5
+    past_vol = rolling_sum(v, FG_VOLUME_LOOKBACK) / FG_VOLUME_LOOKBACK
+    with np.errstate(invalid="ignore", divide="ignore"):
+        surge = np.clip(recent_vol / past_vol, 0, 3)
+    vol_surge = np.where(full & (past_vol > 0), surge, 1.0)
+
+    # VolSpike: recent 5-period volatility / past 20-period volatility
+    recent_std = rolling_std(returns, 5)
+    past_std = rolling_std(returns, FG_VOLUME_LOOKBACK)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        spike = np.clip(recent_std / past_std, 0, 3)
+    vol_spike = np.where(full & (past_std > 0), spike, 1.0)
+
+    m_period = FG_MOMENTUM_SMOOTHING_PERIOD
+    v_period = FG_VOLUME_SMOOTHING_PERIOD
+    m = rolling_sum(momentum5, m_period) / m_period / FG_MOMENTUM_DIVISOR
+    m = np.clip(m, FG_MOMENTUM_MIN, FG_MOMENTUM_MAX)
+    p = 2 * rolling_sum(pos52, m_period) / m_period - 1
+    p = np.clip(p, FG_POSITION_MIN, FG_POSITION_MAX)
+    surge_score = rolling_sum(vol_surge, v_period) / v_period - 1
+    surge_score = np.clip(surge_score, FG_VOLUME_MIN, FG_VOLUME_MAX)
+    spike_score = -(rolling_sum(vol_spike, v_period) / v_period - 1)
+    spike_score = np.clip(spike_score, FG_VOLUME_MIN, FG_VOLUME_MAX)
+
+    fg = (
+        FG_WEIGHT_MOMENTUM * m
+        + FG_WEIGHT_POSITION * p
+        + FG_WEIGHT_VOLUME_SURGE * surge_score
+        + FG_WEIGHT_VOLUME_SPIKE * spike_score
+    )
+    fg[k < FG_MIN_CALC_PERIOD] = 0.0
+    # Tickers with less than a 52-period history get no index at all
+    fg[al.counts < FG_POSITION_LOOKBACK] = 0.0
+    return fg
+
+
+def _trend(al: _Aligned, matrix: OhlcvMatrix, timeframe: str) -> Dict[str, np.ndarray]:
+    """Trend signal in the aligned layout."""
+    h = al.gather(matrix.high)
+    lo = al.gather(matrix.low)
+    c = al.gather(matrix.close)
+    v = al.gather(matrix.volume)
+    k = al.k
+
+    periods = (5, 10, 20, 60) if timeframe == "daily" else (5, 10, 20)
+    result = {f"ma{period}": _ma(c, k, period) for period in periods}
+    cmf = _cmf(h, lo, c, v, k, 20 if timeframe == "daily" else 4)
+    fear_greed = _fear_greed(c, v, al)
+
+    if timeframe != "daily":
+        # Reference 3-condition signal: new high/low, close vs MA10, CMF sign
+        ma10 = result["ma10"]
+        ready = (k >= 1) & ~np.isnan(ma10)
+        buy = ready & (h > _shift(h, 1)) & (c > ma10) & (cmf > 0)
+        sell = ready & (lo < _shift(lo, 1)) & (c < ma10) & (cmf < 0)
+    else:
+        ma5, ma20, ma60 = result["ma5"], result["ma20"], result["ma60"]
+        buy = (ma5 > ma20) & (ma20 > ma60)
+        sell = (ma5 < ma20) & (ma20 < ma60)
+    ma_signal = np.where(buy, 1, np.where(sell, -1, 0))
+
+    bull = (ma_signal == 1).astype(int) + (cmf > 0.05) + (fear_greed > 0.5)
+    bear = (ma_signal == -1).astype(int) + (cmf < -0.05) + (fear_greed < -0.5)
+    trend = np.where(bull >= 2, 1, np.where(bear >= 2, -1, 0))
+
+    result.update({
+        "ma_signal": ma_signal.astype(np.float64),
+        "cmf": cmf,
+        "fear_greed": fear_greed,
+        "trend": trend.astype(np.float64),
+    })
+    return result
+
+
+def _elder(al: _Aligned, close: np.ndarray) -> Dict[str, np.ndarray]:
+    """Elder Impulse in the aligned layout."""
+    c = al.gather(close)
+    k = al.k
+    ema13 = _ema(c, k, 13)
+    macd_line = _ema(c, k, 12) - _ema(c, k, 26)
+    signal_line = _ema(macd_line, k, 9)
+    macd_hist = macd_line - signal_line
+
+    ema13_slope = _slope(ema13, k)
+    hist_slope = _slope(macd_hist, k)
+    impulse = np.where(
+        (ema13_slope > 0) & (hist_slope > 0), 1,
+        np.where((ema13_slope < 0) & (hist_slope < 0), -1, 0),
+    )
+    return {
+        "impulse": impulse.astype(np.float64),
+        "ema13": ema13,
+        "macd_line": macd_line,
+        "signal_line": signal_line,
+        "macd_hist": macd_hist,
+        "ema13_slope": ema13_slope,
+        "hist_slope": hist_slope,
+    }
+
+
+def _demark(al: _Aligned, close: np.ndarray) -> Dict[str, np.ndarray]:
+    """TD Setup counts in the aligned layout."""
+    c = al.gather(close)
+    k = al.k
+    prior = _shift(c, 4)
+    up = (k >= 4) & (c > prior)
+    down = (k >= 4) & (c < prior)
+
+    sell = np.zeros(c.shape)
+    buy = np.zeros(c.shape)
+    sell_count = np.zeros(c.shape[0])
+    buy_count = np.zeros(c.shape[0])
+    for j in range(c.shape[1]):
+        sell_count = np.where(up[:, j], sell_count + 1, 0.0)
+        buy_count = np.where(down[:, j], buy_count + 1, 0.0)
+        sell[:, j] = sell_count
+        buy[:, j] = buy_count
+    return {"sell_setup": sell, "buy_setup": buy}
+
+
+def _scatter(al: _Aligned, result: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    return {key: al.scatter(value) for key, value in result.items()}
+
+
+def calc_trend(
+    matrix: OhlcvMatrix,
+    timeframe: Literal["daily", "weekly", "monthly"] = "daily",
+) -> Dict[str, np.ndarray]:
+    """
+    Calculate the trend signal for all tickers.
+
+    Args:
+        matrix: Aligned OHLCV matrix
+        timeframe: "daily", "weekly" or "monthly" (CMF period, MAs and MA
+            signal rule; monthly uses the weekly rules)
+
+    Returns:
+        {"ma5", "ma10", "ma20", ("ma60" daily), "ma_signal", "cmf",
+         "fear_greed", "trend"}, each a (tickers, dates) matrix
+    """
+    al = _Aligned(~np.isnan(matrix.close))
+    return _scatter(al, _trend(al, matrix, timeframe))
+
+
+def calc_elder(close: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Calculate the Elder Impulse System for all tickers.
+
+    Args:
+        close: Close matrix (tickers, dates), oldest first, NaN padded
+
+    Returns:
+        {"impulse", "ema13", "macd_line", "signal_line", "macd_hist",
+         "ema13_slope", "hist_slope"}, each a (tickers, dates) matrix
+    """
+    al = _Aligned(~np.isnan(close))
+    return _scatter(al, _elder(al, close))
+
+
+def calc_demark(close: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Calculate TD Setup counts for all tickers.
+
+    Args:
+        close: Close matrix (tickers, dates), oldest first, NaN padded
+
+    Returns:
+        {"sell_setup", "buy_setup"}, each a (tickers, dates) matrix
+    """
+    al = _Aligned(~np.isnan(close))
+    return _scatter(al, _demark(al, close))
+
+
+def calc_oscillator(
+    mcap: np.ndarray,
+    foreign: np.ndarray,
+    institution: np.ndarray,
+    apply_rolling: bool = True,
+) -> Dict[str, np.ndarray]:
+    """
+    Calculate the supply/demand oscillator for all tickers.
+
+    Inputs follow ``oscillator.calc_from_analysis``: market cap in 원 and
+    daily net buys in 백만원, as (tickers, dates) matrices oldest first.
+
+    Args:
+        mcap: Market cap matrix (NaN where no data)
+        foreign: Foreign daily net buy matrix
+        institution: Institution daily net buy matrix
+        apply_rolling: If True, use 5-day rolling sums of the net buys
+
+    Returns:
+        {"market_cap", "foreign_5d", "institution_5d", "supply_ratio",
+         "ema12", "ema26", "macd", "signal", "oscillator"}, each a
+        (tickers, dates) matrix in the units of calc_from_analysis
+    """
+    al = _Aligned(~np.isnan(mcap))
+    k = al.k
+    cap = al.gather(mcap)
+    foreign_5d = al.gather(foreign)
+    institution_5d = al.gather(institution)
+    if apply_rolling:
+        # Padding is zero, so the expanding head matches the per-ticker sums
+        foreign_5d = rolling_sum(foreign_5d, 5, min_periods=1)
+        institution_5d = rolling_sum(institution_5d, 5, min_periods=1)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        supply_ratio = (foreign_5d + institution_5d) * 1_000_000 / cap
+    supply_ratio = np.where(cap == 0, 0.0, supply_ratio)
+
+    ema12 = _ema(supply_ratio, k, 12)
+    ema26 = _ema(supply_ratio, k, 26)
+    macd = ema12 - ema26
+    signal = _ema(macd, k, 9)
+
+    return _scatter(al, {
+        "market_cap": cap / 1_000_000_000_000,
+        "foreign_5d": foreign_5d / 100,  # 백만원 -> 억원
+        "institution_5d": institution_5d / 100,
+        "supply_ratio": supply_ratio,
+        "ema12": ema12,
+        "ema26": ema26,
+        "macd": macd,
+        "signal": signal,
+        "oscillator": macd - signal,
+    })
+
+
+def calc_oscillator_score(result: Dict[str, np.ndarray]) -> np.ndarray:
+    """
+    Score every date like ``oscillator.analyze_signal`` scores the newest.
+
+    Args:
+        result: calc_oscillator() matrices ("oscillator", "macd", "signal")
+
+    Returns:
+        total_score matrix (-100 to +100), NaN where analyze_signal would
+        need more data (each ticker's first two bars) or there is no bar
+    """
+    al = _Aligned(~np.isnan(result["oscillator"]))
+    k = al.k
+    osc = al.gather(result["oscillator"])
+    macd = al.gather(result["macd"])
+    signal = al.gather(result["signal"])
+    prev_macd = _shift(macd, 1)
+    prev_signal = _shift(signal, 1)
+    above = macd > signal
+
+    osc_score = np.select(
+        [osc > 0.005, osc > 0.002, osc < -0.005, osc < -0.002],
+        [40, 20, -40, -20],
+        0,
+    )
+    cross_score = np.select(
+        [
+            above & (prev_macd <= prev_signal),  # Golden cross
+            (macd < signal) & (prev_macd >= prev_signal),  # Dead cross
+            above,
+        ],
+        [30, -30, 15],
+        -15,
+    )
+    prev1 = _shift(osc, 1)
+    prev2 = _shift(osc, 2)
+    rising = (prev2 > 0) & (prev2 < prev1) & (prev1 < osc)
+    falling = (prev2 < 0) & (prev2 > prev1) & (prev1 > osc)
+    trend_score = np.where(rising, 30, np.where(falling, -30, 0))
+
+    score = np.clip(osc_score + cross_score + trend_score, -100, 100).astype(np.float64)
+    score[k < 2] = np.nan
+    return al.scatter(score)
+
+
+def calc_all(
+    matrix: OhlcvMatrix,
+    timeframe: Literal["daily", "weekly", "monthly"] = "daily",
+) -> Dict[str, Dict[str, np.ndarray]]:
+    """
+    Calculate trend, Elder and DeMark indicators for all tickers.
+
+    Args:
+        matrix: Aligned OHLCV matrix
+        timeframe: "daily", "weekly" or "monthly"
+
+    Returns:
+        {"trend": {...}, "elder": {...}, "demark": {...}} with the matrices
+        of calc_trend, calc_elder and calc_demark
+    """
+    al = _Aligned(~np.isnan(matrix.close))
+    result = {
+        "trend": _scatter(al, _trend(al, matrix, timeframe)),
+        "elder": _scatter(al, _elder(al, matrix.close)),
+        "demark": _scatter(al, _demark(al, matrix.close)),
+    }
+
+    log_info("indicator.batch", "calc complete", {
+        "tickers": matrix.shape[0],
+        "dates": matrix.shape[1],
+        "timeframe": timeframe,
+    })
+    return result
@@ -9,11 +9,23 @@ TD Setup rules (matching EtfMonitor reference):
 Reference: EtfMonitor_Rel trend_signal.py _calc_td_setup()
 """
 
-from typing import Dict, List, Literal
+from typing import Dict, List, Literal, Optional
 
+import numpy as np
+
+from ..client.async_kiwoom import AsyncKiwoomClient
 from ..client.kiwoom import KiwoomClient
 from ..core.log import log_info
-from ..stock import ohlcv
+from ..stock import multiframe
+from ..stock.frame import OhlcvFrame
+from ..stock.multiframe import MultiTimeframe
+from . import lookback
+from .streaming import BarState, TdSetupState
+
+# Bars before the first valid output: TD Setup compares Close with Close[4]
+WARMUP = 4
+MIN_PERIODS = WARMUP + 1
+lookback.register("demark", {"daily": WARMUP, "weekly": WARMUP, "monthly": WARMUP})
 
 
 def calc(
@@ -21,6 +33,7 @@ def calc(
     ticker: str,
     days: int = 180,
     timeframe: Literal["daily", "weekly", "monthly"] = "daily",
+    bars: Optional[MultiTimeframe] = None,
 ) -> Dict:
     """
     Calculate DeMark TD Setup (EtfMonitor reference).
@@ -35,6 +48,7 @@ def calc(
         ticker: Stock code
         days: Number of periods for result
         timeframe: "daily", "weekly", or "monthly"
+        bars: Preloaded bars shared with other calls (fetched if None)
 
     Returns:
         {
@@ -62,59 +76,39 @@ def calc(
 
     ticker = ticker.strip()
 
-    # Fetch OHLCV data based on timeframe
-    fetch_extra = 10
-    if timeframe == "weekly":
-        # Fetch daily data and resample to weekly (like reference code)
-        fetch_days = (days + fetch_extra) * 7
-        ohlcv_result = ohlcv.get_daily_resampled_to_weekly(client, ticker, days=fetch_days)
-    elif timeframe == "monthly":
-        # Fetch daily data and resample to monthly (like reference code)
-        fetch_days = (days + fetch_extra) * 22  # ~22 trading days per month
-        daily_result = ohlcv.get_daily(client, ticker, days=fetch_days)
-        if not daily_result["ok"]:
-            ohlcv_result = daily_result
-        else:
-            daily = daily_result["data"]
-            monthly = ohlcv.resample_to_monthly(
-                daily["dates"], daily["open"], daily["high"],
-                daily["low"], daily["close"], daily["volume"],
-            )
-            monthly["ticker"] = ticker
-            ohlcv_result = {"ok": True, "data": monthly}
-    else:
-        ohlcv_result = ohlcv.get_daily(client, ticker, days=days + fetch_extra)
-
-    if not ohlcv_result["ok"]:
-        return ohlcv_result
-
-    data = ohlcv_result["data"]
-    closes = data["close"]
-    dates = data["dates"]
-
-    if len(closes) < 5:
-        return {
-            "ok": False,
-            "error": {"code": "NO_DATA", "msg": "데이터가 충분하지 않습니다 (최소 5 필요)"},
-        }
+    # One daily fetch (output + warmup bars, see lookback); weekly and monthly
+    # bars are derived from it
+    if bars is None:
+        fetch_days = lookback.fetch_days("demark", timeframe, days)
+        loaded = multiframe.load(client, ticker, days=fetch_days)
+        if not loaded["ok"]:
+            return loaded
+        bars = loaded["data"]
+    return calc_from_frame(bars.frame(timeframe), timeframe, days=days)
 
-    # Calculate TD Setup
-    sell_setup, buy_setup = _calc_td_setup(closes)
 
-    # Trim to requested periods
-    trim_len = min(days, len(dates) - 4)
-    result = {
-        "ticker": ticker,
-        "timeframe": timeframe,
-        "dates": dates[:trim_len],
-        "close": closes[:trim_len],
-        "sell_setup": sell_setup[:trim_len],
-        "buy_setup": buy_setup[:trim_len],
-    }
+async def calc_async(
+    client: AsyncKiwoomClient,
+    ticker: str,
+    days: int = 180,
+    timeframe: Literal["daily", "weekly", "monthly"] = "daily",
+) -> Dict:
+    """
+    Calculate DeMark TD Setup (async).
 
-    log_info("indicator.demark", "calc complete", {"ticker": ticker, "timeframe": timeframe, "periods": trim_len})
+    Runs calc() on the async client's worker pool so many tickers can be
+    calculated concurrently with AsyncKiwoomClient.fan_out().
 
-    return {"ok": True, "data": result}
+    Args:
+        client: Async Kiwoom API client
+        ticker: Stock code
+        days: Number of periods to return
+        timeframe: Same as calc()
+
+    Returns:
+        Same format as calc()
+    """
+    return await client.run(calc, ticker, days=days, timeframe=timeframe)
 
 
 def calc_from_ohlcv(
@@ -135,26 +129,105 @@ def calc_from_ohlcv(
     Returns:
         Same format as calc()
     """
-    if len(closes) < 5:
-        return {
-            "ok": False,
-            "error": {"code": "NO_DATA", "msg": "데이터가 충분하지 않습니다 (최소 5 필요)"},
-        }
+    if len(closes) < MIN_PERIODS:
+        return _no_data()
 
-    sell_setup, buy_setup = _calc_td_setup(closes)
+    sell_setup, buy_setup = _td_setup_chrono(np.asarray(closes)[::-1])
 
     result = {
         "ticker": ticker,
         "timeframe": timeframe,
         "dates": dates,
         "close": closes,
-        "sell_setup": sell_setup,
-        "buy_setup": buy_setup,
+        "sell_setup": sell_setup[::-1].tolist(),
+        "buy_setup": buy_setup[::-1].tolist(),
     }
 
     return {"ok": True, "data": result}
 
 
+def calc_from_frame(
+    frame: OhlcvFrame,
+    timeframe: str = "daily",
+    days: Optional[int] = None,
+) -> Dict:
+    """
+    Calculate DeMark TD Setup from an OhlcvFrame.
+
+    The counts are computed on the frame's oldest-first close view; lists
+    are only built for the returned periods.
+
+    Args:
+        frame: Bars of the timeframe, newest first
+        timeframe: "daily", "weekly" or "monthly"
+        days: Number of periods for result (all valid periods if None)
+
+    Returns:
+        Same format as calc()
+    """
+    if len(frame) < MIN_PERIODS:
+        return _no_data()
+
+    sell_setup, buy_setup = _td_setup_chrono(frame.chrono().close)
+
+    # Trim to requested periods
+    trim_len = len(frame) - WARMUP
+    if days is not None:
+        trim_len = min(days, trim_len)
+    newest = frame.head(trim_len)
+    result = {
+        "ticker": frame.ticker,
+        "timeframe": timeframe,
+        "dates": newest.date_strings(),
+        "close": newest.close.tolist(),
+        "sell_setup": sell_setup[::-1][:trim_len].tolist(),
+        "buy_setup": buy_setup[::-1][:trim_len].tolist(),
+    }
+
+    log_info("indicator.demark", "calc complete", {
+        "ticker": frame.ticker,
+        "timeframe": timeframe,
+        "periods": trim_len,
+    })
+
+    return {"ok": True, "data": result}
+
+
+def _no_data() -> Dict:
+    return {
+        "ok": False,
+        "error": {
+            "code": "NO_DATA",
+            "msg": f"데이터가 충분하지 않습니다 (최소 {MIN_PERIODS} 필요)",
+        },
+    }
+
+
+class DemarkState(BarState):
+    """
+    Streaming TD Setup state.
+
+    ``update(bar)`` takes {"date", "close"} and returns the newest
+    sell_setup and buy_setup counts, matching ``_calc_td_setup``.
+    """
+
+    name = "demark"
+
+    def __init__(self):
+        super().__init__()
+        self.setup = TdSetupState()
+
+    def _apply(self, bar: Dict) -> Dict:
+        sell, buy = self.setup.update(bar["close"])
+        return {"close": bar["close"], "sell_setup": sell, "buy_setup": buy}
+
+    def _state(self) -> Dict:
+        return self.setup.to_dict()
+
+    def _load(self, state: Dict) -> None:
+        self.setup = TdSetupState.from_dict(state)
+
+
 def _calc_td_setup(closes: List[int]) -> tuple:
     """
     Calculate TD Setup counts (EtfMonitor reference).
@@ -172,33 +245,37 @@ def _calc_td_setup(closes: List[int]) -> tuple:
     Returns:
         Tuple of (sell_setup, buy_setup)
     """
+    sell_setup, buy_setup = _td_setup_chrono(np.asarray(closes)[::-1])
+    return sell_setup[::-1].tolist(), buy_setup[::-1].tolist()
+
+
+def _td_setup_chrono(closes: np.ndarray) -> tuple:
+    """
+    TD Setup counts on a chronological close array.
+
+    A count is the length of the current run of bars whose close is above
+    (sell) or below (buy) the close 4 bars earlier.
+
+    Args:
+        closes: Close prices (oldest first)
+
+    Returns:
+        Tuple of (sell_setup, buy_setup) int arrays (oldest first)
+    """
     n = len(closes)
-    sell_setup = [0] * n
-    buy_setup = [0] * n
-
-    # Process in chronological order (reverse the list)
-    closes_chrono = list(reversed(closes))
-    sell_chrono = [0] * n
-    buy_chrono = [0] * n
-
-    for i in range(n):
-        # Sell Setup: 4일 전보다 위에 있으면 카운트 증가
-        if i >= 4 and closes_chrono[i] > closes_chrono[i - 4]:
-            sell_chrono[i] = sell_chrono[i - 1] + 1
-        else:
-            sell_chrono[i] = 0
-
-        # Buy Setup: 4일 전보다 아래 있으면 카운트 증가 (EtfMonitor reference: 대칭적)
-        if i >= 4 and closes_chrono[i] < closes_chrono[i - 4]:
-            buy_chrono[i] = buy_chrono[i - 1] + 1
-        else:
-            buy_chrono[i] = 0
-
-    # Reverse back to newest-first order
-    sell_setup = list(reversed(sell_chrono))
-    buy_setup = list(reversed(buy_chrono))
-
-    return sell_setup, buy_setup
+    up = np.zeros(n, dtype=bool)
+    down = np.zeros(n, dtype=bool)
+    up[4:] = closes[4:] > closes[:-4]
+    down[4:] = closes[4:] < closes[:-4]
+    return _run_lengths(up), _run_lengths(down)
+
+
+def _run_lengths(hits: np.ndarray) -> np.ndarray:
+    """Length of the run of True values ending at each position."""
+    index = np.arange(len(hits))
+    # Index of the latest miss at or before each position (-1 if none)
+    last_miss = np.maximum.accumulate(np.where(hits, -1, index))
+    return index - last_miss
 
 
 def get_active_setups(
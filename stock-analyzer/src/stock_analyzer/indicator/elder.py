@@ -6,16 +6,30 @@ Impulse color is determined by the direction (slope) of EMA13 and MACD histogram
 
 from typing import Dict, List, Literal, Optional
 
+import numpy as np
+
+from ..client.async_kiwoom import AsyncKiwoomClient
 from ..client.kiwoom import KiwoomClient
 from ..core.log import log_info
-from ..stock import ohlcv
+from ..stock import multiframe
+from ..stock.frame import OhlcvFrame
+from ..stock.multiframe import MultiTimeframe
+from . import lookback
+from .rolling import ema
+from .streaming import BarState, EmaState, MacdState
+
+# Bars before the first valid output: MACD slow EMA (26) + signal EMA (9)
+WARMUP = 26 + 9 - 1
+MIN_PERIODS = WARMUP + 1
+lookback.register("elder", {"daily": WARMUP, "weekly": WARMUP, "monthly": WARMUP})
 
 
 def calc(
     client: KiwoomClient,
     ticker: str,
     days: int = 180,
-    timeframe: Literal["daily", "weekly"] = "daily",
+    timeframe: Literal["daily", "weekly", "monthly"] = "daily",
+    bars: Optional[MultiTimeframe] = None,
 ) -> Dict:
     """
     Calculate Elder Impulse System.
@@ -33,7 +47,8 @@ def calc(
         client: Kiwoom API client
         ticker: Stock code
         days: Number of days/weeks for result
-        timeframe: "daily" or "weekly" (reference uses weekly)
+        timeframe: "daily", "weekly" or "monthly" (reference uses weekly)
+        bars: Preloaded bars shared with other calls (fetched if None)
 
     Returns:
         {
@@ -65,59 +80,39 @@ def calc(
 
     ticker = ticker.strip()
 
-    # Fetch OHLCV data based on timeframe
-    if timeframe == "weekly":
-        # Fetch daily data and resample to weekly (like reference code)
-        fetch_days = (days + 50) * 7  # ~7 days per week
-        ohlcv_result = ohlcv.get_daily_resampled_to_weekly(client, ticker, days=fetch_days)
-    else:
-        # Fetch extra days for indicator warmup
-        fetch_days = days + 50
-        ohlcv_result = ohlcv.get_daily(client, ticker, days=fetch_days)
-
-    if not ohlcv_result["ok"]:
-        return ohlcv_result
-
-    data = ohlcv_result["data"]
-    closes = data["close"]
-    dates = data["dates"]
-
-    min_periods = 35
-    if len(closes) < min_periods:
-        return {
-            "ok": False,
-            "error": {"code": "NO_DATA", "msg": f"데이터가 충분하지 않습니다 (최소 {min_periods} 필요)"},
-        }
+    # One daily fetch (output + warmup bars, see lookback); weekly and monthly
+    # bars are derived from it
+    if bars is None:
+        fetch_days = lookback.fetch_days("elder", timeframe, days)
+        loaded = multiframe.load(client, ticker, days=fetch_days)
+        if not loaded["ok"]:
+            return loaded
+        bars = loaded["data"]
+    return calc_from_frame(bars.frame(timeframe), timeframe, days=days)
 
-    # Calculate indicators using reference-style EMA (adjust=False, no SMA init)
-    ema13 = _calc_ema_no_sma(closes, 13)
-    macd_line, signal_line, macd_hist = _calc_macd_no_sma(closes)
 
-    # Calculate slopes (diff from previous value) - this is what reference uses
-    ema13_slope = _calc_slope(ema13)
-    hist_slope = _calc_slope(macd_hist)
+async def calc_async(
+    client: AsyncKiwoomClient,
+    ticker: str,
+    days: int = 180,
+    timeframe: Literal["daily", "weekly", "monthly"] = "daily",
+) -> Dict:
+    """
+    Calculate Elder Impulse System (async).
 
-    # Determine impulse colors based on slopes
-    colors = _calc_impulse_color_by_slope(ema13_slope, hist_slope)
+    Runs calc() on the async client's worker pool so many tickers can be
+    calculated concurrently with AsyncKiwoomClient.fan_out().
 
-    # Trim to requested days/weeks
-    trim_len = min(days, len(dates) - 34)
-    result = {
-        "ticker": ticker,
-        "timeframe": timeframe,
-        "dates": dates[:trim_len],
-        "color": colors[:trim_len],
-        "ema13": ema13[:trim_len],
-        "macd_line": macd_line[:trim_len],
-        "signal_line": signal_line[:trim_len],
-        "macd_hist": macd_hist[:trim_len],
-        "ema13_slope": ema13_slope[:trim_len],
-        "hist_slope": hist_slope[:trim_len],
-    }
-
-    log_info("indicator.elder", "calc complete", {"ticker": ticker, "timeframe": timeframe, "periods": trim_len})
+    Args:
+        client: Async Kiwoom API client
+        ticker: Stock code
+        days: Number of periods to return
+        timeframe: Same as calc()
 
-    return {"ok": True, "data": result}
+    Returns:
+        Same format as calc()
+    """
+    return await client.run(calc, ticker, days=days, timeframe=timeframe)
 
 
 def calc_from_ohlcv(
@@ -133,33 +128,95 @@ def calc_from_ohlcv(
         ticker: Stock code
         dates: Date list
         closes: Close prices
-        timeframe: "daily" or "weekly" (for labeling)
+        timeframe: "daily", "weekly" or "monthly" (for labeling)
 
     Returns:
         Same format as calc()
     """
-    if len(closes) < 35:
-        return {
-            "ok": False,
-            "error": {"code": "NO_DATA", "msg": "데이터가 충분하지 않습니다 (최소 35 필요)"},
-        }
+    if len(closes) < MIN_PERIODS:
+        return _no_data()
+
+    # Use reference-style EMA (no SMA initialization) on a chronological view
+    series = _calc_series(np.asarray(closes)[::-1])
+    return {
+        "ok": True,
+        "data": _to_result(ticker, timeframe, dates, series, len(closes)),
+    }
+
+
+def calc_from_frame(
+    frame: OhlcvFrame,
+    timeframe: str = "daily",
+    days: Optional[int] = None,
+) -> Dict:
+    """
+    Calculate Elder Impulse from an OhlcvFrame.
+
+    The kernels read the frame's oldest-first close view directly; lists
+    are only built for the returned periods.
+
+    Args:
+        frame: Bars of the timeframe, newest first
+        timeframe: "daily", "weekly" or "monthly"
+        days: Number of periods for result (all valid periods if None)
+
+    Returns:
+        Same format as calc()
+    """
+    if len(frame) < MIN_PERIODS:
+        return _no_data()
+
+    series = _calc_series(frame.chrono().close)
+
+    # Trim to requested days/weeks
+    trim_len = len(frame) - WARMUP
+    if days is not None:
+        trim_len = min(days, trim_len)
+    dates = frame.head(trim_len).date_strings()
+    result = _to_result(frame.ticker, timeframe, dates, series, trim_len)
+
+    log_info("indicator.elder", "calc complete", {
+        "ticker": frame.ticker,
+        "timeframe": timeframe,
+        "periods": trim_len,
+    })
+
+    return {"ok": True, "data": result}
+
+
+def _no_data() -> Dict:
+    return {
+        "ok": False,
+        "error": {
+            "code": "NO_DATA",
+            "msg": f"데이터가 충분하지 않습니다 (최소 {MIN_PERIODS} 필요)",
+        },
+    }
+
+
+def _calc_series(closes: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Calculate every Elder series on a chronological close array.
+
+    Args:
+        closes: Close prices (oldest first)
 
-    # Use reference-style EMA (no SMA initialization)
-    ema13 = _calc_ema_no_sma(closes, 13)
-    macd_line, signal_line, macd_hist = _calc_macd_no_sma(closes)
+    Returns:
+        Series by output field (oldest first)
+    """
+    ema13 = ema(closes, 13)
+    macd_line, signal_line, macd_hist = _macd_chrono(closes)
 
     # Calculate slopes (reference uses .diff())
-    ema13_slope = _calc_slope(ema13)
-    hist_slope = _calc_slope(macd_hist)
+    ema13_slope = _slope_chrono(ema13)
+    hist_slope = _slope_chrono(macd_hist)
 
     # Determine colors based on slopes
-    colors = _calc_impulse_color_by_slope(ema13_slope, hist_slope)
+    green = (ema13_slope > 0) & (hist_slope > 0)
+    red = (ema13_slope < 0) & (hist_slope < 0)
 
-    result = {
-        "ticker": ticker,
-        "timeframe": timeframe,
-        "dates": dates,
-        "color": colors,
+    return {
+        "color": np.where(green, "green", np.where(red, "red", "blue")),
         "ema13": ema13,
         "macd_line": macd_line,
         "signal_line": signal_line,
@@ -168,7 +225,73 @@ def calc_from_ohlcv(
         "hist_slope": hist_slope,
     }
 
-    return {"ok": True, "data": result}
+
+def _to_result(
+    ticker: str,
+    timeframe: str,
+    dates: List[str],
+    series: Dict[str, np.ndarray],
+    n: int,
+) -> Dict:
+    """Build the newest-first result dict for the newest n periods."""
+    result = {"ticker": ticker, "timeframe": timeframe, "dates": dates}
+    for name, values in series.items():
+        result[name] = values[::-1][:n].tolist()
+    return result
+
+
+class ElderState(BarState):
+    """
+    Streaming Elder Impulse state.
+
+    ``update(bar)`` takes {"date", "close"} and returns the newest
+    ema13, macd_line, signal_line, macd_hist, ema13_slope, hist_slope and
+    color, matching the newest values of ``calc_from_ohlcv``.
+
+    Example:
+        state = ElderState.from_ohlcv(ohlcv.get_daily(client, "005930")["data"])
+        state.update({"date": "20250113", "close": 55200})["color"]
+    """
+
+    name = "elder"
+
+    def __init__(self):
+        super().__init__()
+        self.ema13 = EmaState(13)
+        self.macd = MacdState()
+        self.prev_hist: Optional[float] = None
+
+    def _apply(self, bar: Dict) -> Dict:
+        close = bar["close"]
+        prev_ema = self.ema13.value
+        ema13 = self.ema13.update(close)
+        macd_line, signal_line, macd_hist = self.macd.update(close)
+
+        ema13_slope = 0.0 if prev_ema is None else ema13 - prev_ema
+        hist_slope = 0.0 if self.prev_hist is None else macd_hist - self.prev_hist
+        self.prev_hist = macd_hist
+
+        return {
+            "color": _calc_impulse_color_by_slope([ema13_slope], [hist_slope])[0],
+            "ema13": ema13,
+            "macd_line": macd_line,
+            "signal_line": signal_line,
+            "macd_hist": macd_hist,
+            "ema13_slope": ema13_slope,
+            "hist_slope": hist_slope,
+        }
+
+    def _state(self) -> Dict:
+        return {
+            "ema13": self.ema13.to_dict(),
+            "macd": self.macd.to_dict(),
+            "prev_hist": self.prev_hist,
+        }
+
+    def _load(self, state: Dict) -> None:
+        self.ema13 = EmaState.from_dict(state["ema13"])
+        self.macd = MacdState.from_dict(state["macd"])
+        self.prev_hist = state["prev_hist"]
 
 
 def _calc_ema_no_sma(prices: List[int], period: int) -> List[Optional[float]]:
@@ -188,22 +311,7 @@ def _calc_ema_no_sma(prices: List[int], period: int) -> List[Optional[float]]:
     Returns:
         EMA values as floats
     """
-    if not prices:
-        return []
-
-    # Reverse to chronological order for calculation
-    prices_chrono = list(reversed(prices))
-    alpha = 2 / (period + 1)
-
-    # Start from first value (no SMA initialization)
-    ema_chrono = [float(prices_chrono[0])]
-
-    for i in range(1, len(prices_chrono)):
-        ema_value = alpha * prices_chrono[i] + (1 - alpha) * ema_chrono[-1]
-        ema_chrono.append(ema_value)
-
-    # Reverse back to newest-first order
-    return list(reversed(ema_chrono))
+    return ema(np.asarray(prices)[::-1], period)[::-1].tolist()
 
 
 def _calc_macd_no_sma(
@@ -228,32 +336,22 @@ def _calc_macd_no_sma(
     Returns:
         Tuple of (macd_line, signal_line, histogram)
     """
-    if not prices:
-        return [], [], []
-
-    # Calculate EMAs
-    ema_fast = _calc_ema_no_sma(prices, fast_period)
-    ema_slow = _calc_ema_no_sma(prices, slow_period)
-
-    # Calculate MACD Line
-    macd_line = [ema_fast[i] - ema_slow[i] for i in range(len(prices))]
-
-    # Calculate Signal Line (EMA of MACD Line)
-    # Reverse MACD to chronological order
-    macd_chrono = list(reversed(macd_line))
-    alpha = 2 / (signal_period + 1)
-
-    signal_chrono = [macd_chrono[0]]
-    for i in range(1, len(macd_chrono)):
-        signal_value = alpha * macd_chrono[i] + (1 - alpha) * signal_chrono[-1]
-        signal_chrono.append(signal_value)
-
-    signal_line = list(reversed(signal_chrono))
+    lines = _macd_chrono(
+        np.asarray(prices)[::-1], fast_period, slow_period, signal_period
+    )
+    return tuple(line[::-1].tolist() for line in lines)
 
-    # Calculate Histogram
-    histogram = [macd_line[i] - signal_line[i] for i in range(len(prices))]
 
-    return macd_line, signal_line, histogram
+def _macd_chrono(
+    closes: np.ndarray,
+    fast_period: int = 12,
+    slow_period: int = 26,
+    signal_period: int = 9,
+) -> tuple:
+    """MACD line, signal line and histogram on chronological arrays."""
+    macd_line = ema(closes, fast_period) - ema(closes, slow_period)
+    signal_line = ema(macd_line, signal_period)
+    return macd_line, signal_line, macd_line - signal_line
 
 
 def _calc_slope(values: List[Optional[float]]) -> List[float]:
@@ -281,6 +379,13 @@ def _calc_slope(values: List[Optional[float]]) -> List[float]:
     return result
 
 
+def _slope_chrono(values: np.ndarray) -> np.ndarray:
+    """Diff from the previous value on a chronological array (0.0 first)."""
+    slope = np.zeros(len(values))
+    slope[1:] = values[1:] - values[:-1]
+    return slope
+
+
 def _calc_impulse_color_by_slope(
     ema13_slope: List[float],
     hist_slope: List[float],
@@ -325,7 +430,9 @@ def _calc_macd(
     signal_period: int = 9,
 ) -> tuple:
     """Legacy MACD calculation (deprecated, use _calc_macd_no_sma)."""
-    macd_line, signal_line, histogram = _calc_macd_no_sma(prices, fast_period, slow_period, signal_period)
+    macd_line, signal_line, histogram = _calc_macd_no_sma(
+        prices, fast_period, slow_period, signal_period
+    )
     return (
         [int(m) for m in macd_line],
         [int(s) for s in signal_line],
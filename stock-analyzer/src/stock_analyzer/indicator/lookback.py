@@ -0,0 +1,110 @@
+"""Warmup-aware fetch planning.
+
+Each indicator module declares how many bars it needs before its first
+valid output (its warmup) per timeframe and registers it here. The planner
+turns "N output bars of these indicators on these timeframes" into the
+calendar days of daily data to fetch; weekly and monthly bars are resampled
+from daily data, so one daily fetch covers every timeframe.
+
+Example:
+    plan = lookback.plan([("trend", "daily", 180), ("elder", "weekly", 52)])
+    ohlcv.get_daily(client, ticker, days=plan.days)
+"""
+
+import math
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Tuple
+
+TIMEFRAMES = ("daily", "weekly", "monthly")
+
+# KRX sessions per calendar year (weekends and ~15 holidays closed)
+TRADING_DAYS_PER_YEAR = 245
+# Covers the longest market closure (설/추석 연휴 + weekends) at the range start
+HOLIDAY_SLACK_DAYS = 10
+# Calendar days per resampled bar; one extra bar covers a partial first period
+CALENDAR_DAYS_PER_BAR = {"weekly": 7, "monthly": 31}
+
+# indicator -> timeframe -> warmup bars
+_warmups: Dict[str, Dict[str, int]] = {}
+
+
+@dataclass(frozen=True)
+class FetchPlan:
+    """Combined fetch for a set of indicator requests."""
+
+    days: int  # Calendar days of daily data to fetch
+    bars: Dict[str, int] = field(default_factory=dict)  # Bars per timeframe
+
+
+def register(indicator: str, warmup: Dict[str, int]) -> None:
+    """
+    Declare the warmup of an indicator.
+
+    Args:
+        indicator: Indicator name ("trend", "elder", ...)
+        warmup: Timeframe -> bars needed before the first valid output
+    """
+    for timeframe, bars in warmup.items():
+        if timeframe not in TIMEFRAMES:
+            raise ValueError(f"unknown timeframe: {timeframe}")
+        if bars < 0:
+            raise ValueError("warmup must be >= 0")
+    _warmups[indicator] = dict(warmup)
+
+
+def warmup(indicator: str, timeframe: str) -> int:
+    """
+    Get the warmup bars of an indicator on a timeframe.
+
+    Raises:
+        ValueError: If the indicator or timeframe is not registered
+    """
+    bars = _warmups.get(indicator, {}).get(timeframe)
+    if bars is None:
+        raise ValueError(f"no warmup for {indicator} ({timeframe})")
+    return bars
+
+
+def calendar_days(bars: int, timeframe: str = "daily") -> int:
+    """
+    Get calendar days of daily data that yield ``bars`` bars.
+
+    Args:
+        bars: Number of bars of the timeframe
+        timeframe: "daily", "weekly" or "monthly"
+
+    Returns:
+        Calendar days to look back
+    """
+    if bars <= 0:
+        return 0
+    if timeframe == "daily":
+        return math.ceil(bars * 365 / TRADING_DAYS_PER_YEAR) + HOLIDAY_SLACK_DAYS
+    if timeframe not in CALENDAR_DAYS_PER_BAR:
+        raise ValueError(f"unknown timeframe: {timeframe}")
+    return (bars + 1) * CALENDAR_DAYS_PER_BAR[timeframe]
+
+
+def plan(requests: Iterable[Tuple[str, str, int]]) -> FetchPlan:
+    """
+    Plan the minimal daily fetch for a set of indicator requests.
+
+    Args:
+        requests: (indicator, timeframe, output bars) tuples
+
+    Returns:
+        FetchPlan with the calendar days covering every request and the
+        bars (output + warmup) needed per timeframe
+    """
+    bars: Dict[str, int] = {}
+    for indicator, timeframe, periods in requests:
+        need = max(periods, 0) + warmup(indicator, timeframe)
+        bars[timeframe] = max(bars.get(timeframe, 0), need)
+
+    days = max((calendar_days(n, tf) for tf, n in bars.items()), default=0)
+    return FetchPlan(days=days, bars=bars)
+
+
+def fetch_days(indicator: str, timeframe: str, periods: int) -> int:
+    """Get calendar days of daily data for one indicator request."""
+    return plan([(indicator, timeframe, periods)]).days
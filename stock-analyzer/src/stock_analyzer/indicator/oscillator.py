@@ -2,10 +2,15 @@
 
 from typing import Dict, List
 
+import numpy as np
+
+from ..client.async_kiwoom import AsyncKiwoomClient
 from ..client.kiwoom import KiwoomClient
 from ..core import safe_int
 from ..core.log import log_info
 from ..stock import analysis, ohlcv
+from .rolling import ema
+from .streaming import BarState, MacdState, RollingSumState
 
 
 def calc(client: KiwoomClient, ticker: str, days: int = 180) -> Dict:
@@ -63,15 +68,13 @@ def calc(client: KiwoomClient, ticker: str, days: int = 180) -> Dict:
             "error": {"code": "INSUFFICIENT_DATA", "msg": "최소 30일 데이터 필요"},
         }
 
-    # 1.5. Reverse data to chronological order (oldest first) for correct EMA calculation
+    # 1.5. Chronological views (oldest first) for correct EMA calculation
     # API returns data in reverse chronological order (newest first)
-    dates_chrono = list(reversed(data["dates"]))
-    mcap_chrono = list(reversed(data["mcap"]))
-    for_5d_chrono = list(reversed(data["for_5d"]))
-    ins_5d_chrono = list(reversed(data["ins_5d"]))
+    dates_chrono = data["dates"][::-1]
+    mcap_chrono = np.asarray(data["mcap"])[::-1]
 
     # 2. Get OHLCV data and shares outstanding for daily market cap calculation
-    ohlcv_result = ohlcv.get_daily(client, ticker, days=days)
+    ohlcv_result = ohlcv.get_frame(client, ticker, "daily", days=days)
     stock_info = client.get_stock_info(ticker)
 
     # Get floating shares (in 천주 units)
@@ -79,62 +82,25 @@ def calc(client: KiwoomClient, ticker: str, days: int = 180) -> Dict:
     if stock_info.ok:
         flo_stk = safe_int(stock_info.data.get("flo_stk", 0))
 
-    # Build date -> close price mapping from OHLCV
-    date_to_close = {}
-    if ohlcv_result["ok"]:
-        ohlcv_data = ohlcv_result["data"]
-        for i, dt in enumerate(ohlcv_data["dates"]):
-            # Convert YYYYMMDD to YYYY-MM-DD if needed
-            if len(dt) == 8:
-                dt = f"{dt[:4]}-{dt[4:6]}-{dt[6:8]}"
-            date_to_close[dt] = ohlcv_data["close"][i]
-
     # 3. Calculate daily market cap from OHLCV (close * shares)
     # flo_stk is in 천주 (1000 shares), so multiply by 1000 to get actual shares
     shares = flo_stk * 1000 if flo_stk > 0 else 0
-    daily_mcap = []
-    for i, dt in enumerate(dates_chrono):
-        if shares > 0 and dt in date_to_close:
-            mcap = shares * date_to_close[dt]
-        else:
-            # Fallback to analysis mcap (already in chronological order)
-            mcap = mcap_chrono[i] if i < len(mcap_chrono) else 0
-        daily_mcap.append(mcap)
-
-    # 4. Calculate 5-day rolling sum for foreign and institution
-    # Data is now in chronological order (oldest first)
-    foreign_5d = _calc_rolling_sum(for_5d_chrono, 5)
-    institution_5d = _calc_rolling_sum(ins_5d_chrono, 5)
-
-    # 5. Calculate Supply Ratio = (Foreign5d + Institution5d) / MarketCap
-    # Note: API returns amounts in 백만원 (million KRW) via unit_tp="1000"
-    # mcap is in 원 (KRW), so multiply by 1,000,000 to convert
-    supply_ratio = []
-    for i in range(n):
-        mcap = daily_mcap[i]
-        if mcap == 0:
-            supply_ratio.append(0.0)
-        else:
-            supply = (foreign_5d[i] + institution_5d[i]) * 1_000_000  # 백만원 -> 원
-            supply_ratio.append(supply / mcap)
-
-    # 6. Calculate EMA of Supply Ratio
-    ema12 = _calc_ema(supply_ratio, 12)
-    ema26 = _calc_ema(supply_ratio, 26)
-
-    # 7. Calculate MACD
-    macd = [ema12[i] - ema26[i] for i in range(n)]
-
-    # 8. Calculate Signal Line
-    signal = _calc_ema(macd, 9)
-
-    # 9. Calculate Oscillator (Histogram)
-    oscillator = [macd[i] - signal[i] for i in range(n)]
-
-    # 10. Normalize values for display
-    market_cap_trillion = [m / 1_000_000_000_000 for m in daily_mcap]
-    foreign_5d_billion = [f / 100 for f in foreign_5d]  # 백만원 -> 억원
-    institution_5d_billion = [i / 100 for i in institution_5d]  # 백만원 -> 억원
+    daily_mcap = mcap_chrono
+    if shares > 0 and ohlcv_result["ok"] and len(ohlcv_result["data"]):
+        bars = ohlcv_result["data"].chrono()
+        # Analysis dates are YYYY-MM-DD, bar dates YYYYMMDD ints (ascending)
+        keys = np.array([safe_int(dt.replace("-", "")) for dt in dates_chrono])
+        pos = np.minimum(np.searchsorted(bars.dates, keys), len(bars) - 1)
+        found = bars.dates[pos] == keys
+        # Fallback to analysis mcap where the bar is missing
+        daily_mcap = np.where(found, shares * bars.close[pos], mcap_chrono)
+
+    # 4-10. 5-day rolling sums, supply ratio, EMA/MACD and display units
+    series = _calc_series(
+        daily_mcap,
+        np.asarray(data["for_5d"])[::-1],
+        np.asarray(data["ins_5d"])[::-1],
+    )
 
     log_info("indicator.oscillator", "calc complete", {"ticker": ticker, "days": n})
 
@@ -144,19 +110,29 @@ def calc(client: KiwoomClient, ticker: str, days: int = 180) -> Dict:
             "ticker": ticker,
             "name": data["name"],
             "dates": dates_chrono,  # Chronological order (oldest first, newest last)
-            "market_cap": market_cap_trillion,
-            "foreign_5d": foreign_5d_billion,
-            "institution_5d": institution_5d_billion,
-            "supply_ratio": supply_ratio,
-            "ema12": ema12,
-            "ema26": ema26,
-            "macd": macd,
-            "signal": signal,
-            "oscillator": oscillator,
+            **{name: values.tolist() for name, values in series.items()},
         },
     }
 
 
+async def calc_async(client: AsyncKiwoomClient, ticker: str, days: int = 180) -> Dict:
+    """
+    Calculate supply oscillator (async).
+
+    Runs calc() on the async client's worker pool so many tickers can be
+    calculated concurrently with AsyncKiwoomClient.fan_out().
+
+    Args:
+        client: Async Kiwoom API client
+        ticker: Stock code
+        days: Number of days to calculate
+
+    Returns:
+        Same format as calc()
+    """
+    return await client.run(calc, ticker, days=days)
+
+
 def calc_from_analysis(
     ticker: str,
     name: str,
@@ -189,68 +165,83 @@ def calc_from_analysis(
             "error": {"code": "INSUFFICIENT_DATA", "msg": "최소 30일 데이터 필요"},
         }
 
+    mcap = np.asarray(mcap)
+    foreign_daily = np.asarray(foreign_daily)
+    institution_daily = np.asarray(institution_daily)
+
     # Auto-detect date order and ensure chronological order (oldest first)
     # Compare first and last dates to determine order
     if n >= 2 and dates[0] > dates[-1]:
-        # Data is in reverse chronological order (newest first), reverse it
-        dates = list(reversed(dates))
-        mcap = list(reversed(mcap))
-        foreign_daily = list(reversed(foreign_daily))
-        institution_daily = list(reversed(institution_daily))
+        # Data is in reverse chronological order (newest first), use
+        # reversed views
+        dates = dates[::-1]
+        mcap = mcap[::-1]
+        foreign_daily = foreign_daily[::-1]
+        institution_daily = institution_daily[::-1]
+
+    series = _calc_series(mcap, foreign_daily, institution_daily, apply_rolling)
+
+    return {
+        "ok": True,
+        "data": {
+            "ticker": ticker,
+            "name": name,
+            "dates": dates,
+            **{name: values.tolist() for name, values in series.items()},
+        },
+    }
+
+
+def _calc_series(
+    mcap: np.ndarray,
+    foreign: np.ndarray,
+    institution: np.ndarray,
+    apply_rolling: bool = True,
+) -> Dict[str, np.ndarray]:
+    """
+    Calculate the oscillator series on chronological arrays.
 
+    Args:
+        mcap: Market cap in 원 (oldest first)
+        foreign: Foreign net buy in 백만원 (oldest first)
+        institution: Institution net buy in 백만원 (oldest first)
+        apply_rolling: If True, use 5-day rolling sums of the net buys
+
+    Returns:
+        Series by output field (oldest first)
+    """
     # Calculate 5-day rolling sum if needed
     if apply_rolling:
-        foreign_5d = _calc_rolling_sum(foreign_daily, 5)
-        institution_5d = _calc_rolling_sum(institution_daily, 5)
+        foreign_5d = _rolling_sum_chrono(foreign, 5)
+        institution_5d = _rolling_sum_chrono(institution, 5)
     else:
-        foreign_5d = list(foreign_daily)
-        institution_5d = list(institution_daily)
+        foreign_5d = foreign
+        institution_5d = institution
 
     # Calculate Supply Ratio = (Foreign5d + Institution5d) / MarketCap
     # Note: API returns amounts in 백만원 (million KRW) via unit_tp="1000"
     # mcap is in 원 (KRW), so multiply by 1,000,000 to convert
-    supply_ratio = []
-    for i in range(n):
-        if mcap[i] == 0:
-            supply_ratio.append(0.0)
-        else:
-            supply = (foreign_5d[i] + institution_5d[i]) * 1_000_000  # 백만원 -> 원
-            supply_ratio.append(supply / mcap[i])
-
-    # Calculate EMA
-    ema12 = _calc_ema(supply_ratio, 12)
-    ema26 = _calc_ema(supply_ratio, 26)
+    supply = (foreign_5d + institution_5d) * 1_000_000  # 백만원 -> 원
+    with np.errstate(invalid="ignore", divide="ignore"):
+        supply_ratio = np.where(mcap == 0, 0.0, supply / mcap)
 
-    # Calculate MACD
-    macd_line = [ema12[i] - ema26[i] for i in range(n)]
-
-    # Calculate Signal Line
-    signal = _calc_ema(macd_line, 9)
-
-    # Calculate Oscillator (Histogram)
-    oscillator = [macd_line[i] - signal[i] for i in range(n)]
+    # Calculate EMA, MACD and Signal Line
+    ema12 = ema(supply_ratio, 12)
+    ema26 = ema(supply_ratio, 26)
+    macd_line = ema12 - ema26
+    signal = ema(macd_line, 9)
 
     # Normalize values for display
-    market_cap_trillion = [m / 1_000_000_000_000 for m in mcap]
-    foreign_5d_billion = [f / 100 for f in foreign_5d]  # 백만원 -> 억원
-    institution_5d_billion = [i / 100 for i in institution_5d]  # 백만원 -> 억원
-
     return {
-        "ok": True,
-        "data": {
-            "ticker": ticker,
-            "name": name,
-            "dates": dates,
-            "market_cap": market_cap_trillion,
-            "foreign_5d": foreign_5d_billion,
-            "institution_5d": institution_5d_billion,
-            "supply_ratio": supply_ratio,
-            "ema12": ema12,
-            "ema26": ema26,
-            "macd": macd_line,
-            "signal": signal,
-            "oscillator": oscillator,
-        },
+        "market_cap": mcap / 1_000_000_000_000,  # Trillion KRW
+        "foreign_5d": foreign_5d / 100,  # 백만원 -> 억원
+        "institution_5d": institution_5d / 100,  # 백만원 -> 억원
+        "supply_ratio": supply_ratio,
+        "ema12": ema12,
+        "ema26": ema26,
+        "macd": macd_line,
+        "signal": signal,
+        "oscillator": macd_line - signal,  # Histogram
     }
 
 
@@ -353,25 +344,89 @@ def analyze_signal(osc_result: Dict) -> Dict:
     }
 
 
+class OscillatorState(BarState):
+    """
+    Streaming supply/demand oscillator state.
+
+    ``update(bar)`` takes a row of ``analysis.analyze`` data
+    ({"date", "mcap", "for_5d", "ins_5d"}) and returns the newest values of
+    ``calc_from_analysis`` (supply_ratio, ema12, ema26, macd, signal,
+    oscillator and the normalized market_cap/foreign_5d/institution_5d).
+    """
+
+    name = "oscillator"
+    params = ("apply_rolling",)
+
+    def __init__(self, apply_rolling: bool = True):
+        super().__init__()
+        self.apply_rolling = apply_rolling
+        self.foreign = RollingSumState(5)
+        self.institution = RollingSumState(5)
+        self.macd = MacdState(12, 26, 9)
+
+    def _apply(self, bar: Dict) -> Dict:
+        mcap = bar["mcap"]
+        foreign_5d = bar["for_5d"]
+        institution_5d = bar["ins_5d"]
+        if self.apply_rolling:
+            foreign_5d = self.foreign.update(foreign_5d)
+            institution_5d = self.institution.update(institution_5d)
+
+        if mcap == 0:
+            supply_ratio = 0.0
+        else:
+            supply = (foreign_5d + institution_5d) * 1_000_000  # 백만원 -> 원
+            supply_ratio = supply / mcap
+
+        macd, signal, osc = self.macd.update(supply_ratio)
+        return {
+            "market_cap": mcap / 1_000_000_000_000,
+            "foreign_5d": foreign_5d / 100,  # 백만원 -> 억원
+            "institution_5d": institution_5d / 100,
+            "supply_ratio": supply_ratio,
+            "ema12": self.macd.fast.value,
+            "ema26": self.macd.slow.value,
+            "macd": macd,
+            "signal": signal,
+            "oscillator": osc,
+        }
+
+    def _state(self) -> Dict:
+        return {
+            "foreign": self.foreign.to_dict(),
+            "institution": self.institution.to_dict(),
+            "macd": self.macd.to_dict(),
+        }
+
+    def _load(self, state: Dict) -> None:
+        self.foreign = RollingSumState.from_dict(state["foreign"])
+        self.institution = RollingSumState.from_dict(state["institution"])
+        self.macd = MacdState.from_dict(state["macd"])
+
+
 def _calc_rolling_sum(values: List[float], window: int) -> List[float]:
     """Calculate rolling sum with specified window."""
+    return _rolling_sum_chrono(np.asarray(values), window).tolist()
+
+
+def _rolling_sum_chrono(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Trailing window sums (expanding at the head).
+
+    Adds the shifted series oldest term first, so float sums equal Python's
+    ``sum(values[i - window + 1 : i + 1])``.
+    """
+    out = np.zeros_like(values)
     n = len(values)
-    result = []
-    for i in range(n):
-        start = max(0, i - window + 1)
-        result.append(sum(values[start:i + 1]))
-    return result
+    for lag in range(window - 1, -1, -1):
+        if lag < n:
+            out[lag:] += values[: n - lag]
+    return out
 
 
 def _calc_ema(values: List[float], period: int) -> List[float]:
     """Calculate EMA."""
-    if not values:
-        return []
-    alpha = 2 / (period + 1)
-    ema = [values[0]]
-    for i in range(1, len(values)):
-        ema.append(alpha * values[i] + (1 - alpha) * ema[i - 1])
-    return ema
+    return ema(values, period).tolist()
 
 
 def _is_increasing(values: List[float]) -> bool:
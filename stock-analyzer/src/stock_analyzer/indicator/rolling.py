@@ -0,0 +1,216 @@
+"""Rolling-window kernels shared by indicators.
+
+All kernels take values in chronological order (oldest first) and return a
+float64 array of the same shape, where element i covers the trailing
+window ``values[i - window + 1 : i + 1]``. Windows that are shorter than
+``min_periods`` (default: ``window``) are NaN; with ``min_periods=1`` the
+head of the series uses the expanding window of the values available.
+
+Sums, means and standard deviations are O(n) via cumulative sums. Integer
+input is summed exactly in int64. Min/max use a strided window view.
+``ema`` is recursive and runs one pass over a 1-D series.
+
+Windows run along the last axis, so a 2-D (tickers x dates) matrix is
+processed row by row in a single pass.
+"""
+
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+def _prepare(
+    values: Sequence,
+    window: int,
+    min_periods: Optional[int],
+) -> Tuple[np.ndarray, int]:
+    """Validate arguments and convert values to an array."""
+    if window < 1:
+        raise ValueError("window must be >= 1")
+    if min_periods is None:
+        min_periods = window
+    if not 1 <= min_periods <= window:
+        raise ValueError("min_periods must be between 1 and window")
+    x = np.asarray(values)
+    if x.dtype.kind not in "iuf":
+        x = x.astype(np.float64)
+    return x, min_periods
+
+
+def _counts(n: int, window: int) -> np.ndarray:
+    """Number of observations in each trailing window."""
+    return np.minimum(np.arange(1, n + 1), window)
+
+
+def _window_sums(x: np.ndarray, window: int) -> np.ndarray:
+    """Trailing window sums (expanding at the head)."""
+    acc_dtype = np.int64 if x.dtype.kind in "iu" else np.float64
+    cs = np.cumsum(x, axis=-1, dtype=acc_dtype)
+    cs = np.concatenate([np.zeros(x.shape[:-1] + (1,), dtype=acc_dtype), cs], axis=-1)
+    end = np.arange(1, x.shape[-1] + 1)
+    start = np.maximum(end - window, 0)
+    return (cs[..., end] - cs[..., start]).astype(np.float64)
+
+
+def _mask_short(out: np.ndarray, n: int, window: int, min_periods: int) -> np.ndarray:
+    """Set windows with fewer than min_periods observations to NaN."""
+    if min_periods > 1:
+        out[..., : min(n, min_periods - 1)] = np.nan
+    return out
+
+
+def rolling_sum(
+    values: Sequence,
+    window: int,
+    min_periods: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Rolling sum.
+
+    Args:
+        values: Values (oldest first)
+        window: Window length
+        min_periods: Minimum observations for a value (default: window)
+
+    Returns:
+        Rolling sums (NaN where fewer than min_periods observations)
+    """
+    x, min_periods = _prepare(values, window, min_periods)
+    out = _window_sums(x, window)
+    return _mask_short(out, x.shape[-1], window, min_periods)
+
+
+def rolling_mean(
+    values: Sequence,
+    window: int,
+    min_periods: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Rolling mean (simple moving average).
+
+    Args:
+        values: Values (oldest first)
+        window: Window length
+        min_periods: Minimum observations for a value (default: window)
+
+    Returns:
+        Rolling means (NaN where fewer than min_periods observations)
+    """
+    x, min_periods = _prepare(values, window, min_periods)
+    n = x.shape[-1]
+    out = _window_sums(x, window) / _counts(n, window)
+    return _mask_short(out, n, window, min_periods)
+
+
+def rolling_std(
+    values: Sequence,
+    window: int,
+    min_periods: Optional[int] = None,
+    ddof: int = 0,
+) -> np.ndarray:
+    """
+    Rolling standard deviation.
+
+    Args:
+        values: Values (oldest first)
+        window: Window length
+        min_periods: Minimum observations for a value (default: window)
+        ddof: Delta degrees of freedom (0: population, 1: sample)
+
+    Returns:
+        Rolling standard deviations (NaN where fewer than min_periods
+        observations or not more than ddof observations)
+    """
+    x, min_periods = _prepare(values, window, min_periods)
+    x = x.astype(np.float64)
+    n = x.shape[-1]
+    counts = _counts(n, window)
+
+    sums = _window_sums(x, window)
+    sq_sums = _window_sums(x * x, window)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        var = (sq_sums - sums * sums / counts) / (counts - ddof)
+    # Cancellation can leave tiny negatives for flat windows
+    out = np.sqrt(np.maximum(var, 0.0))
+    out[..., counts <= ddof] = np.nan
+    return _mask_short(out, n, window, min_periods)
+
+
+def rolling_min(
+    values: Sequence,
+    window: int,
+    min_periods: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Rolling minimum.
+
+    Args:
+        values: Values (oldest first)
+        window: Window length
+        min_periods: Minimum observations for a value (default: window)
+
+    Returns:
+        Rolling minimums (NaN where fewer than min_periods observations)
+    """
+    return _rolling_extreme(values, window, min_periods, np.min, np.minimum)
+
+
+def rolling_max(
+    values: Sequence,
+    window: int,
+    min_periods: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Rolling maximum.
+
+    Args:
+        values: Values (oldest first)
+        window: Window length
+        min_periods: Minimum observations for a value (default: window)
+
+    Returns:
+        Rolling maximums (NaN where fewer than min_periods observations)
+    """
+    return _rolling_extreme(values, window, min_periods, np.max, np.maximum)
+
+
+def _rolling_extreme(values, window, min_periods, reduce, accumulate) -> np.ndarray:
+    """Rolling min/max over a strided window view."""
+    x, min_periods = _prepare(values, window, min_periods)
+    n = x.shape[-1]
+    out = np.empty(x.shape, dtype=np.float64)
+    head = min(n, window - 1)
+    if head:
+        out[..., :head] = accumulate.accumulate(x[..., :head], axis=-1)
+    if n >= window:
+        out[..., head:] = reduce(sliding_window_view(x, window, axis=-1), axis=-1)
+    return _mask_short(out, n, window, min_periods)
+
+
+def ema(values: Sequence, period: int) -> np.ndarray:
+    """
+    Exponential moving average seeded with the first value.
+
+    Matches pandas ewm(alpha=2/(period+1), adjust=False).mean() and gives
+    the same floats as the equivalent Python loop.
+
+    Args:
+        values: Values (oldest first, 1-D)
+        period: EMA period
+
+    Returns:
+        EMA values (no NaN warmup)
+    """
+    x = np.asarray(values)
+    out = np.empty(len(x))
+    if len(x) == 0:
+        return out
+    alpha = 2 / (period + 1)
+    prev = float(x[0])
+    # The recursion is sequential; Python floats keep the loop cheap
+    for i, value in enumerate(x.tolist()):
+        if i:
+            prev = alpha * value + (1 - alpha) * prev
+        out[i] = prev
+    return out
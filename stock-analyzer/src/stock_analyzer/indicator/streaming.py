@@ -0,0 +1,404 @@
+"""Incremental (streaming) indicator state.
+
+State objects hold just enough history to produce the newest indicator
+value from one new bar in O(1), so a watchlist can be refreshed without
+recomputing full series. Values are fed in chronological order (oldest
+first) and produce the same results as the batch kernels.
+
+Every state converts to/from a JSON-serializable dict with ``to_dict()`` /
+``from_dict()`` so it can be persisted next to the OHLCV data (see
+``OhlcvStore.save_state``).
+
+``BarState`` is the base for the per-indicator states (``elder.ElderState``,
+``trend.TrendState``, ...). It tracks the date of the newest bar: feeding a
+bar with the same date again revises that bar (intraday refresh) instead of
+appending a new one.
+"""
+
+import math
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Dict, List, Optional, Tuple, Union
+
+from ..stock.frame import OhlcvFrame
+
+
+class EmaState:
+    """
+    Exponential moving average without SMA seeding.
+
+    Matches ``ewm(alpha=2/(period+1), adjust=False)``: the first value seeds
+    the average.
+    """
+
+    def __init__(self, period: int, value: Optional[float] = None):
+        if period < 1:
+            raise ValueError("period must be >= 1")
+        self.period = period
+        self.alpha = 2 / (period + 1)
+        self.value = value
+
+    def update(self, x: float) -> float:
+        """Add a value and get the new EMA."""
+        if self.value is None:
+            self.value = float(x)
+        else:
+            self.value = self.alpha * x + (1 - self.alpha) * self.value
+        return self.value
+
+    def to_dict(self) -> Dict:
+        return {"period": self.period, "value": self.value}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "EmaState":
+        return cls(data["period"], data["value"])
+
+
+class MacdState:
+    """MACD line, signal line and histogram."""
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        self.fast = EmaState(fast)
+        self.slow = EmaState(slow)
+        self.signal = EmaState(signal)
+
+    def update(self, x: float) -> Tuple[float, float, float]:
+        """
+        Add a value.
+
+        Returns:
+            (macd_line, signal_line, histogram)
+        """
+        macd = self.fast.update(x) - self.slow.update(x)
+        signal = self.signal.update(macd)
+        return macd, signal, macd - signal
+
+    def to_dict(self) -> Dict:
+        return {
+            "fast": self.fast.to_dict(),
+            "slow": self.slow.to_dict(),
+            "signal": self.signal.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "MacdState":
+        state = cls()
+        state.fast = EmaState.from_dict(data["fast"])
+        state.slow = EmaState.from_dict(data["slow"])
+        state.signal = EmaState.from_dict(data["signal"])
+        return state
+
+
+class RollingSumState:
+    """
+    Trailing window sum.
+
+    Integer input is summed exactly. Float totals are re-summed from the
+    window once per ``window`` updates so rounding error cannot accumulate.
+    """
+
+    def __init__(
+        self,
+        window: int,
+        values: Optional[List[float]] = None,
+        updates: int = 0,
+        total: Optional[float] = None,
+    ):
+        if window < 1:
+            raise ValueError("window must be >= 1")
+        self.window = window
+        self.values = deque(values or [], maxlen=window)
+        self.total = sum(self.values) if total is None else total
+        self.updates = updates
+
+    @property
+    def count(self) -> int:
+        """Number of values in the window."""
+        return len(self.values)
+
+    @property
+    def full(self) -> bool:
+        return len(self.values) == self.window
+
+    def update(self, x: float) -> float:
+        """Add a value and get the sum of the trailing window."""
+        if len(self.values) == self.window:
+            self.total -= self.values[0]
+        self.values.append(x)
+        self.total += x
+        self.updates += 1
+
+        if isinstance(self.total, float) and self.updates % self.window == 0:
+            self.total = math.fsum(self.values)
+        return self.total
+
+    def mean(self) -> Optional[float]:
+        """Mean of the values in the window (None if empty)."""
+        return self.total / len(self.values) if self.values else None
+
+    def to_dict(self) -> Dict:
+        return {
+            "window": self.window,
+            "values": list(self.values),
+            "updates": self.updates,
+            "total": self.total,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "RollingSumState":
+        return cls(data["window"], data["values"], data["updates"], data["total"])
+
+
+class RollingStdState:
+    """Trailing window population standard deviation."""
+
+    def __init__(self, window: int):
+        self.sums = RollingSumState(window)
+        self.sq_sums = RollingSumState(window)
+
+    @property
+    def full(self) -> bool:
+        return self.sums.full
+
+    def update(self, x: float) -> float:
+        """Add a value and get the std of the trailing window."""
+        x = float(x)
+        total = self.sums.update(x)
+        sq_total = self.sq_sums.update(x * x)
+        count = self.sums.count
+        var = (sq_total - total * total / count) / count
+        # Cancellation can leave tiny negatives for flat windows
+        return math.sqrt(max(var, 0.0))
+
+    def to_dict(self) -> Dict:
+        return {"sums": self.sums.to_dict(), "sq_sums": self.sq_sums.to_dict()}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "RollingStdState":
+        state = cls(data["sums"]["window"])
+        state.sums = RollingSumState.from_dict(data["sums"])
+        state.sq_sums = RollingSumState.from_dict(data["sq_sums"])
+        return state
+
+
+class RollingMinMaxState:
+    """
+    Trailing window minimum and maximum (e.g. 52-week range).
+
+    Monotonic deques of (index, value) keep each update amortized O(1).
+    """
+
+    def __init__(self, window: int):
+        if window < 1:
+            raise ValueError("window must be >= 1")
+        self.window = window
+        self.index = 0
+        self._min = deque()
+        self._max = deque()
+
+    def update(self, x: float) -> Tuple[float, float]:
+        """
+        Add a value.
+
+        Returns:
+            (min, max) of the trailing window
+        """
+        start = self.index - self.window + 1
+        while self._min and self._min[-1][1] >= x:
+            self._min.pop()
+        self._min.append((self.index, x))
+        while self._min[0][0] < start:
+            self._min.popleft()
+
+        while self._max and self._max[-1][1] <= x:
+            self._max.pop()
+        self._max.append((self.index, x))
+        while self._max[0][0] < start:
+            self._max.popleft()
+
+        self.index += 1
+        return self._min[0][1], self._max[0][1]
+
+    def to_dict(self) -> Dict:
+        return {
+            "window": self.window,
+            "index": self.index,
+            "min": [list(item) for item in self._min],
+            "max": [list(item) for item in self._max],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "RollingMinMaxState":
+        state = cls(data["window"])
+        state.index = data["index"]
+        state._min = deque(tuple(item) for item in data["min"])
+        state._max = deque(tuple(item) for item in data["max"])
+        return state
+
+
+class TdSetupState:
+    """
+    DeMark TD Setup counters.
+
+    Sell setup counts closes above the close ``lookback`` bars earlier, buy
+    setup counts closes below it; each resets to 0 otherwise.
+    """
+
+    def __init__(self, lookback: int = 4):
+        self.lookback = lookback
+        self.closes = deque(maxlen=lookback)
+        self.sell = 0
+        self.buy = 0
+
+    def update(self, close: float) -> Tuple[int, int]:
+        """
+        Add a close.
+
+        Returns:
+            (sell_setup, buy_setup)
+        """
+        if len(self.closes) == self.lookback:
+            prior = self.closes[0]
+            self.sell = self.sell + 1 if close > prior else 0
+            self.buy = self.buy + 1 if close < prior else 0
+        self.closes.append(close)
+        return self.sell, self.buy
+
+    def to_dict(self) -> Dict:
+        return {
+            "lookback": self.lookback,
+            "closes": list(self.closes),
+            "sell": self.sell,
+            "buy": self.buy,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "TdSetupState":
+        state = cls(data["lookback"])
+        state.closes.extend(data["closes"])
+        state.sell = data["sell"]
+        state.buy = data["buy"]
+        return state
+
+
+class BarState(ABC):
+    """
+    Base class for per-indicator streaming state.
+
+    Subclasses set ``name``, implement ``_apply(bar)`` returning the newest
+    values, and ``_state()``/``_load(state)`` for their primitive states.
+    Constructor settings are listed in ``params`` so ``from_dict`` can
+    rebuild the object.
+    """
+
+    name = ""
+    params: Tuple[str, ...] = ()
+
+    def __init__(self):
+        self.date: Optional[str] = None
+        self.count = 0
+        self.last: Optional[Dict] = None
+        self._pending: Optional[Dict] = None  # State before the newest bar
+
+    @abstractmethod
+    def _apply(self, bar: Dict) -> Dict:
+        """Advance the primitive states by one bar; returns its values."""
+
+    @abstractmethod
+    def _state(self) -> Dict:
+        """Get the primitive states as a JSON-serializable dict."""
+
+    @abstractmethod
+    def _load(self, state: Dict) -> None:
+        """Restore the primitive states from _state()."""
+
+    def update(self, bar: Dict) -> Dict:
+        """
+        Add one bar (oldest to newest).
+
+        A bar with the same date as the newest one replaces it, so an
+        intraday bar can be refreshed until the close.
+
+        Args:
+            bar: {"date": "20250110", "close": ..., ...}
+
+        Returns:
+            Indicator values for the bar
+
+        Raises:
+            ValueError: If the bar is older than the newest bar
+        """
+        date = str(bar.get("date", "")) or None
+        if date is not None and self.date is not None and date < self.date:
+            raise ValueError(f"Bar {date} is older than state date {self.date}")
+
+        if date is not None and date == self.date and self._pending is not None:
+            self._load(self._pending["state"])
+            self.count = self._pending["count"]
+        else:
+            self._pending = {"state": self._state(), "count": self.count}
+
+        self.last = self._apply(bar)
+        self.count += 1
+        self.date = date
+        return self.last
+
+    def replay(self, data: Union[Dict, OhlcvFrame]) -> Optional[Dict]:
+        """
+        Feed bars from a series, skipping bars older than the state date.
+
+        Args:
+            data: Dict of lists with "dates" (newest first, like
+                ``ohlcv.get_daily``) or an OhlcvFrame
+
+        Returns:
+            Indicator values for the newest bar (None if nothing was fed)
+        """
+        if isinstance(data, OhlcvFrame):
+            data = data.to_dict()
+
+        dates = data["dates"]
+        columns = [
+            (key, values) for key, values in data.items()
+            if isinstance(values, list) and len(values) == len(dates) and key != "dates"
+        ]
+        for i in range(len(dates) - 1, -1, -1):
+            date = str(dates[i])
+            if self.date is not None and date < self.date:
+                continue
+            bar = {key: values[i] for key, values in columns}
+            bar["date"] = date
+            self.update(bar)
+        return self.last
+
+    @classmethod
+    def from_ohlcv(cls, data: Union[Dict, OhlcvFrame], **kwargs) -> "BarState":
+        """Create a state and warm it up from a series (newest first)."""
+        state = cls(**kwargs)
+        state.replay(data)
+        return state
+
+    def to_dict(self) -> Dict:
+        """Convert to a JSON-serializable dict."""
+        return {
+            "type": self.name,
+            "params": {key: getattr(self, key) for key in self.params},
+            "date": self.date,
+            "count": self.count,
+            "last": self.last,
+            "pending": self._pending,
+            "state": self._state(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "BarState":
+        """Restore a state saved with ``to_dict()``."""
+        if data.get("type") != cls.name:
+            raise ValueError(f"Expected {cls.name} state, got {data.get('type')}")
+        state = cls(**data.get("params", {}))
+        state._load(data["state"])
+        state.date = data["date"]
+        state.count = data["count"]
+        state.last = data["last"]
+        state._pending = data["pending"]
+        return state
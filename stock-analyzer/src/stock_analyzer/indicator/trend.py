@@ -6,11 +6,26 @@ Reference: Uses weekly data for Fear/Greed and CMF calculations.
 - Fear/Greed index calculated on weekly data
 """
 
+import math
+from collections import deque
 from typing import Dict, List, Literal, Optional
 
+import numpy as np
+
+from ..client.async_kiwoom import AsyncKiwoomClient
 from ..client.kiwoom import KiwoomClient
 from ..core.log import log_info
-from ..stock import ohlcv
+from ..stock import multiframe
+from ..stock.frame import OhlcvFrame
+from ..stock.multiframe import MultiTimeframe
+from . import lookback
+from .rolling import rolling_max, rolling_min, rolling_std, rolling_sum
+from .streaming import (
+    BarState,
+    RollingMinMaxState,
+    RollingStdState,
+    RollingSumState,
+)
 
 
 # Fear/Greed calculation constants
@@ -37,12 +52,22 @@ FG_POSITION_MAX = 1.5
 FG_VOLUME_MIN = -0.5
 FG_VOLUME_MAX = 1.2
 
+# Bars before the first valid output: MA60/CMF20/52-day range on daily data,
+# MA20/CMF4/52-period range on weekly and monthly data
+WARMUP = {
+    "daily": max(60, 20, FG_POSITION_LOOKBACK) - 1,
+    "weekly": max(20, 4, FG_POSITION_LOOKBACK) - 1,
+    "monthly": max(20, 4, FG_POSITION_LOOKBACK) - 1,
+}
+lookback.register("trend", WARMUP)
+
 
 def calc(
     client: KiwoomClient,
     ticker: str,
     days: int = 180,
-    timeframe: Literal["daily", "weekly"] = "daily",
+    timeframe: Literal["daily", "weekly", "monthly"] = "daily",
+    bars: Optional[MultiTimeframe] = None,
 ) -> Dict:
     """
     Calculate Trend Signal.
@@ -56,7 +81,9 @@ def calc(
         client: Kiwoom API client
         ticker: Stock code
         days: Number of days/weeks for calculation
-        timeframe: "daily" or "weekly" (reference uses weekly)
+        timeframe: "daily", "weekly" or "monthly" (reference uses weekly;
+            monthly uses the weekly rules)
+        bars: Preloaded bars shared with other calls (fetched if None)
 
     Returns:
         {
@@ -89,84 +116,39 @@ def calc(
 
     ticker = ticker.strip()
 
-    # Fetch OHLCV data based on timeframe
-    if timeframe == "weekly":
-        # Fetch daily data and resample to weekly (like reference code)
-        # Need enough daily data for weekly resampling + MA calculation
-        fetch_days = (days + 60) * 7  # ~7 days per week
-        ohlcv_result = ohlcv.get_daily_resampled_to_weekly(client, ticker, days=fetch_days)
-        min_periods = 52  # 1 year of weekly data for 52-week range
-        cmf_period = 4  # 4-week CMF for weekly data (reference)
-    else:
-        # Fetch extra days for MA60 calculation
-        fetch_days = days + 60
-        ohlcv_result = ohlcv.get_daily(client, ticker, days=fetch_days)
-        min_periods = 60
-        cmf_period = 20  # 20-day CMF for daily data
-
-    if not ohlcv_result["ok"]:
-        return ohlcv_result
-
-    data = ohlcv_result["data"]
-    closes = data["close"]
-    highs = data["high"]
-    lows = data["low"]
-    volumes = data["volume"]
-    dates = data["dates"]
-
-    if len(closes) < min_periods:
-        return {
-            "ok": False,
-            "error": {"code": "NO_DATA", "msg": f"데이터가 충분하지 않습니다 (최소 {min_periods} 필요)"},
-        }
-
-    # Calculate indicators based on timeframe
-    if timeframe == "weekly":
-        # Weekly: MA10 is key (reference uses MA10 for buy/sell signals)
-        ma10 = _calc_ma(closes, 10)
-        ma5 = _calc_ma(closes, 5)
-        ma20 = _calc_ma(closes, 20)
-    else:
-        # Daily: MA5/20/60 alignment
-        ma5 = _calc_ma(closes, 5)
-        ma20 = _calc_ma(closes, 20)
-        ma60 = _calc_ma(closes, 60)
-        ma10 = _calc_ma(closes, 10)
-
-    cmf = _calc_cmf(highs, lows, closes, volumes, period=cmf_period)
-    fear_greed = _calc_fear_greed_weekly(closes, volumes) if timeframe == "weekly" else _calc_fear_greed(closes, volumes)
-
-    # Calculate MA signal based on timeframe (reference: 3 conditions for weekly)
-    if timeframe == "weekly":
-        ma_signal = _calc_ma_signal_weekly_reference(closes, highs, lows, ma10, cmf)
-    else:
-        ma_signal = _calc_ma_signal(ma5, ma20, ma60)
+    # One daily fetch (output + warmup bars, see lookback); weekly and monthly
+    # bars are derived from it
+    if bars is None:
+        fetch_days = lookback.fetch_days("trend", timeframe, days)
+        loaded = multiframe.load(client, ticker, days=fetch_days)
+        if not loaded["ok"]:
+            return loaded
+        bars = loaded["data"]
+    return calc_from_frame(bars.frame(timeframe), timeframe, days=days)
 
-    trend = _calc_trend(ma_signal, cmf, fear_greed)
 
-    # Trim to requested days/weeks
-    trim_len = min(days, len(dates) - (min_periods - 1))
-    result = {
-        "ticker": ticker,
-        "timeframe": timeframe,
-        "dates": dates[:trim_len],
-        "ma_signal": ma_signal[:trim_len],
-        "cmf": cmf[:trim_len],
-        "fear_greed": fear_greed[:trim_len],
-        "trend": trend[:trim_len],
-        "ma10": ma10[:trim_len],
-        "ma5": ma5[:trim_len],
-        "ma20": ma20[:trim_len],
-    }
+async def calc_async(
+    client: AsyncKiwoomClient,
+    ticker: str,
+    days: int = 180,
+    timeframe: Literal["daily", "weekly", "monthly"] = "daily",
+) -> Dict:
+    """
+    Calculate Trend Signal (async).
 
-    # Add ma60 for daily timeframe
-    if timeframe == "daily":
-        ma60 = _calc_ma(closes, 60)
-        result["ma60"] = ma60[:trim_len]
+    Runs calc() on the async client's worker pool so many tickers can be
+    calculated concurrently with AsyncKiwoomClient.fan_out().
 
-    log_info("indicator.trend", "calc complete", {"ticker": ticker, "timeframe": timeframe, "periods": trim_len})
+    Args:
+        client: Async Kiwoom API client
+        ticker: Stock code
+        days: Number of periods to return
+        timeframe: Same as calc()
 
-    return {"ok": True, "data": result}
+    Returns:
+        Same format as calc()
+    """
+    return await client.run(calc, ticker, days=days, timeframe=timeframe)
 
 
 def calc_from_ohlcv(
@@ -190,65 +172,359 @@ def calc_from_ohlcv(
         highs: High prices
         lows: Low prices
         volumes: Volume list
-        timeframe: "daily" or "weekly" (for labeling and period adjustments)
+        timeframe: "daily", "weekly" or "monthly" (for labeling and period
+            adjustments)
 
     Returns:
         Same format as calc()
     """
-    # Determine minimum periods and CMF period based on timeframe
-    if timeframe == "weekly":
-        min_periods = 52  # 1 year of weekly data for 52-week range
-        cmf_period = 4  # 4-week CMF for weekly data (reference)
-    else:
-        min_periods = 60
-        cmf_period = 20  # 20-day CMF for daily data
-
+    min_periods = _min_periods(timeframe)
     if len(closes) < min_periods:
-        return {
-            "ok": False,
-            "error": {"code": "NO_DATA", "msg": f"데이터가 충분하지 않습니다 (최소 {min_periods} 필요)"},
-        }
+        return _no_data(min_periods)
+
+    # Chronological views of the newest-first input
+    series = _calc_series(
+        np.asarray(closes)[::-1],
+        np.asarray(highs)[::-1],
+        np.asarray(lows)[::-1],
+        np.asarray(volumes)[::-1],
+        timeframe,
+    )
+    return {
+        "ok": True,
+        "data": _to_result(ticker, timeframe, dates, series, len(closes)),
+    }
 
-    # Calculate MA based on timeframe
-    if timeframe == "weekly":
-        ma10 = _calc_ma(closes, 10)
-        ma5 = _calc_ma(closes, 5)
-        ma20 = _calc_ma(closes, 20)
-    else:
-        ma5 = _calc_ma(closes, 5)
-        ma20 = _calc_ma(closes, 20)
-        ma60 = _calc_ma(closes, 60)
-        ma10 = _calc_ma(closes, 10)
 
-    cmf = _calc_cmf(highs, lows, closes, volumes, period=cmf_period)
-    fear_greed = _calc_fear_greed_weekly(closes, volumes) if timeframe == "weekly" else _calc_fear_greed(closes, volumes)
+def calc_from_frame(
+    frame: OhlcvFrame,
+    timeframe: str = "daily",
+    days: Optional[int] = None,
+) -> Dict:
+    """
+    Calculate Trend Signal from an OhlcvFrame.
+
+    The kernels read the frame's oldest-first views directly; lists are
+    only built for the returned periods.
+
+    Args:
+        frame: Bars of the timeframe, newest first
+        timeframe: "daily", "weekly" or "monthly"
+        days: Number of periods for result (all valid periods if None)
+
+    Returns:
+        Same format as calc()
+    """
+    min_periods = _min_periods(timeframe)
+    if len(frame) < min_periods:
+        return _no_data(min_periods)
+
+    chrono = frame.chrono()
+    series = _calc_series(
+        chrono.close, chrono.high, chrono.low, chrono.volume, timeframe
+    )
+
+    # Trim to requested days/weeks
+    trim_len = len(frame) - WARMUP[timeframe]
+    if days is not None:
+        trim_len = min(days, trim_len)
+    dates = frame.head(trim_len).date_strings()
+    result = _to_result(frame.ticker, timeframe, dates, series, trim_len)
+
+    log_info("indicator.trend", "calc complete", {
+        "ticker": frame.ticker,
+        "timeframe": timeframe,
+        "periods": trim_len,
+    })
+
+    return {"ok": True, "data": result}
+
+
+def _min_periods(timeframe: str) -> int:
+    """Minimum bars for a timeframe."""
+    if timeframe != "daily":
+        return 52  # 1 year of weekly data for 52-week range
+    return 60
+
+
+def _no_data(min_periods: int) -> Dict:
+    return {
+        "ok": False,
+        "error": {
+            "code": "NO_DATA",
+            "msg": f"데이터가 충분하지 않습니다 (최소 {min_periods} 필요)",
+        },
+    }
+
+
+def _calc_series(
+    c: np.ndarray,
+    h: np.ndarray,
+    lo: np.ndarray,
+    v: np.ndarray,
+    timeframe: str,
+) -> Dict[str, np.ndarray]:
+    """
+    Calculate every trend series on chronological arrays.
+
+    Args:
+        c: Close prices (oldest first)
+        h: High prices (oldest first)
+        lo: Low prices (oldest first)
+        v: Volumes (oldest first)
+        timeframe: "daily", "weekly" or "monthly"
+
+    Returns:
+        Series by output field (oldest first, NaN MA warmup)
+    """
+    periods = (5, 10, 20, 60) if timeframe == "daily" else (5, 10, 20)
+    series = {f"ma{period}": _ma_chrono(c, period) for period in periods}
+
+    # 4-week CMF for weekly data (reference), 20-day CMF for daily data
+    cmf_period = 20 if timeframe == "daily" else 4
+    series["cmf"] = _cmf_chrono(h, lo, c, v, cmf_period)
+    series["fear_greed"] = _fear_greed_chrono(c, v)
 
     # Calculate MA signal based on timeframe (reference: 3 conditions for weekly)
-    if timeframe == "weekly":
-        ma_signal = _calc_ma_signal_weekly_reference(closes, highs, lows, ma10, cmf)
+    if timeframe != "daily":
+        series["ma_signal"] = _ma_signal_weekly_chrono(
+            c, h, lo, series["ma10"], series["cmf"]
+        )
     else:
-        ma_signal = _calc_ma_signal(ma5, ma20, ma60)
+        series["ma_signal"] = _ma_signal_chrono(
+            series["ma5"], series["ma20"], series["ma60"]
+        )
+
+    series["trend"] = _trend_chrono(
+        series["ma_signal"], series["cmf"], series["fear_greed"]
+    )
+    return series
 
-    trend = _calc_trend(ma_signal, cmf, fear_greed)
+
+def _to_result(
+    ticker: str,
+    timeframe: str,
+    dates: List[str],
+    series: Dict[str, np.ndarray],
+    n: int,
+) -> Dict:
+    """Build the newest-first result dict for the newest n periods."""
+    def newest(name: str) -> List:
+        return series[name][::-1][:n].tolist()
 
     result = {
         "ticker": ticker,
         "timeframe": timeframe,
         "dates": dates,
-        "ma_signal": ma_signal,
-        "cmf": cmf,
-        "fear_greed": fear_greed,
-        "trend": trend,
-        "ma10": ma10,
-        "ma5": ma5,
-        "ma20": ma20,
+        "ma_signal": newest("ma_signal"),
+        "cmf": newest("cmf"),
+        "fear_greed": newest("fear_greed"),
+        "trend": newest("trend"),
     }
+    # ma60 only exists for daily timeframe
+    for name in ("ma10", "ma5", "ma20", "ma60"):
+        if name in series:
+            result[name] = [None if math.isnan(ma) else int(ma) for ma in newest(name)]
+    return result
 
-    # Add ma60 for daily timeframe
-    if timeframe == "daily":
-        result["ma60"] = ma60
 
-    return {"ok": True, "data": result}
+class FearGreedState:
+    """
+    Streaming Fear/Greed index.
+
+    Holds the momentum lookback, 52-period range, volume and volatility
+    windows and the smoothing sums, so ``update(close, volume)`` gives the
+    newest value of ``_fear_greed_chrono`` in O(1).
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.closes = deque(maxlen=FG_MOMENTUM_LOOKBACK + 1)
+        self.range52 = RollingMinMaxState(FG_POSITION_LOOKBACK)
+        self.recent_vol = RollingSumState(5)
+        self.past_vol = RollingSumState(FG_VOLUME_LOOKBACK)
+        self.recent_std = RollingStdState(5)
+        self.past_std = RollingStdState(FG_VOLUME_LOOKBACK)
+        self.momentum = RollingSumState(FG_MOMENTUM_SMOOTHING_PERIOD)
+        self.position = RollingSumState(FG_POSITION_SMOOTHING_PERIOD)
+        self.surge = RollingSumState(FG_VOLUME_SMOOTHING_PERIOD)
+        self.spike = RollingSumState(FG_VOLUME_SMOOTHING_PERIOD)
+
+    def update(self, close: int, volume: int) -> float:
+        """Add a bar and get the newest Fear/Greed value."""
+        prev = self.closes[-1] if self.closes else None
+        self.closes.append(close)
+
+        # Momentum5: log return over 5 periods * 100
+        momentum5 = 0.0
+        if len(self.closes) > FG_MOMENTUM_LOOKBACK:
+            base = self.closes[0]
+            if close > 0 and base > 0:
+                momentum5 = (math.log(close) - math.log(base)) * 100
+
+        # Pos52: position within 52-period range
+        low52, high52 = self.range52.update(close)
+        span = high52 - low52
+        pos52 = (close - low52) / span if span > 0 else 0.5
+
+        ret = (close - prev) / prev if prev is not None and prev > 0 else 0.0
+
+        recent_vol = self.recent_vol.update(volume) / 5
+        past_vol = self.past_vol.update(volume) / FG_VOLUME_LOOKBACK
+        recent_std = self.recent_std.update(ret)
+        past_std = self.past_std.update(ret)
+
+        full = self.count >= FG_VOLUME_LOOKBACK
+        vol_surge = 1.0
+        if full and past_vol > 0:
+            vol_surge = min(max(recent_vol / past_vol, 0.0), 3.0)
+        vol_spike = 1.0
+        if full and past_std > 0:
+            vol_spike = min(max(recent_std / past_std, 0.0), 3.0)
+
+        m_sum = self.momentum.update(momentum5)
+        p_sum = self.position.update(pos52)
+        v_sum = self.surge.update(vol_surge)
+        vs_sum = self.spike.update(vol_spike)
+        self.count += 1
+
+        # The batch version is all zeros until a full 52-period range exists
+        if self.count < max(FG_MIN_CALC_PERIOD + 1, FG_POSITION_LOOKBACK):
+            return 0.0
+
+        m_period = FG_MOMENTUM_SMOOTHING_PERIOD
+        v_period = FG_VOLUME_SMOOTHING_PERIOD
+        m = m_sum / m_period / FG_MOMENTUM_DIVISOR
+        m = _clip(m, FG_MOMENTUM_MIN, FG_MOMENTUM_MAX)
+        p = _clip(2 * p_sum / m_period - 1, FG_POSITION_MIN, FG_POSITION_MAX)
+        v = _clip(v_sum / v_period - 1, FG_VOLUME_MIN, FG_VOLUME_MAX)
+        vs = _clip(-(vs_sum / v_period - 1), FG_VOLUME_MIN, FG_VOLUME_MAX)
+
+        return (
+            FG_WEIGHT_MOMENTUM * m
+            + FG_WEIGHT_POSITION * p
+            + FG_WEIGHT_VOLUME_SURGE * v
+            + FG_WEIGHT_VOLUME_SPIKE * vs
+        )
+
+    def to_dict(self) -> Dict:
+        return {
+            "count": self.count,
+            "closes": list(self.closes),
+            "range52": self.range52.to_dict(),
+            "recent_vol": self.recent_vol.to_dict(),
+            "past_vol": self.past_vol.to_dict(),
+            "recent_std": self.recent_std.to_dict(),
+            "past_std": self.past_std.to_dict(),
+            "momentum": self.momentum.to_dict(),
+            "position": self.position.to_dict(),
+            "surge": self.surge.to_dict(),
+            "spike": self.spike.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "FearGreedState":
+        state = cls()
+        state.count = data["count"]
+        state.closes.extend(data["closes"])
+        state.range52 = RollingMinMaxState.from_dict(data["range52"])
+        sums = ("recent_vol", "past_vol", "momentum", "position", "surge", "spike")
+        for name in sums:
+            setattr(state, name, RollingSumState.from_dict(data[name]))
+        state.recent_std = RollingStdState.from_dict(data["recent_std"])
+        state.past_std = RollingStdState.from_dict(data["past_std"])
+        return state
+
+
+class TrendState(BarState):
+    """
+    Streaming trend signal state.
+
+    ``update(bar)`` takes {"date", "high", "low", "close", "volume"} and
+    returns the newest ma5/ma10/ma20 (and ma60 for daily), cmf, fear_greed,
+    ma_signal and trend, matching ``calc`` for the same timeframe.
+    """
+
+    name = "trend"
+    params = ("timeframe",)
+
+    def __init__(self, timeframe: Literal["daily", "weekly", "monthly"] = "daily"):
+        super().__init__()
+        self.timeframe = timeframe
+        periods = (5, 10, 20, 60) if timeframe == "daily" else (5, 10, 20)
+        self.mas = {period: RollingSumState(period) for period in periods}
+        cmf_period = 20 if timeframe == "daily" else 4
+        self.mfv = RollingSumState(cmf_period)
+        self.vol = RollingSumState(cmf_period)
+        self.fear_greed = FearGreedState()
+        self.prev_bar: Optional[Dict] = None
+
+    def _apply(self, bar: Dict) -> Dict:
+        high, low, close, volume = bar["high"], bar["low"], bar["close"], bar["volume"]
+
+        result = {}
+        for period, sums in self.mas.items():
+            total = sums.update(close)
+            result[f"ma{period}"] = int(total / period) if sums.full else None
+
+        # Chaikin Money Flow
+        hl_range = high - low
+        mfv = 0.0
+        if hl_range != 0:
+            mfv = ((close - low) - (high - close)) / hl_range * volume
+        sum_mfv = self.mfv.update(mfv)
+        sum_vol = self.vol.update(volume)
+        cmf = 0.0
+        if self.vol.full and sum_vol != 0:
+            cmf = round(sum_mfv / sum_vol, 4)
+
+        fear_greed = self.fear_greed.update(close, volume)
+
+        if self.timeframe != "daily":
+            prev = self.prev_bar
+            if prev is None:
+                ma_signal = 0
+            else:
+                ma_signal = _calc_ma_signal_weekly_reference(
+                    [close, prev["close"]], [high, prev["high"]], [low, prev["low"]],
+                    [result["ma10"], None], [cmf, 0.0],
+                )[0]
+        else:
+            ma_signal = _calc_ma_signal(
+                [result["ma5"]], [result["ma20"]], [result["ma60"]],
+            )[0]
+        self.prev_bar = {"high": high, "low": low, "close": close}
+
+        result.update({
+            "ma_signal": ma_signal,
+            "cmf": cmf,
+            "fear_greed": fear_greed,
+            "trend": _calc_trend([ma_signal], [cmf], [fear_greed])[0],
+        })
+        return result
+
+    def _state(self) -> Dict:
+        return {
+            "mas": {str(period): sums.to_dict() for period, sums in self.mas.items()},
+            "mfv": self.mfv.to_dict(),
+            "vol": self.vol.to_dict(),
+            "fear_greed": self.fear_greed.to_dict(),
+            "prev_bar": self.prev_bar,
+        }
+
+    def _load(self, state: Dict) -> None:
+        self.mas = {
+            int(period): RollingSumState.from_dict(sums)
+            for period, sums in state["mas"].items()
+        }
+        self.mfv = RollingSumState.from_dict(state["mfv"])
+        self.vol = RollingSumState.from_dict(state["vol"])
+        self.fear_greed = FearGreedState.from_dict(state["fear_greed"])
+        self.prev_bar = state["prev_bar"]
+
+
+def _clip(value: float, low: float, high: float) -> float:
+    return min(max(value, low), high)
 
 
 def _calc_ma(prices: List[int], period: int) -> List[Optional[int]]:
@@ -262,14 +538,15 @@ def _calc_ma(prices: List[int], period: int) -> List[Optional[int]]:
     Returns:
         MA values (None for insufficient data)
     """
-    result = []
-    for i in range(len(prices)):
-        if i + period > len(prices):
-            result.append(None)
-        else:
-            window = prices[i : i + period]
-            result.append(int(sum(window) / period))
-    return result
+    if not prices:
+        return []
+    ma = _ma_chrono(np.asarray(prices)[::-1], period)[::-1]
+    return [None if math.isnan(value) else int(value) for value in ma.tolist()]
+
+
+def _ma_chrono(c: np.ndarray, period: int) -> np.ndarray:
+    """Simple moving average truncated to whole won (oldest first, NaN warmup)."""
+    return np.trunc(rolling_sum(c, period) / period)
 
 
 def _calc_ma_signal(
@@ -373,6 +650,34 @@ def _calc_ma_signal_weekly_reference(
     return result
 
 
+def _ma_signal_chrono(
+    ma5: np.ndarray,
+    ma20: np.ndarray,
+    ma60: np.ndarray,
+) -> np.ndarray:
+    """``_calc_ma_signal`` on chronological arrays (NaN MA: neutral)."""
+    bull = (ma5 > ma20) & (ma20 > ma60)
+    bear = (ma5 < ma20) & (ma20 < ma60)
+    return np.where(bull, 1, np.where(bear, -1, 0))
+
+
+def _ma_signal_weekly_chrono(
+    c: np.ndarray,
+    h: np.ndarray,
+    lo: np.ndarray,
+    ma10: np.ndarray,
+    cmf: np.ndarray,
+) -> np.ndarray:
+    """``_calc_ma_signal_weekly_reference`` on chronological arrays."""
+    signal = np.zeros(len(c), dtype=np.int64)
+    # Need previous bar data and MA10
+    ready = ~np.isnan(ma10[1:])
+    buy = ready & (h[1:] > h[:-1]) & (c[1:] > ma10[1:]) & (cmf[1:] > 0)
+    sell = ready & (lo[1:] < lo[:-1]) & (c[1:] < ma10[1:]) & (cmf[1:] < 0)
+    signal[1:] = np.where(buy, 1, np.where(sell, -1, 0))
+    return signal
+
+
 def _calc_cmf(
     highs: List[int],
     lows: List[int],
@@ -391,32 +696,38 @@ def _calc_cmf(
     Returns:
         CMF values (-1 to 1)
     """
-    result = []
-
+    if not closes:
+        return []
+    cmf = _cmf_chrono(
+        np.asarray(highs)[::-1],
+        np.asarray(lows)[::-1],
+        np.asarray(closes)[::-1],
+        np.asarray(volumes)[::-1],
+        period,
+    )
+    return cmf[::-1].tolist()
+
+
+def _cmf_chrono(
+    h: np.ndarray,
+    lo: np.ndarray,
+    c: np.ndarray,
+    v: np.ndarray,
+    period: int,
+) -> np.ndarray:
+    """CMF on chronological arrays (0.0 until the window is full)."""
     # Calculate Money Flow Multiplier and Volume
-    mfv = []
-    for i in range(len(closes)):
-        hl_range = highs[i] - lows[i]
-        if hl_range == 0:
-            mfv.append(0.0)
-        else:
-            mfm = ((closes[i] - lows[i]) - (highs[i] - closes[i])) / hl_range
-            mfv.append(mfm * volumes[i])
-
-    # Calculate CMF for each period
-    for i in range(len(closes)):
-        if i + period > len(closes):
-            result.append(0.0)
-        else:
-            sum_mfv = sum(mfv[i : i + period])
-            sum_vol = sum(volumes[i : i + period])
-            if sum_vol == 0:
-                result.append(0.0)
-            else:
-                cmf_value = sum_mfv / sum_vol
-                result.append(round(cmf_value, 4))
-
-    return result
+    hl_range = h - lo
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mfm = ((c - lo) - (h - c)) / hl_range
+        mfv = np.where(hl_range == 0, 0.0, mfm * v)
+        sum_mfv = rolling_sum(mfv, period)
+        sum_vol = rolling_sum(v, period)
+        cmf = sum_mfv / sum_vol
+    # Python round() like the streaming state (np.round can differ in the
+    # last digit)
+    cmf = np.where(np.isnan(sum_vol) | (sum_vol == 0), 0.0, cmf)
+    return np.array([round(value, 4) for value in cmf.tolist()])
 
 
 def _calc_fear_greed(
@@ -438,121 +749,8 @@ def _calc_fear_greed(
     Returns:
         Fear/Greed index (approximately -1 to 1.5)
     """
-    import math
-
-    n = len(closes)
-    result = [0.0] * n
-
-    if n < 52:
-        return result
-
-    # Process in chronological order
-    closes_chrono = list(reversed(closes))
-    volumes_chrono = list(reversed(volumes))
-
-    # Calculate components
-    momentum5 = [0.0] * n
-    pos52 = [0.0] * n
-    vol_surge = [1.0] * n
-    vol_spike = [1.0] * n
-    returns = [0.0] * n
-
-    for i in range(n):
-        # Momentum5: log return over 5 periods * 100
-        if i >= 5 and closes_chrono[i] > 0 and closes_chrono[i - 5] > 0:
-            momentum5[i] = (math.log(closes_chrono[i]) - math.log(closes_chrono[i - 5])) * 100
-
-        # Pos52: Position within 52-day range
-        if i >= 51:
-            window = closes_chrono[max(0, i - 51) : i + 1]
-            low52 = min(window)
-            high52 = max(window)
-            if high52 > low52:
-                pos52[i] = (closes_chrono[i] - low52) / (high52 - low52)
-            else:
-                pos52[i] = 0.5
-        else:
-            # Use available data
-            window = closes_chrono[: i + 1]
-            if window:
-                low_val = min(window)
-                high_val = max(window)
-                if high_val > low_val:
-                    pos52[i] = (closes_chrono[i] - low_val) / (high_val - low_val)
-                else:
-                    pos52[i] = 0.5
-
-        # Returns for volatility calculation
-        if i >= 1 and closes_chrono[i - 1] > 0:
-            returns[i] = (closes_chrono[i] - closes_chrono[i - 1]) / closes_chrono[i - 1]
-
-    # VolSurge: recent 5-day avg volume / past 20-day avg volume
-    for i in range(n):
-        if i >= 20:
-            recent_vol = sum(volumes_chrono[i - 4 : i + 1]) / 5
-            past_vol = sum(volumes_chrono[i - 19 : i + 1]) / 20
-            if past_vol > 0:
-                vol_surge[i] = max(0, min(3, recent_vol / past_vol))
-        elif i >= 5:
-            recent_vol = sum(volumes_chrono[: i + 1]) / (i + 1)
-            if recent_vol > 0:
-                vol_surge[i] = 1.0
-
-    # VolSpike: recent 5-day volatility / past 20-day volatility
-    for i in range(n):
-        if i >= 20:
-            recent_returns = returns[i - 4 : i + 1]
-            past_returns = returns[i - 19 : i + 1]
-
-            recent_std = _calc_std(recent_returns)
-            past_std = _calc_std(past_returns)
-
-            if past_std > 0:
-                vol_spike[i] = max(0, min(3, recent_std / past_std))
-        elif i >= 5:
-            vol_spike[i] = 1.0
-
-    # Calculate FG with smoothing (using module-level constants)
-    fg_chrono = [0.0] * n
-    momentum_window_offset = FG_MOMENTUM_SMOOTHING_PERIOD - 1
-    volume_window_offset = FG_VOLUME_SMOOTHING_PERIOD - 1
-
-    for i in range(n):
-        if i < FG_MIN_CALC_PERIOD:
-            fg_chrono[i] = 0.0
-            continue
-
-        # Smoothed momentum (7-period mean, then /10)
-        m_window = momentum5[max(0, i - momentum_window_offset) : i + 1]
-        m = (sum(m_window) / len(m_window) / FG_MOMENTUM_DIVISOR) if m_window else 0
-        m = max(FG_MOMENTUM_MIN, min(FG_MOMENTUM_MAX, m))
-
-        # Smoothed position (7-period mean, then *2 - 1)
-        p_window = pos52[max(0, i - momentum_window_offset) : i + 1]
-        p = (2 * sum(p_window) / len(p_window) - 1) if p_window else 0
-        p = max(FG_POSITION_MIN, min(FG_POSITION_MAX, p))
-
-        # Smoothed volume surge (10-period mean, then -1)
-        v_window = vol_surge[max(0, i - volume_window_offset) : i + 1]
-        v = (sum(v_window) / len(v_window) - 1) if v_window else 0
-        v = max(FG_VOLUME_MIN, min(FG_VOLUME_MAX, v))
-
-        # Smoothed volatility spike (10-period mean, then -1, negative)
-        vs_window = vol_spike[max(0, i - volume_window_offset) : i + 1]
-        vs = -((sum(vs_window) / len(vs_window) - 1)) if vs_window else 0
-        vs = max(FG_VOLUME_MIN, min(FG_VOLUME_MAX, vs))
-
-        # Final FG = weighted sum of components
-        fg_chrono[i] = (
-            FG_WEIGHT_MOMENTUM * m
-            + FG_WEIGHT_POSITION * p
-            + FG_WEIGHT_VOLUME_SURGE * v
-            + FG_WEIGHT_VOLUME_SPIKE * vs
-        )
-
-    # Reverse back to newest-first order
-    result = list(reversed(fg_chrono))
-    return result
+    c = np.asarray(closes)[::-1]
+    return _fear_greed_chrono(c, np.asarray(volumes)[::-1])[::-1].tolist()
 
 
 def _calc_fear_greed_weekly(
@@ -578,128 +776,86 @@ def _calc_fear_greed_weekly(
     Returns:
         Fear/Greed index (approximately -1 to 1.5)
     """
-    import math
-
-    n = len(closes)
-    result = [0.0] * n
-
-    if n < 52:
-        return result
-
-    # Process in chronological order (data is newest-first, so reverse)
-    closes_chrono = list(reversed(closes))
-    volumes_chrono = list(reversed(volumes))
-
-    # Initialize components
-    momentum5 = [0.0] * n
-    pos52 = [0.0] * n
-    vol_surge = [1.0] * n
-    vol_spike = [1.0] * n
-    returns = [0.0] * n
+    c = np.asarray(closes)[::-1]
+    return _fear_greed_chrono(c, np.asarray(volumes)[::-1])[::-1].tolist()
 
-    for i in range(n):
-        # Momentum5: log return over 5 periods * 100
-        if i >= 5 and closes_chrono[i] > 0 and closes_chrono[i - 5] > 0:
-            momentum5[i] = (math.log(closes_chrono[i]) - math.log(closes_chrono[i - 5])) * 100
-
-        # Pos52: Position within 52-week range
-        if i >= 51:
-            window = closes_chrono[max(0, i - 51) : i + 1]
-            low52 = min(window)
-            high52 = max(window)
-            if high52 > low52:
-                pos52[i] = max(0, min(1, (closes_chrono[i] - low52) / (high52 - low52)))
-            else:
-                pos52[i] = 0.5
-        else:
-            # Use available data with min_periods=1
-            window = closes_chrono[: i + 1]
-            if window:
-                low_val = min(window)
-                high_val = max(window)
-                if high_val > low_val:
-                    pos52[i] = max(0, min(1, (closes_chrono[i] - low_val) / (high_val - low_val)))
-                else:
-                    pos52[i] = 0.5
-
-        # Returns for volatility calculation
-        if i >= 1 and closes_chrono[i - 1] > 0:
-            returns[i] = (closes_chrono[i] - closes_chrono[i - 1]) / closes_chrono[i - 1]
-
-    # VolSurge: recent 5-week avg volume / past 20-week avg volume
-    for i in range(n):
-        if i >= 20:
-            recent_vol = sum(volumes_chrono[i - 4 : i + 1]) / 5
-            past_vol = sum(volumes_chrono[i - 19 : i + 1]) / 20
-            if past_vol > 0:
-                vol_surge[i] = max(0, min(3, recent_vol / past_vol))
-        elif i >= 5:
-            vol_surge[i] = 1.0
-
-    # VolSpike: recent 5-week volatility / past 20-week volatility
-    for i in range(n):
-        if i >= 20:
-            recent_returns = returns[i - 4 : i + 1]
-            past_returns = returns[i - 19 : i + 1]
 
-            recent_std = _calc_std(recent_returns)
-            past_std = _calc_std(past_returns)
-
-            if past_std > 0:
-                vol_spike[i] = max(0, min(3, recent_std / past_std))
-        elif i >= 5:
-            vol_spike[i] = 1.0
-
-    # Calculate FG with smoothing (using module-level constants)
-    fg_chrono = [0.0] * n
-    momentum_window_offset = FG_MOMENTUM_SMOOTHING_PERIOD - 1
-    volume_window_offset = FG_VOLUME_SMOOTHING_PERIOD - 1
-
-    for i in range(n):
-        if i < FG_MIN_CALC_PERIOD:
-            fg_chrono[i] = 0.0
-            continue
-
-        # m = (Momentum5.rolling(7).mean() / 10).clip(-1, 1.5)
-        m_window = momentum5[max(0, i - momentum_window_offset) : i + 1]
-        m = (sum(m_window) / len(m_window) / FG_MOMENTUM_DIVISOR) if m_window else 0
-        m = max(FG_MOMENTUM_MIN, min(FG_MOMENTUM_MAX, m))
-
-        # p = (2 * Pos52W.rolling(7).mean() - 1).clip(-1, 1.5)
-        p_window = pos52[max(0, i - momentum_window_offset) : i + 1]
-        p = (2 * sum(p_window) / len(p_window) - 1) if p_window else 0
-        p = max(FG_POSITION_MIN, min(FG_POSITION_MAX, p))
-
-        # v = (VolSurge.rolling(10).mean() - 1).clip(-0.5, 1.2)
-        v_window = vol_surge[max(0, i - volume_window_offset) : i + 1]
-        v = (sum(v_window) / len(v_window) - 1) if v_window else 0
-        v = max(FG_VOLUME_MIN, min(FG_VOLUME_MAX, v))
-
-        # vs = -(VolSpike.rolling(10).mean() - 1).clip(-0.5, 1.2)
-        vs_window = vol_spike[max(0, i - volume_window_offset) : i + 1]
-        vs = -((sum(vs_window) / len(vs_window) - 1)) if vs_window else 0
-        vs = max(FG_VOLUME_MIN, min(FG_VOLUME_MAX, vs))
-
-        # FG = weighted sum of components
-        fg_chrono[i] = (
-            FG_WEIGHT_MOMENTUM * m
-            + FG_WEIGHT_POSITION * p
-            + FG_WEIGHT_VOLUME_SURGE * v
-            + FG_WEIGHT_VOLUME_SPIKE * vs
-        )
+def _fear_greed_chrono(c: np.ndarray, vol: np.ndarray) -> np.ndarray:
+    """
+    Fear/Greed kernel shared by the daily and weekly variants.
 
-    # Reverse back to newest-first order
-    result = list(reversed(fg_chrono))
-    return result
+    Runs in O(n) on chronological arrays using rolling kernels.
 
+    Args:
+        c: Close prices (oldest first)
+        vol: Volumes (oldest first)
 
-def _calc_std(values: List[float]) -> float:
-    """Calculate standard deviation."""
-    if len(values) < 2:
-        return 0.0
-    mean = sum(values) / len(values)
-    variance = sum((x - mean) ** 2 for x in values) / len(values)
-    return variance ** 0.5
+    Returns:
+        Fear/Greed values (oldest first, all 0.0 below 52 periods)
+    """
+    n = len(c)
+    if n < 52:
+        return np.zeros(n)
+    c_float = c.astype(np.float64)
+
+    # Momentum5: log return over 5 periods * 100
+    lookback = FG_MOMENTUM_LOOKBACK
+    momentum5 = np.zeros(n)
+    valid = (c[lookback:] > 0) & (c[:-lookback] > 0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        log_ret = (np.log(c_float[lookback:]) - np.log(c_float[:-lookback])) * 100
+    momentum5[lookback:] = np.where(valid, log_ret, 0.0)
+
+    # Pos52: position within 52-period range (expanding window at the head)
+    low52 = rolling_min(c, FG_POSITION_LOOKBACK, min_periods=1)
+    high52 = rolling_max(c, FG_POSITION_LOOKBACK, min_periods=1)
+    span = high52 - low52
+    with np.errstate(invalid="ignore", divide="ignore"):
+        pos52 = np.where(span > 0, (c - low52) / span, 0.5)
+
+    # Returns for volatility calculation
+    returns = np.zeros(n)
+    prev = c[:-1]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        ret = (c[1:] - prev) / prev
+    returns[1:] = np.where(prev > 0, ret, 0.0)
+
+    full = np.arange(n) >= FG_VOLUME_LOOKBACK
+
+    # VolSurge: recent 5-period avg volume / past 20-period avg volume
+    recent_vol = rolling_sum(vol, 5) / 5
+    past_vol = rolling_sum(vol, FG_VOLUME_LOOKBACK) / FG_VOLUME_LOOKBACK
+    with np.errstate(invalid="ignore", divide="ignore"):
+        surge = np.clip(recent_vol / past_vol, 0, 3)
+    vol_surge = np.where(full & (past_vol > 0), surge, 1.0)
+
+    # VolSpike: recent 5-period volatility / past 20-period volatility
+    recent_std = rolling_std(returns, 5)
+    past_std = rolling_std(returns, FG_VOLUME_LOOKBACK)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        spike = np.clip(recent_std / past_std, 0, 3)
+    vol_spike = np.where(full & (past_std > 0), spike, 1.0)
+
+    # Smoothed components (windows are always full from FG_MIN_CALC_PERIOD on)
+    m_period = FG_MOMENTUM_SMOOTHING_PERIOD
+    v_period = FG_VOLUME_SMOOTHING_PERIOD
+    m = rolling_sum(momentum5, m_period) / m_period / FG_MOMENTUM_DIVISOR
+    m = np.clip(m, FG_MOMENTUM_MIN, FG_MOMENTUM_MAX)
+    p = 2 * rolling_sum(pos52, m_period) / m_period - 1
+    p = np.clip(p, FG_POSITION_MIN, FG_POSITION_MAX)
+    v = rolling_sum(vol_surge, v_period) / v_period - 1
+    v = np.clip(v, FG_VOLUME_MIN, FG_VOLUME_MAX)
+    vs = -(rolling_sum(vol_spike, v_period) / v_period - 1)
+    vs = np.clip(vs, FG_VOLUME_MIN, FG_VOLUME_MAX)
+
+    fg = (
+        FG_WEIGHT_MOMENTUM * m
+        + FG_WEIGHT_POSITION * p
+        + FG_WEIGHT_VOLUME_SURGE * v
+        + FG_WEIGHT_VOLUME_SPIKE * vs
+    )
+    fg[:FG_MIN_CALC_PERIOD] = 0.0
+    return fg
 
 
 def _calc_trend(
@@ -756,3 +912,16 @@ def _calc_trend(
             result.append("neutral")
 
     return result
+
+
+def _trend_chrono(
+    ma_signal: np.ndarray,
+    cmf: np.ndarray,
+    fear_greed: np.ndarray,
+) -> np.ndarray:
+    """``_calc_trend`` on arrays (labels as a str array)."""
+    bull = (ma_signal == 1).astype(int) + (cmf > 0.05) + (fear_greed > 0.5)
+    bear = (ma_signal == -1).astype(int) + (cmf < -0.05) + (fear_greed < -0.5)
+    return np.where(
+        bull >= 2, "bullish", np.where(bear >= 2, "bearish", "neutral")
+    )
@@ -0,0 +1,20 @@
+"""Universe screening.
+
+Runs trend/Elder/DeMark/oscillator over the stock master or a condition
+search result and keeps the tickers passing every rule, ranked by a field.
+Command line: ``python -m stock_analyzer.screen --help``.
+"""
+
+from .engine import compute, fetch, load_universe, screen
+from .rules import Field, Rule, parse_field, parse_rule
+
+__all__ = [
+    "screen",
+    "load_universe",
+    "fetch",
+    "compute",
+    "Field",
+    "Rule",
+    "parse_field",
+    "parse_rule",
+]
@@ -0,0 +1,155 @@
+"""Screen the market from the command line.
+
+Usage (from stock-analyzer/, KIWOOM_* keys in .env):
+    python -m stock_analyzer.screen \\
+        --rule "weekly.trend.ma_signal==1" --rule "weekly.elder.color==green" \\
+        --rule "daily.demark.buy_setup>=9" --rank daily.oscillator.total_score \\
+        --market KOSPI --output screen.jsonl
+"""
+
+import argparse
+import json
+import logging
+import sys
+from typing import Dict, List, Optional
+
+from ..client.kiwoom import KiwoomClient
+from ..client.token_cache import TokenCache
+from ..config import Config, ConfigError
+from ..stock.store import OhlcvStore
+from .engine import DEFAULT_FETCHERS, DEFAULT_PROGRESS_INTERVAL, load_universe, screen
+from .rules import parse_field, parse_rule
+
+DEFAULT_TOP = 30  # Ranked rows printed at the end
+
+
+def _print_progress(stats: Dict) -> None:
+    print(
+        f"{stats['done']}/{stats['total']} tickers, {stats['matched']} matched, "
+        f"{stats['errors']} errors, {stats['rate']:.1f} tickers/s",
+        file=sys.stderr,
+        flush=True,
+    )
+
+
+def _print_table(rows: List[Dict], columns: List[str], top: int) -> None:
+    header = " ".join(f"{c:>24}" for c in columns)
+    print(f"{'ticker':<8} {'name':<16} {'date':<9} {header}")
+    for row in rows[:top]:
+        cells = []
+        for column in columns:
+            value = row["values"].get(column)
+            if isinstance(value, float):
+                value = f"{value:.4f}"
+            cells.append(f"{str(value):>24}")
+        print(
+            f"{row['ticker']:<8} {row['name'][:16]:<16} {row['date'] or '':<9} "
+            + " ".join(cells)
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run a screen; returns the exit code."""
+    parser = argparse.ArgumentParser(
+        description="Screen stocks by trend/Elder/DeMark/oscillator rules",
+    )
+    parser.add_argument(
+        "--rule", action="append", default=[],
+        help="[timeframe.]indicator.field OP value, e.g. weekly.elder.color==green",
+    )
+    parser.add_argument("--rank", help="field to sort by, e.g. daily.trend.fear_greed")
+    parser.add_argument("--ascending", action="store_true", help="smallest first")
+    parser.add_argument(
+        "--market", action="append", choices=["KOSPI", "KOSDAQ"],
+        help="stock master markets (default: all)",
+    )
+    parser.add_argument(
+        "--condition", help="condition search index instead of the master",
+    )
+    parser.add_argument("--limit", type=int, help="screen only the first N tickers")
+    parser.add_argument(
+        "--workers", type=int, help="worker processes (default: CPU count)",
+    )
+    parser.add_argument("--fetchers", type=int, default=DEFAULT_FETCHERS)
+    parser.add_argument("--store", help="local OHLCV store directory")
+    parser.add_argument("--output", help="append matches here as JSON lines")
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP)
+    parser.add_argument(
+        "--progress-interval", type=float, default=DEFAULT_PROGRESS_INTERVAL,
+    )
+    parser.add_argument("--env", help=".env path")
+    parser.add_argument("--base-url", help="API base URL (overrides KIWOOM_BASE_URL)")
+    parser.add_argument("--verbose", action="store_true", help="keep INFO logs")
+    args = parser.parse_args(argv)
+
+    try:
+        rules = [parse_rule(text) for text in args.rule]
+        rank_by = parse_field(args.rank) if args.rank else None
+    except ValueError as e:
+        parser.error(str(e))
+    if not rules and rank_by is None:
+        parser.error("at least one --rule or --rank is required")
+
+    if not args.verbose:
+        # Every indicator call logs "calc complete"; keep progress readable
+        logging.disable(logging.INFO)
+
+    try:
+        config = Config.from_env(args.env)
+    except ConfigError as e:
+        print(f"Error loading config: {e}", file=sys.stderr)
+        return 1
+
+    client = KiwoomClient(
+        config.app_key,
+        config.secret_key,
+        args.base_url or config.base_url,
+        token_cache=TokenCache(),
+    )
+    output = None
+    try:
+        universe = load_universe(client, args.market, args.condition)
+        if not universe["ok"]:
+            print(f"Error loading universe: {universe['error']}", file=sys.stderr)
+            return 1
+        tickers = universe["data"][: args.limit] if args.limit else universe["data"]
+
+        if args.output:
+            output = open(args.output, "a", encoding="utf-8")
+
+        def write(row: Dict) -> None:
+            if output is not None:
+                output.write(json.dumps(row, ensure_ascii=False) + "\n")
+                output.flush()
+
+        result = screen(
+            client,
+            tickers,
+            rules,
+            rank_by=rank_by,
+            descending=not args.ascending,
+            workers=args.workers,
+            fetchers=args.fetchers,
+            store=OhlcvStore(args.store) if args.store else None,
+            on_match=write,
+            on_progress=_print_progress,
+            progress_interval=args.progress_interval,
+        )
+    finally:
+        if output is not None:
+            output.close()
+        client.close()
+
+    if not result["ok"]:
+        print(f"Error: {result['error']}", file=sys.stderr)
+        return 1
+
+    columns = list(dict.fromkeys(rule.field.key for rule in rules))
+    if rank_by is not None and rank_by.key not in columns:
+        columns.append(rank_by.key)
+    _print_table(result["data"]["results"], columns, args.top)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
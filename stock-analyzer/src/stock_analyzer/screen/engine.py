@@ -0,0 +1,354 @@
+"""Universe screener: concurrent fetches, process-pool indicator math."""
+
+import logging
+import os
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from ..client.kiwoom import KiwoomClient
+from ..client.session import KiwoomSession
+from ..core.log import log_info, log_warn
+from ..indicator import demark, elder, lookback, oscillator, trend
+from ..search import condition
+from ..stock import analysis, multiframe
+from ..stock.frame import OhlcvFrame
+from ..stock.master import get_master
+from ..stock.multiframe import MultiTimeframe
+from ..stock.store import OhlcvStore
+from .rules import FIELDS, Field, Rule, matches, rank, requirements
+
+DEFAULT_FETCHERS = 4  # Concurrent tickers being fetched (all share one rate limit)
+DEFAULT_PERIODS = 1  # Output bars per indicator; rules look at the newest one
+OSCILLATOR_DAYS = 120  # Investor-flow days for the oscillator (EMA26 + signal9 settle)
+DEFAULT_PROGRESS_INTERVAL = 5.0  # Seconds between progress reports
+
+_CALC = {"trend": trend.calc, "elder": elder.calc, "demark": demark.calc}
+
+
+def load_universe(
+    client: KiwoomClient,
+    markets: Optional[List[str]] = None,
+    cond_idx: Optional[str] = None,
+) -> Dict:
+    """
+    Get the tickers to screen.
+
+    Args:
+        client: Kiwoom API client
+        markets: Markets of the stock master to include (all if None)
+        cond_idx: Condition search index; its result replaces the master
+
+    Returns:
+        {"ok": True, "data": [(ticker, name), ...]} or the fetch error
+    """
+    if cond_idx:
+        result = condition.search_by_idx(client, cond_idx)
+        if not result["ok"]:
+            return result
+        return {
+            "ok": True,
+            "data": [(s["ticker"], s["name"]) for s in result["data"]["stocks"]],
+        }
+
+    master = get_master(client)
+    result = master.ensure()
+    if not result["ok"]:
+        return result
+    return {"ok": True, "data": [(s.ticker, s.name) for s in master.all(markets)]}
+
+
+def fetch(
+    client: KiwoomClient,
+    ticker: str,
+    name: str,
+    needs: List[Tuple[str, str]],
+    days: int,
+    store: Optional[OhlcvStore] = None,
+) -> Dict:
+    """
+    Fetch what the needed indicators of one ticker read.
+
+    Runs on a fetch thread. A per-ticker session lets the investor
+    analysis reuse the daily chart pages of the multi-timeframe fetch.
+
+    Args:
+        client: Kiwoom API client (shared rate limit)
+        ticker: Stock code
+        name: Stock name
+        needs: (indicator, timeframe) pairs
+        days: Calendar days of daily bars (see lookback.plan)
+        store: Local OHLCV store
+
+    Returns:
+        {"ok": True, "data": {"ticker", "name", "daily", "analysis"}} or
+        the first fetch error
+    """
+    daily: Optional[OhlcvFrame] = None
+    analysis_data: Optional[Dict] = None
+    with KiwoomSession(client) as session:
+        if days > 0:
+            loaded = multiframe.load(session, ticker, days=days, store=store)
+            if not loaded["ok"]:
+                return loaded
+            daily = loaded["data"].daily
+        if any(indicator == "oscillator" for indicator, _ in needs):
+            analyzed = analysis.analyze(session, ticker, OSCILLATOR_DAYS)
+            if not analyzed["ok"]:
+                return analyzed
+            analysis_data = analyzed["data"]
+    return {
+        "ok": True,
+        "data": {
+            "ticker": ticker,
+            "name": name,
+            "daily": daily,
+            "analysis": analysis_data,
+        },
+    }
+
+
+def compute(
+    task: Dict[str, Any],
+    needs: List[Tuple[str, str]],
+    periods: int = DEFAULT_PERIODS,
+) -> Dict:
+    """
+    Calculate the newest value of every needed indicator field.
+
+    Runs in a worker process; ``task`` is the data of fetch().
+
+    Args:
+        task: {"ticker", "name", "daily", "analysis"}
+        needs: (indicator, timeframe) pairs
+        periods: Output bars per indicator
+
+    Returns:
+        {"ok": True, "data": {"ticker", "name", "date", "values"}} with
+        values keyed "timeframe.indicator.field", or the first calc error
+    """
+    ticker = task["ticker"]
+    bars = MultiTimeframe(task["daily"]) if task["daily"] is not None else None
+    values: Dict[str, Any] = {}
+
+    for indicator, timeframe in needs:
+        if indicator == "oscillator":
+            data = task["analysis"]
+            result = oscillator.calc_from_analysis(
+                ticker, data["name"], data["dates"], data["mcap"],
+                data["for_5d"], data["ins_5d"],
+            )
+            if not result["ok"]:
+                return result
+            series = result["data"]
+            latest = {
+                name: series[name][-1]
+                for name in FIELDS[indicator] if name in series
+            }
+            signal = oscillator.analyze_signal(result)
+            if signal["ok"]:
+                latest["total_score"] = signal["data"]["total_score"]
+                latest["signal_type"] = signal["data"]["signal_type"]
+        else:
+            result = _CALC[indicator](None, ticker, periods, timeframe, bars=bars)
+            if not result["ok"]:
+                return result
+            series = result["data"]
+            if not series["dates"]:
+                return {
+                    "ok": False,
+                    "error": {"code": "NO_DATA", "msg": "데이터가 충분하지 않습니다"},
+                }
+            latest = {
+                name: series[name][0]
+                for name in FIELDS[indicator] if name in series
+            }
+
+        for name, value in latest.items():
+            values[Field(timeframe, indicator, name).key] = value
+
+    if bars is not None and len(bars.daily):
+        date = bars.daily.date_strings()[0]
+    elif task["analysis"] and task["analysis"]["dates"]:
+        date = task["analysis"]["dates"][0].replace("-", "")
+    else:
+        date = None
+    return {
+        "ok": True,
+        "data": {
+            "ticker": ticker,
+            "name": task["name"],
+            "date": date,
+            "values": values,
+        },
+    }
+
+
+def _init_worker(log_disable_level: int) -> None:
+    """Carry the parent's log silencing into spawned workers."""
+    logging.disable(log_disable_level)
+
+
+def _progress(stats: Dict[str, int], start: float) -> Dict[str, Any]:
+    elapsed = time.monotonic() - start
+    return dict(
+        stats,
+        elapsed=round(elapsed, 1),
+        rate=round(stats["done"] / elapsed, 2) if elapsed > 0 else 0.0,
+    )
+
+
+def screen(
+    client: KiwoomClient,
+    universe: Iterable[Tuple[str, str]],
+    rules: List[Rule],
+    rank_by: Optional[Field] = None,
+    descending: bool = True,
+    workers: Optional[int] = None,
+    fetchers: int = DEFAULT_FETCHERS,
+    periods: int = DEFAULT_PERIODS,
+    store: Optional[OhlcvStore] = None,
+    on_match: Optional[Callable[[Dict], None]] = None,
+    on_progress: Optional[Callable[[Dict], None]] = None,
+    progress_interval: float = DEFAULT_PROGRESS_INTERVAL,
+) -> Dict:
+    """
+    Screen a universe of tickers.
+
+    Fetches run on ``fetchers`` threads sharing the client's rate limit;
+    each fetched ticker is handed to a process pool for the indicator math
+    as soon as it arrives, so fetching and computing overlap.
+
+    Example:
+        rules = [parse_rule("weekly.trend.ma_signal==1"),
+                 parse_rule("daily.demark.buy_setup>=9")]
+        result = screen(client, load_universe(client)["data"], rules)
+
+    Args:
+        client: Kiwoom API client
+        universe: (ticker, name) pairs (see load_universe)
+        rules: Rules every result must pass (empty keeps all tickers)
+        rank_by: Field to sort results by (universe order if None)
+        descending: Largest rank_by value first
+        workers: Worker processes (CPU count if None, 0 computes on the
+            calling thread, e.g. where multiprocessing is unavailable)
+        fetchers: Concurrent fetch threads
+        periods: Output bars per indicator
+        store: Local OHLCV store for incremental top-up
+        on_match: Called with each passing result as soon as it is known
+        on_progress: Called every progress_interval seconds and at the end
+            with {"total", "done", "matched", "errors", "elapsed", "rate"}
+        progress_interval: Seconds between progress reports
+
+    Returns:
+        {
+            "ok": True,
+            "data": {
+                "results": [{"ticker", "name", "date", "values"}, ...],  # ranked
+                "stats": {"total", "done", "matched", "errors", "elapsed", "rate"}
+            }
+        }
+
+    Errors:
+        - INVALID_ARG: No rule or rank field
+    """
+    fields = [rule.field for rule in rules] + ([rank_by] if rank_by else [])
+    needs = sorted(requirements(fields))
+    if not needs:
+        return {
+            "ok": False,
+            "error": {"code": "INVALID_ARG", "msg": "조건 또는 정렬 기준이 필요합니다"},
+        }
+
+    universe = list(universe)
+    days = lookback.plan(
+        (indicator, timeframe, periods)
+        for indicator, timeframe in needs if indicator != "oscillator"
+    ).days
+
+    stats = {"total": len(universe), "done": 0, "matched": 0, "errors": 0}
+    rows: List[Dict] = []
+    start = time.monotonic()
+    last_report = start
+
+    def finish(ticker: str, result: Dict) -> None:
+        stats["done"] += 1
+        if not result["ok"]:
+            stats["errors"] += 1
+            log_warn("screen.engine", "Ticker skipped", {
+                "ticker": ticker,
+                **result["error"],
+            })
+            return
+        row = result["data"]
+        if matches(rules, row["values"]):
+            stats["matched"] += 1
+            rows.append(row)
+            if on_match:
+                on_match(row)
+
+    def outcome(future: Future) -> Dict:
+        try:
+            return future.result()
+        except Exception as e:
+            return {"ok": False, "error": {"code": "UNKNOWN_ERROR", "msg": str(e)}}
+
+    pool = None
+    if workers is None or workers > 0:
+        pool = ProcessPoolExecutor(
+            max_workers=workers or os.cpu_count(),
+            initializer=_init_worker,
+            initargs=(logging.root.manager.disable,),
+        )
+    try:
+        with ThreadPoolExecutor(fetchers, thread_name_prefix="screen-fetch") as io:
+            fetches = {
+                io.submit(fetch, client, ticker, name, needs, days, store): ticker
+                for ticker, name in universe
+            }
+            computes: Dict[Future, str] = {}
+            while fetches or computes:
+                done, _ = wait(
+                    list(fetches) + list(computes),
+                    timeout=progress_interval,
+                    return_when=FIRST_COMPLETED,
+                )
+                for future in done:
+                    if future in fetches:
+                        ticker = fetches.pop(future)
+                        task = outcome(future)
+                        if not task["ok"]:
+                            finish(ticker, task)
+                        elif pool is None:
+                            finish(ticker, compute(task["data"], needs, periods))
+                        else:
+                            future = pool.submit(
+                                compute, task["data"], needs, periods,
+                            )
+                            computes[future] = ticker
+                    else:
+                        finish(computes.pop(future), outcome(future))
+
+                now = time.monotonic()
+                if on_progress and now - last_report >= progress_interval:
+                    on_progress(_progress(stats, start))
+                    last_report = now
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    final = _progress(stats, start)
+    if on_progress:
+        on_progress(final)
+    log_info("screen.engine", "screen complete", final)
+
+    return {
+        "ok": True,
+        "data": {"results": rank(rows, rank_by, descending), "stats": final},
+    }
@@ -0,0 +1,178 @@
+"""Screening rules over the latest indicator values.
+
+A field is written ``[timeframe.]indicator.name`` (timeframe defaults to
+daily), e.g. ``weekly.trend.ma_signal`` or ``demark.buy_setup``. A rule
+compares a field with a number or a label:
+
+    weekly.trend.ma_signal==1
+    weekly.elder.color==green
+    daily.demark.buy_setup>=9
+"""
+
+import operator
+import re
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+TIMEFRAMES = ("daily", "weekly", "monthly")
+
+# Fields of each indicator's calc() result that can be screened
+FIELDS = {
+    "trend": ("ma_signal", "cmf", "fear_greed", "trend", "ma5", "ma10", "ma20", "ma60"),
+    "elder": (
+        "color", "ema13", "macd_line", "signal_line", "macd_hist",
+        "ema13_slope", "hist_slope",
+    ),
+    "demark": ("close", "sell_setup", "buy_setup"),
+    "oscillator": (
+        "market_cap", "foreign_5d", "institution_5d", "supply_ratio", "ema12",
+        "ema26", "macd", "signal", "oscillator",
+        # From oscillator.analyze_signal()
+        "total_score", "signal_type",
+    ),
+}
+
+# Investor data is daily only
+DAILY_ONLY = frozenset({"oscillator"})
+
+OPERATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    ">=": operator.ge,
+    "<=": operator.le,
+    ">": operator.gt,
+    "<": operator.lt,
+}
+
+_RULE_RE = re.compile(r"^\s*([\w.]+)\s*(==|!=|>=|<=|>|<)\s*(\S+)\s*$")
+
+
+@dataclass(frozen=True)
+class Field:
+    """An indicator value on a timeframe."""
+
+    timeframe: str
+    indicator: str
+    name: str
+
+    @property
+    def key(self) -> str:
+        """Column name in screen results."""
+        return f"{self.timeframe}.{self.indicator}.{self.name}"
+
+
+@dataclass(frozen=True)
+class Rule:
+    """A comparison of a field's latest value with a constant."""
+
+    field: Field
+    op: str
+    value: Union[int, float, str]
+
+    def __str__(self) -> str:
+        return f"{self.field.key}{self.op}{self.value}"
+
+    def matches(self, values: Dict[str, Any]) -> bool:
+        """
+        Check the rule against one ticker's values.
+
+        Missing values and label/number mismatches never match.
+        """
+        actual = values.get(self.field.key)
+        if actual is None or isinstance(actual, str) != isinstance(self.value, str):
+            return False
+        return OPERATORS[self.op](actual, self.value)
+
+
+def parse_field(text: str) -> Field:
+    """
+    Parse ``[timeframe.]indicator.name``.
+
+    Raises:
+        ValueError: If the field is unknown
+    """
+    parts = text.strip().split(".")
+    if len(parts) == 2:
+        parts.insert(0, "daily")
+    if len(parts) != 3:
+        raise ValueError(f"field must be [timeframe.]indicator.name: {text}")
+
+    timeframe, indicator, name = parts
+    if timeframe not in TIMEFRAMES:
+        raise ValueError(f"unknown timeframe: {timeframe}")
+    if indicator not in FIELDS:
+        raise ValueError(f"unknown indicator: {indicator}")
+    if name not in FIELDS[indicator]:
+        raise ValueError(f"unknown {indicator} field: {name}")
+    if indicator in DAILY_ONLY and timeframe != "daily":
+        raise ValueError(f"{indicator} is only available on daily data")
+    if indicator == "trend" and name == "ma60" and timeframe != "daily":
+        raise ValueError("trend.ma60 is only available on daily data")
+    return Field(timeframe, indicator, name)
+
+
+def _parse_value(text: str) -> Union[int, float, str]:
+    for convert in (int, float):
+        try:
+            return convert(text)
+        except ValueError:
+            pass
+    return text
+
+
+def parse_rule(text: str) -> Rule:
+    """
+    Parse a rule such as ``weekly.trend.ma_signal==1``.
+
+    Raises:
+        ValueError: If the rule is malformed or names an unknown field
+    """
+    match = _RULE_RE.match(text)
+    if match is None:
+        raise ValueError(f"rule must be FIELD OP VALUE: {text}")
+    field_text, op, value = match.groups()
+    return Rule(parse_field(field_text), op, _parse_value(value))
+
+
+def requirements(fields: Iterable[Field]) -> Set[Tuple[str, str]]:
+    """Get the (indicator, timeframe) pairs needed for some fields."""
+    return {(f.indicator, f.timeframe) for f in fields}
+
+
+def matches(rules: List[Rule], values: Dict[str, Any]) -> bool:
+    """Check whether one ticker's values pass every rule."""
+    return all(rule.matches(values) for rule in rules)
+
+
+def rank(
+    rows: List[Dict[str, Any]],
+    by: Optional[Field],
+    descending: bool = True,
+) -> List[Dict[str, Any]]:
+    """
+    Sort screen results by a field.
+
+    Rows without a numeric value for the field go last; ties keep their
+    input order.
+
+    Args:
+        rows: {"ticker", "name", "values": {field key: value}} dicts
+        by: Sort field (input order if None)
+        descending: Largest first
+
+    Returns:
+        Sorted rows
+    """
+    if by is None:
+        return list(rows)
+
+    def numeric(row: Dict[str, Any]) -> bool:
+        value = row["values"].get(by.key)
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+    ranked = sorted(
+        (row for row in rows if numeric(row)),
+        key=lambda row: row["values"][by.key],
+        reverse=descending,
+    )
+    return ranked + [row for row in rows if not numeric(row)]
@@ -1,8 +1,15 @@
 """Stock data modules."""
 
 from .search import search, get_all, get_name, get_info, StockInfo
+from .master import StockMaster, get_master
 from .analysis import analyze, StockData
-from .ohlcv import get_daily, get_weekly, get_monthly, OhlcvData
+from .ohlcv import (
+    get_daily, get_weekly, get_monthly, get_frame, OhlcvData, set_default_store,
+)
+from .frame import OhlcvFrame
+from .matrix import OhlcvMatrix
+from .multiframe import MultiTimeframe
+from .store import OhlcvStore
 
 __all__ = [
     "search",
@@ -10,10 +17,18 @@ __all__ = [
     "get_name",
     "get_info",
     "StockInfo",
+    "StockMaster",
+    "get_master",
     "analyze",
     "StockData",
     "get_daily",
     "get_weekly",
     "get_monthly",
+    "get_frame",
     "OhlcvData",
+    "OhlcvFrame",
+    "OhlcvMatrix",
+    "MultiTimeframe",
+    "OhlcvStore",
+    "set_default_store",
 ]
@@ -1,9 +1,11 @@
 """Supply/demand analysis functionality."""
 
+import asyncio
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
-from ..client.kiwoom import KiwoomClient
+from ..client.async_kiwoom import AsyncKiwoomClient
+from ..client.kiwoom import KiwoomClient, page_rows
 from ..core import safe_float, safe_int
 from ..core.log import log_err, log_info
 from . import ohlcv
@@ -83,21 +85,21 @@ def analyze(client: KiwoomClient, ticker: str, days: int = 180) -> Dict:
             return {"ok": False, "error": info_resp.error}
         return {"ok": False, "error": info_resp.error}
 
-    name = info_resp.data.get("stk_nm", ticker)
-    # API field name per official docs: mac (시가총액)
-    # ka10001 API returns market cap in 억원 (100 million won), convert to raw won
-    mcap = safe_int(info_resp.data.get("mac", 0)) * 100_000_000
-    # Get floating shares for daily market cap calculation (in 천주 units)
-    flo_stk = safe_int(info_resp.data.get("flo_stk", 0))
-    shares = flo_stk * 1000 if flo_stk > 0 else 0
-
-    # 2. Get investor trend
-    trend_resp = client.get_investor_trend(ticker)
-    if not trend_resp.ok:
-        return {"ok": False, "error": trend_resp.error}
+    # 2. Get investor trend (page back until `days` rows are available)
+    pages = KiwoomClient.iter_pages(
+        lambda cont_yn, next_key: client.get_investor_trend(
+            ticker, cont_yn=cont_yn, next_key=next_key
+        ),
+        "stk_invsr_orgn",
+        max_rows=days,
+    )
+    trend_data = []
+    for trend_resp in pages:
+        if not trend_resp.ok:
+            return {"ok": False, "error": trend_resp.error}
+        # API returns data in 'stk_invsr_orgn' field
+        trend_data.extend(page_rows(trend_resp, "stk_invsr_orgn"))
 
-    # API returns data in 'stk_invsr_orgn' field
-    trend_data = trend_resp.data.get("stk_invsr_orgn", []) or trend_resp.data.get("list", [])
     if not trend_data:
         return {
             "ok": False,
@@ -107,6 +109,92 @@ def analyze(client: KiwoomClient, ticker: str, days: int = 180) -> Dict:
     # 2.5. Get OHLCV data for daily market cap calculation
     # This ensures market cap varies with stock price, avoiding flat lines
     ohlcv_result = ohlcv.get_daily(client, ticker, days=days)
+
+    return _build_analysis(ticker, days, info_resp.data, trend_data, ohlcv_result)
+
+
+async def analyze_async(
+    client: AsyncKiwoomClient, ticker: str, days: int = 180
+) -> Dict:
+    """
+    Analyze stock supply/demand (async).
+
+    Stock info, investor trend and daily chart are fetched concurrently.
+
+    Args:
+        client: Async Kiwoom API client
+        ticker: Stock code
+        days: Number of days to analyze
+
+    Returns:
+        Same format as analyze()
+    """
+    if not ticker or not ticker.strip():
+        return {
+            "ok": False,
+            "error": {"code": "INVALID_ARG", "msg": "종목코드가 필요합니다"},
+        }
+
+    ticker = ticker.strip()
+
+    info_resp, trend_result, ohlcv_result = await asyncio.gather(
+        client.get_stock_info(ticker),
+        _get_investor_rows_async(client, ticker, days),
+        ohlcv.get_daily_async(client, ticker, days=days),
+    )
+
+    if not info_resp.ok:
+        return {"ok": False, "error": info_resp.error}
+    error, trend_data = trend_result
+    if error:
+        return {"ok": False, "error": error}
+
+    if not trend_data:
+        return {
+            "ok": False,
+            "error": {"code": "NO_DATA", "msg": "수급 데이터가 없습니다"},
+        }
+
+    return _build_analysis(ticker, days, info_resp.data, trend_data, ohlcv_result)
+
+
+async def _get_investor_rows_async(
+    client: AsyncKiwoomClient,
+    ticker: str,
+    days: int,
+) -> Tuple[Optional[Dict], List[Dict]]:
+    """Fetch investor trend rows page by page until `days` rows are available."""
+    pages = AsyncKiwoomClient.iter_pages(
+        lambda cont_yn, next_key: client.get_investor_trend(
+            ticker, cont_yn=cont_yn, next_key=next_key
+        ),
+        "stk_invsr_orgn",
+        max_rows=days,
+    )
+    rows = []
+    async for resp in pages:
+        if not resp.ok:
+            return resp.error, []
+        rows.extend(page_rows(resp, "stk_invsr_orgn"))
+    return None, rows
+
+
+def _build_analysis(
+    ticker: str,
+    days: int,
+    info: Dict,
+    trend_data: List[Dict],
+    ohlcv_result: Dict,
+) -> Dict:
+    """Build analysis result from fetched stock info, investor trend and OHLCV."""
+    name = info.get("stk_nm", ticker)
+    # API field name per official docs: mac (시가총액)
+    # ka10001 API returns market cap in 억원 (100 million won), convert to raw won
+    mcap = safe_int(info.get("mac", 0)) * 100_000_000
+    # Get floating shares for daily market cap calculation (in 천주 units)
+    flo_stk = safe_int(info.get("flo_stk", 0))
+    shares = flo_stk * 1000 if flo_stk > 0 else 0
+
     date_to_close = {}
     if ohlcv_result["ok"]:
         ohlcv_data = ohlcv_result["data"]
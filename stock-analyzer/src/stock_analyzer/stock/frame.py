@@ -0,0 +1,162 @@
+"""Columnar OHLCV frame."""
+
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from ..core import safe_int
+
+# Column dtypes
+DATE_DTYPE = np.int32  # YYYYMMDD
+PRICE_DTYPE = np.int64  # Prices and volume in won/shares
+PRICE_FIELDS = ("open", "high", "low", "close", "volume")
+
+
+def _empty(dtype) -> np.ndarray:
+    return np.empty(0, dtype=dtype)
+
+
+@dataclass
+class OhlcvFrame:
+    """
+    Columnar OHLCV data.
+
+    Each column is a contiguous NumPy array, newest bar first like the
+    Kiwoom API. Dates are int32 YYYYMMDD, prices and volume int64.
+    ``chrono()`` gives an oldest-first view without copying, and
+    ``to_dict()`` converts to the dict-of-lists format used at the
+    JSON/Android boundary.
+    """
+
+    ticker: str
+    dates: np.ndarray = field(default_factory=lambda: _empty(DATE_DTYPE))
+    open: np.ndarray = field(default_factory=lambda: _empty(PRICE_DTYPE))
+    high: np.ndarray = field(default_factory=lambda: _empty(PRICE_DTYPE))
+    low: np.ndarray = field(default_factory=lambda: _empty(PRICE_DTYPE))
+    close: np.ndarray = field(default_factory=lambda: _empty(PRICE_DTYPE))
+    volume: np.ndarray = field(default_factory=lambda: _empty(PRICE_DTYPE))
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    @classmethod
+    def from_rows(
+        cls,
+        ticker: str,
+        rows: List[Dict],
+        fields: Dict[str, tuple],
+        date_field: str = "dt",
+        convert: Callable = safe_int,
+    ) -> "OhlcvFrame":
+        """
+        Parse API rows straight into preallocated columns.
+
+        Args:
+            ticker: Stock code
+            rows: API rows (newest first)
+            fields: Column name -> candidate row field names
+            date_field: Row field holding the date (YYYYMMDD)
+            convert: Value converter
+
+        Returns:
+            OhlcvFrame instance
+        """
+        n = len(rows)
+        dates = np.empty(n, dtype=DATE_DTYPE)
+        columns = {name: np.empty(n, dtype=PRICE_DTYPE) for name in PRICE_FIELDS}
+        targets = [(columns[name], fields[name]) for name in PRICE_FIELDS]
+
+        for i, item in enumerate(rows):
+            dates[i] = safe_int(item.get(date_field, ""))
+            for column, names in targets:
+                value = 0
+                for name in names:
+                    if name in item and item[name] is not None:
+                        value = item[name]
+                        break
+                column[i] = convert(value)
+
+        return cls(ticker, dates, **columns)
+
+    @classmethod
+    def from_dict(cls, data: Dict, ticker: Optional[str] = None) -> "OhlcvFrame":
+        """
+        Build a frame from the dict-of-lists format.
+
+        Args:
+            data: {"ticker", "dates", "open", "high", "low", "close", "volume"}
+            ticker: Stock code (defaults to data["ticker"])
+
+        Returns:
+            OhlcvFrame instance
+        """
+        return cls(
+            ticker if ticker is not None else data.get("ticker", ""),
+            np.asarray([int(d) for d in data["dates"]], dtype=DATE_DTYPE),
+            **{
+                name: np.asarray(data[name], dtype=PRICE_DTYPE)
+                for name in PRICE_FIELDS
+            },
+        )
+
+    def to_dict(self) -> Dict:
+        """
+        Convert to the dict-of-lists format (JSON serializable).
+
+        Returns:
+            {"ticker": ..., "dates": ["20250110", ...], "open": [...], ...}
+        """
+        data = {"ticker": self.ticker, "dates": self.date_strings()}
+        for name in PRICE_FIELDS:
+            data[name] = getattr(self, name).tolist()
+        return data
+
+    def date_strings(self) -> List[str]:
+        """Get dates as YYYYMMDD strings."""
+        return [str(d) for d in self.dates.tolist()]
+
+    def chrono(self) -> "OhlcvFrame":
+        """Get an oldest-first view (no copy)."""
+        return self._map(lambda column: column[::-1])
+
+    def head(self, n: int) -> "OhlcvFrame":
+        """Get the newest n bars (view)."""
+        return self._map(lambda column: column[:n])
+
+    def until(self, end_date: str) -> "OhlcvFrame":
+        """Get bars on or before end_date (view)."""
+        skip = int(np.count_nonzero(self.dates > int(end_date)))
+        if skip == 0:
+            return self
+        return self._map(lambda column: column[skip:])
+
+    def _map(self, func: Callable[[np.ndarray], np.ndarray]) -> "OhlcvFrame":
+        return OhlcvFrame(
+            self.ticker,
+            func(self.dates),
+            **{name: func(getattr(self, name)) for name in PRICE_FIELDS},
+        )
+
+    def merge(self, fresh: "OhlcvFrame") -> "OhlcvFrame":
+        """
+        Merge freshly fetched bars into this frame.
+
+        Bars are keyed by date; bars of ``fresh`` replace existing ones.
+
+        Args:
+            fresh: Newer frame
+
+        Returns:
+            Merged frame (newest first)
+        """
+        keep = ~np.isin(self.dates, fresh.dates)
+        dates = np.concatenate([fresh.dates, self.dates[keep]])
+        order = np.argsort(-dates.astype(np.int64), kind="stable")
+        columns = {
+            name: np.concatenate(
+                [getattr(fresh, name), getattr(self, name)[keep]]
+            )[order]
+            for name in PRICE_FIELDS
+        }
+        return OhlcvFrame(fresh.ticker or self.ticker, dates[order], **columns)
@@ -0,0 +1,358 @@
+"""In-memory stock master index."""
+
+import threading
+import time
+import weakref
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ..client.kiwoom import KiwoomClient
+from ..core.log import log_err, log_info
+
+
+@dataclass
+class StockInfo:
+    """Stock information."""
+
+    ticker: str
+    name: str
+    market: str  # KOSPI/KOSDAQ
+
+
+# Stock list is refreshed at most this often (seconds)
+DEFAULT_MASTER_TTL = 12 * 60 * 60
+MAX_MASTER_PAGES = 100  # Safety limit for the ka10099 sweep
+
+# Hangul initial consonants in syllable order (U+AC00 + 588 * index)
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_HANGUL_FIRST = 0xAC00
+_HANGUL_LAST = 0xD7A3
+_CHOSEONG_SPAN = 588  # 21 medial vowels * 28 finals
+
+# Match ranks (lower first)
+_RANK_EXACT = 0
+_RANK_PREFIX = 1
+_RANK_SUBSTRING = 2
+_RANK_CHOSEONG = 3
+
+
+def to_choseong(text: str) -> str:
+    """
+    Replace Hangul syllables by their initial consonant.
+
+    Other characters are kept, so the result has the same length as text.
+
+    Example:
+        to_choseong("삼성전자") -> "ㅅㅅㅈㅈ"
+    """
+    chars = []
+    for ch in text:
+        code = ord(ch)
+        if _HANGUL_FIRST <= code <= _HANGUL_LAST:
+            chars.append(CHOSEONG[(code - _HANGUL_FIRST) // _CHOSEONG_SPAN])
+        else:
+            chars.append(ch)
+    return "".join(chars)
+
+
+def _has_choseong(text: str) -> bool:
+    return any(ch in CHOSEONG for ch in text)
+
+
+def _get_market_name(market_name: str) -> str:
+    """Convert market name to standardized format."""
+    if not market_name:
+        return "기타"
+    name_upper = market_name.upper()
+    # '거래소' = KOSPI (유가증권시장)
+    if "거래소" in market_name or "코스피" in market_name or "KOSPI" in name_upper:
+        return "KOSPI"
+    if "코스닥" in market_name or "KOSDAQ" in name_upper:
+        return "KOSDAQ"
+    return market_name or "기타"
+
+
+class _Haystack:
+    """Newline-joined strings searched with str.find (C speed)."""
+
+    def __init__(self, values: List[str]):
+        self.text = "\n".join(values)
+        self.offsets = []
+        pos = 0
+        for value in values:
+            self.offsets.append(pos)
+            pos += len(value) + 1
+
+    def find(self, query: str) -> Dict[int, bool]:
+        """
+        Find entries containing query.
+
+        Returns:
+            Entry index -> True if the entry starts with query
+        """
+        found = {}
+        pos = self.text.find(query)
+        while pos != -1:
+            idx = bisect_right(self.offsets, pos) - 1
+            found.setdefault(idx, pos == self.offsets[idx])
+            pos = self.text.find(query, pos + 1)
+        return found
+
+
+@dataclass(frozen=True)
+class _Snapshot:
+    """
+    Immutable lookup structures of one index load.
+
+    ``refresh()`` publishes a new snapshot with a single assignment, so a
+    reader that takes one reference never sees a half-built index.
+    """
+
+    entries: Tuple[StockInfo, ...]
+    index: Dict[str, int]
+    codes: _Haystack
+    names: _Haystack
+    initials: _Haystack
+    loaded_at: Optional[float] = None
+
+    @classmethod
+    def build(
+        cls,
+        entries: List[StockInfo],
+        loaded_at: Optional[float] = None,
+    ) -> "_Snapshot":
+        """Build lookup structures."""
+        names = [e.name.upper() for e in entries]
+        return cls(
+            entries=tuple(entries),
+            index={e.ticker: i for i, e in enumerate(entries)},
+            codes=_Haystack([e.ticker.upper() for e in entries]),
+            names=_Haystack(names),
+            initials=_Haystack([to_choseong(name) for name in names]),
+            loaded_at=loaded_at,
+        )
+
+
+class StockMaster:
+    """
+    Cached stock master (ka10099) with code/name/초성 lookup.
+
+    One full ka10099 sweep fills the index; it is refreshed when older than
+    ``ttl`` or on ``refresh()``. Lookups run in memory without API calls.
+
+    Example:
+        master = get_master(client)
+        master.search("ㅅㅅㅈㅈ")  # -> [StockInfo("005930", "삼성전자", ...)]
+    """
+
+    def __init__(
+        self,
+        client: KiwoomClient,
+        ttl: float = DEFAULT_MASTER_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize stock master.
+
+        Args:
+            client: Kiwoom API client (held weakly; the caller keeps it alive)
+            ttl: Seconds before the index is refreshed (0 = refresh every use)
+            clock: Monotonic time source
+        """
+        # Weak so the get_master() cache, keyed weakly by this client, can
+        # drop the entry once the client is gone
+        self._client = weakref.ref(client)
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        # Replaced as a whole by refresh(); readers take one reference
+        self._snapshot = _Snapshot.build([])
+
+    def __len__(self) -> int:
+        return len(self._snapshot.entries)
+
+    @property
+    def client(self) -> Optional[KiwoomClient]:
+        """Kiwoom API client, or None once it was garbage collected."""
+        return self._client()
+
+    @property
+    def stale(self) -> bool:
+        """True if the index was never loaded or is older than ttl."""
+        loaded_at = self._snapshot.loaded_at
+        if loaded_at is None:
+            return True
+        return self._clock() - loaded_at >= self.ttl
+
+    def refresh(self, force: bool = True) -> Dict:
+        """
+        Reload the index with one full ka10099 sweep.
+
+        Args:
+            force: Reload even if the index is fresh
+
+        Returns:
+            {"ok": True, "data": {"count": n}} or {"ok": False, "error": ...}
+        """
+        with self._lock:
+            # Another thread may have reloaded while we waited for the lock
+            if not force and not self.stale:
+                return {"ok": True, "data": {"count": len(self)}}
+
+            client = self.client
+            if client is None:
+                return {
+                    "ok": False,
+                    "error": {
+                        "code": "INVALID_ARG",
+                        "msg": "클라이언트가 해제되었습니다",
+                    },
+                }
+
+            entries = []
+            pages = KiwoomClient.iter_pages(
+                lambda cont_yn, next_key: client.get_stock_list(
+                    "0", cont_yn=cont_yn, next_key=next_key,
+                ),
+                "stk_list",
+                max_pages=MAX_MASTER_PAGES,
+            )
+            for resp in pages:
+                if not resp.ok:
+                    log_err("stock.master", "API error", {"error": resp.error})
+                    return {"ok": False, "error": resp.error}
+                # API may return None for the list
+                rows = resp.data.get("stk_list") or resp.data.get("list") or []
+                for item in rows:
+                    entries.append(StockInfo(
+                        ticker=item.get("code", ""),
+                        name=item.get("name", ""),
+                        market=_get_market_name(item.get("marketName", "")),
+                    ))
+
+            self._snapshot = _Snapshot.build(entries, loaded_at=self._clock())
+
+        log_info("stock.master", "Stock master loaded", {"count": len(entries)})
+        return {"ok": True, "data": {"count": len(entries)}}
+
+    def ensure(self) -> Dict:
+        """
+        Refresh the index if it is stale.
+
+        Returns:
+            {"ok": True, ...} or the refresh error
+        """
+        if self.stale:
+            return self.refresh(force=False)
+        return {"ok": True, "data": {"count": len(self)}}
+
+    def get(self, ticker: str) -> Optional[StockInfo]:
+        """Get a stock by code."""
+        snap = self._snapshot
+        idx = snap.index.get(ticker)
+        return None if idx is None else snap.entries[idx]
+
+    def all(self, markets: Optional[List[str]] = None) -> List[StockInfo]:
+        """
+        Get all stocks in listing order.
+
+        Args:
+            markets: Markets to include (all if None)
+        """
+        entries = self._snapshot.entries
+        if markets is None:
+            return list(entries)
+        return [e for e in entries if e.market in markets]
+
+    def search(
+        self,
+        query: str,
+        markets: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+    ) -> List[StockInfo]:
+        """
+        Search by code or name.
+
+        Exact code matches come first, then code/name prefix matches, then
+        substring matches and finally 초성 matches (e.g. "ㅅㅅ" for 삼성),
+        each in listing order. Queries may mix syllables and initials.
+
+        Args:
+            query: Code, name or 초성 query (case insensitive)
+            markets: Markets to include (all if None)
+            limit: Maximum number of results
+
+        Returns:
+            Matching stocks
+        """
+        query = query.strip().upper()
+        if not query or "\n" in query:
+            return []
+
+        snap = self._snapshot
+        ranks: Dict[int, int] = {}
+
+        def add(found: Dict[int, bool], prefix_rank: int, rank: int) -> None:
+            for idx, is_prefix in found.items():
+                r = prefix_rank if is_prefix else rank
+                if r < ranks.get(idx, _RANK_CHOSEONG + 1):
+                    ranks[idx] = r
+
+        add(snap.codes.find(query), _RANK_PREFIX, _RANK_SUBSTRING)
+        add(snap.names.find(query), _RANK_PREFIX, _RANK_SUBSTRING)
+        idx = snap.index.get(query)
+        if idx is not None:
+            ranks[idx] = _RANK_EXACT
+        if _has_choseong(query):
+            found = snap.initials.find(to_choseong(query))
+            found = {
+                i: p for i, p in found.items()
+                if _match_mixed(snap.entries[i].name.upper(), query)
+            }
+            add(found, _RANK_CHOSEONG, _RANK_CHOSEONG)
+
+        order = sorted(ranks, key=lambda i: (ranks[i], i))
+        results = [snap.entries[i] for i in order]
+        if markets is not None:
+            results = [e for e in results if e.market in markets]
+        return results[:limit] if limit is not None else results
+
+
+def _match_mixed(name: str, query: str) -> bool:
+    """Check a 초성 candidate: query syllables must match exactly."""
+    if all(ch in CHOSEONG for ch in query):
+        return True
+    initials = to_choseong(name)
+    start = initials.find(to_choseong(query))
+    while start != -1:
+        window = name[start:start + len(query)]
+        if all(q in CHOSEONG or q == n for q, n in zip(query, window)):
+            return True
+        start = initials.find(to_choseong(query), start + 1)
+    return False
+
+
+# Stock master per client (dropped with the client)
+_masters: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_masters_lock = threading.Lock()
+
+
+def get_master(client: KiwoomClient, ttl: Optional[float] = None) -> StockMaster:
+    """
+    Get the shared stock master of a client.
+
+    Args:
+        client: Kiwoom API client
+        ttl: Refresh interval for a newly created master
+            (DEFAULT_MASTER_TTL if None)
+
+    Returns:
+        StockMaster (not loaded until first use)
+    """
+    with _masters_lock:
+        master = _masters.get(client)
+        if master is None:
+            master = StockMaster(client, DEFAULT_MASTER_TTL if ttl is None else ttl)
+            _masters[client] = master
+        return master
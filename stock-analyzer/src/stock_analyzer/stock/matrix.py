@@ -0,0 +1,88 @@
+"""Aligned multi-ticker OHLCV matrix."""
+
+from dataclasses import dataclass
+from typing import Iterable, List
+
+import numpy as np
+
+from .frame import DATE_DTYPE, PRICE_FIELDS, OhlcvFrame
+
+
+@dataclass
+class OhlcvMatrix:
+    """
+    OHLCV data for many tickers on a shared date axis.
+
+    Each price column is a float64 matrix of shape (tickers, dates) with
+    dates oldest first (unlike OhlcvFrame). Dates on which a ticker has no
+    bar (not yet listed, delisted, suspended) are NaN.
+
+    Example:
+        frames = [store.load(t) for t in tickers]
+        matrix = OhlcvMatrix.from_frames(f for f in frames if f is not None)
+        result = batch.calc_trend(matrix)
+    """
+
+    tickers: List[str]
+    dates: np.ndarray  # int32 YYYYMMDD, oldest first
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    @property
+    def shape(self) -> tuple:
+        return self.close.shape
+
+    @classmethod
+    def from_frames(cls, frames: Iterable[OhlcvFrame]) -> "OhlcvMatrix":
+        """
+        Align frames on the union of their dates.
+
+        Args:
+            frames: OhlcvFrame per ticker (newest first)
+
+        Returns:
+            OhlcvMatrix with one row per frame
+        """
+        frames = list(frames)
+        if frames:
+            dates = np.unique(np.concatenate([f.dates for f in frames]))
+        else:
+            dates = np.empty(0, dtype=DATE_DTYPE)
+        dates = dates.astype(DATE_DTYPE)
+
+        shape = (len(frames), len(dates))
+        columns = {name: np.full(shape, np.nan) for name in PRICE_FIELDS}
+        for row, frame in enumerate(frames):
+            cols = np.searchsorted(dates, frame.dates)
+            for name in PRICE_FIELDS:
+                columns[name][row, cols] = getattr(frame, name)
+
+        return cls([f.ticker for f in frames], dates, **columns)
+
+    def index(self, ticker: str) -> int:
+        """Get the row of a ticker."""
+        return self.tickers.index(ticker)
+
+    def to_frame(self, ticker: str) -> OhlcvFrame:
+        """
+        Extract one ticker as an OhlcvFrame (newest first, NaN dates dropped).
+
+        Args:
+            ticker: Stock code
+
+        Returns:
+            OhlcvFrame instance
+        """
+        row = self.index(ticker)
+        valid = ~np.isnan(self.close[row])
+        return OhlcvFrame(
+            ticker,
+            self.dates[valid][::-1].copy(),
+            **{
+                name: getattr(self, name)[row, valid][::-1].astype(np.int64)
+                for name in PRICE_FIELDS
+            },
+        )
@@ -0,0 +1,292 @@
+"""Daily, weekly and monthly bars from one daily fetch."""
+
+from typing import Dict, Optional
+
+import numpy as np
+
+from ..client.kiwoom import KiwoomClient
+from ..core.log import log_info
+from .frame import DATE_DTYPE, PRICE_FIELDS, OhlcvFrame
+from .store import OhlcvStore
+
+TIMEFRAMES = ("daily", "weekly", "monthly")
+
+# Day number of the first Saturday after 1970-01-01 (a Thursday); weeks run
+# Saturday-Friday like pandas resample("W-FRI")
+_FIRST_SATURDAY = 2
+
+
+def day_numbers(dates: np.ndarray) -> np.ndarray:
+    """
+    Convert YYYYMMDD ints to days since 1970-01-01.
+
+    Args:
+        dates: YYYYMMDD dates (any order)
+
+    Returns:
+        int32 day numbers
+    """
+    dates = np.asarray(dates, dtype=np.int64)
+    months = (dates // 10000 - 1970) * 12 + dates // 100 % 100 - 1
+    first = months.astype("datetime64[M]").astype("datetime64[D]").astype(np.int64)
+    return (first + dates % 100 - 1).astype(np.int32)
+
+
+def _to_yyyymmdd(day: int) -> int:
+    """Convert a day number back to a YYYYMMDD int."""
+    return int(str(np.datetime64(int(day), "D")).replace("-", ""))
+
+
+def period_keys(dates: np.ndarray, timeframe: str) -> np.ndarray:
+    """
+    Get the period each date belongs to.
+
+    Args:
+        dates: YYYYMMDD dates
+        timeframe: "daily", "weekly" (W-FRI) or "monthly"
+
+    Returns:
+        int64 keys, equal for dates in the same period and increasing with time
+    """
+    dates = np.asarray(dates, dtype=np.int64)
+    if timeframe == "daily":
+        return dates
+    if timeframe == "weekly":
+        return (day_numbers(dates).astype(np.int64) - _FIRST_SATURDAY) // 7
+    if timeframe == "monthly":
+        return dates // 100
+    raise ValueError(f"unknown timeframe: {timeframe}")
+
+
+def period_start(date: int, timeframe: str) -> int:
+    """
+    Get the first calendar date of the period containing a date.
+
+    Args:
+        date: YYYYMMDD date
+        timeframe: "daily", "weekly" or "monthly"
+
+    Returns:
+        YYYYMMDD date (Saturday for W-FRI weeks, the 1st for months)
+    """
+    key = int(period_keys(np.array([date]), timeframe)[0])
+    if timeframe == "weekly":
+        return _to_yyyymmdd(key * 7 + _FIRST_SATURDAY)
+    if timeframe == "monthly":
+        return key * 100 + 1
+    return key
+
+
+def period_starts(dates: np.ndarray, timeframe: str) -> np.ndarray:
+    """
+    Get the index of the first bar of each period.
+
+    Args:
+        dates: YYYYMMDD dates, oldest first
+        timeframe: "daily", "weekly" or "monthly"
+
+    Returns:
+        Start indices (oldest period first)
+    """
+    keys = period_keys(dates, timeframe)
+    if len(keys) == 0:
+        return np.empty(0, dtype=np.intp)
+    return np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+
+
+def aggregate(chrono: OhlcvFrame, starts: np.ndarray) -> OhlcvFrame:
+    """
+    Aggregate oldest-first bars into one bar per period.
+
+    Open is the first open, high/low the extremes, close the last close and
+    volume the sum; the bar is dated on its last trading day.
+
+    Args:
+        chrono: Bars, oldest first
+        starts: Period start indices (see period_starts)
+
+    Returns:
+        Aggregated bars, newest first
+    """
+    if len(starts) == 0:
+        return OhlcvFrame(chrono.ticker)
+    ends = np.append(starts[1:], len(chrono)) - 1
+    return OhlcvFrame(
+        chrono.ticker,
+        chrono.dates[ends][::-1].astype(DATE_DTYPE),
+        open=chrono.open[starts][::-1],
+        high=np.maximum.reduceat(chrono.high, starts)[::-1],
+        low=np.minimum.reduceat(chrono.low, starts)[::-1],
+        close=chrono.close[ends][::-1],
+        volume=np.add.reduceat(chrono.volume, starts)[::-1],
+    )
+
+
+def _concat(newer: OhlcvFrame, older: OhlcvFrame) -> OhlcvFrame:
+    """Stack two newest-first frames."""
+    return OhlcvFrame(
+        newer.ticker or older.ticker,
+        np.concatenate([newer.dates, older.dates]),
+        **{
+            name: np.concatenate([getattr(newer, name), getattr(older, name)])
+            for name in PRICE_FIELDS
+        },
+    )
+
+
+def resample(
+    daily: OhlcvFrame,
+    timeframe: str,
+    previous: Optional[OhlcvFrame] = None,
+) -> OhlcvFrame:
+    """
+    Resample daily bars to weekly or monthly bars.
+
+    With ``previous`` (an earlier result for the same history) only the
+    newest previous period and later ones are aggregated again, so a new or
+    revised daily bar costs O(period) instead of O(history). ``daily`` must
+    still hold every bar of that newest previous period.
+
+    Args:
+        daily: Daily bars, newest first
+        timeframe: "daily", "weekly" or "monthly"
+        previous: Earlier resampled bars, newest first (incremental mode)
+
+    Returns:
+        Resampled bars, newest first
+    """
+    if previous is None or len(previous) == 0:
+        chrono = daily.chrono()
+        return aggregate(chrono, period_starts(chrono.dates, timeframe))
+
+    first = period_start(int(previous.dates[0]), timeframe)
+    # Dates are descending: count the bars on or after the period start
+    head = int(np.searchsorted(-daily.dates.astype(np.int64), -first, side="right"))
+    chrono = daily.head(head).chrono()
+    fresh = aggregate(chrono, period_starts(chrono.dates, timeframe))
+    return _concat(fresh, previous._map(lambda column: column[1:]))
+
+
+class MultiTimeframe:
+    """
+    Daily bars with weekly and monthly bars derived on demand.
+
+    Period boundaries and derived frames are computed once per timeframe
+    and cached, so daily/weekly/monthly indicators on the same ticker share
+    one history fetch.
+
+    Example:
+        bars = load(client, "005930", days=1500)["data"]
+        trend.calc(client, "005930", timeframe="weekly", bars=bars)
+        demark.calc(client, "005930", timeframe="monthly", bars=bars)
+    """
+
+    def __init__(self, daily: OhlcvFrame):
+        """
+        Initialize from daily bars.
+
+        Args:
+            daily: Daily bars, newest first
+        """
+        self.daily = daily
+        self._chrono = daily.chrono()
+        self._starts: Dict[str, np.ndarray] = {}
+        self._frames: Dict[str, OhlcvFrame] = {"daily": daily}
+
+    @property
+    def ticker(self) -> str:
+        return self.daily.ticker
+
+    def boundaries(self, timeframe: str) -> np.ndarray:
+        """Get period start indices into the oldest-first daily bars."""
+        starts = self._starts.get(timeframe)
+        if starts is None:
+            starts = period_starts(self._chrono.dates, timeframe)
+            self._starts[timeframe] = starts
+        return starts
+
+    def frame(self, timeframe: str) -> OhlcvFrame:
+        """
+        Get bars of a timeframe.
+
+        Args:
+            timeframe: "daily", "weekly" or "monthly"
+
+        Returns:
+            OhlcvFrame, newest first
+        """
+        frame = self._frames.get(timeframe)
+        if frame is None:
+            frame = aggregate(self._chrono, self.boundaries(timeframe))
+            self._frames[timeframe] = frame
+        return frame
+
+    def extend(self, fresh: OhlcvFrame) -> None:
+        """
+        Add new daily bars or revise the newest one (intraday refresh).
+
+        Derived frames are updated incrementally: only their newest period
+        and any new periods are aggregated again.
+
+        Args:
+            fresh: Daily bars, newest first
+        """
+        if len(fresh) == 0:
+            return
+        oldest = int(fresh.dates.min())
+        self.daily = self.daily.merge(fresh)
+        self._chrono = self.daily.chrono()
+        self._starts.clear()
+
+        frames = {"daily": self.daily}
+        for timeframe, frame in self._frames.items():
+            if timeframe == "daily":
+                continue
+            # Bars older than the newest period would change settled periods
+            if len(frame) and oldest >= period_start(int(frame.dates[0]), timeframe):
+                frames[timeframe] = resample(self.daily, timeframe, previous=frame)
+        self._frames = frames
+
+    def to_dict(self, timeframe: str) -> Dict:
+        """Get bars of a timeframe in the dict-of-lists format."""
+        return self.frame(timeframe).to_dict()
+
+
+def load(
+    client: KiwoomClient,
+    ticker: str,
+    days: int = 180,
+    end_date: str = None,
+    adj_price: bool = True,
+    store: Optional[OhlcvStore] = None,
+) -> Dict:
+    """
+    Fetch daily bars once for all timeframes.
+
+    Use ``indicator.lookback.plan`` to size ``days`` for a set of indicators.
+
+    Args:
+        client: Kiwoom API client
+        ticker: Stock code
+        days: Calendar days of daily data to fetch
+        end_date: End date (YYYYMMDD), defaults to today
+        adj_price: Use adjusted price
+        store: Local OHLCV store (module default if None)
+
+    Returns:
+        {"ok": True, "data": MultiTimeframe} or the fetch error
+    """
+    from . import ohlcv
+
+    result = ohlcv.get_frame(
+        client, ticker, "daily", end_date=end_date, days=days,
+        adj_price=adj_price, store=store,
+    )
+    if not result["ok"]:
+        return result
+
+    log_info("stock.multiframe", "Daily bars loaded", {
+        "ticker": result["data"].ticker,
+        "bars": len(result["data"]),
+    })
+    return {"ok": True, "data": MultiTimeframe(result["data"])}
@@ -1,25 +1,55 @@
 """OHLCV price data functionality."""
 
-from dataclasses import dataclass
-from typing import Dict, List
+from typing import Dict, Iterator, List, Optional, Tuple
 
-from ..client.kiwoom import KiwoomClient
-from ..core import safe_int
+import numpy as np
+
+from ..client.async_kiwoom import AsyncKiwoomClient
+from ..client.kiwoom import ApiResponse, KiwoomClient, page_rows
 from ..core.date import days_ago, today_str
 from ..core.log import log_info
+from . import multiframe
+from .frame import OhlcvFrame
+from .store import OhlcvStore
+
+# Former list-based model name; the columnar frame is the canonical type
+OhlcvData = OhlcvFrame
+
+# Chart endpoint per timeframe: (client method, response list field)
+CHART_APIS = {
+    "daily": ("get_daily_chart", "stk_dt_pole_chart_qry"),
+    "weekly": ("get_weekly_chart", "stk_stk_pole_chart_qry"),
+    "monthly": ("get_monthly_chart", "stk_mth_pole_chart_qry"),
+}
+
+# Frame column -> row field names (official API name first, then legacy name)
+CHART_FIELDS = {
+    "open": ("open_pric", "opn_prc"),
+    "high": ("high_pric", "high_prc"),
+    "low": ("low_pric", "low_prc"),
+    "close": ("cur_prc", "cls_prc"),
+    "volume": ("trde_qty", "trd_qty"),
+}
+
+# Keys of resampled dict-of-lists results
+_RESAMPLE_KEYS = ("dates", "open", "high", "low", "close", "volume")
 
+# Store consulted by get_daily/get_weekly/get_monthly when none is passed
+_default_store: Optional[OhlcvStore] = None
 
-@dataclass
-class OhlcvData:
-    """OHLCV price data."""
 
-    ticker: str
-    dates: List[str]
-    open: List[int]
-    high: List[int]
-    low: List[int]
-    close: List[int]
-    volume: List[int]
+def set_default_store(store: Optional[OhlcvStore]) -> None:
+    """
+    Set the local OHLCV store used when no store is passed.
+
+    Indicator calc() functions fetch through get_daily, so setting a default
+    store makes them top up from disk as well.
+
+    Args:
+        store: OhlcvStore instance, or None to disable
+    """
+    global _default_store
+    _default_store = store
 
 
 def get_daily(
@@ -29,6 +59,7 @@ def get_daily(
     end_date: str = None,
     days: int = 180,
     adj_price: bool = True,
+    store: Optional[OhlcvStore] = None,
 ) -> Dict:
     """
     Get daily OHLCV data.
@@ -40,6 +71,7 @@ def get_daily(
         end_date: End date (YYYYMMDD), defaults to today
         days: Number of days (used if start_date not provided)
         adj_price: Use adjusted price
+        store: Local OHLCV store (module default if None, see set_default_store)
 
     Returns:
         {
@@ -60,40 +92,10 @@ def get_daily(
         - NO_DATA: No data available
         - API_ERROR: API call failed
     """
-    if not ticker or not ticker.strip():
-        return {
-            "ok": False,
-            "error": {"code": "INVALID_ARG", "msg": "종목코드가 필요합니다"},
-        }
-
-    ticker = ticker.strip()
-    end_date = end_date or today_str()
-    start_date = start_date or days_ago(days)
-
-    resp = client.get_daily_chart(
-        ticker,
-        start_date,
-        end_date,
-        adj_price="1" if adj_price else "0",
+    return _to_dict_result(
+        get_frame(client, ticker, "daily", start_date, end_date, days, adj_price, store)
     )
 
-    if not resp.ok:
-        return {"ok": False, "error": resp.error}
-
-    # API returns data in 'stk_dt_pole_chart_qry' field for daily chart
-    chart_data = resp.data.get("stk_dt_pole_chart_qry", []) or resp.data.get("list", [])
-    if not chart_data:
-        return {
-            "ok": False,
-            "error": {"code": "NO_DATA", "msg": "차트 데이터가 없습니다"},
-        }
-
-    result = _parse_chart_data(ticker, chart_data)
-
-    log_info("stock.ohlcv", "get_daily complete", {"ticker": ticker, "count": len(result["dates"])})
-
-    return {"ok": True, "data": result}
-
 
 def get_weekly(
     client: KiwoomClient,
@@ -102,6 +104,7 @@ def get_weekly(
     end_date: str = None,
     weeks: int = 52,
     adj_price: bool = True,
+    store: Optional[OhlcvStore] = None,
 ) -> Dict:
     """
     Get weekly OHLCV data.
@@ -113,10 +116,82 @@ def get_weekly(
         end_date: End date (YYYYMMDD), defaults to today
         weeks: Number of weeks (used if start_date not provided)
         adj_price: Use adjusted price
+        store: Local OHLCV store (module default if None, see set_default_store)
 
     Returns:
         Same format as get_daily
     """
+    return _to_dict_result(
+        get_frame(
+            client, ticker, "weekly", start_date, end_date, weeks * 7,
+            adj_price, store,
+        )
+    )
+
+
+def get_monthly(
+    client: KiwoomClient,
+    ticker: str,
+    start_date: str = None,
+    end_date: str = None,
+    months: int = 24,
+    adj_price: bool = True,
+    store: Optional[OhlcvStore] = None,
+) -> Dict:
+    """
+    Get monthly OHLCV data.
+
+    Args:
+        client: Kiwoom API client
+        ticker: Stock code
+        start_date: Start date (YYYYMMDD), defaults to `months` months ago
+        end_date: End date (YYYYMMDD), defaults to today
+        months: Number of months (used if start_date not provided)
+        adj_price: Use adjusted price
+        store: Local OHLCV store (module default if None, see set_default_store)
+
+    Returns:
+        Same format as get_daily
+    """
+    return _to_dict_result(
+        get_frame(
+            client, ticker, "monthly", start_date, end_date, months * 30,
+            adj_price, store,
+        )
+    )
+
+
+def get_frame(
+    client: KiwoomClient,
+    ticker: str,
+    timeframe: str = "daily",
+    start_date: str = None,
+    end_date: str = None,
+    days: int = 180,
+    adj_price: bool = True,
+    store: Optional[OhlcvStore] = None,
+) -> Dict:
+    """
+    Get OHLCV data as a columnar OhlcvFrame.
+
+    Args:
+        client: Kiwoom API client
+        ticker: Stock code
+        timeframe: "daily", "weekly" or "monthly"
+        start_date: Start date (YYYYMMDD), defaults to `days` calendar days ago
+        end_date: End date (YYYYMMDD), defaults to today
+        days: Calendar days to look back (used if start_date not provided)
+        adj_price: Use adjusted price
+        store: Local OHLCV store (module default if None, see set_default_store)
+
+    Returns:
+        {"ok": True, "data": OhlcvFrame}
+
+    Errors:
+        - INVALID_ARG: Invalid argument
+        - NO_DATA: No data available
+        - API_ERROR: API call failed
+    """
     if not ticker or not ticker.strip():
         return {
             "ok": False,
@@ -125,50 +200,148 @@ def get_weekly(
 
     ticker = ticker.strip()
     end_date = end_date or today_str()
-    start_date = start_date or days_ago(weeks * 7)
+    start_date = start_date or days_ago(days)
 
-    resp = client.get_weekly_chart(
-        ticker,
-        start_date,
-        end_date,
-        adj_price="1" if adj_price else "0",
-    )
+    return _get_chart(client, ticker, start_date, end_date, adj_price, timeframe, store)
 
-    if not resp.ok:
-        return {"ok": False, "error": resp.error}
 
-    # API returns data in 'stk_stk_pole_chart_qry' field for weekly chart
-    chart_data = resp.data.get("stk_stk_pole_chart_qry", []) or resp.data.get("list", [])
-    if not chart_data:
-        return {
-            "ok": False,
-            "error": {"code": "NO_DATA", "msg": "차트 데이터가 없습니다"},
-        }
+def _to_dict_result(result: Dict) -> Dict:
+    """Convert a frame result into the dict-of-lists result format."""
+    if not result["ok"]:
+        return result
+    return {"ok": True, "data": result["data"].to_dict()}
 
-    result = _parse_chart_data(ticker, chart_data)
 
-    log_info("stock.ohlcv", "get_weekly complete", {"ticker": ticker, "count": len(result["dates"])})
+def _get_chart(
+    client: KiwoomClient,
+    ticker: str,
+    start_date: str,
+    end_date: str,
+    adj_price: bool,
+    timeframe: str,
+    store: Optional[OhlcvStore],
+) -> Dict:
+    """
+    Get chart data, topping up a local store when one is configured.
 
-    return {"ok": True, "data": result}
+    With a store, only bars from the last stored date onwards are fetched
+    and merged in. A full fetch is done when the store does not reach back
+    to start_date, or when an adjusted series was re-based by a corporate
+    action. The whole stored series up to end_date is returned, like the
+    API returns whole pages.
+    """
+    label = f"get_{timeframe}"
+    store = store if store is not None else _default_store
+    if store is None:
+        return _fetch_chart(
+            client, ticker, start_date, end_date, adj_price, timeframe, label
+        )
+
+    stored = store.load(ticker, timeframe, adj_price)
+    if stored is not None and stored.dates[-1] <= int(start_date):
+        last_date = str(stored.dates[0])
+        if end_date < last_date:
+            log_info(
+                "stock.ohlcv", f"{label} served from store", {"ticker": ticker}
+            )
+            return {"ok": True, "data": stored.until(end_date)}
+
+        fresh = _fetch_chart(
+            client, ticker, last_date, end_date, adj_price, timeframe, label
+        )
+        if not fresh["ok"]:
+            if fresh["error"].get("code") == "NO_DATA":
+                return {"ok": True, "data": stored.until(end_date)}
+            return fresh
+
+        if adj_price and _rebased(stored, fresh["data"]):
+            log_info(
+                "stock.ohlcv",
+                "Adjusted history changed, refetching",
+                {"ticker": ticker},
+            )
+            stored = None
+        else:
+            merged = stored.merge(fresh["data"])
+            store.save(ticker, merged, timeframe, adj_price)
+            log_info("stock.ohlcv", f"{label} topped up", {
+                "ticker": ticker,
+                "new_bars": len(merged) - len(stored),
+            })
+            return {"ok": True, "data": merged.until(end_date)}
+
+    fresh = _fetch_chart(
+        client, ticker, start_date, end_date, adj_price, timeframe, label
+    )
+    if not fresh["ok"]:
+        return fresh
 
+    merged = stored.merge(fresh["data"]) if stored is not None else fresh["data"]
+    store.save(ticker, merged, timeframe, adj_price)
+    return {"ok": True, "data": merged.until(end_date)}
 
-def get_monthly(
+
+def _fetch_chart(
     client: KiwoomClient,
     ticker: str,
+    start_date: str,
+    end_date: str,
+    adj_price: bool,
+    timeframe: str,
+    label: str,
+) -> Dict:
+    """Fetch chart pages from the API back to start_date."""
+    method, list_key = CHART_APIS[timeframe]
+    fetch_page = getattr(client, method)
+    adj = "1" if adj_price else "0"
+
+    # Page back until start_date is crossed
+    pages = KiwoomClient.iter_pages(
+        lambda cont_yn, next_key: fetch_page(
+            ticker,
+            start_date,
+            end_date,
+            adj_price=adj,
+            cont_yn=cont_yn,
+            next_key=next_key,
+        ),
+        list_key,
+        start_date=start_date,
+    )
+
+    error, chart_data = _collect_pages(pages, list_key)
+    return _chart_result(ticker, error, chart_data, label)
+
+
+def _rebased(stored: OhlcvFrame, fresh: OhlcvFrame) -> bool:
+    """
+    Check whether adjusted prices changed for already stored bars.
+
+    The newest stored bar is skipped because it may be an intraday snapshot.
+    """
+    _, stored_idx, fresh_idx = np.intersect1d(
+        stored.dates[1:], fresh.dates, assume_unique=True, return_indices=True
+    )
+    return bool(np.any(stored.close[1:][stored_idx] != fresh.close[fresh_idx]))
+
+
+async def get_daily_async(
+    client: AsyncKiwoomClient,
+    ticker: str,
     start_date: str = None,
     end_date: str = None,
-    months: int = 24,
+    days: int = 180,
     adj_price: bool = True,
 ) -> Dict:
     """
-    Get monthly OHLCV data.
+    Get daily OHLCV data (async).
 
     Args:
-        client: Kiwoom API client
+        client: Async Kiwoom API client
         ticker: Stock code
-        start_date: Start date (YYYYMMDD), defaults to `months` months ago
+        start_date: Start date (YYYYMMDD), defaults to `days` ago
         end_date: End date (YYYYMMDD), defaults to today
-        months: Number of months (used if start_date not provided)
+        days: Number of days (used if start_date not provided)
         adj_price: Use adjusted price
 
     Returns:
@@ -182,68 +355,73 @@ def get_monthly(
 
     ticker = ticker.strip()
     end_date = end_date or today_str()
-    start_date = start_date or days_ago(months * 30)
+    start_date = start_date or days_ago(days)
 
-    resp = client.get_monthly_chart(
-        ticker,
-        start_date,
-        end_date,
-        adj_price="1" if adj_price else "0",
+    adj = "1" if adj_price else "0"
+    pages = AsyncKiwoomClient.iter_pages(
+        lambda cont_yn, next_key: client.get_daily_chart(
+            ticker,
+            start_date,
+            end_date,
+            adj_price=adj,
+            cont_yn=cont_yn,
+            next_key=next_key,
+        ),
+        "stk_dt_pole_chart_qry",
+        start_date=start_date,
     )
 
-    if not resp.ok:
-        return {"ok": False, "error": resp.error}
+    chart_data = []
+    async for resp in pages:
+        if not resp.ok:
+            return {"ok": False, "error": resp.error}
+        chart_data.extend(page_rows(resp, "stk_dt_pole_chart_qry"))
 
-    # API returns data in 'stk_mth_pole_chart_qry' field for monthly chart
-    chart_data = resp.data.get("stk_mth_pole_chart_qry", []) or resp.data.get("list", [])
-    if not chart_data:
-        return {
-            "ok": False,
-            "error": {"code": "NO_DATA", "msg": "차트 데이터가 없습니다"},
-        }
+    return _to_dict_result(_chart_result(ticker, None, chart_data, "get_daily_async"))
 
-    result = _parse_chart_data(ticker, chart_data)
 
-    log_info("stock.ohlcv", "get_monthly complete", {"ticker": ticker, "count": len(result["dates"])})
+def _collect_pages(
+    pages: Iterator[ApiResponse],
+    list_key: str,
+) -> Tuple[Optional[Dict], List[Dict]]:
+    """
+    Concatenate rows of all pages.
 
-    return {"ok": True, "data": result}
+    Returns:
+        (error, rows) - error is the first failed page's error, or None
+    """
+    rows = []
+    for resp in pages:
+        if not resp.ok:
+            return resp.error, []
+        rows.extend(page_rows(resp, list_key))
+    return None, rows
 
 
-def _parse_chart_data(ticker: str, chart_data: List[Dict]) -> Dict:
-    """Parse chart data from API response."""
-    dates = []
-    opens = []
-    highs = []
-    lows = []
-    closes = []
-    volumes = []
+def _chart_result(
+    ticker: str,
+    error: Optional[Dict],
+    chart_data: List[Dict],
+    label: str,
+) -> Dict:
+    """Parse fetched chart rows into a frame result."""
+    if error:
+        return {"ok": False, "error": error}
 
-    for item in chart_data:
-        dates.append(item.get("dt", ""))
-        # Support both official API field names and legacy field names
-        opens.append(safe_int(_get_field(item, "open_pric", "opn_prc")))
-        highs.append(safe_int(_get_field(item, "high_pric", "high_prc")))
-        lows.append(safe_int(_get_field(item, "low_pric", "low_prc")))
-        closes.append(safe_int(_get_field(item, "cur_prc", "cls_prc")))
-        volumes.append(safe_int(_get_field(item, "trde_qty", "trd_qty")))
+    if not chart_data:
+        return {
+            "ok": False,
+            "error": {"code": "NO_DATA", "msg": "차트 데이터가 없습니다"},
+        }
 
-    return {
-        "ticker": ticker,
-        "dates": dates,
-        "open": opens,
-        "high": highs,
-        "low": lows,
-        "close": closes,
-        "volume": volumes,
-    }
+    frame = OhlcvFrame.from_rows(ticker, chart_data, CHART_FIELDS)
 
+    log_info("stock.ohlcv", f"{label} complete", {
+        "ticker": ticker,
+        "count": len(frame),
+    })
 
-def _get_field(item: Dict, *field_names):
-    """Get value from item using multiple possible field names."""
-    for name in field_names:
-        if name in item and item[name] is not None:
-            return item[name]
-    return 0
+    return {"ok": True, "data": frame}
 
 
 def resample_to_weekly(
@@ -253,11 +431,12 @@ def resample_to_weekly(
     lows: List[int],
     closes: List[int],
     volumes: List[int],
+    previous: Optional[Dict] = None,
 ) -> Dict:
     """
     Resample daily OHLCV data to weekly (Friday close).
 
-    Reference logic from 추세판별.txt:
+    Reference logic from 추세판별.txt (pandas resample('W-FRI')):
     - Open: first day's open
     - High: max of the week
     - Low: min of the week
@@ -267,83 +446,15 @@ def resample_to_weekly(
     Args:
         dates: Daily dates (YYYYMMDD format, newest first)
         opens, highs, lows, closes, volumes: Daily OHLCV data
+        previous: Earlier result for the same history; only its newest
+            (possibly partial) week and newer weeks are recomputed
 
     Returns:
         Weekly OHLCV data dict with same structure
     """
-    from datetime import datetime
-
-    if not dates:
-        return {
-            "dates": [],
-            "open": [],
-            "high": [],
-            "low": [],
-            "close": [],
-            "volume": [],
-        }
-
-    # Convert to chronological order for processing
-    dates_chrono = list(reversed(dates))
-    opens_chrono = list(reversed(opens))
-    highs_chrono = list(reversed(highs))
-    lows_chrono = list(reversed(lows))
-    closes_chrono = list(reversed(closes))
-    volumes_chrono = list(reversed(volumes))
-
-    # Group by ISO week (year, week_number)
-    weekly_data = {}
-
-    for i, date_str in enumerate(dates_chrono):
-        dt = datetime.strptime(date_str, "%Y%m%d")
-        # ISO week: (year, week_number)
-        iso_cal = dt.isocalendar()
-        week_key = (iso_cal[0], iso_cal[1])
-
-        if week_key not in weekly_data:
-            weekly_data[week_key] = {
-                "dates": [],
-                "open": [],
-                "high": [],
-                "low": [],
-                "close": [],
-                "volume": [],
-            }
-
-        weekly_data[week_key]["dates"].append(date_str)
-        weekly_data[week_key]["open"].append(opens_chrono[i])
-        weekly_data[week_key]["high"].append(highs_chrono[i])
-        weekly_data[week_key]["low"].append(lows_chrono[i])
-        weekly_data[week_key]["close"].append(closes_chrono[i])
-        weekly_data[week_key]["volume"].append(volumes_chrono[i])
-
-    # Aggregate each week
-    result_dates = []
-    result_opens = []
-    result_highs = []
-    result_lows = []
-    result_closes = []
-    result_volumes = []
-
-    for week_key in sorted(weekly_data.keys()):
-        week = weekly_data[week_key]
-        # Use last day of the week as the date (Friday or last trading day)
-        result_dates.append(week["dates"][-1])
-        result_opens.append(week["open"][0])  # First day's open
-        result_highs.append(max(week["high"]))  # Week's high
-        result_lows.append(min(week["low"]))  # Week's low
-        result_closes.append(week["close"][-1])  # Last day's close
-        result_volumes.append(sum(week["volume"]))  # Total volume
-
-    # Reverse back to newest-first order
-    return {
-        "dates": list(reversed(result_dates)),
-        "open": list(reversed(result_opens)),
-        "high": list(reversed(result_highs)),
-        "low": list(reversed(result_lows)),
-        "close": list(reversed(result_closes)),
-        "volume": list(reversed(result_volumes)),
-    }
+    return _resample(
+        "weekly", dates, opens, highs, lows, closes, volumes, previous,
+    )
 
 
 def resample_to_monthly(
@@ -353,6 +464,7 @@ def resample_to_monthly(
     lows: List[int],
     closes: List[int],
     volumes: List[int],
+    previous: Optional[Dict] = None,
 ) -> Dict:
     """
     Resample daily OHLCV data to monthly.
@@ -360,77 +472,52 @@ def resample_to_monthly(
     Args:
         dates: Daily dates (YYYYMMDD format, newest first)
         opens, highs, lows, closes, volumes: Daily OHLCV data
+        previous: Earlier result for the same history; only its newest
+            (possibly partial) month and newer months are recomputed
 
     Returns:
         Monthly OHLCV data dict with same structure
     """
-    if not dates:
-        return {
-            "dates": [],
-            "open": [],
-            "high": [],
-            "low": [],
-            "close": [],
-            "volume": [],
-        }
+    return _resample(
+        "monthly", dates, opens, highs, lows, closes, volumes, previous,
+    )
 
-    # Convert to chronological order for processing
-    dates_chrono = list(reversed(dates))
-    opens_chrono = list(reversed(opens))
-    highs_chrono = list(reversed(highs))
-    lows_chrono = list(reversed(lows))
-    closes_chrono = list(reversed(closes))
-    volumes_chrono = list(reversed(volumes))
-
-    # Group by month (year, month)
-    monthly_data = {}
-
-    for i, date_str in enumerate(dates_chrono):
-        month_key = (date_str[:4], date_str[4:6])  # (YYYY, MM)
-
-        if month_key not in monthly_data:
-            monthly_data[month_key] = {
-                "dates": [],
-                "open": [],
-                "high": [],
-                "low": [],
-                "close": [],
-                "volume": [],
-            }
 
-        monthly_data[month_key]["dates"].append(date_str)
-        monthly_data[month_key]["open"].append(opens_chrono[i])
-        monthly_data[month_key]["high"].append(highs_chrono[i])
-        monthly_data[month_key]["low"].append(lows_chrono[i])
-        monthly_data[month_key]["close"].append(closes_chrono[i])
-        monthly_data[month_key]["volume"].append(volumes_chrono[i])
-
-    # Aggregate each month
-    result_dates = []
-    result_opens = []
-    result_highs = []
-    result_lows = []
-    result_closes = []
-    result_volumes = []
-
-    for month_key in sorted(monthly_data.keys()):
-        month = monthly_data[month_key]
-        result_dates.append(month["dates"][-1])  # Last day of month
-        result_opens.append(month["open"][0])  # First day's open
-        result_highs.append(max(month["high"]))  # Month's high
-        result_lows.append(min(month["low"]))  # Month's low
-        result_closes.append(month["close"][-1])  # Last day's close
-        result_volumes.append(sum(month["volume"]))  # Total volume
-
-    # Reverse back to newest-first order
-    return {
-        "dates": list(reversed(result_dates)),
-        "open": list(reversed(result_opens)),
-        "high": list(reversed(result_highs)),
-        "low": list(reversed(result_lows)),
-        "close": list(reversed(result_closes)),
-        "volume": list(reversed(result_volumes)),
-    }
+def _resample(
+    timeframe: str,
+    dates: List[str],
+    opens: List[int],
+    highs: List[int],
+    lows: List[int],
+    closes: List[int],
+    volumes: List[int],
+    previous: Optional[Dict],
+) -> Dict:
+    """Resample dict-of-lists daily data (see multiframe.resample)."""
+    n = len(dates)
+    kept = None
+    if previous and previous["dates"]:
+        # Only daily bars from the start of the newest previous period on
+        first = multiframe.period_start(int(previous["dates"][0]), timeframe)
+        n = 0
+        while n < len(dates) and int(dates[n]) >= first:
+            n += 1
+        kept = {key: previous[key][1:] for key in _RESAMPLE_KEYS}
+
+    daily = OhlcvFrame.from_dict({
+        "dates": dates[:n],
+        "open": opens[:n],
+        "high": highs[:n],
+        "low": lows[:n],
+        "close": closes[:n],
+        "volume": volumes[:n],
+    })
+    result = multiframe.resample(daily, timeframe).to_dict()
+    del result["ticker"]
+    if kept is not None:
+        for key in _RESAMPLE_KEYS:
+            result[key] = result[key] + kept[key]
+    return result
 
 
 def get_daily_resampled_to_weekly(
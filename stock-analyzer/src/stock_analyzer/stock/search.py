@@ -1,42 +1,40 @@
 """Stock search functionality."""
 
-from dataclasses import dataclass
+from dataclasses import asdict
 from typing import Any, Dict, List, Optional
 
 from ..client.kiwoom import KiwoomClient
 from ..core.log import log_err, log_info
-
-
-@dataclass
-class StockInfo:
-    """Stock information."""
-
-    ticker: str
-    name: str
-    market: str  # KOSPI/KOSDAQ
-
+from .master import (
+    StockInfo,  # noqa: F401 (re-exported)
+    StockMaster,
+    get_master,
+)
 
 # Default markets to include (KOSPI and KOSDAQ only)
 DEFAULT_MARKETS = ["KOSPI", "KOSDAQ"]
 
-# Pagination limits
+# Result limits
 MAX_SEARCH_RESULTS = 50  # Maximum results returned from search
-MAX_SEARCH_PAGES = 50  # Safety limit for search pagination
-MAX_GET_ALL_PAGES = 100  # Safety limit for get_all pagination
 
 
 def search(
     client: KiwoomClient,
     query: str,
     markets: Optional[List[str]] = None,
+    master: Optional[StockMaster] = None,
 ) -> Dict:
     """
-    Search stocks by name or code.
+    Search stocks by code, name or 초성 (e.g. "ㅅㅅㅈㅈ").
+
+    Answers from the client's cached stock master (see ``get_master``);
+    the stock list is only fetched when the cache is empty or expired.
 
     Args:
         client: Kiwoom API client
-        query: Search query (name or code)
+        query: Search query (name, code or initial consonants)
         markets: List of markets to include (default: ["KOSPI", "KOSDAQ"])
+        master: Stock master to use (default: shared master of client)
 
     Returns:
         {
@@ -54,8 +52,6 @@ def search(
     if markets is None:
         markets = DEFAULT_MARKETS
 
-    log_info("stock.search", "search started", {"query": query, "markets": markets})
-
     if not query or not query.strip():
         log_err("stock.search", "empty query", {"query": query})
         return {
@@ -63,89 +59,19 @@ def search(
             "error": {"code": "INVALID_ARG", "msg": "검색어가 필요합니다"},
         }
 
-    # Filter by query
-    query = query.strip().upper()
-    results = []
-
-    # Get stock list with pagination
-    cont_yn = ""
-    next_key = ""
-
-    log_info("stock.search", "starting pagination loop", {"query": query, "max_pages": MAX_SEARCH_PAGES})
-
-    for page_num in range(MAX_SEARCH_PAGES):
-        log_info("stock.search", f"fetching page {page_num + 1}", {
-            "cont_yn": cont_yn,
-            "next_key": next_key[:20] if next_key else ""
-        })
-
-        resp = client.get_stock_list(cont_yn=cont_yn, next_key=next_key)
-
-        log_info("stock.search", "API response received", {
-            "ok": resp.ok,
-            "has_next": resp.has_next if resp.ok else None,
-            "error": resp.error if not resp.ok else None
-        })
-
-        if not resp.ok:
-            log_err("stock.search", "API error", {"error": resp.error})
-            return {"ok": False, "error": resp.error}
-
-        # Log raw response data keys for debugging
-        log_info("stock.search", "response data keys", {
-            "keys": list(resp.data.keys()) if resp.data else [],
-            "data_sample": str(resp.data)[:500] if resp.data else "None"
-        })
+    master = master or get_master(client)
+    loaded = master.ensure()
+    if not loaded["ok"]:
+        return loaded
 
-        # API returns 'list' with 'code', 'name', 'marketName' fields
-        stk_list = resp.data.get("list", [])
-
-        log_info("stock.search", "stock list info", {
-            "list_length": len(stk_list),
-            "first_items": stk_list[:3] if stk_list else []
-        })
-
-        for item in stk_list:
-            ticker = item.get("code", "")
-            name = item.get("name", "")
-            market = _get_market_name(item.get("marketName", ""))
-
-            # Filter by market (KOSPI/KOSDAQ only by default)
-            if market not in markets:
-                continue
-
-            if query in ticker or query in name.upper():
-                results.append({
-                    "ticker": ticker,
-                    "name": name,
-                    "market": market,
-                })
-
-                # Early exit if we have enough results
-                if len(results) >= MAX_SEARCH_RESULTS:
-                    break
-
-        log_info("stock.search", f"page {page_num + 1} processed", {
-            "results_so_far": len(results),
-            "has_next": resp.has_next
-        })
-
-        # Stop if we have enough results or no more pages
-        if len(results) >= MAX_SEARCH_RESULTS or not resp.has_next:
-            break
-
-        # Prepare for next page
-        cont_yn = "Y"
-        next_key = resp.next_key or ""
-
-    log_info("stock.search", "search complete", {"query": query, "count": len(results)})
-
-    return {"ok": True, "data": results[:MAX_SEARCH_RESULTS]}
+    results = master.search(query, markets, limit=MAX_SEARCH_RESULTS)
+    return {"ok": True, "data": [asdict(info) for info in results]}
 
 
 def get_all(
     client: KiwoomClient,
     markets: Optional[List[str]] = None,
+    master: Optional[StockMaster] = None,
 ) -> Dict:
     """
     Get all stocks.
@@ -153,6 +79,7 @@ def get_all(
     Args:
         client: Kiwoom API client
         markets: List of markets to include (default: ["KOSPI", "KOSDAQ"])
+        master: Stock master to use (default: shared master of client)
 
     Returns:
         {
@@ -166,77 +93,15 @@ def get_all(
     if markets is None:
         markets = DEFAULT_MARKETS
 
-    results = []
-
-    log_info("stock.search", "get_all fetching all stocks", {"markets": markets})
-
-    # Use mrkt_tp=0 to get all stocks, then filter by marketName
-    # Note: mrkt_tp=1 (KOSPI) and mrkt_tp=2 (KOSDAQ) don't work reliably
-    # The API returns stocks with different categorizations, so we fetch all
-    # and filter by the marketName field which contains the actual market type
-    cont_yn = ""
-    next_key = ""
-
-    log_info("stock.search", "Fetching all stocks with mrkt_tp=0", {})
-
-    for page_num in range(MAX_GET_ALL_PAGES):
-        resp = client.get_stock_list("0", cont_yn=cont_yn, next_key=next_key)
-        if not resp.ok:
-            log_err("stock.search", "get_all API error", {"error": resp.error})
-            return {"ok": False, "error": resp.error}
-
-        # Debug: Log response structure
-        log_info("stock.search", f"get_all page {page_num + 1} response", {
-            "keys": list(resp.data.keys()) if resp.data else [],
-            "data_sample": str(resp.data)[:500] if resp.data else "None",
-            "has_next": resp.has_next,
-        })
-
-        # API returns 'stk_list' with stock data (or 'list' for backward compatibility)
-        # Note: API may return None for list, so use `or []` to handle that case
-        stk_list = resp.data.get("stk_list") or resp.data.get("list") or []
-
-        log_info("stock.search", f"get_all page {page_num + 1} items", {
-            "list_length": len(stk_list) if stk_list else 0,
-            "first_items": stk_list[:3] if stk_list else [],
-        })
-
-        page_count = 0
-        for item in stk_list:
-            ticker = item.get("code", "")
-            name = item.get("name", "")
-            # Get the actual market from marketName field and normalize it
-            market_name = item.get("marketName", "")
-            market = _get_market_name(market_name)
-
-            # Only include stocks from requested markets (KOSPI/KOSDAQ)
-            if market not in markets:
-                continue
-
-            results.append({
-                "ticker": ticker,
-                "name": name,
-                "market": market,
-            })
-            page_count += 1
-
-        log_info("stock.search", f"get_all page {page_num + 1} processed", {
-            "page_count": page_count,
-            "total_count": len(results),
-            "has_next": resp.has_next,
-        })
-
-        # Stop if no more pages
-        if not resp.has_next:
-            break
-
-        # Prepare for next page
-        cont_yn = "Y"
-        next_key = resp.next_key or ""
+    master = master or get_master(client)
+    loaded = master.ensure()
+    if not loaded["ok"]:
+        return loaded
 
+    results = master.all(markets)
     log_info("stock.search", "get_all complete", {"markets": markets, "count": len(results)})
 
-    return {"ok": True, "data": results}
+    return {"ok": True, "data": [asdict(info) for info in results]}
 
 
 def get_name(client: KiwoomClient, ticker: str) -> Optional[str]:
@@ -329,16 +194,3 @@ def _to_float(value: Any) -> float:
         return float(value)
     except (ValueError, TypeError):
         return 0.0
-
-
-def _get_market_name(market_name: str) -> str:
-    """Convert market name to standardized format."""
-    if not market_name:
-        return "기타"
-    name_upper = market_name.upper()
-    # '거래소' = KOSPI (유가증권시장)
-    if "거래소" in market_name or "코스피" in market_name or "KOSPI" in name_upper:
-        return "KOSPI"
-    if "코스닥" in market_name or "KOSDAQ" in name_upper:
-        return "KOSDAQ"
-    return market_name or "기타"
@@ -0,0 +1,205 @@
+"""Persistent local OHLCV store."""
+
+import json
+import os
+import threading
+from typing import Dict, Optional
+
+import numpy as np
+
+from ..core.log import log_err, log_info
+from .frame import DATE_DTYPE, PRICE_DTYPE, PRICE_FIELDS, OhlcvFrame
+
+# Store layout: <root>/<timeframe>/<adj|raw>/<ticker>.npz
+# Indicator state: <root>/<timeframe>/<adj|raw>/<ticker>.<name>.json
+TIMEFRAMES = ("daily", "weekly", "monthly")
+
+
+class OhlcvStore:
+    """
+    On-disk OHLCV store.
+
+    One columnar ``.npz`` file is kept per ticker, timeframe and price type
+    (adjusted/raw). Dates are stored as int32 YYYYMMDD and prices/volume as
+    int64, oldest first so new bars are appended at the end. Series are
+    passed in and out as newest-first ``OhlcvFrame`` objects.
+
+    Example:
+        store = OhlcvStore("~/.stock_analyzer/ohlcv")
+        result = ohlcv.get_daily(client, "005930", store=store)
+    """
+
+    def __init__(self, root_dir: str):
+        """
+        Initialize store.
+
+        Args:
+            root_dir: Directory for store files (created on first save)
+        """
+        self.root_dir = os.path.expanduser(root_dir)
+        self._lock = threading.Lock()
+
+    def path(
+        self, ticker: str, timeframe: str = "daily", adj_price: bool = True
+    ) -> str:
+        """Get the file path for a series."""
+        if timeframe not in TIMEFRAMES:
+            raise ValueError(f"Unknown timeframe: {timeframe}")
+        kind = "adj" if adj_price else "raw"
+        return os.path.join(self.root_dir, timeframe, kind, f"{ticker}.npz")
+
+    def state_path(
+        self,
+        ticker: str,
+        name: str,
+        timeframe: str = "daily",
+        adj_price: bool = True,
+    ) -> str:
+        """Get the file path for a persisted indicator state."""
+        base, _ = os.path.splitext(self.path(ticker, timeframe, adj_price))
+        return f"{base}.{name}.json"
+
+    def load(
+        self,
+        ticker: str,
+        timeframe: str = "daily",
+        adj_price: bool = True,
+    ) -> Optional[OhlcvFrame]:
+        """
+        Load a stored series.
+
+        Args:
+            ticker: Stock code
+            timeframe: daily, weekly or monthly
+            adj_price: Adjusted (True) or raw (False) prices
+
+        Returns:
+            OhlcvFrame (newest first) or None if nothing is stored
+        """
+        path = self.path(ticker, timeframe, adj_price)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with np.load(path) as npz:
+                # Stored oldest first; flip once into contiguous newest-first columns
+                columns = {
+                    name: np.ascontiguousarray(npz[name][::-1])
+                    for name in ("dates",) + PRICE_FIELDS
+                }
+        except (OSError, ValueError, KeyError) as e:
+            log_err("stock.store", e, {"path": path})
+            return None
+
+        if len(columns["dates"]) == 0:
+            return None
+
+        return OhlcvFrame(ticker, **columns)
+
+    def save(
+        self,
+        ticker: str,
+        frame: OhlcvFrame,
+        timeframe: str = "daily",
+        adj_price: bool = True,
+    ) -> None:
+        """
+        Replace a stored series.
+
+        Args:
+            ticker: Stock code
+            frame: OHLCV frame (newest first)
+            timeframe: daily, weekly or monthly
+            adj_price: Adjusted (True) or raw (False) prices
+        """
+        path = self.path(ticker, timeframe, adj_price)
+        chrono = frame.chrono()
+        columns = {"dates": chrono.dates.astype(DATE_DTYPE)}
+        for name in PRICE_FIELDS:
+            columns[name] = getattr(chrono, name).astype(PRICE_DTYPE)
+
+        with self._lock:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                np.savez(f, **columns)
+            os.replace(tmp_path, path)
+
+        log_info("stock.store", "Series saved", {
+            "ticker": ticker,
+            "timeframe": timeframe,
+            "adj": adj_price,
+            "count": len(frame),
+        })
+
+    def delete(
+        self, ticker: str, timeframe: str = "daily", adj_price: bool = True
+    ) -> bool:
+        """
+        Delete a stored series.
+
+        Returns:
+            True if a file was removed
+        """
+        path = self.path(ticker, timeframe, adj_price)
+        try:
+            os.remove(path)
+            return True
+        except FileNotFoundError:
+            return False
+
+    def load_state(
+        self,
+        ticker: str,
+        name: str,
+        timeframe: str = "daily",
+        adj_price: bool = True,
+    ) -> Optional[Dict]:
+        """
+        Load a persisted indicator state.
+
+        Args:
+            ticker: Stock code
+            name: State name (e.g. "elder")
+            timeframe: daily, weekly or monthly
+            adj_price: Adjusted (True) or raw (False) prices
+
+        Returns:
+            State dict (see ``indicator.streaming``) or None if nothing is stored
+        """
+        path = self.state_path(ticker, name, timeframe, adj_price)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            log_err("stock.store", e, {"path": path})
+            return None
+
+    def save_state(
+        self,
+        ticker: str,
+        name: str,
+        state: Dict,
+        timeframe: str = "daily",
+        adj_price: bool = True,
+    ) -> None:
+        """
+        Persist an indicator state next to the series.
+
+        Args:
+            ticker: Stock code
+            name: State name (e.g. "elder")
+            state: JSON-serializable state (``state.to_dict()``)
+            timeframe: daily, weekly or monthly
+            adj_price: Adjusted (True) or raw (False) prices
+        """
+        path = self.state_path(ticker, name, timeframe, adj_price)
+        with self._lock:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(state, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
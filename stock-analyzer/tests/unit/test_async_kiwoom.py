@@ -0,0 +1,136 @@
+"""Tests for async Kiwoom client."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from stock_analyzer.client.async_kiwoom import AsyncKiwoomClient
+from stock_analyzer.client.kiwoom import ApiResponse
+from stock_analyzer.indicator import oscillator, trend
+from stock_analyzer.stock import analysis, ohlcv
+
+
+@pytest.fixture
+def async_client(mock_kiwoom_client):
+    """Wrap the mock KiwoomClient in an AsyncKiwoomClient."""
+    client = AsyncKiwoomClient.from_client(mock_kiwoom_client, max_concurrency=3)
+    yield client
+    client._executor.shutdown(wait=True)
+
+
+class TestAsyncKiwoomClient:
+    """Tests for AsyncKiwoomClient."""
+
+    def test_invalid_concurrency(self, mock_kiwoom_client):
+        """Test max_concurrency must be positive."""
+        with pytest.raises(ValueError):
+            AsyncKiwoomClient.from_client(mock_kiwoom_client, max_concurrency=0)
+
+    @pytest.mark.asyncio
+    async def test_endpoint_delegates(self, async_client, mock_kiwoom_client):
+        """Test async endpoint calls the wrapped client."""
+        resp = await async_client.get_stock_info("005930")
+        assert resp.ok is True
+        mock_kiwoom_client.get_stock_info.assert_called_once_with("005930")
+
+    @pytest.mark.asyncio
+    async def test_concurrency_bound(self, async_client, mock_kiwoom_client):
+        """Test no more than max_concurrency calls are in flight."""
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def slow_info(ticker):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.02)
+            with lock:
+                state["active"] -= 1
+            return ApiResponse(ok=True, data={"stk_nm": ticker})
+
+        mock_kiwoom_client.get_stock_info.side_effect = slow_info
+
+        tickers = [f"{i:06d}" for i in range(10)]
+        results = await asyncio.gather(
+            *(async_client.get_stock_info(t) for t in tickers)
+        )
+
+        assert [r.data["stk_nm"] for r in results] == tickers
+        assert state["peak"] <= 3
+        assert state["peak"] > 1
+
+    def test_reused_across_event_loops(self, async_client, mock_kiwoom_client):
+        """Test one client serves several asyncio.run() calls."""
+        def slow_info(ticker):
+            time.sleep(0.01)
+            return ApiResponse(ok=True, data={"stk_nm": ticker})
+
+        mock_kiwoom_client.get_stock_info.side_effect = slow_info
+
+        async def batch():
+            # More calls than permits, so some wait on the semaphore
+            return await asyncio.gather(
+                *(async_client.get_stock_info(f"{i:06d}") for i in range(6))
+            )
+
+        for _ in range(2):
+            results = asyncio.run(batch())
+            assert all(r.ok for r in results)
+
+    @pytest.mark.asyncio
+    async def test_fan_out_keeps_order(self, async_client):
+        """Test fan_out returns results in ticker order."""
+        tickers = ["005930", "000660", "035420"]
+        results = await async_client.fan_out(ohlcv.get_daily_async, tickers, days=30)
+        assert len(results) == 3
+        assert all(r["ok"] for r in results)
+        assert [r["data"]["ticker"] for r in results] == tickers
+
+
+class TestAsyncFunctions:
+    """Tests for async variants of stock/indicator functions."""
+
+    @pytest.mark.asyncio
+    async def test_get_daily_async_matches_sync(self, async_client, mock_kiwoom_client):
+        """Test get_daily_async returns same data as get_daily."""
+        expected = ohlcv.get_daily(mock_kiwoom_client, "005930", days=30)
+        result = await ohlcv.get_daily_async(async_client, "005930", days=30)
+        assert result == expected
+
+    @pytest.mark.asyncio
+    async def test_get_daily_async_invalid_ticker(self, async_client):
+        """Test get_daily_async with empty ticker."""
+        result = await ohlcv.get_daily_async(async_client, "")
+        assert result["ok"] is False
+        assert result["error"]["code"] == "INVALID_ARG"
+
+    @pytest.mark.asyncio
+    async def test_analyze_async_matches_sync(self, async_client, mock_kiwoom_client):
+        """Test analyze_async returns same data as analyze."""
+        expected = analysis.analyze(mock_kiwoom_client, "005930")
+        result = await analysis.analyze_async(async_client, "005930")
+        assert result == expected
+
+    @pytest.mark.asyncio
+    async def test_analyze_async_no_trend_data(self, async_client, mock_kiwoom_client):
+        """Test analyze_async with no trend data."""
+        mock_kiwoom_client.get_investor_trend.return_value = ApiResponse(
+            ok=True,
+            data={"trend_list": [], "return_code": 0},
+        )
+        result = await analysis.analyze_async(async_client, "005930")
+        assert result["ok"] is False
+        assert result["error"]["code"] == "NO_DATA"
+
+    @pytest.mark.asyncio
+    async def test_indicator_calc_async(self, async_client, mock_kiwoom_client):
+        """Test indicator calc_async matches sync calc."""
+        expected = trend.calc(mock_kiwoom_client, "005930", days=30)
+        result = await trend.calc_async(async_client, "005930", days=30)
+        assert result == expected
+
+        expected = oscillator.calc(mock_kiwoom_client, "005930", days=30)
+        result = await oscillator.calc_async(async_client, "005930", days=30)
+        assert result == expected
@@ -1,11 +1,15 @@
 """Tests for auth module."""
 
+import os
+import threading
+import time
 from datetime import datetime, timedelta
 from unittest.mock import Mock, patch
 
 import pytest
 
 from stock_analyzer.client.auth import AuthClient, AuthError, TokenInfo
+from stock_analyzer.client.token_cache import TokenCache
 
 
 class TestTokenInfo:
@@ -149,3 +153,184 @@ class TestAuthClient:
         client.clear_token()
 
         assert client._token is None
+
+
+def _token_post(mock_post, mock_token_response, delay=0.0):
+    """Make requests.post return a fresh token per call."""
+    calls = []
+
+    def post(*args, **kwargs):
+        calls.append(1)
+        time.sleep(delay)
+        resp = Mock()
+        resp.json.return_value = dict(
+            mock_token_response, token=f"token_{len(calls)}"
+        )
+        resp.raise_for_status = Mock()
+        return resp
+
+    mock_post.side_effect = post
+    return calls
+
+
+class TestTokenCache:
+    """Tests for TokenCache."""
+
+    def test_store_and_load(self, tmp_path):
+        cache = TokenCache(str(tmp_path))
+        name = TokenCache.key("https://api.kiwoom.com", "app")
+        cache.store(name, {"token": "abc"}, time.time() + 60)
+
+        assert cache.load(name) == {"token": "abc"}
+        assert os.stat(tmp_path / name).st_mode & 0o777 == 0o600
+
+    def test_expired_entry(self, tmp_path):
+        now = [1000.0]
+        cache = TokenCache(str(tmp_path), clock=lambda: now[0])
+        cache.store("t.json", {"token": "abc"}, 1060.0)
+        now[0] = 1060.0
+
+        assert cache.load("t.json") is None
+
+    def test_missing_and_corrupt(self, tmp_path):
+        cache = TokenCache(str(tmp_path))
+        assert cache.load("missing.json") is None
+        (tmp_path / "bad.json").write_text("{not json")
+        assert cache.load("bad.json") is None
+
+    def test_key_separates_accounts(self):
+        assert TokenCache.key("https://api.kiwoom.com", "a") != TokenCache.key(
+            "https://mockapi.kiwoom.com", "a"
+        )
+        assert TokenCache.key("u", "a") != TokenCache.key("u", "b")
+
+    def test_remove(self, tmp_path):
+        cache = TokenCache(str(tmp_path))
+        cache.store("t.json", {"token": "abc"}, time.time() + 60)
+        cache.remove("t.json")
+        cache.remove("t.json")
+        assert cache.load("t.json") is None
+
+    def test_get_or_fetch(self, tmp_path):
+        cache = TokenCache(str(tmp_path))
+        fetch = Mock(side_effect=["new", "newer"])
+
+        def call(accept):
+            return cache.get_or_fetch(
+                "t.json",
+                fetch,
+                decode=lambda entry: entry["token"],
+                encode=lambda token: ({"token": token}, time.time() + 60),
+                accept=accept,
+            )
+
+        assert call(lambda token: True) == "new"
+        assert call(lambda token: True) == "new"
+        assert call(lambda token: token != "new") == "newer"
+        assert cache.load("t.json") == {"token": "newer"}
+        assert fetch.call_count == 2
+
+    def test_get_or_fetch_ignores_malformed_entry(self, tmp_path):
+        cache = TokenCache(str(tmp_path))
+        cache.store("t.json", {"other": 1}, time.time() + 60)
+        token = cache.get_or_fetch(
+            "t.json",
+            lambda: "new",
+            decode=lambda entry: entry["token"],
+            encode=lambda token: ({"token": token}, time.time() + 60),
+            accept=lambda token: True,
+        )
+        assert token == "new"
+
+
+class TestAuthClientTokenCache:
+    """Tests for AuthClient with a persistent token cache."""
+
+    def _client(self, tmp_path):
+        return AuthClient(
+            app_key="test_app_key",
+            secret_key="test_secret_key",
+            base_url="https://api.kiwoom.com",
+            token_cache=TokenCache(str(tmp_path)),
+        )
+
+    @patch("stock_analyzer.client.auth.requests.post")
+    def test_new_client_reuses_stored_token(
+        self, mock_post, mock_token_response, tmp_path
+    ):
+        calls = _token_post(mock_post, mock_token_response)
+
+        first = self._client(tmp_path).get_token()
+        # A restarted process starts with an empty client
+        second = self._client(tmp_path).get_token()
+
+        assert len(calls) == 1
+        assert second.token == first.token
+        assert second.expires_dt == first.expires_dt
+        assert "test_secret_key" not in "".join(
+            p.read_text() for p in tmp_path.glob("*.json")
+        )
+
+    @patch("stock_analyzer.client.auth.requests.post")
+    def test_force_refresh_replaces_stored_token(
+        self, mock_post, mock_token_response, tmp_path
+    ):
+        calls = _token_post(mock_post, mock_token_response)
+        client = self._client(tmp_path)
+
+        client.get_token()
+        refreshed = client.get_token(force_refresh=True)
+
+        assert len(calls) == 2
+        assert refreshed.token == "token_2"
+        assert self._client(tmp_path).get_token().token == "token_2"
+
+    @patch("stock_analyzer.client.auth.requests.post")
+    def test_force_refresh_takes_token_refreshed_elsewhere(
+        self, mock_post, mock_token_response, tmp_path
+    ):
+        calls = _token_post(mock_post, mock_token_response)
+        a = self._client(tmp_path)
+        b = self._client(tmp_path)
+
+        a.get_token()
+        b.get_token()
+        a.get_token(force_refresh=True)
+        # b saw the same rejected token; a already replaced it
+        token = b.get_token(force_refresh=True)
+
+        assert len(calls) == 2
+        assert token.token == "token_2"
+
+    @patch("stock_analyzer.client.auth.requests.post")
+    def test_concurrent_threads_fetch_once(
+        self, mock_post, mock_token_response, tmp_path
+    ):
+        calls = _token_post(mock_post, mock_token_response, delay=0.05)
+        client = self._client(tmp_path)
+        tokens = []
+
+        threads = [
+            threading.Thread(target=lambda: tokens.append(client.get_token()))
+            for _ in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(calls) == 1
+        assert {t.token for t in tokens} == {"token_1"}
+
+    @patch("stock_analyzer.client.auth.requests.post")
+    def test_clear_token_removes_stored_token(
+        self, mock_post, mock_token_response, tmp_path
+    ):
+        calls = _token_post(mock_post, mock_token_response)
+        client = self._client(tmp_path)
+
+        client.get_token()
+        client.clear_token()
+        self._client(tmp_path).get_token()
+
+        assert len(calls) == 2
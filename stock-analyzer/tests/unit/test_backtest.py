@@ -0,0 +1,172 @@
+"""Tests for the vectorized backtest engine and signal builders."""
+
+import random
+import time
+
+import numpy as np
+import pytest
+
+from stock_analyzer.backtest import STAT_FIELDS, run, signals
+from stock_analyzer.indicator import batch, oscillator
+
+nan = np.nan
+
+
+class TestSignals:
+    def test_hold(self):
+        entries = np.array([[0, 1, 0, 0, 1, 0, 0]], dtype=bool)
+        exits = np.array([[0, 0, 0, 1, 1, 0, 1]], dtype=bool)
+        # Exit wins on the bar with both
+        assert signals.hold(entries, exits).tolist() == [[0, 1, 1, 0, 0, 0, 0]]
+
+    def test_from_trend(self):
+        signal = np.array([[nan, 1, 0, -1]])
+        np.testing.assert_array_equal(signals.from_trend(signal), [[nan, 1, 0, 0]])
+        np.testing.assert_array_equal(
+            signals.from_trend(signal, long_only=False), [[nan, 1, 0, -1]],
+        )
+
+    def test_from_impulse_holds_through_blue(self):
+        impulse = np.array([[nan, 0, 1, 0, 0, -1, 0]])
+        np.testing.assert_array_equal(
+            signals.from_impulse(impulse), [[nan, 0, 1, 1, 1, 0, 0]],
+        )
+
+    def test_from_setup(self):
+        buy = np.array([[7, 8, 9, 0, 0, 0]], dtype=float)
+        sell = np.array([[0, 0, 0, 8, 9, 10]], dtype=float)
+        np.testing.assert_array_equal(
+            signals.from_setup(buy, sell), [[0, 0, 1, 1, 0, 0]],
+        )
+
+    def test_from_score(self):
+        score = np.array([[nan, nan, 0, 30, 0, -20, 60]])
+        np.testing.assert_array_equal(
+            signals.from_score(score), [[nan, nan, 0, 1, 1, 0, 1]],
+        )
+
+
+class TestOscillatorScore:
+    def test_matches_analyze_signal(self):
+        rng = random.Random(5)
+        n = 40
+        mcap = np.array(
+            [[rng.randint(1, 9) * 10**12 for _ in range(n)] for _ in range(2)],
+            dtype=np.float64,
+        )
+        flows = [np.array([[rng.randint(-90000, 90000) for _ in range(n)]
+                           for _ in range(2)], dtype=np.float64) for _ in range(2)]
+        mcap[1, :10] = nan
+        result = batch.calc_oscillator(mcap, *flows)
+        score = batch.calc_oscillator_score(result)
+
+        for row in range(2):
+            start = 10 if row else 0
+            assert np.isnan(score[row, : start + 2]).all()
+            for end in range(start + 3, n + 1):
+                data = {key: result[key][row, start:end].tolist()
+                        for key in ("oscillator", "macd", "signal")}
+                expected = oscillator.analyze_signal({"ok": True, "data": data})
+                assert score[row, end - 1] == expected["data"]["total_score"]
+
+
+class TestRun:
+    def test_long_returns_with_lag(self):
+        close = np.array([[100, 110, 121, 121, 108.9]])
+        positions = np.array([[1, 1, 0, 1, 1]], dtype=float)
+        result = run(close, positions)
+
+        # Held one bar after each decision
+        assert result["positions"].tolist() == [[0, 1, 1, 0, 1]]
+        np.testing.assert_allclose(result["returns"], [[0, 0.1, 0.1, 0, -0.1]])
+        np.testing.assert_allclose(result["equity"][0, -1], 1.21 * 0.9)
+        np.testing.assert_allclose(result["drawdown"][0], [0, 0, 0, 0, -0.1])
+        assert result["turnover"].tolist() == [[0, 1, 0, 1, 1]]
+
+        trades = result["trades"]
+        assert trades["start"].tolist() == [1, 4]
+        assert trades["end"].tolist() == [2, 4]
+        np.testing.assert_allclose(trades["return"], [0.21, -0.1])
+        stats = result["stats"]
+        assert stats["trades"].tolist() == [2]
+        assert stats["hit_rate"].tolist() == [0.5]
+        np.testing.assert_allclose(stats["max_drawdown"], [-0.1])
+
+    def test_costs_and_short(self):
+        close = np.array([[100, 90, 81]])
+        result = run(close, np.array([[-1, -1, 0]], dtype=float), cost=0.01, lag=1)
+        np.testing.assert_allclose(result["returns"], [[0, 0.1 - 0.01, 0.1]])
+        assert result["trades"]["side"].tolist() == [-1]
+
+    def test_longer_lag(self):
+        close = np.array([[100, 110, 121, 133.1]])
+        result = run(close, np.array([[1, 0, 0, 0]], dtype=float), lag=2)
+        assert result["positions"].tolist() == [[0, 0, 1, 0]]
+        np.testing.assert_allclose(result["returns"], [[0, 0, 0.1, 0]])
+
+    def test_gaps_and_listing(self):
+        close = np.array([
+            [nan, nan, 100, 110, 121],  # Listed later
+            [100, nan, nan, 120, 120],  # Suspended
+        ])
+        positions = np.ones(close.shape)
+        result = run(close, positions)
+
+        assert result["positions"][0].tolist() == [0, 0, 0, 1, 1]
+        np.testing.assert_allclose(result["returns"][0], [0, 0, 0, 0.1, 0.1])
+        # Suspension earns nothing; the gap return lands on the next bar
+        np.testing.assert_allclose(result["returns"][1], [0, 0, 0, 0.2, 0])
+        assert result["stats"]["exposure"][1] == pytest.approx(4 / 5)
+
+    def test_trades_do_not_span_tickers(self):
+        close = np.array([[100, 110, 121], [100, 90, 81]])
+        result = run(close, np.ones(close.shape))
+        assert result["trades"]["ticker"].tolist() == [0, 1]
+        np.testing.assert_allclose(result["trades"]["return"], [0.21, -0.19])
+
+    def test_portfolio_equal_weight(self):
+        close = np.array([[100, 110, 121], [100, 90, 81], [100, 100, 100]])
+        positions = np.array([[1, 1, 1], [1, 1, 1], [0, 0, 0]], dtype=float)
+        portfolio = run(close, positions)["portfolio"]
+        np.testing.assert_allclose(portfolio["returns"], [0, 0, 0], atol=1e-12)
+        assert portfolio["trades"] == 2
+        assert portfolio["hit_rate"] == 0.5
+        assert set(STAT_FIELDS) <= set(portfolio)
+
+    def test_portfolio_pays_exit_costs(self):
+        close = np.full((1, 6), 100.0)
+        positions = np.array([[0, 1, 1, 0, 0, 0]], dtype=float)
+        result = run(close, positions, cost=0.01)
+        portfolio = result["portfolio"]
+        np.testing.assert_allclose(portfolio["returns"], result["returns"][0])
+        assert portfolio["total_return"] == pytest.approx(
+            result["stats"]["total_return"][0]
+        )
+        assert portfolio["total_return"] == pytest.approx(0.99**2 - 1)
+
+        # An exit on a bar where another ticker is held costs its own share
+        close = np.full((2, 6), 100.0)
+        positions = np.array([[0, 1, 1, 0, 0, 0], [1, 1, 1, 1, 1, 1]], dtype=float)
+        portfolio = run(close, positions, cost=0.01)["portfolio"]
+        np.testing.assert_allclose(
+            portfolio["returns"], [0, -0.01, -0.005, 0, -0.005, 0],
+        )
+
+    def test_invalid_args(self):
+        with pytest.raises(ValueError):
+            run(np.ones((2, 3)), np.ones((2, 4)))
+        with pytest.raises(ValueError):
+            run(np.ones((2, 3)), np.ones((2, 3)), lag=0)
+
+    def test_market_scale(self):
+        rng = np.random.default_rng(0)
+        close = 10000 * np.exp(np.cumsum(rng.normal(0, 0.02, (3000, 2500)), axis=1))
+        positions = (rng.random(close.shape) > 0.5).astype(np.float64)
+
+        start = time.perf_counter()
+        result = run(close, positions, cost=0.0025)
+        elapsed = time.perf_counter() - start
+
+        assert result["stats"]["sharpe"].shape == (3000,)
+        # Generous bound for slow CI machines; typically well under a second
+        assert elapsed < 10
@@ -0,0 +1,188 @@
+"""Tests for the universe-wide batch indicator engine."""
+
+import random
+
+import numpy as np
+import pytest
+
+from stock_analyzer.indicator import batch, demark, elder, oscillator, trend
+from stock_analyzer.stock.frame import OhlcvFrame
+from stock_analyzer.stock.matrix import OhlcvMatrix
+
+
+def _frame(ticker: str, n: int, seed: int, skip: int = 0) -> OhlcvFrame:
+    """Random-walk frame (newest first) listed ``skip`` days after day 0."""
+    rng = random.Random(seed)
+    rows = {"open": [], "high": [], "low": [], "close": [], "volume": []}
+    price = rng.randint(5000, 90000)
+    for i in range(n):
+        step = 0 if i % 41 < 2 else rng.randint(-800, 800)
+        price = max(1000, price + step)
+        rows["open"].append(price)
+        rows["close"].append(price)
+        rows["high"].append(price + rng.randint(0, 400) if step else price)
+        rows["low"].append(price - rng.randint(0, 400) if step else price)
+        rows["volume"].append(rng.randint(100, 50000) if step else 0)
+    dates = [20200101 + skip + i for i in range(n)]
+    return OhlcvFrame(
+        ticker,
+        np.asarray(dates[::-1], dtype=np.int32),
+        **{name: np.asarray(v[::-1], dtype=np.int64) for name, v in rows.items()},
+    )
+
+
+@pytest.fixture
+def frames():
+    """Tickers with different listing dates, a short history and a gap."""
+    gapped = _frame("000660", 150, seed=2)
+    keep = np.ones(len(gapped), dtype=bool)
+    keep[40:45] = False  # Five-day suspension
+    gapped = gapped._map(lambda column: column[keep])
+    return [
+        _frame("005930", 160, seed=1),
+        gapped,
+        _frame("035420", 120, seed=3, skip=40),
+        _frame("373220", 45, seed=4, skip=115),  # Listed recently (< 52 bars)
+    ]
+
+
+def _row(result, matrix, ticker):
+    """Per-ticker values newest first with the padding dropped."""
+    row = matrix.index(ticker)
+    valid = ~np.isnan(matrix.close[row])
+    return {key: value[row, valid][::-1] for key, value in result.items()}
+
+
+class TestOhlcvMatrix:
+    """Tests for OhlcvMatrix."""
+
+    def test_from_frames_aligns_dates(self, frames):
+        matrix = OhlcvMatrix.from_frames(frames)
+        assert matrix.shape == (4, 160)
+        assert matrix.dates[0] == 20200101
+        assert np.isnan(matrix.close[2, :40]).all()
+        assert np.isnan(matrix.close[1, 105:110]).all()  # Suspension
+        assert np.isnan(matrix.close[1, 150:]).all()  # No recent bars
+
+    def test_to_frame_roundtrip(self, frames):
+        matrix = OhlcvMatrix.from_frames(frames)
+        for frame in frames:
+            restored = matrix.to_frame(frame.ticker)
+            assert restored.to_dict() == frame.to_dict()
+
+    def test_empty(self):
+        matrix = OhlcvMatrix.from_frames([])
+        assert matrix.shape == (0, 0)
+
+
+class TestBatchIndicators:
+    """Batch results must match the per-ticker calculations."""
+
+    @pytest.mark.parametrize("timeframe", ["daily", "weekly"])
+    def test_trend_matches_per_ticker(self, frames, timeframe):
+        matrix = OhlcvMatrix.from_frames(frames)
+        result = batch.calc_trend(matrix, timeframe)
+        cmf_period = 4 if timeframe == "weekly" else 20
+
+        for frame in frames:
+            data = frame.to_dict()
+            got = _row(result, matrix, frame.ticker)
+            for period in (5, 10, 20):
+                ma = [None if np.isnan(x) else int(x) for x in got[f"ma{period}"]]
+                assert ma == trend._calc_ma(data["close"], period)
+            cmf = trend._calc_cmf(
+                data["high"], data["low"], data["close"], data["volume"], cmf_period,
+            )
+            np.testing.assert_allclose(got["cmf"], cmf, atol=1e-12)
+            fg = trend._calc_fear_greed(data["close"], data["volume"])
+            np.testing.assert_allclose(got["fear_greed"], fg, atol=1e-12)
+
+            if timeframe == "weekly":
+                ma10 = trend._calc_ma(data["close"], 10)
+                signal = trend._calc_ma_signal_weekly_reference(
+                    data["close"], data["high"], data["low"], ma10, cmf,
+                )
+            else:
+                signal = trend._calc_ma_signal(
+                    trend._calc_ma(data["close"], 5),
+                    trend._calc_ma(data["close"], 20),
+                    trend._calc_ma(data["close"], 60),
+                )
+            assert got["ma_signal"].tolist() == signal
+            labels = [batch.TREND_CODES[int(x)] for x in got["trend"]]
+            assert labels == trend._calc_trend(signal, cmf, fg)
+
+    def test_short_history_has_no_fear_greed(self, frames):
+        matrix = OhlcvMatrix.from_frames(frames)
+        fg = batch.calc_trend(matrix)["fear_greed"]
+        row = matrix.index("373220")
+        assert (fg[row, -45:] == 0).all()
+        assert np.isnan(fg[row, :-45]).all()
+
+    def test_elder_matches_per_ticker(self, frames):
+        matrix = OhlcvMatrix.from_frames(frames)
+        result = batch.calc_elder(matrix.close)
+        for frame in frames:
+            data = frame.to_dict()
+            expected = elder.calc_from_ohlcv("X", data["dates"], data["close"])
+            got = _row(result, matrix, frame.ticker)
+            if not expected["ok"]:
+                continue
+            expected = expected["data"]
+            for key in ("ema13", "macd_line", "signal_line", "macd_hist",
+                        "ema13_slope", "hist_slope"):
+                assert got[key].tolist() == expected[key], key
+            colors = [batch.IMPULSE_CODES[int(x)] for x in got["impulse"]]
+            assert colors == expected["color"]
+
+    def test_demark_matches_per_ticker(self, frames):
+        matrix = OhlcvMatrix.from_frames(frames)
+        result = batch.calc_demark(matrix.close)
+        for frame in frames:
+            sell, buy = demark._calc_td_setup(frame.close.tolist())
+            got = _row(result, matrix, frame.ticker)
+            assert got["sell_setup"].tolist() == sell
+            assert got["buy_setup"].tolist() == buy
+
+    def test_oscillator_matches_per_ticker(self):
+        rng = random.Random(9)
+        n = 60
+
+        def matrix(low, high, scale=1):
+            rows = [[rng.randint(low, high) * scale for _ in range(n)]
+                    for _ in range(3)]
+            return np.array(rows, dtype=np.float64)
+
+        mcap = matrix(1, 9, 10**13)
+        foreign = matrix(-9000, 9000)
+        institution = matrix(-9000, 9000)
+        mcap[1, :20] = np.nan  # Listed later
+
+        result = batch.calc_oscillator(mcap, foreign, institution)
+        dates = [f"2025{i:04d}" for i in range(n)]
+        for row in range(3):
+            start = 20 if row == 1 else 0
+            expected = oscillator.calc_from_analysis(
+                "X", "X", dates[start:],
+                mcap[row, start:].astype(int).tolist(),
+                foreign[row, start:].astype(int).tolist(),
+                institution[row, start:].astype(int).tolist(),
+            )["data"]
+            for key in ("supply_ratio", "ema12", "ema26", "macd", "signal",
+                        "oscillator", "foreign_5d", "institution_5d", "market_cap"):
+                np.testing.assert_allclose(
+                    result[key][row, start:], expected[key], rtol=1e-12, atol=0,
+                )
+            assert np.isnan(result["oscillator"][row, :start]).all()
+
+    def test_calc_all(self, frames):
+        matrix = OhlcvMatrix.from_frames(frames)
+        result = batch.calc_all(matrix)
+        assert set(result) == {"trend", "elder", "demark"}
+        np.testing.assert_array_equal(
+            result["elder"]["ema13"], batch.calc_elder(matrix.close)["ema13"],
+        )
+        for group in result.values():
+            for value in group.values():
+                assert value.shape == matrix.shape
+                assert np.isnan(value[np.isnan(matrix.close)]).all()
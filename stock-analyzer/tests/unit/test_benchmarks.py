@@ -0,0 +1,96 @@
+"""Tests for the benchmark harness (generators, case list, baseline check)."""
+
+import json
+
+from benchmarks import cases, generators, runner
+
+
+def _result(**medians):
+    return {
+        "results": {
+            name: {"median_ms": ms, "min_ms": ms, "mean_ms": ms, "runs": 3}
+            for name, ms in medians.items()
+        },
+    }
+
+
+class TestGenerators:
+    def test_chart_rows_deterministic(self):
+        assert generators.chart_rows(50, seed=1) == generators.chart_rows(50, seed=1)
+        assert generators.chart_rows(50, seed=1) != generators.chart_rows(50, seed=2)
+
+    def test_chart_rows_newest_first_and_consistent(self):
+        rows = generators.chart_rows(300)
+        dates = [row["dt"] for row in rows]
+        assert dates == sorted(dates, reverse=True)
+        assert len(set(dates)) == 300
+        for row in rows:
+            high, low = int(row["high_pric"]), int(row["low_pric"])
+            assert low <= int(row["open_pric"]) <= high
+            assert low <= int(row["cur_prc"]) <= high
+
+    def test_analysis_data_lengths(self):
+        data = generators.analysis_data(120)
+        for key in ("dates", "mcap", "for_daily", "ins_daily"):
+            assert len(data[key]) == 120
+
+    def test_tickers_distinct(self):
+        codes = generators.tickers(3000)
+        assert len(set(codes)) == 3000
+        assert all(len(code) == 6 for code in codes)
+
+
+class TestCases:
+    def test_build_names_and_sizes(self):
+        names = [case.name for case in cases.build((250, 25000), (1, 3000))]
+        assert "trend.calc_from_ohlcv/25000" in names
+        assert "ohlcv.resample_to_weekly/250" in names
+        assert "etf.filter_etfs/3000" in names
+        assert "backtest.run/3000" in names
+        # Charts are capped at CHART_MAX_BARS
+        assert "chart.candle/250" in names
+        assert "chart.candle/25000" not in names
+
+    def test_build_filter(self):
+        built = cases.build((250,), (1,), pattern="elder")
+        assert built
+        assert all("elder" in case.name for case in built)
+
+    def test_run_small_case(self):
+        built = cases.build((250,), (), pattern="resample_to_weekly")
+        result = runner.run(built, repeat=2, min_time=0, max_time=1)
+        timing = result["results"]["ohlcv.resample_to_weekly/250"]
+        assert timing["runs"] >= 2
+        assert timing["min_ms"] <= timing["median_ms"]
+        json.dumps(result)
+
+
+class TestCompare:
+    def test_regression_detected(self):
+        diff = runner.compare(_result(a=30.0), _result(a=10.0))
+        assert [entry["name"] for entry in diff["regressions"]] == ["a"]
+        assert diff["regressions"][0]["ratio"] == 3.0
+
+    def test_within_tolerance(self):
+        diff = runner.compare(_result(a=12.0), _result(a=10.0), tolerance=1.5)
+        assert diff == {"regressions": [], "improvements": []}
+
+    def test_small_absolute_delta_ignored(self):
+        diff = runner.compare(_result(a=0.3), _result(a=0.1), min_delta_ms=1.0)
+        assert diff["regressions"] == []
+
+    def test_improvement_and_new_cases(self):
+        diff = runner.compare(_result(a=5.0, new=1.0), _result(a=20.0))
+        assert [entry["name"] for entry in diff["improvements"]] == ["a"]
+        assert diff["regressions"] == []
+
+    def test_main_fails_on_regression(self, tmp_path):
+        baseline = _result(**{"ohlcv.resample_to_weekly/250": 1e-6})
+        path = tmp_path / "baseline.json"
+        path.write_text(json.dumps(baseline), encoding="utf-8")
+        argv = [
+            "--profile", "quick", "--filter", "resample_to_weekly/250",
+            "--repeat", "2", "--min-time", "0", "--verbose",
+            "--baseline", str(path), "--min-delta-ms", "0",
+        ]
+        assert runner.main(argv) == 1
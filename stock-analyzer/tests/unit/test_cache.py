@@ -0,0 +1,193 @@
+"""Tests for the persistent response cache."""
+
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+
+from stock_analyzer.client.cache import INTRADAY_TTL, POST_CLOSE_TTL, ResponseCache
+from stock_analyzer.client.kiwoom import KiwoomClient
+from stock_analyzer.core.http import HttpTransport
+from stock_analyzer.core.krx_calendar import KST, KrxCalendar
+
+
+def _epoch(*args) -> float:
+    return datetime(*args, tzinfo=KST).timestamp()
+
+
+class FakeClock:
+    def __init__(self, now: float):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock(_epoch(2025, 1, 10, 10, 0))  # Friday, market open
+
+
+@pytest.fixture
+def cache(tmp_path, clock):
+    return ResponseCache(str(tmp_path), clock=clock)
+
+
+class TestKrxCalendar:
+    """Tests for KrxCalendar."""
+
+    def test_next_open_skips_weekend_and_holidays(self):
+        cal = KrxCalendar(holidays=["20250127", "20250128", "20250129", "20250130"])
+        friday_night = datetime(2025, 1, 24, 20, 0, tzinfo=KST)
+        assert cal.next_open(friday_night) == datetime(2025, 1, 31, 9, 0, tzinfo=KST)
+
+    def test_next_open_same_morning(self):
+        cal = KrxCalendar()
+        early = datetime(2025, 1, 10, 7, 30, tzinfo=KST)
+        assert cal.next_open(early) == datetime(2025, 1, 10, 9, 0, tzinfo=KST)
+
+
+class TestTtl:
+    """Tests for session-aware lifetimes."""
+
+    def test_closed_date_never_expires(self, cache):
+        assert cache.ttl({"stk_cd": "005930", "base_dt": "20250109"}) is None
+        body = {"stk_cd": "005930", "base_dt": "20250109", "upd_stkpc_tp": "0"}
+        assert cache.ttl(body) is None
+
+    def test_adjusted_closed_date_until_next_open(self, cache, clock):
+        body = {"stk_cd": "005930", "base_dt": "20250109", "upd_stkpc_tp": "1"}
+        assert cache.ttl(body) == _epoch(2025, 1, 13, 9, 0) - clock.now
+        clock.now = _epoch(2025, 1, 13, 8, 0)  # Before a possible ex-date open
+        assert cache.ttl(body) == 3600
+
+    def test_intraday(self, cache):
+        assert cache.ttl({"stk_cd": "005930", "base_dt": "20250110"}) == INTRADAY_TTL
+        assert cache.ttl({"stk_cd": "005930"}) == INTRADAY_TTL
+
+    def test_after_close(self, cache, clock):
+        clock.now = _epoch(2025, 1, 10, 16, 0)
+        assert cache.ttl({"dt": "20250110"}) == POST_CLOSE_TTL
+
+    def test_until_next_open(self, cache, clock):
+        clock.now = _epoch(2025, 1, 10, 19, 0)  # Friday evening
+        expected = _epoch(2025, 1, 13, 9, 0) - clock.now
+        assert cache.ttl({"dt": "20250110"}) == expected
+        clock.now = _epoch(2025, 1, 11, 12, 0)  # Saturday
+        assert cache.ttl({}) == _epoch(2025, 1, 13, 9, 0) - clock.now
+
+
+class TestResponseCache:
+    """Tests for ResponseCache storage."""
+
+    def test_roundtrip_and_expiry(self, cache, clock):
+        key = cache.key("https://api", "ka10001", "/x", {"stk_cd": "005930"})
+        cache.put(key, {"stk_cd": "005930"}, {"stk_nm": "삼성전자"}, True, "k1")
+
+        entry = cache.get(key)
+        assert entry["data"] == {"stk_nm": "삼성전자"}
+        assert (entry["has_next"], entry["next_key"]) == (True, "k1")
+
+        clock.now += INTRADAY_TTL
+        assert cache.get(key) is None
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 0)
+
+    def test_key_depends_on_request(self, cache):
+        base = cache.key("u", "ka10081", "/c", {"stk_cd": "005930"})
+        assert base == cache.key("u", "ka10081", "/c", {"stk_cd": "005930"})
+        assert base != cache.key("u", "ka10081", "/c", {"stk_cd": "000660"})
+        assert base != cache.key("u", "ka10081", "/c", {"stk_cd": "005930"}, "Y", "k")
+
+    def test_lru_eviction(self, tmp_path, clock):
+        cache = ResponseCache(str(tmp_path), max_entries=2, clock=clock)
+        body = {"dt": "20250101"}
+        keys = [cache.key("u", "ka10059", "/x", {"n": i}) for i in range(3)]
+        cache.put(keys[0], body, {"n": 0})
+        cache.put(keys[1], body, {"n": 1})
+        cache.get(keys[0])  # keys[1] is now least recently used
+        cache.put(keys[2], body, {"n": 2})
+
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) is not None
+        assert cache.stats()["evictions"] == 1
+
+    def test_byte_bound(self, tmp_path, clock):
+        cache = ResponseCache(str(tmp_path), max_bytes=300, clock=clock)
+        body = {"dt": "20250101"}
+        for i in range(10):
+            cache.put(cache.key("u", "a", "/", {"n": i}), body, {"rows": "x" * 50})
+        stats = cache.stats()
+        assert stats["bytes"] <= 300
+        assert 0 < stats["entries"] < 10
+
+    def test_persists_across_instances(self, tmp_path, clock):
+        first = ResponseCache(str(tmp_path), clock=clock)
+        key = first.key("u", "ka10081", "/c", {"base_dt": "20250102"})
+        first.put(key, {"base_dt": "20250102"}, {"rows": [1, 2]})
+
+        second = ResponseCache(str(tmp_path), clock=clock)
+        assert second.stats()["entries"] == 1
+        assert second.get(key)["data"] == {"rows": [1, 2]}
+
+    def test_directory_from_env(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("STOCK_ANALYZER_CACHE_DIR", str(tmp_path / "app"))
+        assert ResponseCache().directory == str(tmp_path / "app")
+
+
+class TestClientCache:
+    """Tests for KiwoomClient with a response cache."""
+
+    @pytest.fixture
+    def transport(self, mock_token_response, mock_stock_info_response):
+        responses = {
+            "au10001": mock_token_response,
+            "ka10001": mock_stock_info_response,
+            "ka10171": {"cond_list": [], "return_code": 0},
+            "kt00001": {"return_code": 0},
+        }
+
+        def post(url, headers, json_data, timeout=None):
+            resp = Mock()
+            resp.status_code = 200
+            resp.headers = {}
+            resp.json.return_value = responses[headers["api-id"]]
+            return resp
+
+        transport = Mock(spec=HttpTransport)
+        transport.post.side_effect = post
+        return transport
+
+    def _api_posts(self, transport, api_id):
+        return sum(
+            1 for call in transport.post.call_args_list
+            if call.kwargs["headers"]["api-id"] == api_id
+        )
+
+    def test_restart_is_served_from_disk(self, tmp_path, clock, transport):
+        for _ in range(2):  # Two process starts sharing the cache directory
+            client = KiwoomClient(
+                "key", "secret", min_interval=0, transport=transport,
+                cache=ResponseCache(str(tmp_path), clock=clock),
+            )
+            resp = client.get_stock_info("005930")
+            assert resp.ok is True
+            assert resp.data["stk_nm"] == "삼성전자"
+
+        assert self._api_posts(transport, "ka10001") == 1
+        # A cache hit needs no token either
+        assert self._api_posts(transport, "au10001") == 1
+
+    @pytest.mark.parametrize("method, api_id", [
+        ("get_condition_list", "ka10171"),  # Live
+        ("get_deposit_trend", "kt00001"),  # Account
+    ])
+    def test_uncached_apis(self, tmp_path, clock, transport, method, api_id):
+        cache = ResponseCache(str(tmp_path), clock=clock)
+        client = KiwoomClient(
+            "key", "secret", min_interval=0, transport=transport, cache=cache,
+        )
+        getattr(client, method)()
+        getattr(client, method)()
+        assert self._api_posts(transport, api_id) == 2
+        assert cache.stats()["entries"] == 0
@@ -0,0 +1,71 @@
+"""Tests for columnar OHLCV frame."""
+
+import json
+
+import numpy as np
+
+from stock_analyzer.stock.frame import OhlcvFrame
+from stock_analyzer.stock.ohlcv import CHART_FIELDS
+
+
+def _frame(dates, base=1000):
+    """Build a newest-first frame."""
+    n = len(dates)
+    return OhlcvFrame.from_dict({
+        "ticker": "005930",
+        "dates": dates,
+        "open": [base + i for i in range(n)],
+        "high": [base + 10 + i for i in range(n)],
+        "low": [base - 10 + i for i in range(n)],
+        "close": [base + 5 + i for i in range(n)],
+        "volume": [100 * (i + 1) for i in range(n)],
+    })
+
+
+class TestOhlcvFrame:
+    """Tests for OhlcvFrame."""
+
+    def test_from_rows(self):
+        """Test API rows are parsed into typed columns."""
+        rows = [
+            {"dt": "20250110", "open_pric": "54000", "high_pric": "55500",
+             "low_pric": "53800", "cur_prc": "-55000", "trde_qty": "15000000"},
+            {"dt": "20250109", "opn_prc": 53000, "high_prc": 54500,
+             "low_prc": 52800, "cls_prc": 54000, "trd_qty": None},
+        ]
+        frame = OhlcvFrame.from_rows("005930", rows, CHART_FIELDS)
+
+        assert frame.dates.dtype == np.int32
+        assert frame.close.dtype == np.int64
+        assert frame.dates.tolist() == [20250110, 20250109]
+        assert frame.open.tolist() == [54000, 53000]
+        assert frame.close.tolist() == [-55000, 54000]
+        assert frame.volume.tolist() == [15000000, 0]
+
+    def test_to_dict_json_safe(self):
+        """Test to_dict gives plain Python types."""
+        data = _frame(["20250110", "20250109"]).to_dict()
+        assert data["dates"] == ["20250110", "20250109"]
+        assert data["open"] == [1000, 1001]
+        json.dumps(data)
+
+    def test_chrono_is_view(self):
+        """Test chrono() reverses without copying."""
+        frame = _frame(["20250110", "20250109", "20250108"])
+        chrono = frame.chrono()
+        assert chrono.dates.tolist() == [20250108, 20250109, 20250110]
+        assert np.shares_memory(chrono.close, frame.close)
+
+    def test_until(self):
+        """Test until() drops newer bars."""
+        frame = _frame(["20250110", "20250109", "20250108"])
+        assert frame.until("20250109").date_strings() == ["20250109", "20250108"]
+        assert frame.until("20250110") is frame
+
+    def test_merge_fresh_wins(self):
+        """Test merge replaces overlapping bars with fresh ones."""
+        stored = _frame(["20250109", "20250108"], base=1000)
+        fresh = _frame(["20250110", "20250109"], base=2000)
+        merged = stored.merge(fresh)
+        assert merged.date_strings() == ["20250110", "20250109", "20250108"]
+        assert merged.open.tolist() == [2000, 2001, 1001]
@@ -0,0 +1,147 @@
+"""Tests for HTTP transport module."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock
+
+import pytest
+from requests.adapters import HTTPAdapter
+
+from stock_analyzer.client.kiwoom import KiwoomClient
+from stock_analyzer.core.http import HttpClient, HttpTransport, SessionTransport
+
+
+class _JsonHandler(BaseHTTPRequestHandler):
+    """Keep-alive handler that echoes a fixed JSON body."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        self.rfile.read(length)
+        body = json.dumps({"return_code": 0, "echo": self.path}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    """Start a local keep-alive HTTP server."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _JsonHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestSessionTransport:
+    """Tests for SessionTransport."""
+
+    def test_pool_settings(self):
+        """Test pool size settings are applied."""
+        transport = SessionTransport(
+            pool_connections=2, pool_maxsize=5, pool_block=True
+        )
+        adapter = transport.session.get_adapter("https://api.kiwoom.com")
+        assert adapter._pool_connections == 2
+        assert adapter._pool_maxsize == 5
+        assert adapter._pool_block is True
+        transport.close()
+
+    def test_connection_reuse(self, local_server):
+        """Test sequential requests reuse one keep-alive connection."""
+        transport = SessionTransport()
+        for _ in range(5):
+            resp = transport.post(
+                f"{local_server}/api", headers={}, json_data={"a": 1}, timeout=5
+            )
+            assert resp.json()["return_code"] == 0
+
+        stats = transport.stats()
+        assert stats["requests"] == 5
+        assert stats["connections_opened"] == 1
+        assert stats["connections_reused"] == 4
+        transport.close()
+        assert transport.stats() == stats
+
+    def test_counters_survive_pool_eviction(self, local_server):
+        """Test counters of evicted host pools are kept."""
+        transport = SessionTransport(pool_connections=1)
+        other = local_server.replace("127.0.0.1", "localhost")
+        for url in (local_server, local_server, other):
+            transport.post(f"{url}/api", headers={}, json_data={}, timeout=5)
+
+        assert len(transport.session.get_adapter(url).poolmanager.pools) == 1
+        stats = transport.stats()
+        assert stats["connections_opened"] == 2
+        assert stats["connections_reused"] == 1
+        transport.close()
+
+    def test_without_dispose_hook(self, monkeypatch):
+        """Test a pool container without dispose_func only loses history."""
+        init_poolmanager = HTTPAdapter.init_poolmanager
+
+        def plain_pools(adapter, *args, **kwargs):
+            init_poolmanager(adapter, *args, **kwargs)
+            adapter.poolmanager.pools = {}
+
+        monkeypatch.setattr(HTTPAdapter, "init_poolmanager", plain_pools)
+        transport = SessionTransport()
+        assert transport.stats()["connections_opened"] == 0
+        transport.close()
+
+    def test_error_counter(self):
+        """Test failed requests are counted and re-raised."""
+        transport = SessionTransport()
+        with pytest.raises(Exception):
+            transport.post(
+                "http://127.0.0.1:1/api", headers={}, json_data={}, timeout=1
+            )
+        assert transport.stats()["errors"] == 1
+        transport.close()
+
+    def test_http_client_uses_transport(self, local_server):
+        """Test HttpClient sends through its transport."""
+        client = HttpClient()
+        resp = client.post(f"{local_server}/x", headers={}, json_data={})
+        assert resp.ok is True
+        assert resp.data["echo"] == "/x"
+        assert client.transport.stats()["requests"] == 1
+        client.close()
+
+
+class TestKiwoomClientTransport:
+    """Tests for KiwoomClient transport wiring."""
+
+    def test_default_transport_shared_with_auth(self):
+        """Test default pooled transport is shared by API and auth calls."""
+        client = KiwoomClient("key", "secret", min_interval=0)
+        assert isinstance(client.transport, SessionTransport)
+        assert client.auth.transport is client.transport
+
+    def test_custom_transport(self, mock_token_response):
+        """Test custom transport receives token and API calls."""
+        token_resp = Mock(status_code=200, headers={})
+        token_resp.json.return_value = mock_token_response
+        api_resp = Mock(status_code=200, headers={"cont-yn": "Y", "next-key": "k1"})
+        api_resp.json.return_value = {"return_code": 0, "stk_nm": "삼성전자"}
+
+        transport = Mock(spec=HttpTransport)
+        transport.post.side_effect = [token_resp, api_resp]
+
+        client = KiwoomClient("key", "secret", min_interval=0, transport=transport)
+        resp = client.get_stock_info("005930")
+
+        assert resp.ok is True
+        assert resp.has_next is True
+        assert resp.next_key == "k1"
+        assert transport.post.call_count == 2
+        assert transport.post.call_args_list[0].args[0].endswith("/oauth2/token")
@@ -0,0 +1,95 @@
+"""Tests for warmup-aware fetch planning."""
+
+from datetime import date, timedelta
+
+import pytest
+
+from stock_analyzer.indicator import demark, elder, lookback, trend
+
+
+def _trading_days(days: int, end: date = date(2025, 10, 31)) -> int:
+    """Weekday count over the last ``days`` calendar days (holidays ignored)."""
+    return sum((end - timedelta(days=i)).weekday() < 5 for i in range(days))
+
+
+class TestWarmup:
+    """Tests for declared warmups."""
+
+    def test_indicator_warmups(self):
+        assert lookback.warmup("trend", "daily") == 59  # MA60
+        assert lookback.warmup("trend", "weekly") == 51  # 52-week range
+        assert lookback.warmup("elder", "weekly") == 34  # EMA26 + signal 9
+        assert lookback.warmup("demark", "monthly") == 4  # Close[4]
+
+    def test_unknown_indicator(self):
+        with pytest.raises(ValueError):
+            lookback.warmup("trend", "hourly")
+        with pytest.raises(ValueError):
+            lookback.warmup("unknown", "daily")
+
+    def test_register_validates(self):
+        with pytest.raises(ValueError):
+            lookback.register("bad", {"hourly": 1})
+        with pytest.raises(ValueError):
+            lookback.register("bad", {"daily": -1})
+
+
+class TestPlan:
+    """Tests for the fetch planner."""
+
+    @pytest.mark.parametrize("bars", [1, 40, 239, 600])
+    def test_daily_days_cover_bars(self, bars):
+        days = lookback.calendar_days(bars, "daily")
+        # Even after ~15 holidays a year the range holds enough sessions
+        holidays = 15 * days // 365 + 5
+        assert _trading_days(days) - holidays >= bars
+
+    def test_daily_trend_is_fully_warmed(self):
+        """The old ``days + 60`` calendar days left MA60 under-warmed."""
+        days = lookback.fetch_days("trend", "daily", 180)
+        assert _trading_days(days) >= 180 + 59
+        assert _trading_days(180 + 60) < 180 + 59
+
+    def test_weekly_fetch_is_smaller(self):
+        """Weekly views fetch output + warmup weeks, not (days + 60) * 7."""
+        days = lookback.fetch_days("trend", "weekly", 52)
+        assert days == (52 + 51 + 1) * 7
+        assert days < (52 + 60) * 7
+
+    def test_combined_plan_takes_largest_need(self):
+        plan = lookback.plan([
+            ("trend", "daily", 120),
+            ("elder", "daily", 180),
+            ("demark", "weekly", 30),
+        ])
+        assert plan.bars == {"daily": 214, "weekly": 34}
+        assert plan.days == max(
+            lookback.calendar_days(214, "daily"),
+            lookback.calendar_days(34, "weekly"),
+        )
+
+    def test_empty_plan(self):
+        assert lookback.plan([]).days == 0
+
+
+class TestCalcUsesPlan:
+    """calc() functions fetch the planned range."""
+
+    @pytest.mark.parametrize("module, timeframe", [
+        (trend, "daily"),
+        (elder, "daily"),
+        (demark, "daily"),
+        (demark, "monthly"),
+    ])
+    def test_fetch_days(self, mock_kiwoom_client, monkeypatch, module, timeframe):
+        calls = []
+
+        def fake_load(client, ticker, days=180, **kwargs):
+            calls.append(days)
+            return {"ok": False, "error": {"code": "NO_DATA", "msg": "없음"}}
+
+        monkeypatch.setattr(module.multiframe, "load", fake_load)
+        module.calc(mock_kiwoom_client, "005930", days=100, timeframe=timeframe)
+
+        name = module.__name__.rsplit(".", 1)[-1]
+        assert calls == [lookback.fetch_days(name, timeframe, 100)]
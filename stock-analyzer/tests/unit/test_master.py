@@ -0,0 +1,195 @@
+"""Tests for the stock master index."""
+
+import gc
+import threading
+import weakref
+from unittest.mock import Mock
+
+import pytest
+
+from stock_analyzer.client.kiwoom import ApiResponse, KiwoomClient
+from stock_analyzer.stock.master import StockMaster, get_master, to_choseong
+from stock_analyzer.stock.search import get_all, search
+
+STOCKS = [
+    {"code": "005930", "name": "삼성전자", "marketName": "거래소"},
+    {"code": "005935", "name": "삼성전자우", "marketName": "거래소"},
+    {"code": "028260", "name": "삼성물산", "marketName": "거래소"},
+    {"code": "000660", "name": "SK하이닉스", "marketName": "거래소"},
+    {"code": "035720", "name": "카카오", "marketName": "코스닥"},
+    {"code": "323410", "name": "카카오뱅크", "marketName": "코스닥"},
+    {"code": "900110", "name": "이스트아시아홀딩스", "marketName": "코넥스"},
+]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_paged_client():
+    """Client serving STOCKS over three ka10099 pages."""
+    client = Mock(spec=KiwoomClient)
+    pages = [STOCKS[:3], STOCKS[3:6], STOCKS[6:]]
+
+    def get_stock_list(market="0", cont_yn="", next_key=""):
+        page = int(next_key or 0)
+        last = page == len(pages) - 1
+        return ApiResponse(
+            ok=True,
+            data={"stk_list": pages[page], "return_code": 0},
+            has_next=not last,
+            next_key="" if last else str(page + 1),
+        )
+
+    client.get_stock_list.side_effect = get_stock_list
+    return client
+
+
+@pytest.fixture
+def paged_client():
+    return make_paged_client()
+
+
+class TestChoseong:
+    """Tests for initial consonant conversion."""
+
+    def test_to_choseong(self):
+        assert to_choseong("삼성전자") == "ㅅㅅㅈㅈ"
+        assert to_choseong("SK하이닉스") == "SKㅎㅇㄴㅅ"
+        assert to_choseong("까치") == "ㄲㅊ"
+
+
+class TestStockMaster:
+    """Tests for StockMaster."""
+
+    def test_refresh_sweeps_all_pages(self, paged_client):
+        master = StockMaster(paged_client)
+        assert master.refresh() == {"ok": True, "data": {"count": 7}}
+        assert paged_client.get_stock_list.call_count == 3
+        assert master.get("035720").market == "KOSDAQ"
+        assert master.get("999999") is None
+
+    def test_search_ranking(self, paged_client):
+        master = StockMaster(paged_client)
+        master.refresh()
+        tickers = [s.ticker for s in master.search("00593")]
+        assert tickers == ["005930", "005935"]
+        # Exact code first, then prefix, then substring
+        assert [s.ticker for s in master.search("005930")][0] == "005930"
+        assert [s.name for s in master.search("카카오")] == ["카카오", "카카오뱅크"]
+        assert [s.name for s in master.search("뱅크")] == ["카카오뱅크"]
+        assert [s.name for s in master.search("sk")] == ["SK하이닉스"]
+
+    def test_search_choseong(self, paged_client):
+        master = StockMaster(paged_client)
+        master.refresh()
+        assert [s.name for s in master.search("ㅅㅅㅈㅈ")] == ["삼성전자", "삼성전자우"]
+        assert [s.name for s in master.search("ㅋㅋㅇㅂ")] == ["카카오뱅크"]
+        # Syllables in a mixed query must match exactly
+        assert [s.name for s in master.search("삼ㅅㅁ")] == ["삼성물산"]
+        assert master.search("삼ㅋ") == []
+
+    def test_search_markets_and_limit(self, paged_client):
+        master = StockMaster(paged_client)
+        master.refresh()
+        assert master.search("이스트", markets=["KOSPI", "KOSDAQ"]) == []
+        assert len(master.search("삼성", limit=2)) == 2
+        assert len(master.all(["KOSDAQ"])) == 2
+
+    def test_ttl(self, paged_client):
+        clock = FakeClock()
+        master = StockMaster(paged_client, ttl=60, clock=clock)
+        master.ensure()
+        master.ensure()
+        assert paged_client.get_stock_list.call_count == 3
+
+        clock.now = 61
+        assert master.stale
+        master.ensure()
+        assert paged_client.get_stock_list.call_count == 6
+
+    def test_refresh_error_keeps_index(self, paged_client):
+        master = StockMaster(paged_client)
+        master.refresh()
+        paged_client.get_stock_list.side_effect = None
+        paged_client.get_stock_list.return_value = ApiResponse(
+            ok=False, error={"code": "API_ERROR", "msg": "오류"},
+        )
+        result = master.refresh()
+        assert result["ok"] is False
+        assert len(master) == 7
+
+    def test_readers_see_whole_snapshots(self, paged_client):
+        """Searches racing refresh() never mix two index loads."""
+        master = StockMaster(paged_client)
+        master.refresh()
+        renamed = [dict(s, name=s["name"] + "X") for s in STOCKS]
+        paged_client.get_stock_list.side_effect = None
+        paged_client.get_stock_list.return_value = ApiResponse(
+            ok=True, data={"stk_list": renamed, "return_code": 0},
+        )
+        done = threading.Event()
+
+        def refresher():
+            for _ in range(200):
+                master.refresh()
+            done.set()
+
+        thread = threading.Thread(target=refresher)
+        thread.start()
+        try:
+            while not done.is_set():
+                for query in ("삼성", "ㅋㅋㅇ", "0"):
+                    results = master.search(query)
+                    assert results
+                    # All names come from the same load
+                    assert len({r.name.endswith("X") for r in results}) == 1
+                    assert all(master.get(r.ticker) for r in results)
+        finally:
+            thread.join()
+        assert len(master) == 7
+
+
+class TestSearchUsesMaster:
+    """search()/get_all() answer from the cached master."""
+
+    def test_search_fetches_once(self, paged_client):
+        search(paged_client, "삼성")
+        search(paged_client, "카카오")
+        result = get_all(paged_client)
+        assert paged_client.get_stock_list.call_count == 3
+        assert len(result["data"]) == 6
+        assert get_master(paged_client) is get_master(paged_client)
+
+    def test_master_dropped_with_client(self):
+        # Not the fixture: pytest keeps fixture values alive
+        paged_client = make_paged_client()
+        master = get_master(paged_client)
+        master.ensure()
+        client = weakref.ref(paged_client)
+        del paged_client
+        gc.collect()
+        assert client() is None
+        assert master.client is None
+        assert master.refresh()["ok"] is False
+        # Lookups still answer from the last snapshot
+        assert master.get("005930") is not None
+
+    def test_search_choseong(self, paged_client):
+        result = search(paged_client, "ㅅㅅㅁㅅ")
+        assert result["data"] == [
+            {"ticker": "028260", "name": "삼성물산", "market": "KOSPI"},
+        ]
+
+    def test_search_api_error(self, mock_kiwoom_client):
+        mock_kiwoom_client.get_stock_list.side_effect = None
+        mock_kiwoom_client.get_stock_list.return_value = ApiResponse(
+            ok=False, error={"code": "API_ERROR", "msg": "오류"},
+        )
+        result = search(mock_kiwoom_client, "삼성")
+        assert result["ok"] is False
+        assert result["error"]["code"] == "API_ERROR"
@@ -0,0 +1,211 @@
+"""Tests for multi-timeframe bars derived from one daily fetch."""
+
+import random
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from stock_analyzer.client.kiwoom import ApiResponse
+from stock_analyzer.indicator import demark, elder, lookback, trend
+from stock_analyzer.stock import multiframe, ohlcv
+from stock_analyzer.stock.frame import OhlcvFrame
+
+
+def _daily_rows(n: int, end: date = date(2025, 10, 31), seed: int = 1):
+    """Weekday chart rows (ka10081 format), newest first."""
+    rng = random.Random(seed)
+    rows = []
+    day = end
+    price = 50000
+    while len(rows) < n:
+        if day.weekday() < 5:
+            price = max(1000, price + rng.randint(-900, 900))
+            rows.append({
+                "dt": day.strftime("%Y%m%d"),
+                "open_pric": price + rng.randint(-300, 300),
+                "high_pric": price + rng.randint(300, 900),
+                "low_pric": price - rng.randint(300, 900),
+                "cur_prc": price,
+                "trde_qty": rng.randint(1000, 90000),
+            })
+        day -= timedelta(days=1)
+    return rows
+
+
+def _reference(daily: OhlcvFrame, timeframe: str):
+    """Row-by-row grouping by ISO week / month (the former implementation)."""
+    groups = {}
+    for i in range(len(daily) - 1, -1, -1):
+        d = str(daily.dates[i])
+        day = date(int(d[:4]), int(d[4:6]), int(d[6:]))
+        key = day.isocalendar()[:2] if timeframe == "weekly" else d[:6]
+        groups.setdefault(key, []).append(i)
+    bars = []
+    for key in sorted(groups, reverse=True):
+        idx = groups[key]
+        bars.append((
+            str(daily.dates[idx[-1]]),
+            int(daily.open[idx[0]]),
+            int(max(daily.high[idx])),
+            int(min(daily.low[idx])),
+            int(daily.close[idx[-1]]),
+            int(sum(daily.volume[idx])),
+        ))
+    return bars
+
+
+def _bars(data):
+    keys = ("dates", "open", "high", "low", "close", "volume")
+    return list(zip(*(data[key] for key in keys)))
+
+
+@pytest.fixture
+def daily():
+    rows = _daily_rows(800)
+    return OhlcvFrame.from_rows("005930", rows, ohlcv.CHART_FIELDS)
+
+
+class TestResample:
+    """Tests for the period kernels."""
+
+    def test_day_numbers(self):
+        dates = np.array([19700101, 20000229, 20241231, 20250101])
+        epoch = date(1970, 1, 1)
+        expected = [
+            (date(d // 10000, d // 100 % 100, d % 100) - epoch).days
+            for d in dates.tolist()
+        ]
+        assert multiframe.day_numbers(dates).tolist() == expected
+
+    def test_weeks_end_on_friday(self):
+        # Fri 2025-01-03 | Sat 01-04 .. Fri 01-10 | Sat 01-11
+        dates = np.array([20250103, 20250104, 20250106, 20250110, 20250111])
+        keys = multiframe.period_keys(dates, "weekly")
+        assert keys[0] != keys[1]
+        assert keys[1] == keys[2] == keys[3]
+        assert keys[3] != keys[4]
+
+    @pytest.mark.parametrize("timeframe", ["weekly", "monthly"])
+    def test_matches_reference(self, daily, timeframe):
+        got = multiframe.MultiTimeframe(daily).to_dict(timeframe)
+        assert _bars(got) == _reference(daily, timeframe)
+
+    @pytest.mark.parametrize("timeframe", ["weekly", "monthly"])
+    def test_incremental_matches_full(self, daily, timeframe):
+        """Each new daily bar only re-aggregates the newest period."""
+        start = 600
+        previous = multiframe.resample(
+            daily._map(lambda column: column[start:]), timeframe,
+        )
+        for i in range(start - 1, -1, -1):
+            history = daily._map(lambda column: column[i:])
+            previous = multiframe.resample(history, timeframe, previous=previous)
+        expected = multiframe.resample(daily, timeframe)
+        assert previous.to_dict() == expected.to_dict()
+
+    def test_extend_revises_newest_bar(self, daily):
+        bars = multiframe.MultiTimeframe(daily._map(lambda column: column[1:]))
+        bars.frame("weekly")
+        bars.frame("monthly")
+
+        bars.extend(daily.head(1))  # New day
+        revised = daily.head(1)._map(np.copy)
+        revised.high[0] += 5000
+        bars.extend(revised)  # Intraday refresh of the same day
+
+        expected = multiframe.MultiTimeframe(daily.merge(revised))
+        for timeframe in ("daily", "weekly", "monthly"):
+            assert bars.to_dict(timeframe) == expected.to_dict(timeframe)
+
+    def test_frames_are_cached(self, daily):
+        bars = multiframe.MultiTimeframe(daily)
+        assert bars.frame("weekly") is bars.frame("weekly")
+        assert bars.frame("daily") is daily
+        assert bars.boundaries("monthly")[0] == 0
+
+    def test_empty(self):
+        bars = multiframe.MultiTimeframe(OhlcvFrame("005930"))
+        assert len(bars.frame("weekly")) == 0
+
+    def test_unknown_timeframe(self, daily):
+        with pytest.raises(ValueError):
+            multiframe.MultiTimeframe(daily).frame("hourly")
+
+
+class TestFramePath:
+    """Tests for the indicators' OhlcvFrame path."""
+
+    @pytest.mark.parametrize("timeframe", ["daily", "weekly", "monthly"])
+    def test_matches_list_path(self, daily, timeframe):
+        frame = multiframe.MultiTimeframe(daily).frame(timeframe)
+        data = frame.to_dict()
+        cases = [
+            (trend, (data["close"], data["high"], data["low"], data["volume"])),
+            (elder, (data["close"],)),
+            (demark, (data["close"],)),
+        ]
+        for module, columns in cases:
+            expected = module.calc_from_ohlcv(
+                "005930", data["dates"], *columns, timeframe=timeframe
+            )
+            result = module.calc_from_frame(frame, timeframe, days=10)
+            assert result["ok"] == expected["ok"], module.__name__
+            if not expected["ok"]:
+                continue
+            # Trimmed to 10 periods or to the bars past the warmup
+            n = len(result["data"]["dates"])
+            name = module.__name__.rsplit(".", 1)[1]
+            assert n == min(10, len(frame) - lookback.warmup(name, timeframe))
+            for key, values in expected["data"].items():
+                if isinstance(values, list):
+                    values = values[:n]
+                assert result["data"][key] == values, (module.__name__, key)
+
+    def test_not_enough_bars(self, daily):
+        result = elder.calc_from_frame(daily.head(elder.WARMUP), "daily")
+        assert result["error"]["code"] == "NO_DATA"
+
+
+class TestLoad:
+    """Tests for the shared daily fetch."""
+
+    @pytest.fixture
+    def client(self, mock_kiwoom_client):
+        mock_kiwoom_client.get_daily_chart.return_value = ApiResponse(
+            # ~5.5 years: monthly trend needs a 52-month range
+            ok=True, data={"stk_dt_pole_chart_qry": _daily_rows(1400)},
+        )
+        return mock_kiwoom_client
+
+    def test_dashboard_fetches_once(self, client):
+        plan = lookback.plan([
+            ("trend", "daily", 60),
+            ("elder", "weekly", 52),
+            ("demark", "monthly", 12),
+        ])
+        loaded = multiframe.load(client, "005930", days=plan.days)
+        assert loaded["ok"]
+        bars = loaded["data"]
+
+        results = [
+            trend.calc(client, "005930", days=60, timeframe="daily", bars=bars),
+            elder.calc(client, "005930", days=52, timeframe="weekly", bars=bars),
+            demark.calc(client, "005930", days=12, timeframe="monthly", bars=bars),
+        ]
+        assert all(r["ok"] for r in results)
+        assert client.get_daily_chart.call_count == 1
+        assert [len(r["data"]["dates"]) for r in results] == [60, 52, 12]
+
+    @pytest.mark.parametrize("timeframe", ["weekly", "monthly"])
+    def test_calc_accepts_any_timeframe(self, client, timeframe):
+        for module in (trend, elder, demark):
+            result = module.calc(client, "005930", days=10, timeframe=timeframe)
+            assert result["ok"], module.__name__
+            assert result["data"]["timeframe"] == timeframe
+
+    def test_load_error(self, client):
+        client.get_daily_chart.return_value = ApiResponse(
+            ok=False, error={"code": "API_ERROR", "msg": "오류"},
+        )
+        assert multiframe.load(client, "005930")["ok"] is False
@@ -2,7 +2,7 @@
 
 import pytest
 
-from stock_analyzer.client.kiwoom import ApiResponse
+from stock_analyzer.client.kiwoom import ApiResponse, KiwoomClient
 from stock_analyzer.stock import ohlcv
 
 
@@ -47,6 +47,100 @@ class TestGetDaily:
         assert result["error"]["code"] == "NO_DATA"
 
 
+class TestPagination:
+    """Tests for cont-yn/next-key paging of chart data."""
+
+    @staticmethod
+    def _pages(mock_client, pages):
+        """Serve chart pages keyed by next-key."""
+
+        def side_effect(
+            ticker, start_date, end_date, adj_price="1", cont_yn="", next_key=""
+        ):
+            return pages[next_key]
+
+        mock_client.get_daily_chart.side_effect = side_effect
+
+    @staticmethod
+    def _page(dates, next_key=""):
+        rows = [{"dt": dt, "cur_prc": "1000", "trde_qty": "10"} for dt in dates]
+        return ApiResponse(
+            ok=True,
+            data={"stk_dt_pole_chart_qry": rows, "return_code": 0},
+            has_next=bool(next_key),
+            next_key=next_key,
+        )
+
+    def test_follows_next_key(self, mock_kiwoom_client):
+        """Test pages are concatenated until start_date is reached."""
+        self._pages(mock_kiwoom_client, {
+            "": self._page(["20250110", "20250109"], "k1"),
+            "k1": self._page(["20250108", "20250107"], "k2"),
+            "k2": self._page(["20250106", "20250103"], "k3"),
+        })
+        result = ohlcv.get_daily(
+            mock_kiwoom_client, "005930", start_date="20250107", end_date="20250110"
+        )
+        assert result["ok"] is True
+        assert result["data"]["dates"] == [
+            "20250110", "20250109", "20250108", "20250107"
+        ]
+        # Third page is not needed: second page already reaches start_date
+        assert mock_kiwoom_client.get_daily_chart.call_count == 2
+
+    def test_stops_when_start_crossed(self, mock_kiwoom_client):
+        """Test no page is fetched after start_date is crossed."""
+        self._pages(mock_kiwoom_client, {
+            "": self._page(["20250110", "20250109"], "k1"),
+            "k1": self._page(["20250108", "20250106"], "k2"),
+        })
+        result = ohlcv.get_daily(
+            mock_kiwoom_client, "005930", start_date="20250107", end_date="20250110"
+        )
+        assert len(result["data"]["dates"]) == 4
+        assert mock_kiwoom_client.get_daily_chart.call_count == 2
+        last_call = mock_kiwoom_client.get_daily_chart.call_args_list[-1]
+        assert last_call.kwargs["cont_yn"] == "Y"
+        assert last_call.kwargs["next_key"] == "k1"
+
+    def test_page_error(self, mock_kiwoom_client):
+        """Test error on a later page is returned."""
+        self._pages(mock_kiwoom_client, {
+            "": self._page(["20250110", "20250109"], "k1"),
+            "k1": ApiResponse(
+                ok=False, error={"code": "TIMEOUT", "msg": "Request timeout"}
+            ),
+        })
+        result = ohlcv.get_daily(
+            mock_kiwoom_client, "005930", start_date="20240101", end_date="20250110"
+        )
+        assert result["ok"] is False
+        assert result["error"]["code"] == "TIMEOUT"
+
+    def test_iter_pages_max_rows(self):
+        """Test iter_pages stops once max_rows rows were yielded."""
+        pages = {
+            "": self._page(["20250110", "20250109"], "k1"),
+            "k1": self._page(["20250108", "20250107"], "k2"),
+        }
+        fetched = list(KiwoomClient.iter_pages(
+            lambda cont_yn, next_key: pages[next_key],
+            "stk_dt_pole_chart_qry",
+            max_rows=2,
+        ))
+        assert len(fetched) == 1
+
+    def test_iter_pages_max_pages(self):
+        """Test iter_pages respects the page limit."""
+        endless = self._page(["20250110"], "same")
+        fetched = list(KiwoomClient.iter_pages(
+            lambda cont_yn, next_key: endless,
+            "stk_dt_pole_chart_qry",
+            max_pages=3,
+        ))
+        assert len(fetched) == 3
+
+
 class TestGetWeekly:
     """Tests for get_weekly function."""
 
@@ -161,6 +255,34 @@ class TestResampleToWeekly:
         assert result["dates"][1] == "20250110"
 
 
+    def test_incremental_recomputes_newest_week(self):
+        """Test previous result is extended with a new daily bar."""
+        dates = ["20250113", "20250110", "20250109", "20250103"]
+        opens = [300, 100, 101, 50]
+        highs = [330, 110, 111, 55]
+        lows = [290, 90, 91, 45]
+        closes = [310, 105, 106, 52]
+        volumes = [3000, 1000, 1100, 500]
+
+        previous = ohlcv.resample_to_weekly(
+            dates[1:], opens[1:], highs[1:], lows[1:], closes[1:], volumes[1:],
+        )
+        # Monday bar starts a new week; then revise it intraday
+        result = ohlcv.resample_to_weekly(
+            dates, opens, highs, lows, closes, volumes, previous=previous,
+        )
+        assert result == ohlcv.resample_to_weekly(
+            dates, opens, highs, lows, closes, volumes,
+        )
+        assert result["dates"] == ["20250113", "20250110", "20250103"]
+
+        closes[0] = 320
+        result = ohlcv.resample_to_weekly(
+            dates, opens, highs, lows, closes, volumes, previous=result,
+        )
+        assert result["close"] == [320, 105, 52]
+
+
 class TestResampleToMonthly:
     """Tests for resample_to_monthly function."""
 
@@ -206,3 +328,24 @@ class TestResampleToMonthly:
         # Newest month first
         assert result["dates"][0] == "20250115"
         assert result["dates"][1] == "20241220"
+
+    def test_incremental_updates_partial_month(self):
+        """Test a new bar in the same month updates only the newest bar."""
+        dates = ["20250116", "20250115", "20250110", "20241220"]
+        opens = [300, 200, 201, 100]
+        highs = [330, 220, 221, 120]
+        lows = [170, 180, 181, 80]
+        closes = [310, 210, 211, 110]
+        volumes = [3000, 2000, 2100, 1000]
+
+        previous = ohlcv.resample_to_monthly(
+            dates[1:], opens[1:], highs[1:], lows[1:], closes[1:], volumes[1:],
+        )
+        result = ohlcv.resample_to_monthly(
+            dates, opens, highs, lows, closes, volumes, previous=previous,
+        )
+        assert result["dates"] == ["20250116", "20241220"]
+        assert result["high"][0] == 330
+        assert result["low"][0] == 170
+        assert result["volume"][0] == 7100
+        assert result["open"][0] == 201
@@ -0,0 +1,204 @@
+"""Tests for token-bucket rate limiter."""
+
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from stock_analyzer.client.kiwoom import KiwoomClient
+from stock_analyzer.core.rate_limit import BucketConfig, RateLimiter, TokenBucket
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    def test_burst_then_wait(self):
+        """Test burst calls are free and later calls queue up."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2, burst=3, clock=clock)
+
+        assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert bucket.reserve() == pytest.approx(0.5)
+        assert bucket.reserve() == pytest.approx(1.0)
+
+    def test_refill(self):
+        """Test tokens refill over time up to burst."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2, burst=2, clock=clock)
+        bucket.reserve()
+        bucket.reserve()
+
+        clock.advance(0.5)
+        assert bucket.reserve() == 0.0
+        clock.advance(100)
+        assert bucket.available() == pytest.approx(2.0)
+
+    def test_reserve_later_keeps_earlier_gap(self):
+        """Test a claim for a later send time leaves earlier tokens free."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1, burst=1, clock=clock)
+
+        assert bucket.reserve(at=5.0) == pytest.approx(5.0)
+        assert bucket.ready_at() == 0.0
+        waits = [bucket.reserve() for _ in range(6)]
+        assert waits == pytest.approx([0.0, 1.0, 2.0, 3.0, 4.0, 6.0])
+
+        assert bucket.available() == pytest.approx(-6.0)
+        clock.advance(10)
+        assert bucket.available() == pytest.approx(1.0)
+
+    def test_unlimited(self):
+        """Test zero rate never waits."""
+        bucket = TokenBucket(rate=0)
+        assert all(bucket.reserve() == 0.0 for _ in range(100))
+
+    def test_invalid_burst(self):
+        """Test burst must be positive."""
+        with pytest.raises(ValueError):
+            TokenBucket(rate=1, burst=0)
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter."""
+
+    def test_per_key_buckets_independent(self):
+        """Test a throttled key does not delay other keys."""
+        clock = FakeClock()
+        limiter = RateLimiter(
+            BucketConfig(rate=100, burst=100),
+            {"ka10081": BucketConfig(rate=1, burst=1)},
+            clock=clock,
+        )
+
+        assert limiter.reserve("ka10081") == 0.0
+        assert limiter.reserve("ka10081") == pytest.approx(1.0)
+        assert limiter.reserve("ka10001") == 0.0
+
+    def test_global_bucket_caps_all_keys(self):
+        """Test global bucket applies across keys."""
+        clock = FakeClock()
+        limiter = RateLimiter(BucketConfig(rate=1, burst=1), clock=clock)
+
+        assert limiter.reserve("ka10081") == 0.0
+        assert limiter.reserve("ka10001") == pytest.approx(1.0)
+
+    def test_global_quota_charged_at_send_time(self):
+        """Test calls queued on a key bucket never overrun the account quota."""
+        clock = FakeClock()
+        limiter = RateLimiter(
+            BucketConfig(rate=5, burst=5),
+            {"ka10081": BucketConfig(rate=1, burst=1)},
+            clock=clock,
+        )
+
+        # 10 chart calls queue on their 1/s bucket, other traffic keeps going
+        charts = [limiter.reserve("ka10081") for _ in range(10)]
+        others = []
+        for _ in range(60):
+            others.append(clock.now + limiter.reserve("ka10001"))
+            clock.advance(0.1)
+
+        assert charts == pytest.approx([float(n) for n in range(10)])
+        assert others[0] == 0.0  # Queued chart calls hold back no other API
+
+        def assert_conforms(times, rate, burst):
+            times = sorted(times)
+            for i in range(len(times)):
+                for j in range(i, len(times)):
+                    allowed = burst + rate * (times[j] - times[i]) + 1e-6
+                    assert j - i + 1 <= allowed
+
+        assert_conforms(charts + others, rate=5, burst=5)
+
+    def test_key_default(self):
+        """Test key_default creates a bucket for every key."""
+        clock = FakeClock()
+        limiter = RateLimiter(
+            BucketConfig(rate=0),
+            key_default=BucketConfig(rate=1, burst=1),
+            clock=clock,
+        )
+
+        assert limiter.reserve("a") == 0.0
+        assert limiter.reserve("b") == 0.0
+        assert limiter.reserve("a") == pytest.approx(1.0)
+
+    def test_acquire_sleeps_for_wait(self):
+        """Test acquire sleeps for the reserved wait."""
+        clock = FakeClock()
+        sleep = Mock()
+        limiter = RateLimiter(BucketConfig(rate=4, burst=1), clock=clock, sleep=sleep)
+
+        limiter.acquire()
+        sleep.assert_not_called()
+        limiter.acquire()
+        sleep.assert_called_once_with(pytest.approx(0.25))
+
+    def test_waiters_do_not_serialize(self):
+        """Test concurrent waiters sleep in parallel, not one after another."""
+        limiter = RateLimiter(BucketConfig(rate=20, burst=1))
+        threads = [threading.Thread(target=limiter.acquire) for _ in range(5)]
+
+        start = time.monotonic()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        elapsed = time.monotonic() - start
+
+        # 4 queued calls at 20/s -> ~0.2s total
+        assert elapsed < 0.6
+
+
+class TestKiwoomClientRateLimit:
+    """Tests for KiwoomClient rate limit settings."""
+
+    def test_default_limits(self):
+        """Test default account-wide bucket."""
+        client = KiwoomClient("key", "secret")
+        assert client.rate_limiter._global.rate == 5.0
+        assert client.rate_limiter._global.burst == 5
+        assert client.rate_limiter._bucket("ka10081").rate == 2.0
+        assert client.rate_limiter._bucket("ka10099") is None
+
+        client = KiwoomClient("key", "secret", api_limits={})
+        assert client.rate_limiter._bucket("ka10081") is None
+
+    def test_min_interval_compat(self):
+        """Test min_interval maps to a single-token bucket."""
+        client = KiwoomClient("key", "secret", min_interval=0.5)
+        assert client.rate_limiter._global.rate == pytest.approx(2.0)
+        assert client.rate_limiter._global.burst == 1
+
+        client = KiwoomClient("key", "secret", min_interval=0)
+        assert client.rate_limiter._global.unlimited is True
+        assert client.rate_limiter._bucket("ka10081") is None
+
+    def test_api_limits_used_by_call(self):
+        """Test _call acquires capacity for its api_id."""
+        limiter = Mock(spec=RateLimiter)
+        client = KiwoomClient("key", "secret", rate_limiter=limiter)
+        client.auth = Mock()
+        client.auth.get_token.return_value = Mock(bearer="Bearer t")
+        resp = Mock(status_code=200, headers={})
+        resp.json.return_value = {"return_code": 0}
+        client.transport = Mock()
+        client.transport.post.return_value = resp
+
+        client.get_stock_info("005930")
+
+        limiter.acquire.assert_called_once_with("ka10001")
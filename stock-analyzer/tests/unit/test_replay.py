@@ -0,0 +1,131 @@
+"""Tests for the mock API server and record/replay transports."""
+
+import json
+
+import pytest
+
+from stock_analyzer.client.kiwoom import KiwoomClient
+from stock_analyzer.client.mock_server import MockConfig, MockServer
+from stock_analyzer.client.replay import (
+    REDACTED,
+    RecordingTransport,
+    ReplayTransport,
+)
+from stock_analyzer.core.http import SessionTransport
+from stock_analyzer.indicator import trend
+from stock_analyzer.stock import analysis, multiframe, ohlcv
+
+
+def _client(base_url, transport=None, **kwargs):
+    return KiwoomClient(
+        "key", "secret", base_url=base_url, min_interval=0,
+        retry_base_delay=0, transport=transport, **kwargs,
+    )
+
+
+@pytest.fixture
+def server():
+    with MockServer(MockConfig(page_size=50, history_days=400)) as server:
+        yield server
+
+
+class TestMockServer:
+    """Tests for the mock Kiwoom API."""
+
+    def test_chart_pagination(self, server):
+        client = _client(server.url)
+        result = ohlcv.get_frame(client, "005930", "daily", days=300)
+        assert result["ok"]
+        frame = result["data"]
+        assert len(frame) > 150
+        assert (frame.dates[:-1] > frame.dates[1:]).all()  # Newest first
+        assert server.stats()["ka10081"] >= 4
+
+    def test_data_is_deterministic(self, server):
+        client = _client(server.url)
+        first = client.get_daily_chart("005930", "", "20250110")
+        second = client.get_daily_chart("005930", "", "20250110")
+        assert first.data == second.data
+        assert first.has_next and first.next_key == "50"
+
+    def test_injected_429_is_retried(self):
+        config = MockConfig(error_rate=0.3, seed=3, history_days=100)
+        with MockServer(config) as server:
+            client = _client(server.url, max_retries=10)
+            for ticker in ("005930", "000660", "035420"):
+                assert client.get_stock_info(ticker).ok
+            assert server.stats()["throttled"] > 0
+
+    def test_rate_limit_exceeded(self):
+        with MockServer(MockConfig(error_rate=1.0)) as server:
+            resp = _client(server.url, max_retries=1).get_stock_info("005930")
+            assert resp.error["code"] == "RATE_LIMIT"
+
+    def test_unknown_api(self, server):
+        resp = _client(server.url).get_credit_trend()
+        assert resp.ok is False
+
+    def test_fetch_to_indicator_pipeline(self, server):
+        client = _client(server.url)
+        bars = multiframe.load(client, "005930", days=500)["data"]
+        assert trend.calc(client, "005930", days=20, bars=bars)["ok"]
+        assert analysis.analyze(client, "005930", days=30)["ok"]
+
+
+class TestReplay:
+    """Tests for cassette recording and replay."""
+
+    def test_record_then_replay_offline(self, server, tmp_path):
+        path = str(tmp_path / "cassette.json")
+        recorder = RecordingTransport(SessionTransport(), path)
+        live = ohlcv.get_frame(
+            _client(server.url, recorder), "005930", "daily", days=200,
+        )["data"]
+        recorder.close()
+
+        replay = ReplayTransport(path)
+        # Base URL differs: only the path and api-id/continuation matter
+        offline = ohlcv.get_frame(
+            _client("http://offline.invalid", replay), "005930", "daily", days=200,
+        )["data"]
+        assert offline.to_dict() == live.to_dict()
+        assert replay.stats() == {"requests": server.stats()["requests"], "misses": 0}
+
+    def test_continuation_headers_recorded(self, server, tmp_path):
+        path = str(tmp_path / "cassette.json")
+        recorder = RecordingTransport(SessionTransport(), path)
+        _client(server.url, recorder).get_daily_chart("005930", "", "20250110")
+        recorder.close()
+
+        with open(path, encoding="utf-8") as f:
+            items = json.load(f)["interactions"]
+        token, chart = items
+        assert token["response"]["json"]["token"] == REDACTED
+        assert token["request"]["body"]["secretkey"] == REDACTED
+        assert chart["response"]["headers"]["cont-yn"] == "Y"
+        assert chart["response"]["headers"]["next-key"] == "50"
+
+    def test_repeated_request_replays_in_order(self, tmp_path):
+        path = str(tmp_path / "cassette.json")
+        with MockServer(MockConfig(error_rate=0.5, seed=1)) as server:
+            recorder = RecordingTransport(SessionTransport(), path)
+            client = _client(server.url, recorder, max_retries=10)
+            assert client.get_stock_info("005930").ok
+            recorder.close()
+            throttled = server.stats().get("throttled", 0)
+
+        replay = ReplayTransport(path)
+        assert _client("http://offline.invalid", replay).get_stock_info("005930").ok
+        # au10001 plus every recorded 429 and the final success
+        assert replay.stats()["requests"] == throttled + 2
+
+    def test_miss_is_network_error(self, server, tmp_path):
+        path = str(tmp_path / "cassette.json")
+        recorder = RecordingTransport(SessionTransport(), path)
+        _client(server.url, recorder).get_stock_info("005930")
+        recorder.close()
+
+        client = _client("http://offline.invalid", ReplayTransport(path))
+        assert client.get_stock_info("005930").ok
+        resp = client.get_stock_info("000660")  # Never recorded
+        assert resp.error["code"] == "NETWORK_ERROR"
@@ -0,0 +1,348 @@
+"""Tests for rolling-window kernels and the vectorized trend indicators."""
+
+import math
+import random
+from typing import List, Optional
+
+import numpy as np
+import pytest
+
+from stock_analyzer.indicator import trend
+from stock_analyzer.indicator.rolling import (
+    ema,
+    rolling_max,
+    rolling_mean,
+    rolling_min,
+    rolling_std,
+    rolling_sum,
+)
+from stock_analyzer.indicator.trend import (
+    FG_MIN_CALC_PERIOD,
+    FG_MOMENTUM_DIVISOR,
+    FG_MOMENTUM_MAX,
+    FG_MOMENTUM_MIN,
+    FG_MOMENTUM_SMOOTHING_PERIOD,
+    FG_POSITION_MAX,
+    FG_POSITION_MIN,
+    FG_VOLUME_MAX,
+    FG_VOLUME_MIN,
+    FG_VOLUME_SMOOTHING_PERIOD,
+    FG_WEIGHT_MOMENTUM,
+    FG_WEIGHT_POSITION,
+    FG_WEIGHT_VOLUME_SPIKE,
+    FG_WEIGHT_VOLUME_SURGE,
+)
+
+# ========== Pure-Python reference implementations (previous trend.py) ==========
+
+def _ref_ma(prices: List[int], period: int) -> List[Optional[int]]:
+    result = []
+    for i in range(len(prices)):
+        if i + period > len(prices):
+            result.append(None)
+        else:
+            window = prices[i : i + period]
+            result.append(int(sum(window) / period))
+    return result
+
+
+def _ref_cmf(
+    highs: List[int],
+    lows: List[int],
+    closes: List[int],
+    volumes: List[int],
+    period: int = 20,
+) -> List[float]:
+    result = []
+
+    # Calculate Money Flow Multiplier and Volume
+    mfv = []
+    for i in range(len(closes)):
+        hl_range = highs[i] - lows[i]
+        if hl_range == 0:
+            mfv.append(0.0)
+        else:
+            mfm = ((closes[i] - lows[i]) - (highs[i] - closes[i])) / hl_range
+            mfv.append(mfm * volumes[i])
+
+    # Calculate CMF for each period
+    for i in range(len(closes)):
+        if i + period > len(closes):
+            result.append(0.0)
+        else:
+            sum_mfv = sum(mfv[i : i + period])
+            sum_vol = sum(volumes[i : i + period])
+            if sum_vol == 0:
+                result.append(0.0)
+            else:
+                cmf_value = sum_mfv / sum_vol
+                result.append(round(cmf_value, 4))
+
+    return result
+
+
+def _ref_fear_greed(
+    closes: List[int],
+    volumes: List[int],
+) -> List[float]:
+
+    n = len(closes)
+    result = [0.0] * n
+
+    if n < 52:
+        return result
+
+    # Process in chronological order
+    closes_chrono = list(reversed(closes))
+    volumes_chrono = list(reversed(volumes))
+
+    # Calculate components
+    momentum5 = [0.0] * n
+    pos52 = [0.0] * n
+    vol_surge = [1.0] * n
+    vol_spike = [1.0] * n
+    returns = [0.0] * n
+
+    for i in range(n):
+        # Momentum5: log return over 5 periods * 100
+        if i >= 5 and closes_chrono[i] > 0 and closes_chrono[i - 5] > 0:
+            log_ret = math.log(closes_chrono[i]) - math.log(closes_chrono[i - 5])
+            momentum5[i] = log_ret * 100
+
+        # Pos52: Position within 52-day range
+        if i >= 51:
+            window = closes_chrono[max(0, i - 51) : i + 1]
+            low52 = min(window)
+            high52 = max(window)
+            if high52 > low52:
+                pos52[i] = (closes_chrono[i] - low52) / (high52 - low52)
+            else:
+                pos52[i] = 0.5
+        else:
+            # Use available data
+            window = closes_chrono[: i + 1]
+            if window:
+                low_val = min(window)
+                high_val = max(window)
+                if high_val > low_val:
+                    pos52[i] = (closes_chrono[i] - low_val) / (high_val - low_val)
+                else:
+                    pos52[i] = 0.5
+
+        # Returns for volatility calculation
+        if i >= 1 and closes_chrono[i - 1] > 0:
+            prev = closes_chrono[i - 1]
+            returns[i] = (closes_chrono[i] - prev) / prev
+
+    # VolSurge: recent 5-day avg volume / past 20-day avg volume
+    for i in range(n):
+        if i >= 20:
+            recent_vol = sum(volumes_chrono[i - 4 : i + 1]) / 5
+            past_vol = sum(volumes_chrono[i - 19 : i + 1]) / 20
+            if past_vol > 0:
+                vol_surge[i] = max(0, min(3, recent_vol / past_vol))
+        elif i >= 5:
+            recent_vol = sum(volumes_chrono[: i + 1]) / (i + 1)
+            if recent_vol > 0:
+                vol_surge[i] = 1.0
+
+    # VolSpike: recent 5-day volatility / past 20-day volatility
+    for i in range(n):
+        if i >= 20:
+            recent_returns = returns[i - 4 : i + 1]
+            past_returns = returns[i - 19 : i + 1]
+
+            recent_std = _ref_std(recent_returns)
+            past_std = _ref_std(past_returns)
+
+            if past_std > 0:
+                vol_spike[i] = max(0, min(3, recent_std / past_std))
+        elif i >= 5:
+            vol_spike[i] = 1.0
+
+    # Calculate FG with smoothing (using module-level constants)
+    fg_chrono = [0.0] * n
+    momentum_window_offset = FG_MOMENTUM_SMOOTHING_PERIOD - 1
+    volume_window_offset = FG_VOLUME_SMOOTHING_PERIOD - 1
+
+    for i in range(n):
+        if i < FG_MIN_CALC_PERIOD:
+            fg_chrono[i] = 0.0
+            continue
+
+        # Smoothed momentum (7-period mean, then /10)
+        m_window = momentum5[max(0, i - momentum_window_offset) : i + 1]
+        m = (sum(m_window) / len(m_window) / FG_MOMENTUM_DIVISOR) if m_window else 0
+        m = max(FG_MOMENTUM_MIN, min(FG_MOMENTUM_MAX, m))
+
+        # Smoothed position (7-period mean, then *2 - 1)
+        p_window = pos52[max(0, i - momentum_window_offset) : i + 1]
+        p = (2 * sum(p_window) / len(p_window) - 1) if p_window else 0
+        p = max(FG_POSITION_MIN, min(FG_POSITION_MAX, p))
+
+        # Smoothed volume surge (10-period mean, then -1)
+        v_window = vol_surge[max(0, i - volume_window_offset) : i + 1]
+        v = (sum(v_window) / len(v_window) - 1) if v_window else 0
+        v = max(FG_VOLUME_MIN, min(FG_VOLUME_MAX, v))
+
+        # Smoothed volatility spike (10-period mean, then -1, negative)
+        vs_window = vol_spike[max(0, i - volume_window_offset) : i + 1]
+        vs = -((sum(vs_window) / len(vs_window) - 1)) if vs_window else 0
+        vs = max(FG_VOLUME_MIN, min(FG_VOLUME_MAX, vs))
+
+        # Final FG = weighted sum of components
+        fg_chrono[i] = (
+            FG_WEIGHT_MOMENTUM * m
+            + FG_WEIGHT_POSITION * p
+            + FG_WEIGHT_VOLUME_SURGE * v
+            + FG_WEIGHT_VOLUME_SPIKE * vs
+        )
+
+    # Reverse back to newest-first order
+    result = list(reversed(fg_chrono))
+    return result
+
+
+def _ref_std(values: List[float]) -> float:
+    if len(values) < 2:
+        return 0.0
+    mean = sum(values) / len(values)
+    variance = sum((x - mean) ** 2 for x in values) / len(values)
+    return variance ** 0.5
+
+
+# ========== Fixtures ==========
+
+
+def _series(n: int, seed: int):
+    """Seeded random-walk OHLCV series (newest first) with flat and halted stretches."""
+    rng = random.Random(seed)
+    price = 50000
+    closes, highs, lows, volumes = [], [], [], []
+    for i in range(n):
+        if 100 <= i < 130:
+            # Trading halt: flat price, zero volume
+            volume = 0
+        else:
+            price = max(100, int(price * (1 + rng.gauss(0, 0.02))))
+            volume = rng.randint(0, 20_000_000)
+        spread = 0 if volume == 0 else rng.randint(0, price // 20)
+        closes.append(price)
+        highs.append(price + spread)
+        lows.append(price - rng.randint(0, spread) if spread else price)
+        volumes.append(volume)
+    return closes[::-1], highs[::-1], lows[::-1], volumes[::-1]
+
+
+SERIES = [_series(n, seed) for n, seed in [(60, 1), (260, 2), (1200, 3), (2500, 4)]]
+
+
+# ========== Kernel tests ==========
+
+
+class TestRollingKernels:
+    """Tests for rolling kernels against naive windows."""
+
+    @pytest.mark.parametrize("window", [1, 3, 20, 52])
+    def test_against_naive(self, window):
+        """Test kernels match direct window computations."""
+        rng = np.random.default_rng(7)
+        x = rng.integers(-1000, 1000, 300)
+        for i in range(len(x)):
+            win = x[max(0, i - window + 1) : i + 1]
+            assert rolling_sum(x, window, min_periods=1)[i] == win.sum()
+            mean = rolling_mean(x, window, min_periods=1)[i]
+            assert mean == pytest.approx(win.mean())
+            assert rolling_min(x, window, min_periods=1)[i] == win.min()
+            assert rolling_max(x, window, min_periods=1)[i] == win.max()
+            std = rolling_std(x, window, min_periods=1)[i]
+            assert std == pytest.approx(win.std(), abs=1e-9)
+
+    def test_min_periods(self):
+        """Test short windows are NaN by default."""
+        out = rolling_sum([1, 2, 3, 4], 3)
+        assert np.isnan(out[:2]).all()
+        assert out[2:].tolist() == [6.0, 9.0]
+
+    def test_flat_window_std_is_zero(self):
+        """Test constant windows give exactly zero std."""
+        out = rolling_std([0.0] * 10 + [0.5, 0.1], 5)
+        assert (out[4:10] == 0.0).all()
+
+    def test_invalid_window(self):
+        """Test invalid window arguments."""
+        with pytest.raises(ValueError):
+            rolling_sum([1, 2], 0)
+        with pytest.raises(ValueError):
+            rolling_mean([1, 2], 2, min_periods=3)
+
+    def test_short_input(self):
+        """Test input shorter than window."""
+        assert np.isnan(rolling_max([3, 1], 5)).all()
+        assert rolling_max([3, 1], 5, min_periods=1).tolist() == [3.0, 3.0]
+
+    def test_ema_matches_loop(self):
+        """Test EMA gives the same floats as the seeded Python loop."""
+        values = np.random.default_rng(3).integers(1000, 90000, 200)
+        alpha = 2 / (13 + 1)
+        expected = [float(values[0])]
+        for value in values[1:].tolist():
+            expected.append(alpha * value + (1 - alpha) * expected[-1])
+        assert ema(values, 13).tolist() == expected
+        assert ema([], 13).tolist() == []
+
+
+# ========== Trend parity tests ==========
+
+
+class TestTrendParity:
+    """Tests that vectorized trend kernels reproduce the pure-Python outputs."""
+
+    @pytest.mark.parametrize("series", SERIES)
+    @pytest.mark.parametrize("period", [5, 10, 20, 60])
+    def test_ma_identical(self, series, period):
+        """Test MA values are identical."""
+        closes = series[0]
+        assert trend._calc_ma(closes, period) == _ref_ma(closes, period)
+
+    @pytest.mark.parametrize("series", SERIES)
+    @pytest.mark.parametrize("period", [4, 20])
+    def test_cmf_identical(self, series, period):
+        """Test CMF values are identical."""
+        closes, highs, lows, volumes = series
+        assert trend._calc_cmf(highs, lows, closes, volumes, period) == _ref_cmf(
+            highs, lows, closes, volumes, period
+        )
+
+    @pytest.mark.parametrize("series", SERIES)
+    def test_fear_greed_matches(self, series):
+        """Test Fear/Greed matches within float rounding."""
+        closes, _, _, volumes = series
+        expected = _ref_fear_greed(closes, volumes)
+        for func in (trend._calc_fear_greed, trend._calc_fear_greed_weekly):
+            result = func(closes, volumes)
+            assert len(result) == len(expected)
+            assert all(isinstance(v, float) for v in result)
+            assert np.allclose(result, expected, rtol=0, atol=1e-9)
+
+    def test_fear_greed_short(self):
+        """Test short input returns zeros."""
+        assert trend._calc_fear_greed([100] * 10, [1] * 10) == [0.0] * 10
+
+    @pytest.mark.parametrize("series", SERIES[1:])
+    def test_calc_from_ohlcv_labels_identical(self, series):
+        """Test trend labels and signals are unchanged."""
+        closes, highs, lows, volumes = series
+        dates = [str(i) for i in range(len(closes))]
+        result = trend.calc_from_ohlcv(
+            "005930", dates, closes, highs, lows, volumes
+        )["data"]
+
+        ma5, ma20, ma60 = (_ref_ma(closes, p) for p in (5, 20, 60))
+        cmf = _ref_cmf(highs, lows, closes, volumes, 20)
+        fg = _ref_fear_greed(closes, volumes)
+        ma_signal = trend._calc_ma_signal(ma5, ma20, ma60)
+
+        assert result["ma_signal"] == ma_signal
+        assert result["cmf"] == cmf
+        assert result["trend"] == trend._calc_trend(ma_signal, cmf, fg)
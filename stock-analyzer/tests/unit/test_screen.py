@@ -0,0 +1,203 @@
+"""Tests for the universe screener."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from stock_analyzer.client.kiwoom import KiwoomClient
+from stock_analyzer.client.mock_server import MockConfig, MockServer
+from stock_analyzer.indicator import demark, lookback, trend
+from stock_analyzer.screen import (
+    Field,
+    compute,
+    fetch,
+    load_universe,
+    parse_field,
+    parse_rule,
+    screen,
+)
+from stock_analyzer.screen.__main__ import main
+from stock_analyzer.screen.rules import rank
+from stock_analyzer.stock import multiframe
+
+
+def _client(base_url):
+    return KiwoomClient("key", "secret", base_url=base_url, min_interval=0)
+
+
+@pytest.fixture(scope="module")
+def server():
+    with MockServer(MockConfig(stocks=8, history_days=600)) as server:
+        yield server
+
+
+class TestRules:
+    def test_parse_field_default_timeframe(self):
+        assert parse_field("demark.buy_setup") == Field("daily", "demark", "buy_setup")
+        assert parse_field("weekly.trend.ma_signal").key == "weekly.trend.ma_signal"
+
+    @pytest.mark.parametrize("text", [
+        "hourly.trend.ma_signal",
+        "daily.rsi.value",
+        "daily.trend.color",
+        "weekly.oscillator.oscillator",
+        "weekly.trend.ma60",
+        "trend",
+    ])
+    def test_parse_field_invalid(self, text):
+        with pytest.raises(ValueError):
+            parse_field(text)
+
+    def test_parse_rule(self):
+        rule = parse_rule("weekly.elder.color == green")
+        assert rule.field.key == "weekly.elder.color"
+        assert (rule.op, rule.value) == ("==", "green")
+        assert parse_rule("daily.demark.buy_setup>=9").value == 9
+        assert parse_rule("trend.cmf<-0.1").value == -0.1
+
+    def test_parse_rule_invalid(self):
+        with pytest.raises(ValueError):
+            parse_rule("daily.demark.buy_setup ~ 9")
+
+    def test_matches(self):
+        values = {"daily.demark.buy_setup": 9, "weekly.elder.color": "green"}
+        assert parse_rule("demark.buy_setup>=9").matches(values)
+        assert not parse_rule("demark.buy_setup>9").matches(values)
+        assert parse_rule("weekly.elder.color==green").matches(values)
+        # Missing fields and label/number mismatches never match
+        assert not parse_rule("weekly.trend.ma_signal==1").matches(values)
+        assert not parse_rule("weekly.elder.color==1").matches(values)
+
+    def test_rank(self):
+        field = Field("daily", "trend", "cmf")
+        rows = [
+            {"ticker": "a", "values": {field.key: 0.1}},
+            {"ticker": "b", "values": {field.key: None}},
+            {"ticker": "c", "values": {field.key: 0.3}},
+            {"ticker": "d", "values": {field.key: 0.1}},
+        ]
+        assert [r["ticker"] for r in rank(rows, field)] == ["c", "a", "d", "b"]
+        assert [r["ticker"] for r in rank(rows, field, descending=False)] == [
+            "a", "d", "c", "b",
+        ]
+        assert rank(rows, None) == rows
+
+
+class TestEngine:
+    def test_load_universe_from_master(self, server):
+        result = load_universe(_client(server.url))
+        assert result["ok"]
+        assert len(result["data"]) == 8
+        ticker, name = result["data"][0]
+        assert len(ticker) == 6 and name
+
+    def test_load_universe_from_condition(self, server):
+        found = {
+            "ok": True,
+            "data": {
+                "condition": {"idx": "001", "name": "골든크로스"},
+                "stocks": [
+                    {"ticker": "005930", "name": "삼성전자", "price": 1, "change": 0},
+                ],
+            },
+        }
+        with patch("stock_analyzer.search.condition.search_by_idx", return_value=found):
+            result = load_universe(_client(server.url), cond_idx="001")
+        assert result["data"] == [("005930", "삼성전자")]
+
+    def test_compute_matches_indicator_calc(self, server):
+        client = _client(server.url)
+        ticker, name = load_universe(client)["data"][0]
+        needs = [("demark", "daily"), ("trend", "weekly")]
+        days = lookback.plan([("demark", "daily", 1), ("trend", "weekly", 1)]).days
+
+        task = fetch(client, ticker, name, needs, days)
+        assert task["ok"]
+        result = compute(task["data"], needs)
+        assert result["ok"]
+        values = result["data"]["values"]
+
+        bars = multiframe.load(client, ticker, days=days)["data"]
+        expected_trend = trend.calc(client, ticker, 1, "weekly", bars=bars)["data"]
+        expected_demark = demark.calc(client, ticker, 1, "daily", bars=bars)["data"]
+        assert values["weekly.trend.ma_signal"] == expected_trend["ma_signal"][0]
+        assert values["weekly.trend.fear_greed"] == expected_trend["fear_greed"][0]
+        assert values["daily.demark.buy_setup"] == expected_demark["buy_setup"][0]
+        assert result["data"]["date"] == expected_demark["dates"][0]
+
+    def test_screen_requires_rule_or_rank(self, server):
+        result = screen(_client(server.url), [("005930", "")], [], workers=0)
+        assert result["error"]["code"] == "INVALID_ARG"
+
+    def test_screen_filters_and_ranks(self, server):
+        client = _client(server.url)
+        universe = load_universe(client)["data"]
+        rules = [parse_rule("daily.elder.color!=red")]
+        rank_by = parse_field("daily.oscillator.total_score")
+        matched = []
+        progress = []
+
+        result = screen(
+            client, universe, rules, rank_by=rank_by, workers=0,
+            on_match=matched.append, on_progress=progress.append,
+        )
+        assert result["ok"]
+        rows = result["data"]["results"]
+        stats = result["data"]["stats"]
+
+        assert stats["total"] == stats["done"] == 8
+        assert stats["matched"] == len(rows) == len(matched)
+        assert all(row["values"]["daily.elder.color"] != "red" for row in rows)
+        scores = [row["values"][rank_by.key] for row in rows]
+        assert scores == sorted(scores, reverse=True)
+        assert progress[-1]["done"] == 8 and progress[-1]["rate"] > 0
+
+    def test_process_pool_matches_inline(self, server):
+        client = _client(server.url)
+        universe = load_universe(client)["data"][:4]
+        rules = [parse_rule("weekly.trend.ma_signal>=-1")]
+
+        inline = screen(client, universe, rules, workers=0)["data"]["results"]
+        pooled = screen(client, universe, rules, workers=2)["data"]["results"]
+
+        key = lambda row: row["ticker"]  # noqa: E731
+        assert sorted(pooled, key=key) == sorted(inline, key=key)
+        assert len(inline) == 4
+
+    def test_fetch_error_is_counted(self, server):
+        client = _client(server.url)
+        rules = [parse_rule("daily.demark.buy_setup>=0")]
+        with patch(
+            "stock_analyzer.stock.multiframe.load",
+            return_value={"ok": False, "error": {"code": "API_ERROR", "msg": "x"}},
+        ):
+            result = screen(client, [("005930", "삼성전자")], rules, workers=0)
+        assert result["data"]["stats"]["errors"] == 1
+        assert result["data"]["results"] == []
+
+
+class TestCli:
+    def test_writes_matches_incrementally(self, server, tmp_path, monkeypatch, capsys):
+        monkeypatch.setenv("KIWOOM_APP_KEY", "key")
+        monkeypatch.setenv("KIWOOM_SECRET_KEY", "secret")
+        monkeypatch.setenv("STOCK_ANALYZER_TOKEN_DIR", str(tmp_path / "tokens"))
+        output = tmp_path / "screen.jsonl"
+
+        code = main([
+            "--base-url", server.url,
+            "--rule", "daily.demark.buy_setup>=0",
+            "--rank", "daily.demark.sell_setup",
+            "--limit", "3", "--workers", "0",
+            "--output", str(output), "--verbose",
+        ])
+
+        assert code == 0
+        text = output.read_text(encoding="utf-8")
+        lines = [json.loads(line) for line in text.splitlines()]
+        assert len(lines) == 3
+        assert "daily.demark.sell_setup" in capsys.readouterr().out
+
+    def test_invalid_rule(self):
+        with pytest.raises(SystemExit):
+            main(["--rule", "daily.nope.x==1"])
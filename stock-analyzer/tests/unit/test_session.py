@@ -0,0 +1,161 @@
+"""Tests for the request-memoizing Kiwoom session."""
+
+import threading
+import time
+from collections import Counter
+from datetime import date, timedelta
+from unittest.mock import Mock
+
+import pytest
+
+from stock_analyzer.client.kiwoom import KiwoomClient
+from stock_analyzer.client.session import KiwoomSession
+from stock_analyzer.core.http import HttpTransport
+from stock_analyzer.indicator import oscillator
+from stock_analyzer.stock import analysis, ohlcv
+
+
+class FakeTransport(HttpTransport):
+    """Transport answering by api-id and counting posts."""
+
+    def __init__(self, responses, delay=0.0):
+        self.responses = responses
+        self.delay = delay
+        self.posts = Counter()
+        self.closed = False
+        self._lock = threading.Lock()
+
+    def post(self, url, headers, json_data, timeout=None):
+        api_id = headers["api-id"]
+        with self._lock:
+            self.posts[api_id] += 1
+        if api_id != "au10001":
+            time.sleep(self.delay)
+        resp = Mock()
+        resp.status_code = 200
+        resp.headers = {}
+        resp.json.return_value = self.responses[api_id]
+        return resp
+
+    def close(self):
+        self.closed = True
+
+
+def _rows(n, make):
+    """n daily rows, newest first."""
+    last = date(2025, 3, 31)
+    return [make((last - timedelta(days=i)).strftime("%Y%m%d"), i) for i in range(n)]
+
+
+@pytest.fixture
+def transport(
+    mock_token_response,
+    mock_stock_info_response,
+    mock_investor_trend_response,
+    mock_chart_response,
+):
+    return FakeTransport({
+        "au10001": mock_token_response,
+        "ka10001": mock_stock_info_response,
+        "ka10059": mock_investor_trend_response,
+        "ka10081": mock_chart_response,
+    })
+
+
+@pytest.fixture
+def client(transport):
+    return KiwoomClient("key", "secret", min_interval=0, transport=transport)
+
+
+class TestKiwoomSession:
+    """Tests for KiwoomSession."""
+
+    def test_repeated_request_is_memoized(self, client, transport):
+        session = KiwoomSession(client)
+        first = session.get_stock_info("005930")
+        second = session.get_stock_info("005930")
+
+        assert first is second
+        assert transport.posts["ka10001"] == 1
+        stats = session.stats()
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+
+    def test_distinct_requests_are_not_shared(self, client, transport):
+        session = KiwoomSession(client)
+        session.get_stock_info("005930")
+        session.get_stock_info("000660")
+        assert transport.posts["ka10001"] == 2
+
+    def test_dashboard_fetches_each_request_once(self, client, transport):
+        """analyze + oscillator + daily chart share one set of API calls."""
+        transport.responses["ka10059"] = {
+            "stk_invsr_orgn": _rows(35, lambda dt, i: {
+                "dt": dt,
+                "mrkt_tot_amt": 328000000000000,
+                "frgnr_invsr": 1000 * (i % 7 - 3),
+                "orgn": 1000 * (i % 5 - 2),
+            }),
+            "return_code": 0,
+        }
+        transport.responses["ka10081"] = {
+            "stk_dt_pole_chart_qry": _rows(35, lambda dt, i: {
+                "dt": dt,
+                "open_pric": 54000 + i,
+                "high_pric": 55000 + i,
+                "low_pric": 53000 + i,
+                "cur_prc": 54500 + i,
+                "trde_qty": 1000000,
+            }),
+            "return_code": 0,
+        }
+        with KiwoomSession(client) as session:
+            assert analysis.analyze(session, "005930", days=30)["ok"]
+            assert oscillator.calc(session, "005930", days=30)["ok"]
+            assert ohlcv.get_daily(session, "005930", days=30)["ok"]
+
+        assert transport.posts["ka10001"] == 1
+        assert transport.posts["ka10059"] == 1
+        assert transport.posts["ka10081"] == 1
+
+    def test_concurrent_requests_are_coalesced(self, client, transport):
+        transport.delay = 0.05
+        session = KiwoomSession(client)
+        client.auth.get_token()  # Keep token fetch out of the race
+
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(session.get_stock_info("005930")),
+            )
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert transport.posts["ka10001"] == 1
+        assert len(results) == 8
+        assert all(r is results[0] for r in results)
+        stats = session.stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] + stats["coalesced"] == 7
+
+    def test_errors_are_not_memoized(self, client, transport):
+        transport.responses["ka10001"] = {"return_code": 1, "return_msg": "오류"}
+        session = KiwoomSession(client)
+
+        assert session.get_stock_info("005930").ok is False
+        assert session.get_stock_info("005930").ok is False
+        assert transport.posts["ka10001"] == 2
+        assert session.stats()["entries"] == 0
+
+    def test_close_keeps_client_open(self, client, transport):
+        session = KiwoomSession(client)
+        session.get_stock_info("005930")
+        session.close()
+
+        assert transport.closed is False
+        assert session.stats()["entries"] == 0
+        session.get_stock_info("005930")
+        assert transport.posts["ka10001"] == 2
@@ -0,0 +1,163 @@
+"""Tests for local OHLCV store."""
+
+import pytest
+
+from stock_analyzer.client.kiwoom import ApiResponse
+from stock_analyzer.stock import ohlcv
+from stock_analyzer.stock.frame import OhlcvFrame
+from stock_analyzer.stock.store import OhlcvStore
+
+
+def _series(dates, base=1000):
+    """Build a newest-first OHLCV dict."""
+    n = len(dates)
+    return {
+        "ticker": "005930",
+        "dates": list(dates),
+        "open": [base + i for i in range(n)],
+        "high": [base + 10 + i for i in range(n)],
+        "low": [base - 10 + i for i in range(n)],
+        "close": [base + 5 + i for i in range(n)],
+        "volume": [100 * (i + 1) for i in range(n)],
+    }
+
+
+def _chart_response(series):
+    """Build a ka10081 response from an OHLCV dict."""
+    rows = [
+        {
+            "dt": dt,
+            "open_pric": str(series["open"][i]),
+            "high_pric": str(series["high"][i]),
+            "low_pric": str(series["low"][i]),
+            "cur_prc": str(series["close"][i]),
+            "trde_qty": str(series["volume"][i]),
+        }
+        for i, dt in enumerate(series["dates"])
+    ]
+    return ApiResponse(ok=True, data={"stk_dt_pole_chart_qry": rows, "return_code": 0})
+
+
+class TestOhlcvStore:
+    """Tests for OhlcvStore."""
+
+    def test_save_load_roundtrip(self, tmp_path):
+        """Test saved series loads back unchanged."""
+        store = OhlcvStore(str(tmp_path))
+        data = _series(["20250110", "20250109", "20250108"])
+        store.save("005930", OhlcvFrame.from_dict(data))
+        assert store.load("005930").to_dict() == data
+
+    def test_adjusted_and_raw_separate(self, tmp_path):
+        """Test adjusted and raw prices are stored in separate files."""
+        store = OhlcvStore(str(tmp_path))
+        adjusted = OhlcvFrame.from_dict(_series(["20250110"], base=1000))
+        raw = OhlcvFrame.from_dict(_series(["20250110"], base=2000))
+        store.save("005930", adjusted, adj_price=True)
+        store.save("005930", raw, adj_price=False)
+
+        assert store.load("005930", adj_price=True).open.tolist() == [1000]
+        assert store.load("005930", adj_price=False).open.tolist() == [2000]
+        assert store.path("005930", adj_price=True) != store.path(
+            "005930", adj_price=False
+        )
+
+    def test_missing(self, tmp_path):
+        """Test loading a missing series returns None."""
+        store = OhlcvStore(str(tmp_path))
+        assert store.load("005930") is None
+        assert store.delete("005930") is False
+
+    def test_invalid_timeframe(self, tmp_path):
+        """Test unknown timeframe is rejected."""
+        with pytest.raises(ValueError):
+            OhlcvStore(str(tmp_path)).path("005930", "hourly")
+
+
+class TestStoreTopUp:
+    """Tests for get_daily with a store."""
+
+    def test_first_call_fills_store(self, tmp_path, mock_kiwoom_client):
+        """Test first call fetches and stores the series."""
+        store = OhlcvStore(str(tmp_path))
+        result = ohlcv.get_daily(mock_kiwoom_client, "005930", store=store)
+        assert result["ok"] is True
+        assert store.load("005930").date_strings() == result["data"]["dates"]
+
+    def test_top_up_merges_new_bars(self, tmp_path, mock_kiwoom_client):
+        """Test repeat call fetches from the last stored date and appends."""
+        store = OhlcvStore(str(tmp_path))
+        history = _series(["20250108", "20250107", "20250106", "20250103"])
+        store.save("005930", OhlcvFrame.from_dict(history))
+
+        fresh = _series(["20250110", "20250109", "20250108", "20250107"])
+        fresh["close"][2:] = history["close"][:2]
+        mock_kiwoom_client.get_daily_chart.return_value = _chart_response(fresh)
+
+        result = ohlcv.get_daily(
+            mock_kiwoom_client,
+            "005930",
+            start_date="20250103",
+            end_date="20250110",
+            store=store,
+        )
+
+        assert result["ok"] is True
+        assert result["data"]["dates"] == [
+            "20250110", "20250109", "20250108", "20250107", "20250106", "20250103",
+        ]
+        # Only bars since the last stored date were requested
+        call = mock_kiwoom_client.get_daily_chart.call_args
+        assert call.args[1] == "20250108"
+        assert len(store.load("005930")) == 6
+
+    def test_served_from_store(self, tmp_path, mock_kiwoom_client):
+        """Test no request is made when the store covers the window."""
+        store = OhlcvStore(str(tmp_path))
+        history = _series(["20250110", "20250109", "20250108"])
+        store.save("005930", OhlcvFrame.from_dict(history))
+
+        result = ohlcv.get_daily(
+            mock_kiwoom_client,
+            "005930",
+            start_date="20250108",
+            end_date="20250109",
+            store=store,
+        )
+
+        assert result["data"]["dates"] == ["20250109", "20250108"]
+        mock_kiwoom_client.get_daily_chart.assert_not_called()
+
+    def test_rebased_history_refetched(self, tmp_path, mock_kiwoom_client):
+        """Test adjusted series is replaced when stored bars changed."""
+        store = OhlcvStore(str(tmp_path))
+        history = _series(["20250108", "20250107", "20250106"], base=1000)
+        store.save("005930", OhlcvFrame.from_dict(history))
+
+        # Split: all history re-adjusted
+        fresh = _series(
+            ["20250110", "20250109", "20250108", "20250107", "20250106"], base=500
+        )
+        mock_kiwoom_client.get_daily_chart.return_value = _chart_response(fresh)
+
+        result = ohlcv.get_daily(
+            mock_kiwoom_client,
+            "005930",
+            start_date="20250106",
+            end_date="20250110",
+            store=store,
+        )
+
+        assert result["data"]["close"] == fresh["close"]
+        assert mock_kiwoom_client.get_daily_chart.call_count == 2
+        assert store.load("005930").close.tolist() == fresh["close"]
+
+    def test_default_store(self, tmp_path, mock_kiwoom_client):
+        """Test module default store is used when none is passed."""
+        store = OhlcvStore(str(tmp_path))
+        ohlcv.set_default_store(store)
+        try:
+            ohlcv.get_daily(mock_kiwoom_client, "005930")
+        finally:
+            ohlcv.set_default_store(None)
+        assert store.load("005930") is not None
@@ -0,0 +1,223 @@
+"""Tests for streaming indicator state."""
+
+import json
+import random
+
+import pytest
+
+from stock_analyzer.indicator import demark, elder, oscillator, trend
+from stock_analyzer.indicator.rolling import rolling_max, rolling_min
+from stock_analyzer.indicator.streaming import (
+    EmaState,
+    MacdState,
+    RollingMinMaxState,
+    RollingSumState,
+    TdSetupState,
+)
+from stock_analyzer.stock.store import OhlcvStore
+
+
+def _ohlcv(n: int, seed: int = 3) -> dict:
+    """Synthetic daily series (newest first) with flat stretches."""
+    rng = random.Random(seed)
+    closes, highs, lows, volumes = [], [], [], []
+    price = 50000
+    for i in range(n):
+        if i % 37 < 3:
+            step = 0  # Trading halt: flat price, tiny volume
+        else:
+            step = rng.randint(-900, 900)
+        price = max(1000, price + step)
+        closes.append(price)
+        highs.append(price + rng.randint(0, 500) if step else price)
+        lows.append(price - rng.randint(0, 500) if step else price)
+        volumes.append(rng.randint(1000, 90000) if step else 10)
+    dates = [f"2024{1 + i // 28:02d}{1 + i % 28:02d}" for i in range(n)]
+    return {
+        "ticker": "005930",
+        "dates": dates[::-1],
+        "open": closes[::-1],
+        "high": highs[::-1],
+        "low": lows[::-1],
+        "close": closes[::-1],
+        "volume": volumes[::-1],
+    }
+
+
+def _prefix(data: dict, n: int) -> dict:
+    """Oldest n bars of a newest-first series."""
+    return {k: v[-n:] if isinstance(v, list) else v for k, v in data.items()}
+
+
+def _roundtrip(state):
+    return type(state).from_dict(json.loads(json.dumps(state.to_dict())))
+
+
+class TestPrimitives:
+    """Tests for primitive states."""
+
+    def test_ema_matches_batch(self):
+        values = [float(v) for v in range(1, 40)]
+        state = EmaState(12)
+        stream = [state.update(v) for v in values]
+        assert stream == oscillator._calc_ema(values, 12)
+
+    def test_macd_matches_batch(self):
+        closes = _ohlcv(80)["close"]
+        macd_line, signal_line, hist = elder._calc_macd_no_sma(closes)
+        state = MacdState()
+        for close in reversed(closes):
+            newest = state.update(close)
+        assert newest == (macd_line[0], signal_line[0], hist[0])
+
+    def test_rolling_sum_matches_batch(self):
+        values = [3, -1, 4, 1, -5, 9, 2, 6, -5, 3]
+        state = RollingSumState(5)
+        stream = [state.update(v) for v in values]
+        assert stream == oscillator._calc_rolling_sum(values, 5)
+
+    def test_rolling_sum_float_does_not_drift(self):
+        rng = random.Random(1)
+        values = [rng.uniform(-1e6, 1e6) for _ in range(5000)]
+        state = RollingSumState(7)
+        for v in values:
+            total = state.update(v)
+        assert total == pytest.approx(sum(values[-7:]), abs=1e-6)
+
+    def test_min_max_matches_batch(self):
+        closes = list(reversed(_ohlcv(200)["close"]))
+        state = RollingMinMaxState(52)
+        stream = [state.update(c) for c in closes]
+        assert [s[0] for s in stream] == rolling_min(closes, 52, min_periods=1).tolist()
+        assert [s[1] for s in stream] == rolling_max(closes, 52, min_periods=1).tolist()
+
+    def test_td_setup_matches_batch(self):
+        closes = _ohlcv(120)["close"]
+        sell, buy = demark._calc_td_setup(closes)
+        state = TdSetupState()
+        stream = [state.update(c) for c in reversed(closes)]
+        assert stream == list(zip(reversed(sell), reversed(buy)))
+
+    def test_primitives_roundtrip(self):
+        closes = list(reversed(_ohlcv(70)["close"]))
+        states = [EmaState(13), MacdState(), RollingSumState(5),
+                  RollingMinMaxState(52), TdSetupState()]
+        for state in states:
+            for c in closes[:60]:
+                state.update(c)
+            restored = _roundtrip(state)
+            for c in closes[60:]:
+                assert restored.update(c) == state.update(c)
+
+
+class TestBarStates:
+    """Tests for per-indicator streaming states."""
+
+    def test_elder_matches_calc(self):
+        data = _ohlcv(120)
+        state = elder.ElderState.from_ohlcv(data)
+        batch = elder.calc_from_ohlcv("005930", data["dates"], data["close"])["data"]
+        for key, value in state.last.items():
+            assert value == batch[key][0], key
+        assert state.date == data["dates"][0]
+        assert state.count == 120
+
+    def test_demark_matches_calc(self):
+        data = _ohlcv(60)
+        state = demark.DemarkState.from_ohlcv(data)
+        batch = demark.calc_from_ohlcv("005930", data["dates"], data["close"])["data"]
+        assert state.last["sell_setup"] == batch["sell_setup"][0]
+        assert state.last["buy_setup"] == batch["buy_setup"][0]
+
+    @pytest.mark.parametrize("timeframe", ["daily", "weekly"])
+    def test_trend_matches_batch(self, timeframe):
+        data = _ohlcv(260)
+        state = trend.TrendState(timeframe)
+        cmf_period = 4 if timeframe == "weekly" else 20
+        fg_func = trend._calc_fear_greed
+        if timeframe == "weekly":
+            fg_func = trend._calc_fear_greed_weekly
+
+        for n in range(1, 261):
+            newest = state.update({
+                "date": data["dates"][-n],
+                "high": data["high"][-n],
+                "low": data["low"][-n],
+                "close": data["close"][-n],
+                "volume": data["volume"][-n],
+            })
+            if n % 29 and n not in (51, 52, 53):
+                continue
+            part = _prefix(data, n)
+            closes = part["close"]
+            assert newest["ma10"] == trend._calc_ma(closes, 10)[0]
+            assert newest["ma20"] == trend._calc_ma(closes, 20)[0]
+            cmf = trend._calc_cmf(
+                part["high"], part["low"], closes, part["volume"], cmf_period,
+            )
+            assert newest["cmf"] == pytest.approx(cmf[0], abs=1e-4)
+            fg = fg_func(closes, part["volume"])
+            assert newest["fear_greed"] == pytest.approx(fg[0], abs=1e-9)
+
+        assert state.last["trend"] in ("bullish", "bearish", "neutral")
+
+    def test_oscillator_matches_calc(self):
+        rng = random.Random(5)
+        n = 60
+        data = {
+            "dates": [f"2025-01-{i:02d}" for i in range(1, n + 1)][::-1],
+            "mcap": [rng.randint(1, 5) * 10**13 for _ in range(n)],
+            "for_5d": [rng.randint(-5000, 5000) for _ in range(n)],
+            "ins_5d": [rng.randint(-5000, 5000) for _ in range(n)],
+        }
+        state = oscillator.OscillatorState.from_ohlcv(data)
+        batch = oscillator.calc_from_analysis(
+            "005930", "삼성전자", data["dates"], data["mcap"],
+            data["for_5d"], data["ins_5d"],
+        )["data"]
+        for key, value in state.last.items():
+            assert value == batch[key][-1], key
+
+    def test_same_date_revises_bar(self):
+        data = _ohlcv(80)
+        state = elder.ElderState.from_ohlcv(_prefix(data, 79))
+        today = data["dates"][0]
+
+        # Intraday refreshes of today's bar, then the final close
+        state.update({"date": today, "close": data["close"][0] + 700})
+        state.update({"date": today, "close": data["close"][0] - 300})
+        state.update({"date": today, "close": data["close"][0]})
+
+        expected = elder.ElderState.from_ohlcv(data)
+        assert state.last == expected.last
+        assert state.count == 80
+
+    def test_older_bar_rejected(self):
+        data = _ohlcv(40)
+        state = demark.DemarkState.from_ohlcv(data)
+        with pytest.raises(ValueError):
+            state.update({"date": data["dates"][5], "close": 1})
+
+    def test_replay_skips_seen_bars(self):
+        data = _ohlcv(100)
+        state = trend.TrendState.from_ohlcv(_prefix(data, 90))
+        state.replay(data)
+        assert state.count == 100
+        assert state.last == trend.TrendState.from_ohlcv(data).last
+
+    def test_roundtrip_and_store(self, tmp_path):
+        data = _ohlcv(120)
+        store = OhlcvStore(str(tmp_path))
+        state = trend.TrendState.from_ohlcv(_prefix(data, 110), timeframe="weekly")
+        store.save_state("005930", state.name, state.to_dict(), timeframe="weekly")
+
+        loaded = store.load_state("005930", "trend", timeframe="weekly")
+        restored = trend.TrendState.from_dict(loaded)
+        assert restored.timeframe == "weekly"
+        assert restored.replay(data) == state.replay(data)
+        assert store.load_state("005930", "elder") is None
+
+    def test_from_dict_wrong_type(self):
+        state = demark.DemarkState.from_ohlcv(_ohlcv(10))
+        with pytest.raises(ValueError):
+            elder.ElderState.from_dict(state.to_dict())